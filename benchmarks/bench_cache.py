@@ -0,0 +1,92 @@
+"""
+Concurrency benchmark for lback.core.cache.Cache.
+
+Runs a read-heavy mixed workload (90% get, 10% set over a fixed key space) from
+1, 4 and 8 threads against a single-shard cache, which behaves like the previous
+one-dict, one-lock implementation, and against the default 16-shard cache. Each
+eviction policy runs with a bounded cache so that eviction is part of the cost.
+
+Also reports the memory retained per CacheItem with __slots__ compared with
+an equivalent class that keeps a per-instance __dict__.
+
+Usage:
+    python -m benchmarks.bench_cache
+"""
+import logging
+import random
+import threading
+import time
+import tracemalloc
+from typing import Any, List, Optional
+
+from lback.core.cache import Cache, CacheItem, EVICTION_POLICIES
+
+
+OPERATIONS_PER_THREAD = 20000
+KEY_SPACE = 5000
+MAX_ENTRIES = 2000
+THREAD_COUNTS = (1, 4, 8)
+ITEMS_FOR_MEMORY = 10000
+
+
+class DictCacheItem:
+    """The previous CacheItem layout, with a per-instance __dict__."""
+    def __init__(self, value: Any, expires_at: Optional[float] = None):
+        self.value = value
+        self.expires_at = expires_at
+
+
+def run_workload(cache: Cache, thread_count: int) -> float:
+    """Returns throughput in operations per second."""
+    for key in range(MAX_ENTRIES):
+        cache.set(key, key)
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        keys = [int(rng.paretovariate(1.2) * 10) % KEY_SPACE for _ in range(OPERATIONS_PER_THREAD)]
+        barrier.wait()
+        for index, key in enumerate(keys):
+            if index % 10 == 0:
+                cache.set(key, index)
+            else:
+                cache.get(key)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return thread_count * OPERATIONS_PER_THREAD / elapsed
+
+
+def retained_per_item(factory: Any) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    items: List[Any] = [factory(index, None) for index in range(ITEMS_FOR_MEMORY)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del items
+    return size / ITEMS_FOR_MEMORY
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    print(f"{'policy':>8} {'shards':>7} " + " ".join(f"{f'{count} thr (ops/s)':>16}" for count in THREAD_COUNTS))
+    for policy in EVICTION_POLICIES:
+        for shards in (1, 16):
+            results = [run_workload(Cache(max_entries=MAX_ENTRIES, eviction_policy=policy, shards=shards), count) for count in THREAD_COUNTS]
+            print(f"{policy:>8} {shards:>7} " + " ".join(f"{result:>16,.0f}" for result in results))
+
+    print()
+    print(f"{'CacheItem layout':>18} {'bytes/item':>11}")
+    print(f"{'__dict__':>18} {retained_per_item(DictCacheItem):>11.1f}")
+    print(f"{'__slots__':>18} {retained_per_item(CacheItem):>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
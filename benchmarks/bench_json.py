@@ -0,0 +1,79 @@
+"""
+Benchmark for lback.core.json_codec.
+
+Encodes list payloads of 1,000 and 10,000 API-style rows (int, UUID, str, Decimal,
+datetime, bool, list) the way JSONResponse used to (json.dumps to str with a
+default= callback, then encode to bytes) and with every installed codec, and
+decodes the encoded payload the way BodyParsingMiddleware used to (decode to str,
+then json.loads) and with every installed codec. Each figure is the best of REPEATS
+runs, timed with the garbage collector off.
+
+Usage:
+    python -m benchmarks.bench_json
+"""
+import datetime
+import decimal
+import json
+import logging
+import timeit
+import uuid
+from typing import Any, Callable, Dict, List
+
+from lback.core import json_codec
+
+
+ROW_COUNTS = (1000, 10000)
+REPEATS = 10
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    created = datetime.datetime(2026, 1, 1, 12, 0, 0)
+    return [
+        {
+            "id": index,
+            "uuid": uuid.UUID(int=index),
+            "name": f"Product {index}",
+            "price": decimal.Decimal(index) / 100,
+            "created_at": created + datetime.timedelta(minutes=index),
+            "active": index % 3 != 0,
+            "tags": ["sale", "new"] if index % 2 else ["stock"],
+        }
+        for index in range(count)
+    ]
+
+
+def legacy_dumps(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def legacy_loads(data: bytes) -> Any:
+    return json.loads(data.decode("utf-8"))
+
+
+def best_of(function: Callable[[], Any]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=REPEATS))
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    codecs = [json_codec.StdlibJSONCodec()]
+    for codec_class, module in ((json_codec.OrjsonCodec, json_codec.orjson), (json_codec.UjsonCodec, json_codec.ujson)):
+        if module is not None:
+            codecs.append(codec_class())
+
+    print(f"{'rows':>6} {'codec':>8} {'encode (ms)':>12} {'decode (ms)':>12} {'bytes':>10}")
+    for count in ROW_COUNTS:
+        payload = {"data": make_rows(count)}
+        encoded = legacy_dumps(payload)
+        encode_time = best_of(lambda: legacy_dumps(payload))
+        decode_time = best_of(lambda: legacy_loads(encoded))
+        print(f"{count:>6} {'legacy':>8} {encode_time * 1000:>12.2f} {decode_time * 1000:>12.2f} {len(encoded):>10,}")
+        for codec in codecs:
+            encoded = codec.dumps(payload)
+            encode_time = best_of(lambda: codec.dumps(payload))
+            decode_time = best_of(lambda: codec.loads(encoded))
+            print(f"{count:>6} {codec.name:>8} {encode_time * 1000:>12.2f} {decode_time * 1000:>12.2f} {len(encoded):>10,}")
+
+
+if __name__ == "__main__":
+    main()
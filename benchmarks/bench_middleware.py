@@ -0,0 +1,91 @@
+"""
+Micro-benchmark for the middleware pipeline overhead.
+
+Runs MiddlewareManager.process_request and process_response over a stack shaped
+like the default 12-middleware MIDDLEWARES list from the project template. The
+stand-in middlewares do no work of their own, so the numbers are the manager's
+per-request cost: the loop, the signal hooks and the debug logging.
+
+Reports the time per request/response round trip with no signal receivers and
+with one receiver connected to 'middleware_process_request_started'.
+
+Usage:
+    python -m benchmarks.bench_middleware
+"""
+import logging
+import timeit
+
+from lback.core.base_middleware import BaseMiddleware
+from lback.core.middleware_manager import MiddlewareManager
+from lback.core.response import Response
+from lback.core.signals import dispatcher
+from lback.core.types import Request
+
+
+NUMBER = 20000
+
+DEFAULT_STACK = (
+    "SQLAlchemySessionMiddleware", "MediaFilesMiddleware", "StaticFilesMiddleware",
+    "SessionMiddleware", "FirewallMiddleware", "RateLimitingMiddleware",
+    "SQLInjectionDetectionMiddleware", "BodyParsingMiddleware", "AuthMiddleware",
+    "CSRFMiddleware", "CORSMiddleware", "SecurityHeadersMiddleware",
+)
+PASS_THROUGH_RESPONSE = {"FirewallMiddleware"}
+
+
+class PassThrough(BaseMiddleware):
+    """Stand-in middleware that does no work in either direction."""
+
+    def process_request(self, request):
+        request.route_requires_auth = False
+        return None
+
+    def process_response(self, request, response):
+        response.status_code = response.status_code
+        return response
+
+
+class RequestOnly(PassThrough):
+    """
+    Stand-in whose process_response is a plain pass-through, like FirewallMiddleware. It is
+    still called: only hooks inherited from the Middleware Protocol are skipped.
+    """
+
+    def process_response(self, request, response):
+        return response
+
+
+def build_manager() -> MiddlewareManager:
+    manager = MiddlewareManager()
+    for name in DEFAULT_STACK:
+        base = RequestOnly if name in PASS_THROUGH_RESPONSE else PassThrough
+        manager.add_middleware(type(name, (base,), {})())
+    return manager
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    manager = build_manager()
+    request = Request('/items/1/', 'GET', b'', {}, environ={})
+    response = Response(body=b'ok')
+
+    def round_trip():
+        manager.process_request(request)
+        manager.process_response(request, response)
+
+    def receiver(sender, **kwargs):
+        pass
+
+    print(f"{'receivers':>10} {'time (us)':>10}")
+    elapsed = timeit.timeit(round_trip, number=NUMBER) / NUMBER * 1e6
+    print(f"{'none':>10} {elapsed:>10.2f}")
+    dispatcher.connect("middleware_process_request_started", receiver)
+    try:
+        elapsed = timeit.timeit(round_trip, number=NUMBER) / NUMBER * 1e6
+    finally:
+        dispatcher.disconnect("middleware_process_request_started", receiver)
+    print(f"{'one':>10} {elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
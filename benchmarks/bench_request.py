@@ -0,0 +1,82 @@
+"""
+Micro-benchmark for Request construction cost.
+
+Compares constructing a Request and reading only its path (what static, health
+and cached responses need) against constructing one and touching headers, query
+params, cookies and META. The second case is the work Request.__init__ used to
+do eagerly for every request.
+
+Reports, per request: wall time, and memory blocks and bytes still allocated
+(measured with tracemalloc while the requests are kept alive).
+
+Usage:
+    python -m benchmarks.bench_request
+"""
+import logging
+import timeit
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from lback.core.types import Request
+
+
+NUMBER = 5000
+
+ENVIRON = {
+    'REQUEST_METHOD': 'GET', 'PATH_INFO': '/static/css/site.css', 'QUERY_STRING': 'v=3',
+    'SERVER_NAME': 'localhost', 'SERVER_PORT': '8000', 'SERVER_PROTOCOL': 'HTTP/1.1',
+    'REMOTE_ADDR': '127.0.0.1', 'SCRIPT_NAME': '', 'wsgi.url_scheme': 'http',
+    'HTTP_HOST': 'localhost:8000', 'HTTP_ACCEPT': 'text/css,*/*;q=0.1',
+    'HTTP_ACCEPT_ENCODING': 'gzip, deflate, br', 'HTTP_ACCEPT_LANGUAGE': 'en-US,en;q=0.9',
+    'HTTP_USER_AGENT': 'Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/128.0',
+    'HTTP_COOKIE': 'session_id=0f3c9a7e; csrftoken=8d1b2c; theme=dark',
+    'HTTP_IF_NONE_MATCH': '"5d8c72a5edda8d6a"',
+}
+HEADERS = {k[5:].replace('_', '-'): v for k, v in ENVIRON.items() if k.startswith('HTTP_')}
+RAW_PATH = '/static/css/site.css?v=3'
+
+
+def path_only() -> Request:
+    """A request that is routed and answered without looking at cookies or META."""
+    request = Request(RAW_PATH, 'GET', b'', HEADERS, environ=ENVIRON)
+    request.path
+    return request
+
+
+def fully_parsed() -> Request:
+    """A request whose headers, query params, cookies and META are all read."""
+    request = Request(RAW_PATH, 'GET', b'', HEADERS, environ=ENVIRON)
+    request.path
+    request.headers
+    request.query_params
+    request.cookies
+    request.meta
+    return request
+
+
+def retained_per_request(factory: Callable[[], Request]) -> Tuple[float, float]:
+    """Returns (blocks, bytes) still allocated per request while NUMBER requests are alive."""
+    factory()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    requests: List[Request] = [factory() for _ in range(NUMBER)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del requests
+    return blocks / NUMBER, size / NUMBER
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    print(f"{'access':>12} {'time (us)':>10} {'blocks':>8} {'bytes':>8}")
+    for label, factory in (("path only", path_only), ("all fields", fully_parsed)):
+        elapsed = timeit.timeit(factory, number=NUMBER) / NUMBER * 1e6
+        blocks, size = retained_per_request(factory)
+        print(f"{label:>12} {elapsed:>10.2f} {blocks:>8.1f} {size:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
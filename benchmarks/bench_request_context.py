@@ -0,0 +1,94 @@
+"""
+Micro-benchmark for per-request context setup.
+
+Compares the previous eager setup, where wsgi_application copied about a dozen
+shared dependencies into every request with add_context() and AppController
+copied them again with set_context(), against a shared AppContext that
+Request.get_context() falls back to.
+
+Reports, per request: wall time, memory blocks and bytes still allocated
+(measured with tracemalloc while the requests are kept alive) and the number
+of entries written to the request's own context dictionary.
+
+Usage:
+    python -m benchmarks.bench_request_context
+"""
+import logging
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from lback.core.types import AppContext, Request
+
+
+NUMBER = 2000
+
+
+class Dependency:
+    """Stand-in for a long-lived framework component."""
+
+
+SHARED_DEPENDENCIES: Dict[str, Any] = {
+    name: Dependency() for name in (
+        'session_manager', 'admin_user_manager', 'user_manager', 'config', 'jwt_auth',
+        'db_manager', 'logger', 'template_renderer', 'router', 'error_handler',
+        'dispatcher', 'firewall', 'headers_configurator', 'rate_limiter', 'admin_registry',
+    )
+}
+WSGI_CONTEXT_KEYS = (
+    'config', 'template_renderer', 'router', 'admin_user_manager', 'session_manager',
+    'user_manager', 'error_handler', 'dispatcher', 'admin_registry',
+)
+APP_CONTEXT = AppContext({**SHARED_DEPENDENCIES, 'jwt_auth_utility': SHARED_DEPENDENCIES['jwt_auth']})
+ENVIRON = {'REQUEST_METHOD': 'GET', 'PATH_INFO': '/items/1/', 'QUERY_STRING': 'page=2'}
+HEADERS = {'HOST': 'localhost', 'ACCEPT': 'text/html'}
+DB_SESSION = Dependency()
+
+
+def eager_request() -> Request:
+    """The previous setup: every shared dependency is written into the request context twice."""
+    request = Request('/items/1/?page=2', 'GET', b'', HEADERS, environ=ENVIRON)
+    request.add_context('db_session', DB_SESSION)
+    for key in WSGI_CONTEXT_KEYS:
+        request.add_context(key, SHARED_DEPENDENCIES[key])
+    request.add_context('jwt_auth_utility', SHARED_DEPENDENCIES['jwt_auth'])
+    request.add_context('environ', ENVIRON)
+    for dep_name, dep_instance in SHARED_DEPENDENCIES.items():
+        request.set_context(**{dep_name: dep_instance})
+    return request
+
+
+def lazy_request() -> Request:
+    """The shared AppContext setup: only the DB session is stored on the request."""
+    request = Request('/items/1/?page=2', 'GET', b'', HEADERS, environ=ENVIRON, app_context=APP_CONTEXT)
+    request.add_context('db_session', DB_SESSION)
+    return request
+
+
+def retained_per_request(factory: Callable[[], Request]) -> Tuple[float, float]:
+    """Returns (blocks, bytes) still allocated per request while NUMBER requests are alive."""
+    factory()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    requests: List[Request] = [factory() for _ in range(NUMBER)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del requests
+    return blocks / NUMBER, size / NUMBER
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    print(f"{'setup':>8} {'time (us)':>10} {'blocks':>8} {'bytes':>8} {'ctx keys':>9}")
+    for label, factory in (("eager", eager_request), ("lazy", lazy_request)):
+        elapsed = timeit.timeit(factory, number=NUMBER) / NUMBER * 1e6
+        blocks, size = retained_per_request(factory)
+        context_keys = len(factory()._context)
+        print(f"{label:>8} {elapsed:>10.2f} {blocks:>8.1f} {size:>8.0f} {context_keys:>9}")
+
+
+if __name__ == "__main__":
+    main()
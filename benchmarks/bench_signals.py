@@ -0,0 +1,63 @@
+"""
+Micro-benchmark for SignalDispatcher.send().
+
+Sends a 'request_finished'-style signal carrying a Request and a Response with
+0, 1 and 5 connected receivers, plus the guarded form used on the request path
+(`if dispatcher.has_receivers(name): dispatcher.send(...)`) with no receivers.
+The receivers do nothing, so the numbers are the dispatch overhead alone. Each
+figure is the best of REPEAT runs.
+
+Logging is set to INFO, as in production, so debug messages are not emitted.
+
+Usage:
+    python -m benchmarks.bench_signals
+"""
+import logging
+import timeit
+
+from lback.core.response import Response
+from lback.core.signals import SignalDispatcher
+from lback.core.types import Request
+
+
+NUMBER = 100000
+REPEAT = 5
+SIGNAL = "request_finished"
+
+REQUEST = Request('/articles/42?page=2', 'GET', b'', {'HOST': 'localhost', 'ACCEPT': 'text/html'},
+                  environ={'REQUEST_METHOD': 'GET', 'PATH_INFO': '/articles/42', 'QUERY_STRING': 'page=2'})
+RESPONSE = Response(body=b'<html>' + b'x' * 4096 + b'</html>', status_code=200, content_type='text/html')
+
+
+def dispatcher_with(count: int) -> SignalDispatcher:
+    dispatcher = SignalDispatcher()
+    for index in range(count):
+        def numbered(sender, **kwargs):
+            return None
+        numbered.__name__ = f"receiver_{index}"
+        dispatcher.connect(SIGNAL, numbered)
+    return dispatcher
+
+
+def main():
+    logging.getLogger("lback").setLevel(logging.INFO)
+
+    print(f"{'receivers':>22} {'time (ns)':>10}")
+    for count in (0, 1, 5):
+        dispatcher = dispatcher_with(count)
+        send = dispatcher.send
+        elapsed = min(timeit.repeat(lambda: send(SIGNAL, sender=None, request=REQUEST, response=RESPONSE), number=NUMBER, repeat=REPEAT))
+        print(f"{count:>22} {elapsed / NUMBER * 1e9:>10.0f}")
+
+    dispatcher = dispatcher_with(0)
+
+    def guarded():
+        if dispatcher.has_receivers(SIGNAL):
+            dispatcher.send(SIGNAL, sender=None, request=REQUEST, response=RESPONSE)
+
+    elapsed = min(timeit.repeat(guarded, number=NUMBER, repeat=REPEAT))
+    print(f"{'0 (has_receivers)':>22} {elapsed / NUMBER * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1223,6 +1223,8 @@ def generic_list_view(request: Request, model: Type[BaseModel]) -> Response:
         logger.exception(f"Error rendering generic list view for model {model_name} for {request.method} {request.path}.")
         return return_500(request, exception=e)
 
+generic_list_view.db_read_only = True
+
 @PermissionRequired(lambda request: f"view_{request.path_params.get('model_name').lower()}" if request.path_params and request.path_params.get('model_name') else "view_unknown_model")
 def generic_detail_view(request: Request, model: Type[BaseModel], object_id: Any) -> Response:
     """
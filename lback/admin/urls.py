@@ -6,6 +6,10 @@ from .views import (
     admin_login_post,
     admin_dashboard_page,
     admin_logout_post,
+    admin_pipeline_profile,
+    admin_pipeline_profile_reset,
+    admin_signal_queue,
+    admin_db_pool,
 )
 
 from .generic import (
@@ -23,6 +27,10 @@ urlpatterns = [
     path("login/", admin_login_post, allowed_methods=["POST"], name="admin_login_post", requires_auth=False),
     path("dashboard/", admin_dashboard_page, allowed_methods=["GET"], name="admin_dashboard", requires_auth=True),
     path("logout/", admin_logout_post, allowed_methods=["POST"], name="admin_logout", requires_auth=False),
+    path("pipeline-profile/", admin_pipeline_profile, allowed_methods=["GET"], name="admin_pipeline_profile", requires_auth=True),
+    path("pipeline-profile/", admin_pipeline_profile_reset, allowed_methods=["POST"], name="admin_pipeline_profile_reset", requires_auth=True),
+    path("signal-queue/", admin_signal_queue, allowed_methods=["GET"], name="admin_signal_queue", requires_auth=True),
+    path("db-pool/", admin_db_pool, allowed_methods=["GET"], name="admin_db_pool", requires_auth=True),
 
     path("adminuser/add/", auth_views.admin_user_add_view, allowed_methods=["GET", "POST"], name="admin_user_add", requires_auth=True),
     path("adminuser/", auth_views.admin_user_list_view, allowed_methods=["GET"], name="admin_user_list", requires_auth=True),
@@ -3,12 +3,15 @@ from typing import Dict, Any, Optional, List
 from http import HTTPStatus
 from sqlalchemy.orm import Session as DBSession
 
-from lback.core.response import Response
+from lback.core.profiling import profiler
+from lback.core.signals import dispatcher
+from lback.core.response import Response, JSONResponse
 from lback.core.types import Request, HTTPMethod
 from lback.utils.shortcuts import render, redirect, return_500
 from lback.auth.permissions import PermissionRequired
 from lback.auth.adminauth import AdminAuth
 from lback.models.adminuser import AdminUser
+from lback.models.database import DatabaseManager
 from lback.utils.app_session import AppSession
 from lback.core.templates import TemplateNotFound
 
@@ -176,6 +179,54 @@ def admin_dashboard_page(request: Request) -> Response:
         return return_500(request, exception=e)
 
 
+@PermissionRequired("view_dashboard")
+def admin_pipeline_profile(request: Request) -> Response:
+    """
+    Returns the request pipeline latency profile as JSON.
+    Requires authentication and 'view_dashboard' permission.
+    Each stage (every middleware's request and response phase, router resolve, view and
+    get_wsgi_response) reports count, mean, p50, p95, p99 and max in milliseconds,
+    slowest p99 first. Timings are only recorded while PROFILE_PIPELINE is enabled.
+    """
+    logger.info(f"Serving pipeline profile for path: {request.path}")
+    return JSONResponse(data={"enabled": profiler.enabled, "stages": profiler.snapshot()})
+
+
+@PermissionRequired("view_dashboard")
+def admin_pipeline_profile_reset(request: Request) -> Response:
+    """
+    Discards the recorded pipeline timings and returns the (now empty) profile as JSON.
+    Requires authentication and 'view_dashboard' permission.
+    """
+    logger.info("Resetting pipeline profile at admin request.")
+    profiler.reset()
+    return JSONResponse(data={"enabled": profiler.enabled, "stages": profiler.snapshot()})
+
+
+@PermissionRequired("view_dashboard")
+def admin_signal_queue(request: Request) -> Response:
+    """
+    Returns the async signal queue metrics as JSON.
+    Requires authentication and 'view_dashboard' permission.
+    Reports the current and highest queue depth, capacity, and the enqueued, delivered,
+    dropped and sampled-out event counts. Empty until an async receiver is connected.
+    """
+    logger.info(f"Serving async signal queue metrics for path: {request.path}")
+    return JSONResponse(data=dispatcher.async_metrics())
+
+
+@PermissionRequired("view_dashboard")
+def admin_db_pool(request: Request) -> Response:
+    """
+    Returns this server's database connection pool statistics as JSON.
+    Requires authentication and 'view_dashboard' permission.
+    Reports checked-out connections, checkout and connect counts and the connection wait
+    histogram of the primary pool, plus one entry per replica when replicas are configured.
+    """
+    logger.info(f"Serving database pool statistics for path: {request.path}")
+    return JSONResponse(data=DatabaseManager.get_instance().pool_stats())
+
+
 def admin_logout_post(request: Request) -> Response:
     """
     Handles admin logout.
@@ -13,7 +13,10 @@ class GenericAPIView(APIView):
 class ListAPIView(ListModelMixin, GenericAPIView):
     """
     View for listing a queryset.
+    GET requests read from a database replica when replicas are configured.
     """
+    db_read_only = True
+
     def get(self, request: Any, *args, **kwargs) -> List[Any]:
         return self.list(request, *args, **kwargs)
 
@@ -27,7 +30,10 @@ class CreateAPIView(CreateModelMixin, GenericAPIView):
 class RetrieveAPIView(RetrieveModelMixin, GenericAPIView):
     """
     View for retrieving a model instance.
+    GET requests read from a database replica when replicas are configured.
     """
+    db_read_only = True
+
     def get(self, request: Any, *args, **kwargs) -> Any:
         return self.retrieve(request, *args, **kwargs)
 
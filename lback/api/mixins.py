@@ -1,7 +1,7 @@
 from typing import Any, List
-import json
 from http import HTTPStatus
 
+from lback.core import json_codec
 from lback.core.response import Response
 from lback.core.exceptions import ValidationError
 
@@ -27,7 +27,7 @@ class CreateModelMixin:
             raise ValidationError(serializer.errors)
         
         instance = serializer.save()
-        return Response(json.dumps(serializer.data), status=HTTPStatus.CREATED.value, content_type="application/json")
+        return Response(json_codec.dumps(serializer.data), status_code=HTTPStatus.CREATED.value, content_type="application/json")
 
 
 class RetrieveModelMixin:
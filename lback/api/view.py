@@ -1,10 +1,10 @@
 import logging
-import json
 from typing import Any, List, Optional, Callable, Dict, Type
 from http import HTTPStatus
 
 from lback.core.signals import dispatcher
 from lback.core.exceptions import MethodNotAllowed, NotFound
+from lback.core import json_codec
 from lback.core.response import Response
 from lback.models.base import BaseModel
 from lback.api.serializer import BaseModelSerializer
@@ -111,10 +111,8 @@ class APIView(BaseView):
 
             try:
                 self.parsed_request_data = request.parsed_body if hasattr(request, 'parsed_body') and request.parsed_body is not None else {}
-            except json.JSONDecodeError:
-                return Response(json.dumps({"detail": "Invalid JSON in request body"}), 
-                                status=HTTPStatus.BAD_REQUEST.value, 
-                                content_type="application/json")
+            except ValueError:
+                return self._json_response({"detail": "Invalid JSON in request body"}, HTTPStatus.BAD_REQUEST.value)
         
         try:
             response_data = super().dispatch(request, *args, **kwargs)
@@ -125,27 +123,32 @@ class APIView(BaseView):
 
         except MethodNotAllowed as e:
             logger.warning(f"Method not allowed for {request.path}: {e.method} not in {e.allowed_methods}")
-            return Response(json.dumps({"detail": f"Method {e.method} not allowed. Allowed methods: {', '.join(e.allowed_methods)}"}), 
-                            status=HTTPStatus.METHOD_NOT_ALLOWED.value, 
-                            content_type="application/json")
+            return self._json_response({"detail": f"Method {e.method} not allowed. Allowed methods: {', '.join(e.allowed_methods)}"}, HTTPStatus.METHOD_NOT_ALLOWED.value)
         
         except NotFound as e:
             logger.warning(f"Resource not found for {request.path}: {e.message}")
-            return Response(json.dumps({"detail": e.message}), 
-                            status=HTTPStatus.NOT_FOUND.value, 
-                            content_type="application/json")
+            return self._json_response({"detail": e.message}, HTTPStatus.NOT_FOUND.value)
         
         except NotImplementedError as e:
             logger.error(f"API Method not implemented: {e}")
-            return Response(json.dumps({"detail": "This API method is not implemented."}), 
-                            status=HTTPStatus.NOT_IMPLEMENTED.value, 
-                            content_type="application/json")
+            return self._json_response({"detail": "This API method is not implemented."}, HTTPStatus.NOT_IMPLEMENTED.value)
         
         except Exception as e:
             logger.exception(f"Unhandled exception in APIView dispatch for {request.path}: {e}")
-            return Response(json.dumps({"detail": "An unexpected server error occurred."}), 
-                            status=HTTPStatus.INTERNAL_SERVER_ERROR.value, 
-                            content_type="application/json")
+            return self._json_response({"detail": "An unexpected server error occurred."}, HTTPStatus.INTERNAL_SERVER_ERROR.value)
+
+    def _json_response(self, data: Any, status_code: int) -> Response:
+        """
+        Builds a JSON Response, encoding the data straight to bytes with the configured JSON codec.
+
+        Args:
+            data (Any): The data to encode. datetime, UUID, Decimal and SQLAlchemy rows are supported.
+            status_code (int): The HTTP status code.
+
+        Returns:
+            Response: The JSON response.
+        """
+        return Response(json_codec.dumps(data), status_code=status_code, content_type="application/json")
 
     def _serialize_response(self, data: Any) -> Response:
         """
@@ -166,11 +169,9 @@ class APIView(BaseView):
         if self.serializer_class is None:
             logger.warning(f"APIView {self.__class__.__name__} returned data but no serializer_class is defined. Returning raw JSON.")
             try:
-                return Response(json.dumps(data), content_type="application/json", status=HTTPStatus.OK.value)
+                return self._json_response(data, HTTPStatus.OK.value)
             except TypeError:
-                return Response(json.dumps({"detail": "Data could not be serialized to JSON without a serializer_class."}), 
-                                status=HTTPStatus.INTERNAL_SERVER_ERROR.value, 
-                                content_type="application/json")
+                return self._json_response({"detail": "Data could not be serialized to JSON without a serializer_class."}, HTTPStatus.INTERNAL_SERVER_ERROR.value)
         
 
         if isinstance(data, list):
@@ -179,7 +180,7 @@ class APIView(BaseView):
         else:
             serialized_data = self.serializer_class(data).data
             
-        return Response(json.dumps(serialized_data), content_type="application/json", status=HTTPStatus.OK.value)
+        return self._json_response(serialized_data, HTTPStatus.OK.value)
 
     def get_serializer(self, instance: Any = None, data: Optional[Dict[str, Any]] = None, **kwargs) -> BaseModelSerializer:
         """
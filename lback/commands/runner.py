@@ -1,4 +1,3 @@
-import os
 import subprocess
 import logging
 import time
@@ -71,31 +70,65 @@ class RunnerCommands:
             logger.error("pytest is not installed or not found in PATH.")
 
 
-    def collectstatic(self, static_dirs=None, output_dir='staticfiles'):
-        """Collect static files into a single directory."""
+    def collectstatic(self, static_dirs=None, output_dir=None, max_workers=None):
+        """
+        Collect static files into a single directory.
+        Writes content-hashed copies, precompressed .gz/.br siblings and a manifest.json
+        used by the static() helper. Files whose digest matches the previous run are skipped.
+
+        Args:
+            static_dirs: Source directories, normally config.STATIC_DIRS. Defaults to ['static'].
+            output_dir: The directory to collect into, normally config.STATIC_ROOT, where
+                        static() and StaticFilesMiddleware look for the manifest and the
+                        precompressed files. Defaults to 'staticfiles'. Must not overlap a source directory.
+            max_workers: Threads used to process files.
+        """
         try:
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir, exist_ok=True)
-                logger.info(f"Static files directory created: {output_dir}")
-            else:
-                logger.info(f"Static files directory already exists: {output_dir}")
+            from lback.utils.static_pipeline import StaticCollector
 
             static_dirs = static_dirs or ['static']
-            for static_dir in static_dirs:
-                if os.path.exists(static_dir):
-                    for root, dirs, files in os.walk(static_dir):
-                        for file in files:
-                            src_file = os.path.join(root, file)
-                            rel_path = os.path.relpath(src_file, static_dir)
-                            dest_file = os.path.join(output_dir, rel_path)
-                            os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-                            with open(src_file, 'rb') as src, open(dest_file, 'wb') as dest:
-                                dest.write(src.read())
-                            logger.info(f"Copied: {src_file} -> {dest_file}")
-                else:
-                    logger.warning(f"Static directory not found: {static_dir}")
+            output_dir = output_dir or 'staticfiles'
+            start_time = time.time()
+            try:
+                collector = StaticCollector(static_dirs, output_dir, max_workers=max_workers)
+            except ValueError as e:
+                logger.error(f"collectstatic: {e}")
+                return None
+            counts = collector.collect()
+            elapsed_time = time.time() - start_time
+            logger.info(f"Static files collected successfully in {elapsed_time:.2f} seconds.")
+            return counts
+
+        except Exception as e:
+            logger.exception(f"Error collecting static files: {e}")
 
-            logger.info("Static files collected successfully.")
+    def dbpoolstats(self, db_manager=None):
+        """
+        Check the database configuration and connectivity.
+        Checks out one connection, then prints the pool class and counters of the pool this
+        command created. These describe the CLI process only, not a running server: a server's
+        live pool figures are served at GET /admin/db-pool/ (DatabaseManager.pool_stats()).
+        """
+        try:
+            from sqlalchemy import text
+            from lback.models.database import DatabaseManager
+
+            db_manager = db_manager or DatabaseManager.get_instance()
+            start_time = time.time()
+            with db_manager.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            elapsed_time = time.time() - start_time
+            logger.info(f"Database connectivity check succeeded in {elapsed_time * 1000:.1f} ms.")
+
+            stats = db_manager.pool_stats()
+            for key, value in stats.items():
+                if key == 'wait_histogram_ms':
+                    print("wait_histogram_ms:")
+                    for bucket, count in value.items():
+                        print(f"  <= {bucket}: {count}")
+                else:
+                    print(f"{key}: {value}")
+            return stats
 
         except Exception as e:
-            logger.exception(f"Error collecting static files: {e}")
\ No newline at end of file
+            logger.exception(f"Error reading database pool statistics: {e}")
@@ -78,6 +78,8 @@ handling, configuration, error management, routing, and server operations.
     * **MiddlewareManager:** Manages the execution order and application of multiple middleware components
         to incoming requests and outgoing responses.
     * **Middleware:** A class or interface representing a single middleware component.
+    * **profiler (from .profiling):** The PipelineProfiler that records per-stage latency
+        histograms (middlewares, router resolve, view, get_wsgi_response) when PROFILE_PIPELINE is on.
 
 10. **Response Handling (from .response):**
     Classes for constructing various types of HTTP responses.
@@ -105,6 +107,8 @@ handling, configuration, error management, routing, and server operations.
     A system for implementing signals (or events) within the framework. This allows
     different parts of the application to send notifications and react to them,
     promoting a decoupled architecture.
+    * **AsyncSignalQueue / SignalEvent (from .signal_queue):** The bounded queue and worker
+        threads that deliver batches of events to receivers connected with mode="async".
 
 14. **Templates (from .templates):**
     Components for rendering HTML templates.
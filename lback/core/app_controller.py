@@ -1,5 +1,6 @@
 import logging
 import importlib
+import time
 from typing import List, Callable, Dict, Any, Optional, Tuple
 from http import HTTPStatus
 from sqlalchemy.orm import Session
@@ -8,10 +9,12 @@ import inspect
 from .signals import SignalDispatcher
 from .router import Router, RouteNotFound, MethodNotAllowed
 from .middleware_manager import MiddlewareManager
+from .profiling import profiler, STAGE_ROUTER_RESOLVE, STAGE_VIEW
 from .templates import TemplateRenderer
 from .config import Config
-from .types import Request
+from .types import Request, AppContext
 from .response import Response, JSONResponse
+from lback.models.routing import client_sticky_key, is_read_only_request
 
 from lback.utils.admin_user_manager import AdminUserManager
 from lback.utils.session_manager import SessionManager
@@ -19,6 +22,10 @@ from lback.utils.user_manager import UserManager
 
 
 IncludedUrlPatterns = Tuple[List[Tuple], str]
+ParamResolver = Callable[[Request, Dict[str, Any]], Any]
+InjectionPlan = List[Tuple[str, ParamResolver]]
+
+_SKIP_PARAM = object()
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +49,8 @@ class AppController:
         session_manager: SessionManager,
         user_manager: UserManager,
         available_dependencies_instances: Dict[str, Any],
-        dispatcher: SignalDispatcher
+        dispatcher: SignalDispatcher,
+        app_context: Optional[AppContext] = None
     ):
         """
         Initializes the AppController with necessary core dependencies.
@@ -60,6 +68,8 @@ class AppController:
                                               to their instances, which will be made available
                                               on the request context for middlewares and views.
             dispatcher: The SignalDispatcher instance for sending signals.
+            app_context: The shared AppContext attached to requests that do not have one yet.
+                         Defaults to an AppContext built from available_dependencies_instances.
         """
         self.middleware_manager = middleware_manager
         self.router = router
@@ -70,6 +80,7 @@ class AppController:
         self.user_manager = user_manager
         self.available_dependencies = available_dependencies_instances
         self.dispatcher = dispatcher
+        self.app_context = app_context if app_context is not None else AppContext(self.available_dependencies)
 
         self.view_param_to_request_attr_map: Dict[str, str] = {}
 
@@ -83,6 +94,8 @@ class AppController:
         self.view_param_to_request_attr_map['logger'] = 'logger' 
         self.view_param_to_request_attr_map['admin_registry'] = 'admin_registry'
         logger.debug(f"AppController: View parameter to request attribute map initialized: {self.view_param_to_request_attr_map}")
+        self._injection_plans: Dict[Tuple[Any, Tuple[str, ...]], Optional[InjectionPlan]] = {}
+        self._model_lookup_cache: Dict[Tuple[int, str], Any] = {}
         self._load_app_components()
 
     def _load_app_components(self):
@@ -147,7 +160,8 @@ class AppController:
                             logger.warning(f"Skipping route {full_pattern}: 'methods' must be a list of strings or None. Found {methods}.")
                             methods = None
 
-                        self.router.add_route(full_pattern, view_func, methods=methods, name=name, requires_auth=requires_auth)
+                        route = self.router.add_route(full_pattern, view_func, methods=methods, name=name, requires_auth=requires_auth)
+                        self._get_injection_plan(route.view, tuple(route._variable_names))
                         logger.debug(f"Added route: {full_pattern} (Methods: {methods}, Name: {name}, Auth: {requires_auth})")
                     else:
                         logger.warning(f"Skipping unrecognized item format in urlpatterns: {item} under prefix {current_prefix}. Expected route tuple or recognized include structure.")
@@ -165,7 +179,7 @@ class AppController:
         """
         Handles an incoming request by orchestrating the application flow.
         This includes:
-        1. Setting core dependencies on the request context.
+        1. Attaching the shared application context to the request if it has none.
         2. Executing the request middleware chain.
         3. Resolving the route using the router (if not short-circuited by middleware).
         4. Dispatching the request to the appropriate view.
@@ -189,19 +203,27 @@ class AppController:
         """
         logger.debug(f"AppController: Starting request processing for {request.method} {request.path}")
         
-        self.dispatcher.send("request_started", sender=self, request=request)
-        logger.debug("Signal 'request_started' sent.")
+        if self.dispatcher.has_receivers("request_started"):
+            self.dispatcher.send("request_started", sender=self, request=request)
+            logger.debug("Signal 'request_started' sent.")
         
-        for dep_name, dep_instance in self.available_dependencies.items():
-            if dep_instance is not None:
-                request.set_context(**{dep_name: dep_instance})
+        if not request.app_context:
+            request.app_context = self.app_context
 
         db_session: Optional[Session] = None
         final_response: Optional[Response] = None
+        route_name: Optional[str] = None
+        pre_resolved: Any = None
+        pre_resolved_path: Optional[str] = None
+
+        if self.middleware_manager.uses_route_resolution:
+            pre_resolved_path = request.path
+            route_name, pre_resolved = self._resolve_for_middleware_scopes(request)
+            request.add_context('route_resolution', (pre_resolved_path, pre_resolved))
         
         try:
             logger.debug(f"AppController: Running request middlewares for {request.path}")
-            response_from_middleware = self.middleware_manager.process_request(request)
+            response_from_middleware = self.middleware_manager.process_request(request, route_name=route_name)
             
             if response_from_middleware:
                 logger.debug(f"AppController: Middleware returned a response (status={response_from_middleware.status_code}). Bypassing router and view execution.")
@@ -211,9 +233,18 @@ class AppController:
                 view: Callable
                 path_variables: Dict[str, Any]
                 requires_auth: bool
+                reuse_resolution = pre_resolved is not None and pre_resolved_path == request.path
+                resolve_started_ns = time.perf_counter_ns() if profiler.enabled and not reuse_resolution else 0
                 try:
-                    view, path_variables, requires_auth = self.router.resolve(request.path, request.method)
+                    if reuse_resolution:
+                        if isinstance(pre_resolved, Exception):
+                            raise pre_resolved
+                        view, path_variables, requires_auth = pre_resolved
+                    else:
+                        view, path_variables, requires_auth = self.router.resolve(request.path, request.method)
                 except (RouteNotFound, MethodNotAllowed) as e:
+                    if resolve_started_ns:
+                        profiler.record(STAGE_ROUTER_RESOLVE, time.perf_counter_ns() - resolve_started_ns)
                     logger.debug(f"AppController: Route resolution failed: {type(e).__name__}. Handling with error handler.")
                     if request.error_handler:
                         if isinstance(e, RouteNotFound):
@@ -228,77 +259,43 @@ class AppController:
                         logger.critical("AppController: error_handler_instance is None for routing exception. Re-raising.")
                         raise e 
                 
+                if resolve_started_ns:
+                    profiler.record(STAGE_ROUTER_RESOLVE, time.perf_counter_ns() - resolve_started_ns)
                 request.route_requires_auth = requires_auth
                 request.path_params = path_variables 
+
+                routed_db_session = request.get_context('db_session')
+                if hasattr(routed_db_session, 'set_routing'):
+                    routed_db_session.set_routing(is_read_only_request(view, request.method), client_sticky_key(request))
             
                 logger.debug(f"AppController: Route resolved. View: {getattr(view, '__name__', str(view))}, Requires Auth: {requires_auth}. Raw Path Params: {path_variables}")
-                self.dispatcher.send("route_matched", sender=self, request=request, view=view, path_variables=path_variables)
-                logger.debug("Signal 'route_matched' sent.")
+                if self.dispatcher.has_receivers("route_matched"):
+                    self.dispatcher.send("route_matched", sender=self, request=request, view=view, path_variables=path_variables)
+                    logger.debug("Signal 'route_matched' sent.")
                 logger.debug(f"AppController: Dispatching to view: {getattr(view, '__name__', str(view))}")
-                self.dispatcher.send("pre_view_execution", sender=self, request=request, view=view, path_variables=path_variables)
-                logger.debug("Signal 'pre_view_execution' sent.")
+                if self.dispatcher.has_receivers("pre_view_execution"):
+                    self.dispatcher.send("pre_view_execution", sender=self, request=request, view=view, path_variables=path_variables)
+                    logger.debug("Signal 'pre_view_execution' sent.")
                 
+                view_started_ns = time.perf_counter_ns() if profiler.enabled else 0
                 try:
-                    resolved_kwargs: Dict[str, Any] = {}
-                    try:
-                        view_params = inspect.signature(view).parameters
-                    except ValueError:
-                        logger.warning(f"AppController: Could not get signature for view {getattr(view, '__name__', str(view))}. Attempting to call with raw path_variables as fallback.")
-                        response_from_view = view(request, **path_variables)
-                        pass
-                    
-                    else:
-                        for param_name, param in view_params.items():
-                            if param_name == 'request':
-                                
-                                continue
-                            if param_name in path_variables:
-                                resolved_kwargs[param_name] = path_variables[param_name]
-                                logger.debug(f"AppController: Matched view parameter '{param_name}' with path variable.")
-                            
-                            elif param_name in self.available_dependencies:
-                                resolved_kwargs[param_name] = self.available_dependencies[param_name]
-                                logger.debug(f"AppController: Matched view parameter '{param_name}' directly with available dependency.")
-                            elif param_name in self.view_param_to_request_attr_map:
-                                request_attr_name = self.view_param_to_request_attr_map[param_name]
-                                if hasattr(request, request_attr_name):
-                                    resolved_kwargs[param_name] = getattr(request, request_attr_name)
-                                    logger.debug(f"AppController: Matched view parameter '{param_name}' to request attribute '{request_attr_name}'.")
-                                else:
-                                    if param.default == inspect.Parameter.empty:
-                                        logger.error(f"AppController: Missing required parameter '{param_name}' (expected as request attribute '{request_attr_name}') for view '{getattr(view, '__name__', 'UnknownView')}'.")
-                                        raise TypeError(f"Missing required parameter: {param_name}")
-                    
-                            elif param_name == 'model':
-                                model_name_from_path = path_variables.get('model_name')
-                                if model_name_from_path:
-                                    admin_registry = request.admin_registry
-                                    if admin_registry:
-                                        model_class = admin_registry.get_model(model_name_from_path)
-                                        if model_class:
-                                            resolved_kwargs['model'] = model_class
-                                            logger.debug(f"AppController: Resolved model '{model_name_from_path}' to class {getattr(model_class, '__name__', str(model_class))} for view parameter 'model'.")
-                                        else:
-                                            logger.warning(f"AppController: Model '{model_name_from_path}' from path for view parameter 'model' not found in AdminRegistry.")
-                                            raise RouteNotFound(f"Model '{model_name_from_path}' not registered.")
-                                    else:
-                                        logger.critical("AppController: AdminRegistry dependency missing while resolving 'model' parameter for view.")
-                                        raise RuntimeError("AdminRegistry dependency missing.")
-                                else:
-                                    logger.warning(f"AppController: View expects 'model' parameter, but 'model_name' path variable is missing for view '{getattr(view, '__name__', 'Unknown')}'.")
-                                    raise RouteNotFound(f"Model name missing from path for view parameter 'model'.")
-
-                            elif param.default == inspect.Parameter.empty and param_name not in resolved_kwargs:
-                                logger.error(f"AppController: Missing required parameter '{param_name}' for view '{getattr(view, '__name__', 'UnknownView')}'.")
-                                raise TypeError(f"Missing required parameter: {param_name}")
-                    
+                    injection_plan = self._get_injection_plan(view, tuple(path_variables))
                     db_session = request.get_context('db_session') 
 
-                    if isinstance(view, type):
-                        view_instance = view()
-                        response_from_view = view_instance.dispatch(request, **resolved_kwargs)
+                    if injection_plan is None:
+                        response_from_view = view(request, **path_variables)
                     else:
-                        response_from_view = view(request, **resolved_kwargs)
+                        resolved_kwargs: Dict[str, Any] = {}
+                        for param_name, resolver in injection_plan:
+                            value = resolver(request, path_variables)
+                            if value is not _SKIP_PARAM:
+                                resolved_kwargs[param_name] = value
+
+                        if isinstance(view, type):
+                            view_instance = view()
+                            response_from_view = view_instance.dispatch(request, **resolved_kwargs)
+                        else:
+                            response_from_view = view(request, **resolved_kwargs)
 
                     if not isinstance(response_from_view, Response):
                         logger.error(f"AppController: View '{getattr(view, '__name__', str(view))}' returned unexpected type: {type(response_from_view)}. Expected Response.")
@@ -308,12 +305,13 @@ class AppController:
                     
                     logger.debug(f"AppController: View execution complete. Initial response status: {getattr(final_response, 'status_code', 'N/A')}")
                     
-                    self.dispatcher.send("post_view_execution", sender=self, request=request, response=final_response)
-                    logger.debug("Signal 'post_view_execution' sent.")
+                    if self.dispatcher.has_receivers("post_view_execution"):
+                        self.dispatcher.send("post_view_execution", sender=self, request=request, response=final_response)
+                        logger.debug("Signal 'post_view_execution' sent.")
                 
                 except Exception as e:
                     logger.exception(f"AppController: Unhandled exception during view execution or argument resolution for {getattr(view, '__name__', str(view))} on {request.method} {request.path}.")
-                    if db_session:
+                    if self._session_in_use(db_session):
                         self.dispatcher.send("db_session_rolled_back", sender=self, request=request, session=db_session, exception=e)
                         logger.debug("Signal 'db_session_rolled_back' sent due to view/arg resolution exception.")
                         try:
@@ -322,8 +320,11 @@ class AppController:
                         except Exception as rb_e:
                             logger.error(f"AppController: Error during rollback after view/arg resolution exception: {rb_e}", exc_info=True)
                     raise e
+                finally:
+                    if view_started_ns:
+                        profiler.record(STAGE_VIEW, time.perf_counter_ns() - view_started_ns)
 
-                if db_session and final_response and int(final_response.status_code) < 400:
+                if self._session_in_use(db_session) and final_response and int(final_response.status_code) < 400:
                     try:
                         db_session.commit()
                         self.dispatcher.send("db_session_committed", sender=self, request=request, session=db_session)
@@ -365,7 +366,7 @@ class AppController:
             self.dispatcher.send("exception_caught", sender=self, request=request, exception=e)
             logger.debug("Signal 'exception_caught' sent.")
             
-            if db_session:
+            if self._session_in_use(db_session):
                 try:
                     if db_session.is_active:
                         self.dispatcher.send("db_session_rolled_back", sender=self, request=request, session=db_session, exception=e)
@@ -387,12 +388,187 @@ class AppController:
             logger.error("AppController: final_response is not a Response object after handling. Generating default error response.")
             final_response = Response(body=b"Internal Server Error: Invalid response generated.", status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value, headers={'Content-Type': 'text/plain'})
         
-        final_response_after_middleware: Response = self.middleware_manager.process_response(request, final_response)
+        final_response_after_middleware: Response = self.middleware_manager.process_response(request, final_response, route_name=route_name)
         logger.debug(f"AppController: Response processing complete for {request.method} {request.path}. Returning final response (status={final_response_after_middleware.status_code}).")
-        self.dispatcher.send("request_finished", sender=self, request=request, response=final_response_after_middleware)
-        logger.debug("Signal 'request_finished' sent.")
+        if self.dispatcher.has_receivers("request_finished"):
+            self.dispatcher.send("request_finished", sender=self, request=request, response=final_response_after_middleware)
+            logger.debug("Signal 'request_finished' sent.")
         return final_response_after_middleware
     
+    def _resolve_for_middleware_scopes(self, request: Request) -> Tuple[Optional[str], Any]:
+        """
+        Resolves the route before the request middlewares run, so route-scoped middlewares
+        know the route name. The outcome is reused by the normal resolution step, and is
+        available to middlewares as the 'route_resolution' context item, a (path, outcome) tuple.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            A tuple (route_name, outcome): outcome is (view, path_variables, requires_auth) on a
+            match, or the RouteNotFound/MethodNotAllowed exception to re-raise later.
+        """
+        resolve_started_ns = time.perf_counter_ns() if profiler.enabled else 0
+        try:
+            route, path_variables = self.router.resolve_route(request.path, request.method)
+            return route.name, (route.view, path_variables, route.requires_auth)
+        except (RouteNotFound, MethodNotAllowed) as e:
+            return None, e
+        finally:
+            if resolve_started_ns:
+                profiler.record(STAGE_ROUTER_RESOLVE, time.perf_counter_ns() - resolve_started_ns)
+
     def add_route(self, path: str, view: Callable, methods: Optional[List[str]] = None, name: Optional[str] = None, requires_auth: bool = True):
         logger.debug(f"AppController: Adding route {path} ({methods}) [auth: {requires_auth}] via add_route method.")
-        self.router.add_route(path, view, methods=methods, name=name, requires_auth=requires_auth)
+        route = self.router.add_route(path, view, methods=methods, name=name, requires_auth=requires_auth)
+        self._get_injection_plan(route.view, tuple(route._variable_names))
+
+    @staticmethod
+    def _session_in_use(db_session: Optional[Any]) -> bool:
+        """
+        Checks whether a request's DB session needs commit/rollback handling.
+        A LazyDBSession that was never opened has nothing to commit or roll back.
+        """
+        return bool(db_session) and getattr(db_session, 'opened', True)
+
+    def _get_injection_plan(self, view: Callable, path_variable_names: Tuple[str, ...]) -> Optional[InjectionPlan]:
+        """
+        Returns the dependency injection plan for a view, compiling it on first use.
+        Plans are compiled when routes are registered through the AppController; routes
+        added directly on the router get theirs on their first request.
+
+        Args:
+            view: The view function or class.
+            path_variable_names: The names of the path variables of the matched route, in order.
+
+        Returns:
+            The injection plan, or None if the view's signature cannot be inspected.
+        """
+        plan_key = (view, path_variable_names)
+        try:
+            return self._injection_plans[plan_key]
+        except KeyError:
+            plan = self._compile_injection_plan(view, path_variable_names)
+            self._injection_plans[plan_key] = plan
+            return plan
+
+    def _compile_injection_plan(self, view: Callable, path_variable_names: Tuple[str, ...]) -> Optional[InjectionPlan]:
+        """
+        Inspects a view's signature once and builds one resolver per parameter.
+        Each resolver takes (request, path_variables) and returns the argument value,
+        or _SKIP_PARAM for optional parameters that are not available.
+
+        Parameters are resolved in this order of precedence: path variables, available
+        dependencies, request attributes from view_param_to_request_attr_map, and 'model'
+        from the admin registry. Required parameters with no source raise TypeError at
+        request time, as before.
+
+        Args:
+            view: The view function or class.
+            path_variable_names: The names of the path variables of the matched route.
+
+        Returns:
+            A list of (parameter name, resolver) tuples, or None if the view's
+            signature cannot be inspected.
+        """
+        view_name = getattr(view, '__name__', str(view))
+        try:
+            view_params = inspect.signature(view).parameters
+        except ValueError:
+            logger.warning(f"AppController: Could not get signature for view {view_name}. It will be called with raw path_variables as fallback.")
+            return None
+
+        plan: InjectionPlan = []
+        for param_name, param in view_params.items():
+            if param_name == 'request':
+                continue
+            required = param.default == inspect.Parameter.empty
+            if param_name in path_variable_names:
+                resolver = self._path_variable_resolver(param_name)
+            elif param_name in self.available_dependencies:
+                resolver = self._dependency_resolver(param_name)
+            elif param_name in self.view_param_to_request_attr_map:
+                resolver = self._request_attr_resolver(param_name, self.view_param_to_request_attr_map[param_name], required, view_name)
+            elif param_name == 'model':
+                resolver = self._model_resolver(view_name)
+            elif required:
+                logger.warning(f"AppController: View '{view_name}' has required parameter '{param_name}' with no injection source.")
+                resolver = self._missing_param_resolver(param_name, view_name)
+            else:
+                continue
+            plan.append((param_name, resolver))
+
+        logger.debug(f"AppController: Compiled injection plan for view '{view_name}' with path variables {list(path_variable_names)}: {[name for name, _ in plan]}")
+        return plan
+
+    @staticmethod
+    def _path_variable_resolver(param_name: str) -> ParamResolver:
+        def resolve(request: Request, path_variables: Dict[str, Any]) -> Any:
+            return path_variables[param_name]
+        return resolve
+
+    def _dependency_resolver(self, param_name: str) -> ParamResolver:
+        available_dependencies = self.available_dependencies
+        def resolve(request: Request, path_variables: Dict[str, Any]) -> Any:
+            return available_dependencies[param_name]
+        return resolve
+
+    @staticmethod
+    def _request_attr_resolver(param_name: str, request_attr_name: str, required: bool, view_name: str) -> ParamResolver:
+        def resolve(request: Request, path_variables: Dict[str, Any]) -> Any:
+            try:
+                return getattr(request, request_attr_name)
+            except AttributeError:
+                if required:
+                    logger.error(f"AppController: Missing required parameter '{param_name}' (expected as request attribute '{request_attr_name}') for view '{view_name}'.")
+                    raise TypeError(f"Missing required parameter: {param_name}")
+                return _SKIP_PARAM
+        return resolve
+
+    def _model_resolver(self, view_name: str) -> ParamResolver:
+        def resolve(request: Request, path_variables: Dict[str, Any]) -> Any:
+            model_name_from_path = path_variables.get('model_name')
+            if not model_name_from_path:
+                logger.warning(f"AppController: View expects 'model' parameter, but 'model_name' path variable is missing for view '{view_name}'.")
+                raise RouteNotFound(f"Model name missing from path for view parameter 'model'.")
+            admin_registry = request.admin_registry
+            if not admin_registry:
+                logger.critical("AppController: AdminRegistry dependency missing while resolving 'model' parameter for view.")
+                raise RuntimeError("AdminRegistry dependency missing.")
+            return self._lookup_model(admin_registry, model_name_from_path)
+        return resolve
+
+    @staticmethod
+    def _missing_param_resolver(param_name: str, view_name: str) -> ParamResolver:
+        def resolve(request: Request, path_variables: Dict[str, Any]) -> Any:
+            logger.error(f"AppController: Missing required parameter '{param_name}' for view '{view_name}'.")
+            raise TypeError(f"Missing required parameter: {param_name}")
+        return resolve
+
+    def _lookup_model(self, admin_registry: Any, model_name: str) -> Any:
+        """
+        Looks up a model class in the admin registry, caching successful lookups.
+        Models cannot be unregistered, so cached entries never go stale; misses are not cached
+        so models registered later are still found.
+
+        Args:
+            admin_registry: The AdminRegistry instance from the request context.
+            model_name: The model name taken from the 'model_name' path variable.
+
+        Returns:
+            The registered model class.
+
+        Raises:
+            RouteNotFound: If the model is not registered.
+        """
+        cache_key = (id(admin_registry), model_name)
+        model_class = self._model_lookup_cache.get(cache_key)
+        if model_class is not None:
+            return model_class
+        model_class = admin_registry.get_model(model_name)
+        if not model_class:
+            logger.warning(f"AppController: Model '{model_name}' from path for view parameter 'model' not found in AdminRegistry.")
+            raise RouteNotFound(f"Model '{model_name}' not registered.")
+        self._model_lookup_cache[cache_key] = model_class
+        logger.debug(f"AppController: Resolved model '{model_name}' to class {getattr(model_class, '__name__', str(model_class))} for view parameter 'model'.")
+        return model_class
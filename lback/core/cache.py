@@ -1,59 +1,648 @@
+import functools
+import heapq
+import itertools
+import math
+import random
+import sys
 import time
 import threading
-from typing import Any, Dict, Optional, List
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, List, Tuple
 
 from lback.core.signals import dispatcher
 
 import logging
 logger = logging.getLogger(__name__)
 
+LRU = 'lru'
+LFU = 'lfu'
+TINY_LFU = 'tinylfu'
+DEFAULT_SHARDS = 16
+SWEEP_BATCH_SIZE = 16
+
+_MISSING = object()
+
+
 class CacheItem:
     """Represents an item stored in the cache with an optional expiration time."""
-    def __init__(self, value: Any, expires_at: Optional[float] = None):
+    __slots__ = ('value', 'expires_at', 'size')
+
+    def __init__(self, value: Any, expires_at: Optional[float] = None, size: int = 0):
         self.value = value
         self.expires_at = expires_at
+        self.size = size
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Checks if the cache item has expired."""
-        return self.expires_at is not None and time.time() > self.expires_at
+        return self.expires_at is not None and (now if now is not None else time.time()) > self.expires_at
 
-class Cache:
+
+class _LRUPolicy:
+    """Evicts the least recently read or written key."""
+    def __init__(self):
+        self._order: "OrderedDict[Any, None]" = OrderedDict()
+
+    def record_lookup(self, key: Any):
+        pass
+
+    def record_insert(self, key: Any):
+        self._order[key] = None
+
+    def record_access(self, key: Any):
+        self._order.move_to_end(key)
+
+    def record_remove(self, key: Any):
+        self._order.pop(key, None)
+
+    def victim(self) -> Any:
+        return next(iter(self._order), _MISSING)
+
+    def admit(self, candidate: Any, victim: Any) -> bool:
+        return True
+
+    def clear(self):
+        self._order.clear()
+
+
+class _LFUPolicy:
     """
-    A simple thread-safe in-memory cache with optional time-to-live (TTL).
-    Integrates SignalDispatcher to emit events for cache operations.
+    Evicts the least frequently used key, in O(1) using frequency buckets.
+    Ties are broken by recency within a bucket.
     """
     def __init__(self):
+        self._frequencies: Dict[Any, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Any, None]"] = {}
+        self._min_frequency = 0
+
+    def record_lookup(self, key: Any):
+        pass
+
+    def record_insert(self, key: Any):
+        self._frequencies[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+
+    def record_access(self, key: Any):
+        frequency = self._frequencies[key]
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+        self._frequencies[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def record_remove(self, key: Any):
+        frequency = self._frequencies.pop(key, None)
+        if frequency is None:
+            return
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+
+    def victim(self) -> Any:
+        if not self._buckets:
+            return _MISSING
+        if self._min_frequency not in self._buckets:
+            self._min_frequency = min(self._buckets)
+        return next(iter(self._buckets[self._min_frequency]))
+
+    def admit(self, candidate: Any, victim: Any) -> bool:
+        return True
+
+    def clear(self):
+        self._frequencies.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+
+class _FrequencySketch:
+    """
+    Count-min sketch of recent key frequencies with 4-bit saturating counters.
+    All counters are halved after 10 * width increments so old popularity fades.
+    """
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+    def __init__(self, width: int):
+        self._width = 1 << max(4, (width - 1).bit_length())
+        self._mask = self._width - 1
+        self._rows = [[0] * self._width for _ in self._SEEDS]
+        self._sample_size = 10 * self._width
+        self._additions = 0
+
+    def _indexes(self, key: Any) -> List[int]:
+        key_hash = hash(key)
+        return [(((key_hash ^ seed) * seed) >> 8) & self._mask for seed in self._SEEDS]
+
+    def increment(self, key: Any):
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            for row in self._rows:
+                for index, count in enumerate(row):
+                    row[index] = count >> 1
+            self._additions //= 2
+
+    def estimate(self, key: Any) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+
+class _TinyLFUPolicy(_LRUPolicy):
+    """
+    LRU eviction with TinyLFU admission: a new key only displaces the LRU victim
+    if the frequency sketch has seen it more often than the victim.
+    """
+    def __init__(self, capacity_hint: int):
+        super().__init__()
+        self._sketch = _FrequencySketch(capacity_hint)
+
+    def record_lookup(self, key: Any):
+        self._sketch.increment(key)
+
+    def admit(self, candidate: Any, victim: Any) -> bool:
+        return self._sketch.estimate(candidate) > self._sketch.estimate(victim)
+
+
+EVICTION_POLICIES = (LRU, LFU, TINY_LFU)
+
+
+def _make_policy(name: str, capacity_hint: int) -> Any:
+    if name == LFU:
+        return _LFUPolicy()
+    if name == TINY_LFU:
+        return _TinyLFUPolicy(capacity_hint)
+    return _LRUPolicy()
+
+
+def _estimate_size(key: Any, value: Any) -> int:
+    """Shallow size of the key and value in bytes (contained objects are not counted)."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class _CacheShard:
+    """One lock-protected partition of the cache with its own eviction policy and limits."""
+    def __init__(self, max_entries: Optional[int], max_bytes: Optional[int], policy: Any):
+        self.lock = threading.Lock()
+        self.items: Dict[Any, CacheItem] = {}
+        self.policy = policy
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._expiry_heap: List[Tuple[float, int, Any]] = []
+        self._sequence = itertools.count()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.sets = 0
+        self.deletes = 0
+
+    def _remove_locked(self, key: Any) -> Optional[CacheItem]:
+        item = self.items.pop(key, None)
+        if item is not None:
+            self.total_bytes -= item.size
+            self.policy.record_remove(key)
+        return item
+
+    def _over_limit_locked(self, incoming_size: int) -> bool:
+        if self.max_entries is not None and len(self.items) >= self.max_entries:
+            return True
+        return self.max_bytes is not None and self.total_bytes + incoming_size > self.max_bytes
+
+    def sweep_locked(self, now: float, limit: Optional[int]) -> List[Any]:
+        """Removes expired items in expiry order, up to limit items (None for all)."""
+        expired: List[Any] = []
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now and (limit is None or len(expired) < limit):
+            expires_at, _, key = heapq.heappop(heap)
+            item = self.items.get(key)
+            if item is not None and item.expires_at == expires_at:
+                self._remove_locked(key)
+                expired.append(key)
+        self.expirations += len(expired)
+        if len(heap) > 2 * len(self.items) + 64:
+            self._expiry_heap = [entry for entry in heap if entry[2] in self.items and self.items[entry[2]].expires_at == entry[0]]
+            heapq.heapify(self._expiry_heap)
+        return expired
+
+    def store_locked(self, key: Any, item: CacheItem, now: float) -> Tuple[bool, List[Any], List[Any]]:
+        """
+        Stores an item, evicting others if the shard is full.
+
+        Returns:
+            (stored, evicted keys, expired keys). stored is False if the item is larger than
+            the shard's byte budget or the admission policy rejected it.
+        """
+        self.policy.record_lookup(key)
+        expired = self.sweep_locked(now, SWEEP_BATCH_SIZE)
+        evicted: List[Any] = []
+        resident = self._remove_locked(key) is not None
+
+        if self.max_bytes is not None and item.size > self.max_bytes:
+            return False, evicted, expired
+
+        while self._over_limit_locked(item.size):
+            victim = self.policy.victim()
+            if victim is _MISSING:
+                break
+            if not resident and not self.policy.admit(key, victim):
+                return False, evicted, expired
+            self._remove_locked(victim)
+            evicted.append(victim)
+            self.evictions += 1
+
+        self.items[key] = item
+        self.total_bytes += item.size
+        self.sets += 1
+        self.policy.record_insert(key)
+        if item.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (item.expires_at, next(self._sequence), key))
+        return True, evicted, expired
+
+    def clear_locked(self) -> int:
+        count = len(self.items)
+        self.items.clear()
+        self.policy.clear()
+        self.total_bytes = 0
+        self._expiry_heap.clear()
+        return count
+
+
+class MemoizedValue:
+    """
+    A value stored by Cache.get_or_set(), with what is needed for early and stale refreshes.
+    Cache.get() unwraps it, so callers only ever see the value.
+    """
+    __slots__ = ('value', 'delta', 'expires_at')
+
+    def __init__(self, value: Any, delta: float, expires_at: Optional[float]):
+        self.value = value
+        self.delta = delta
+        self.expires_at = expires_at
+
+    def __getstate__(self) -> Tuple[Any, float, Optional[float]]:
+        return self.value, self.delta, self.expires_at
+
+    def __setstate__(self, state: Tuple[Any, float, Optional[float]]):
+        self.value, self.delta, self.expires_at = state
+
+
+class _Flight:
+    """One in-progress computation of a key, shared by every thread asking for it."""
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class BaseCacheBackend:
+    """
+    Storage interface behind Cache. Implementations must be safe to call from several threads
+    and keep their own operation counters for stats().
+    """
+    name = 'base'
+
+    def get(self, key: Any) -> Tuple[bool, Any, Optional[float]]:
+        """
+        Looks up a key.
+
+        Returns:
+            (found, value, expired_at). expired_at is set if the key was present but had
+            expired (it is removed), otherwise None.
+        """
+        raise NotImplementedError
+
+    def set(self, key: Any, value: Any, ttl: Optional[float]) -> Tuple[bool, List[Any]]:
+        """
+        Stores a value.
+
+        Returns:
+            (stored, evicted keys). Backends that cannot tell which keys they evicted return an empty list.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: Any) -> bool:
+        """Removes a key. Returns True if it was present."""
+        raise NotImplementedError
+
+    def has(self, key: Any) -> bool:
+        """Returns True if the key is present and not expired."""
+        raise NotImplementedError
+
+    def keys(self) -> List[Any]:
+        """Returns all non-expired keys."""
+        raise NotImplementedError
+
+    def clear(self) -> int:
+        """Removes all keys. Returns the number removed."""
+        raise NotImplementedError
+
+    def sweep(self) -> int:
+        """Removes expired keys. Returns the number removed."""
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns hits, misses, expirations, evictions, sets, deletes, entries and bytes."""
+        raise NotImplementedError
+
+    def close(self):
+        """Releases background threads or connections held by the backend."""
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """
+    Per-process in-memory store. Keys are spread over lock-striped shards so that concurrent
+    threads rarely contend, and each shard has its own eviction policy and share of the limits.
+    """
+    name = 'memory'
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 eviction_policy: str = LRU, shards: int = DEFAULT_SHARDS, sweep_interval: Optional[float] = None):
+        """
+        Initializes the store.
+
+        Limits are split evenly across shards, so the store may start evicting slightly
+        before it holds max_entries keys if keys hash unevenly.
+
+        Args:
+            max_entries: Maximum number of keys kept, or None for no limit.
+            max_bytes: Maximum approximate size of keys and values in bytes, or None for no limit.
+                       Sizes are shallow (sys.getsizeof), so nested containers are undercounted.
+            eviction_policy: 'lru', 'lfu' or 'tinylfu' (LRU eviction with frequency-based admission).
+            shards: Number of independently locked partitions.
+            sweep_interval: If set, a daemon thread removes expired items every sweep_interval
+                            seconds. Writes always sweep a few expired items from their shard.
+
+        Raises:
+            ValueError: If an argument is out of range or the eviction policy is unknown.
+        """
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown cache eviction policy: '{eviction_policy}'. Use one of {', '.join(EVICTION_POLICIES)}.")
+        if not isinstance(shards, int) or shards < 1:
+            raise ValueError(f"Cache shards must be a positive integer, got {shards!r}.")
+        for name, limit in (("max_entries", max_entries), ("max_bytes", max_bytes), ("sweep_interval", sweep_interval)):
+            if limit is not None and limit <= 0:
+                raise ValueError(f"Cache {name} must be positive or None, got {limit!r}.")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        shard_entries = -(-max_entries // shards) if max_entries is not None else None
+        shard_bytes = -(-max_bytes // shards) if max_bytes is not None else None
+        self._shards = [
+            _CacheShard(shard_entries, shard_bytes, _make_policy(eviction_policy, shard_entries or 1024))
+            for _ in range(shards)
+        ]
+        self._shard_count = shards
+
+        self._sweeper_stop: Optional[threading.Event] = None
+        if sweep_interval is not None:
+            self._sweeper_stop = threading.Event()
+            sweeper = threading.Thread(
+                target=MemoryCacheBackend._sweeper_loop, args=(weakref.ref(self), self._sweeper_stop, sweep_interval),
+                name="lback-cache-sweeper", daemon=True,
+            )
+            sweeper.start()
+
+    def _shard_for(self, key: Any) -> _CacheShard:
+        return self._shards[hash(key) % self._shard_count]
+
+    @staticmethod
+    def _sweeper_loop(backend_ref: "weakref.ref[MemoryCacheBackend]", stop: threading.Event, interval: float):
+        while not stop.wait(interval):
+            backend = backend_ref()
+            if backend is None:
+                return
+            backend.sweep()
+            del backend
+
+    def get(self, key: Any) -> Tuple[bool, Any, Optional[float]]:
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.policy.record_lookup(key)
+            item = shard.items.get(key)
+            if item is None:
+                shard.misses += 1
+                return False, None, None
+            if item.is_expired():
+                shard._remove_locked(key)
+                shard.misses += 1
+                shard.expirations += 1
+                return False, None, item.expires_at
+            shard.policy.record_access(key)
+            shard.hits += 1
+            return True, item.value, None
+
+    def set(self, key: Any, value: Any, ttl: Optional[float]) -> Tuple[bool, List[Any]]:
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        size = _estimate_size(key, value) if self.max_bytes is not None else 0
+        shard = self._shard_for(key)
+        with shard.lock:
+            stored, evicted, _ = shard.store_locked(key, CacheItem(value, expires_at, size), now)
+        return stored, evicted
+
+    def delete(self, key: Any) -> bool:
+        shard = self._shard_for(key)
+        with shard.lock:
+            deleted = shard._remove_locked(key) is not None
+            if deleted:
+                shard.deletes += 1
+        return deleted
+
+    def has(self, key: Any) -> bool:
+        shard = self._shard_for(key)
+        with shard.lock:
+            item = shard.items.get(key)
+            return item is not None and not item.is_expired()
+
+    def keys(self) -> List[Any]:
+        now = time.time()
+        active_keys: List[Any] = []
+        for shard in self._shards:
+            with shard.lock:
+                active_keys.extend(k for k, v in shard.items.items() if not v.is_expired(now))
+        return active_keys
+
+    def clear(self) -> int:
+        cleared_count = 0
+        for shard in self._shards:
+            with shard.lock:
+                cleared_count += shard.clear_locked()
+        return cleared_count
+
+    def sweep(self) -> int:
+        now = time.time()
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += len(shard.sweep_locked(now, None))
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {'hits': 0, 'misses': 0, 'expirations': 0, 'evictions': 0, 'sets': 0, 'deletes': 0, 'entries': 0, 'bytes': 0}
+        for shard in self._shards:
+            with shard.lock:
+                stats['hits'] += shard.hits
+                stats['misses'] += shard.misses
+                stats['expirations'] += shard.expirations
+                stats['evictions'] += shard.evictions
+                stats['sets'] += shard.sets
+                stats['deletes'] += shard.deletes
+                stats['entries'] += len(shard.items)
+                stats['bytes'] += shard.total_bytes
+        stats['shards'] = self._shard_count
+        stats['eviction_policy'] = self.eviction_policy
+        return stats
+
+    def close(self):
+        if self._sweeper_stop is not None:
+            self._sweeper_stop.set()
+
+    def __len__(self) -> int:
+        return sum(len(shard.items) for shard in self._shards)
+
+
+class Cache:
+    """
+    A thread-safe cache with optional time-to-live (TTL), in front of a storage backend.
+    By default the backend is a per-process MemoryCacheBackend; see Cache.from_config()
+    and lback.core.cache_backends for stores shared between worker processes.
+
+    Hit, miss, expiration, eviction, set and delete counts are kept as counters and
+    reported by stats(). Per-operation signals ('cache_hit', 'cache_item_set', ...) are
+    only built and sent when a receiver is connected to them, optionally for a sample
+    of operations.
+    """
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 eviction_policy: str = LRU, shards: int = DEFAULT_SHARDS, sweep_interval: Optional[float] = None,
+                 signal_sample_rate: float = 1.0, backend: Optional[BaseCacheBackend] = None):
         """
         Initializes the Cache.
         Emits 'cache_initialized' signal.
+
+        Args:
+            max_entries, max_bytes, eviction_policy, shards, sweep_interval: Options for the
+                default MemoryCacheBackend. Ignored when a backend is given.
+            signal_sample_rate: Fraction of get/set operations that send per-operation signals
+                                to connected receivers. 1.0 sends for every operation, 0.0 never.
+            backend: The storage backend. Defaults to a new MemoryCacheBackend.
+
+        Raises:
+            ValueError: If an argument is out of range or the eviction policy is unknown.
+        """
+        if not 0.0 <= signal_sample_rate <= 1.0:
+            raise ValueError(f"Cache signal_sample_rate must be between 0.0 and 1.0, got {signal_sample_rate!r}.")
+        if backend is None:
+            backend = MemoryCacheBackend(max_entries=max_entries, max_bytes=max_bytes, eviction_policy=eviction_policy,
+                                         shards=shards, sweep_interval=sweep_interval)
+        self.backend = backend
+        self.signal_sample_rate = signal_sample_rate
+        self._flights: Dict[Any, _Flight] = {}
+        self._flights_lock = threading.Lock()
+
+        logger.info(f"Cache initialized with '{backend.name}' backend.")
+        self._send("cache_initialized")
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'Cache':
+        """
+        Creates a Cache with the backend selected by CACHE_BACKEND ('memory', 'sqlite' or 'redis').
+
+        Args:
+            config: The Config instance. Reads CACHE_BACKEND, CACHE_LOCATION, CACHE_KEY_PREFIX,
+                    CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_EVICTION_POLICY and CACHE_SHARDS.
+
+        Returns:
+            A new Cache.
+
+        Raises:
+            ConfigurationError: If CACHE_BACKEND is unknown or CACHE_LOCATION is missing.
         """
-        self._cache: Dict[Any, CacheItem] = {}
-        self._lock = threading.Lock()
-        logger.info("Cache initialized.")
-        dispatcher.send("cache_initialized", sender=self)
-        logger.debug("Signal 'cache_initialized' sent.")
+        from lback.core.cache_backends import backend_from_config
+        return cls(backend=backend_from_config(config))
 
+    def _send(self, signal_name: str, **kwargs: Any):
+        if dispatcher.has_receivers(signal_name):
+            dispatcher.send(signal_name, sender=self, **kwargs)
+            logger.debug(f"Signal '{signal_name}' sent.")
+
+    def _sampled(self) -> bool:
+        rate = self.signal_sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    @property
+    def eviction_policy(self) -> Optional[str]:
+        return getattr(self.backend, 'eviction_policy', None)
+
+    def close(self):
+        """Stops background threads and closes connections held by the backend."""
+        self.backend.close()
+
+    def sweep(self) -> int:
+        """
+        Removes all expired items.
+        Emits 'cache_swept' signal.
+
+        Returns:
+            The number of items removed.
+        """
+        removed = self.backend.sweep()
+        logger.debug(f"Cache sweep removed {removed} expired item(s).")
+        self._send("cache_swept", expired_count=removed)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns aggregated cache counters.
+
+        Returns:
+            A dictionary with hits, misses, hit_rate, expirations, evictions, sets, deletes,
+            entries (including expired items not yet swept), bytes (only tracked when
+            max_bytes is set) and backend, plus backend-specific figures such as shards and
+            eviction_policy. Counters of shared backends cover this process only.
+        """
+        stats = self.backend.stats()
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['backend'] = self.backend.name
+        return stats
 
     def set(self, key: Any, value: Any, ttl: Optional[int] = None):
         """
         Sets a key-value pair in the cache with an optional time-to-live (TTL).
-        Emits 'cache_item_set' signal.
+        Evicts other keys if the cache is full.
+        Emits 'cache_item_set' signal, and 'cache_item_evicted' for each evicted key.
 
         Args:
             key: The cache key.
             value: The value to store.
             ttl (Optional[int]): The time-to-live in seconds. If None, the item does not expire.
         """
-        expires_at = time.time() + ttl if ttl is not None else None
-        logger.debug(f"Attempting to set cache key '{key}' with TTL: {ttl} seconds.")
         try:
-            with self._lock:
-                self._cache[key] = CacheItem(value, expires_at)
-            logger.info(f"Cache key '{key}' set successfully.")
-            dispatcher.send("cache_item_set", sender=self, key=key, ttl=ttl, expires_at=expires_at)
-            logger.debug(f"Signal 'cache_item_set' sent for key '{key}'.")
+            stored, evicted = self.backend.set(key, value, ttl)
         except Exception as e:
             logger.exception(f"Error setting cache key '{key}': {e}")
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache key '{key}' {'set' if stored else 'not stored (too large or not admitted)'} with TTL: {ttl} seconds. Evicted: {len(evicted)}.")
+        if self._sampled():
+            if evicted and dispatcher.has_receivers("cache_item_evicted"):
+                for evicted_key in evicted:
+                    dispatcher.send("cache_item_evicted", sender=self, key=evicted_key, policy=self.eviction_policy)
+            if stored and dispatcher.has_receivers("cache_item_set"):
+                dispatcher.send("cache_item_set", sender=self, key=key, ttl=ttl, expires_at=time.time() + ttl if ttl is not None else None)
 
     def get(self, key: Any) -> Optional[Any]:
         """
@@ -67,45 +656,137 @@ class Cache:
         Returns:
             The value associated with the key, or None if the key is not found or expired.
         """
-        logger.debug(f"Attempting to get cache key '{key}'.")
-        item = None
-        value = None
-        outcome = "miss"
+        value = self._fetch(key)
+        return value.value if type(value) is MemoizedValue else value
 
+    def _fetch(self, key: Any) -> Any:
         try:
-            with self._lock:
-                item = self._cache.get(key)
-
-                if not item:
-                    logger.debug(f"Cache miss for key '{key}': Key not found.")
-                    outcome = "miss"
-                elif item.is_expired():
-                    logger.debug(f"Cache miss for key '{key}': Item expired.")
-
-                    dispatcher.send("cache_item_expired", sender=self, key=key, expires_at=item.expires_at)
-                    logger.debug(f"Signal 'cache_item_expired' sent for key '{key}'.")
-                    del self._cache[key]
-                    outcome = "miss"
-                else:
-                    value = item.value
-                    logger.debug(f"Cache hit for key '{key}'.")
-                    outcome = "hit"
-
+            found, value, expired_at = self.backend.get(key)
+            outcome = "hit" if found else "miss"
         except Exception as e:
             logger.exception(f"Error getting cache key '{key}': {e}")
-            outcome = "error"
+            value, expired_at, outcome = None, None, "error"
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache {outcome} for key '{key}'{' (expired)' if expired_at is not None else ''}.")
+        if self._sampled():
+            if expired_at is not None and dispatcher.has_receivers("cache_item_expired"):
+                dispatcher.send("cache_item_expired", sender=self, key=key, expires_at=expired_at)
+            if dispatcher.has_receivers("cache_item_fetched"):
+                dispatcher.send("cache_item_fetched", sender=self, key=key, outcome=outcome)
+            if outcome == "hit":
+                if dispatcher.has_receivers("cache_hit"):
+                    dispatcher.send("cache_hit", sender=self, key=key)
+            elif outcome == "miss":
+                if dispatcher.has_receivers("cache_miss"):
+                    dispatcher.send("cache_miss", sender=self, key=key)
 
-        dispatcher.send("cache_item_fetched", sender=self, key=key, outcome=outcome)
-        logger.debug(f"Signal 'cache_item_fetched' sent for key '{key}'. Outcome: {outcome}.")
+        return value
 
-        if outcome == "hit":
-             dispatcher.send("cache_hit", sender=self, key=key)
-             logger.debug(f"Signal 'cache_hit' sent for key '{key}'.")
-        elif outcome == "miss":
-             dispatcher.send("cache_miss", sender=self, key=key)
-             logger.debug(f"Signal 'cache_miss' sent for key '{key}'.")
+    def get_or_set(self, key: Any, factory: Callable[[], Any], ttl: Optional[float] = None,
+                   stale_ttl: float = 0, beta: float = 1.0, wait_timeout: Optional[float] = None) -> Any:
+        """
+        Returns the cached value for key, computing and storing it with factory() if needed.
 
-        return value
+        Only one thread per process computes a given key at a time; other threads asking for
+        the same key wait for that result instead of calling factory() again. To avoid a
+        burst of recomputation when a hot key expires:
+
+        * Probabilistic early expiration (XFetch): shortly before expiry, each read has a small
+          chance of refreshing the value, rising as expiry approaches and with how long
+          factory() took last time. beta scales this; 0 disables it.
+        * Stale-while-revalidate: with stale_ttl > 0, a value is kept stale_ttl seconds past
+          its ttl. Reads in that window get the stale value at once while one background
+          thread refreshes it. Early refreshes also run in the background in this mode.
+
+        Emits 'cache_value_computed' signal after each call to factory().
+
+        Args:
+            key: The cache key.
+            factory: Zero-argument callable producing the value.
+            ttl: Seconds the value is fresh, or None to keep it until evicted.
+            stale_ttl: Seconds a value may be served stale while it is refreshed.
+            beta: XFetch aggressiveness. 1.0 is the usual choice.
+            wait_timeout: Maximum seconds to wait for another thread's computation before
+                          computing the value in this thread as well. None waits indefinitely.
+
+        Returns:
+            The cached or newly computed value.
+
+        Raises:
+            Exception: Whatever factory() raised, in the computing thread and in the threads waiting on it.
+        """
+        entry = self._fetch(key)
+        if type(entry) is MemoizedValue:
+            if entry.expires_at is None:
+                return entry.value
+            now = time.time()
+            if now < entry.expires_at:
+                if beta > 0 and entry.delta > 0 and now - entry.delta * beta * math.log(1.0 - random.random()) >= entry.expires_at:
+                    if stale_ttl > 0:
+                        self._refresh_in_background(key, factory, ttl, stale_ttl)
+                    else:
+                        flight, leader = self._join_flight(key, blocking=False)
+                        if leader:
+                            return self._compute(key, factory, ttl, stale_ttl, flight)
+                return entry.value
+            if stale_ttl > 0:
+                self._refresh_in_background(key, factory, ttl, stale_ttl)
+                return entry.value
+
+        flight, leader = self._join_flight(key)
+        if leader:
+            return self._compute(key, factory, ttl, stale_ttl, flight)
+        if not flight.done.wait(wait_timeout):
+            logger.warning(f"Timed out waiting for another thread to compute cache key '{key}'. Computing it here.")
+            return self._compute(key, factory, ttl, stale_ttl, None)
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def _join_flight(self, key: Any, blocking: bool = True) -> Tuple[Optional[_Flight], bool]:
+        """Returns (flight, True) if this thread should compute key, else the flight in progress (or None if not blocking)."""
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return (flight if blocking else None), False
+            flight = _Flight()
+            self._flights[key] = flight
+            return flight, True
+
+    def _compute(self, key: Any, factory: Callable[[], Any], ttl: Optional[float], stale_ttl: float, flight: Optional[_Flight]) -> Any:
+        try:
+            start = time.perf_counter()
+            value = factory()
+            delta = time.perf_counter() - start
+            expires_at = time.time() + ttl if ttl is not None else None
+            self.set(key, MemoizedValue(value, delta, expires_at), ttl=ttl + stale_ttl if ttl is not None else None)
+            self._send("cache_value_computed", key=key, duration=delta)
+            if flight is not None:
+                flight.value = value
+            return value
+        except BaseException as e:
+            if flight is not None:
+                flight.error = e
+            raise
+        finally:
+            if flight is not None:
+                with self._flights_lock:
+                    self._flights.pop(key, None)
+                flight.done.set()
+
+    def _refresh_in_background(self, key: Any, factory: Callable[[], Any], ttl: Optional[float], stale_ttl: float):
+        flight, leader = self._join_flight(key, blocking=False)
+        if not leader:
+            return
+
+        def refresh():
+            try:
+                self._compute(key, factory, ttl, stale_ttl, flight)
+            except Exception as e:
+                logger.error(f"Background refresh of cache key '{key}' failed: {e}", exc_info=True)
+
+        threading.Thread(target=refresh, name="lback-cache-refresh", daemon=True).start()
 
 
     def delete(self, key: Any):
@@ -116,20 +797,12 @@ class Cache:
         Args:
             key: The cache key to delete.
         """
-        logger.debug(f"Attempting to delete cache key '{key}'.")
-        deleted = False
         try:
-            with self._lock:
-                if key in self._cache:
-                    del self._cache[key]
-                    deleted = True
-                    logger.info(f"Cache key '{key}' deleted successfully.")
-                else:
-                    logger.debug(f"Cache key '{key}' not found for deletion.")
-
-            if deleted:
-                 dispatcher.send("cache_item_deleted", sender=self, key=key)
-                 logger.debug(f"Signal 'cache_item_deleted' sent for key '{key}'.")
+            if self.backend.delete(key):
+                 logger.debug(f"Cache key '{key}' deleted successfully.")
+                 self._send("cache_item_deleted", key=key)
+            else:
+                 logger.debug(f"Cache key '{key}' not found for deletion.")
 
         except Exception as e:
             logger.exception(f"Error deleting cache key '{key}': {e}")
@@ -137,17 +810,14 @@ class Cache:
 
     def clear(self):
         """
-        Clears all items from the cache.
+        Clears all items from the cache. Counters are kept.
         Emits 'cache_cleared' signal.
         """
         logger.info("Attempting to clear the entire cache.")
-        initial_count = len(self._cache)
         try:
-            with self._lock:
-                self._cache.clear()
-            logger.info("Cache cleared successfully.")
-            dispatcher.send("cache_cleared", sender=self, cleared_count=initial_count)
-            logger.debug(f"Signal 'cache_cleared' sent. Cleared {initial_count} items.")
+            cleared_count = self.backend.clear()
+            logger.info(f"Cache cleared successfully. Cleared {cleared_count} items.")
+            self._send("cache_cleared", cleared_count=cleared_count)
 
         except Exception as e:
             logger.exception(f"Error clearing cache: {e}")
@@ -157,6 +827,7 @@ class Cache:
         """
         Checks if a key exists in the cache and is not expired.
         # No signals here, as this is a simple status check.
+        Does not count as a use of the key for eviction or in stats().
 
         Args:
             key: The cache key to check.
@@ -164,12 +835,11 @@ class Cache:
         Returns:
             True if the key exists and is not expired, False otherwise.
         """
-        logger.debug(f"Checking if cache key '{key}' exists and is not expired.")
-        with self._lock:
-            item = self._cache.get(key)
-            exists_and_not_expired = item is not None and not item.is_expired()
-            logger.debug(f"Cache key '{key}' exists and is not expired: {exists_and_not_expired}")
-            return exists_and_not_expired
+        try:
+            return self.backend.has(key)
+        except Exception as e:
+            logger.exception(f"Error checking cache key '{key}': {e}")
+            return False
 
 
     def keys(self) -> List[Any]:
@@ -180,9 +850,80 @@ class Cache:
         Returns:
             A list of cache keys.
         """
-        logger.debug("Getting all non-expired cache keys.")
-        with self._lock:
-            active_keys = [k for k, v in self._cache.items() if not v.is_expired()]
-            logger.debug(f"Found {len(active_keys)} non-expired cache keys.")
-            return active_keys
+        active_keys = self.backend.keys()
+        logger.debug(f"Found {len(active_keys)} non-expired cache keys.")
+        return active_keys
+
+    def __len__(self) -> int:
+        """Number of stored items, including expired items not yet swept."""
+        return len(self.backend)
 
+    @property
+    def total_bytes(self) -> int:
+        """Approximate size of stored keys and values (only tracked by the memory backend when max_bytes is set)."""
+        return self.backend.stats().get('bytes', 0)
+
+
+_default_cache: Optional[Cache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache() -> Cache:
+    """
+    Returns the server's cache once core components are initialized, otherwise a
+    process-wide in-memory Cache created on first use.
+    """
+    global _default_cache
+    server_module = sys.modules.get('lback.core.server')
+    server_cache = getattr(server_module, 'cache', None) if server_module is not None else None
+    if server_cache is not None:
+        return server_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = Cache()
+        return _default_cache
+
+
+def cached(ttl: Optional[float] = None, key: Any = None, cache: Optional[Cache] = None,
+           stale_ttl: float = 0, beta: float = 1.0) -> Callable[[Callable], Callable]:
+    """
+    Decorator that memoizes a function with Cache.get_or_set(), including its stampede protection.
+
+    The decorated function gains cache_key(*args, **kwargs) and invalidate(*args, **kwargs).
+
+    Args:
+        ttl: Seconds a result stays fresh, or None to keep it until evicted.
+        key: How to build the cache key from the call arguments: a format string such as
+             "product:{0}" or "user:{user_id}", or a callable taking the same arguments as
+             the function. Defaults to the function's qualified name plus repr() of the
+             arguments. Pass an explicit key when arguments (such as a Request) have no
+             stable repr().
+        cache: The Cache to use. Defaults to default_cache(), resolved at call time.
+        stale_ttl: See Cache.get_or_set().
+        beta: See Cache.get_or_set().
+
+    Returns:
+        The decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        prefix = f"{func.__module__}.{func.__qualname__}"
+
+        def cache_key(*args: Any, **kwargs: Any) -> Any:
+            if key is None:
+                return f"{prefix}:{args!r}:{sorted(kwargs.items())!r}"
+            if callable(key):
+                return key(*args, **kwargs)
+            return key.format(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            target = cache if cache is not None else default_cache()
+            return target.get_or_set(cache_key(*args, **kwargs), lambda: func(*args, **kwargs), ttl=ttl, stale_ttl=stale_ttl, beta=beta)
+
+        def invalidate(*args: Any, **kwargs: Any):
+            (cache if cache is not None else default_cache()).delete(cache_key(*args, **kwargs))
+
+        wrapper.cache_key = cache_key
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
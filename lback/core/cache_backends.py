@@ -0,0 +1,424 @@
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from lback.core.cache import BaseCacheBackend, MemoryCacheBackend, DEFAULT_SHARDS, LRU
+from lback.core.exceptions import CacheBackendError, ConfigurationError
+
+import logging
+logger = logging.getLogger(__name__)
+
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+SQLITE_TRIM_INTERVAL = 64
+REDIS_SCAN_COUNT = 1000
+
+
+def _storage_key(key: Any) -> str:
+    """Shared stores need string keys; non-string keys are stored by their repr()."""
+    return key if isinstance(key, str) else repr(key)
+
+
+class _ProcessCounters:
+    """Operation counters for shared backends. They cover the current process only."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {'hits': 0, 'misses': 0, 'expirations': 0, 'evictions': 0, 'sets': 0, 'deletes': 0}
+
+    def add(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counts[name] += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.counts)
+
+
+class _PerThreadConnections:
+    """
+    Keeps one connection per thread and per process, so connections are never shared
+    between threads or inherited across fork() by pre-forking servers.
+    """
+    def __init__(self, factory: Any):
+        self._factory = factory
+        self._local = threading.local()
+
+    def get(self) -> Any:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = self._factory()
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def discard(self):
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = None
+        if connection is not None and self._local.pid == os.getpid():
+            try:
+                connection.close()
+            except Exception as e:
+                logger.debug(f"Error closing cache backend connection: {e}")
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """
+    Cache store in a SQLite file shared by every worker process on the host.
+
+    The database runs in WAL mode so readers do not block each other or the writer, and
+    is memory-mapped so that processes read cached pages from the shared OS page cache
+    instead of keeping private copies. Values are pickled, so only point this at files
+    that untrusted users cannot write.
+    """
+    name = 'sqlite'
+
+    def __init__(self, path: str, max_entries: Optional[int] = None, key_prefix: str = '', timeout: float = 5.0):
+        """
+        Opens (and creates if needed) the cache database.
+
+        Args:
+            path: The SQLite database file.
+            max_entries: Approximate maximum number of keys. The oldest-written keys are
+                         removed every few writes once the limit is exceeded.
+            key_prefix: Prefix added to every key, to share one file between applications.
+                        max_entries, sweep() and clear() only touch keys with this prefix.
+            timeout: Seconds to wait for a lock held by another process.
+        """
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError(f"Cache max_entries must be positive or None, got {max_entries!r}.")
+        self.path = path
+        self.max_entries = max_entries
+        self.key_prefix = key_prefix
+        self.timeout = timeout
+        self._trim_interval = max(1, min(SQLITE_TRIM_INTERVAL, (max_entries or SQLITE_TRIM_INTERVAL) // 10))
+        self._sets_since_trim = 0
+        self._trim_lock = threading.Lock()
+        self._counters = _ProcessCounters()
+        self._connections = _PerThreadConnections(self._connect)
+        connection = self._connections.get()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS lback_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL, stored_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS lback_cache_expires_at ON lback_cache (expires_at)")
+        connection.execute("CREATE INDEX IF NOT EXISTS lback_cache_stored_at ON lback_cache (stored_at)")
+        logger.info(f"SQLiteCacheBackend using '{path}' (max_entries={max_entries}).")
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        return connection
+
+    def _key(self, key: Any) -> str:
+        return self.key_prefix + _storage_key(key)
+
+    def get(self, key: Any) -> Tuple[bool, Any, Optional[float]]:
+        storage_key = self._key(key)
+        connection = self._connections.get()
+        row = connection.execute("SELECT value, expires_at FROM lback_cache WHERE key = ?", (storage_key,)).fetchone()
+        if row is None:
+            self._counters.add('misses')
+            return False, None, None
+        value, expires_at = row
+        if expires_at is not None and time.time() > expires_at:
+            connection.execute("DELETE FROM lback_cache WHERE key = ? AND expires_at = ?", (storage_key, expires_at))
+            self._counters.add('misses')
+            self._counters.add('expirations')
+            return False, None, expires_at
+        self._counters.add('hits')
+        return True, pickle.loads(value), None
+
+    def set(self, key: Any, value: Any, ttl: Optional[float]) -> Tuple[bool, List[Any]]:
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        connection = self._connections.get()
+        connection.execute(
+            "INSERT OR REPLACE INTO lback_cache (key, value, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+            (self._key(key), sqlite3.Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)), expires_at, now),
+        )
+        self._counters.add('sets')
+        if self.max_entries is not None:
+            with self._trim_lock:
+                self._sets_since_trim += 1
+                trim_due = self._sets_since_trim >= self._trim_interval
+                if trim_due:
+                    self._sets_since_trim = 0
+            if trim_due:
+                self._trim(connection, now)
+        return True, []
+
+    def _trim(self, connection: sqlite3.Connection, now: float):
+        prefix = (len(self.key_prefix), self.key_prefix)
+        expired = connection.execute(
+            "DELETE FROM lback_cache WHERE substr(key, 1, ?) = ? AND expires_at < ?", prefix + (now,)
+        ).rowcount
+        evicted = connection.execute(
+            "DELETE FROM lback_cache WHERE key IN (SELECT key FROM lback_cache WHERE substr(key, 1, ?) = ? "
+            "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            prefix + (self.max_entries,),
+        ).rowcount
+        self._counters.add('expirations', max(0, expired))
+        self._counters.add('evictions', max(0, evicted))
+
+    def delete(self, key: Any) -> bool:
+        deleted = self._connections.get().execute("DELETE FROM lback_cache WHERE key = ?", (self._key(key),)).rowcount > 0
+        if deleted:
+            self._counters.add('deletes')
+        return deleted
+
+    def has(self, key: Any) -> bool:
+        row = self._connections.get().execute(
+            "SELECT 1 FROM lback_cache WHERE key = ? AND (expires_at IS NULL OR expires_at >= ?)", (self._key(key), time.time())
+        ).fetchone()
+        return row is not None
+
+    def keys(self) -> List[Any]:
+        rows = self._connections.get().execute(
+            "SELECT key FROM lback_cache WHERE substr(key, 1, ?) = ? AND (expires_at IS NULL OR expires_at >= ?)",
+            (len(self.key_prefix), self.key_prefix, time.time()),
+        ).fetchall()
+        return [row[0][len(self.key_prefix):] for row in rows]
+
+    def clear(self) -> int:
+        return self._connections.get().execute(
+            "DELETE FROM lback_cache WHERE substr(key, 1, ?) = ?", (len(self.key_prefix), self.key_prefix)
+        ).rowcount
+
+    def sweep(self) -> int:
+        removed = self._connections.get().execute(
+            "DELETE FROM lback_cache WHERE substr(key, 1, ?) = ? AND expires_at < ?",
+            (len(self.key_prefix), self.key_prefix, time.time()),
+        ).rowcount
+        self._counters.add('expirations', max(0, removed))
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._counters.snapshot()
+        stats['entries'] = self._connections.get().execute(
+            "SELECT COUNT(*) FROM lback_cache WHERE substr(key, 1, ?) = ?", (len(self.key_prefix), self.key_prefix)
+        ).fetchone()[0]
+        stats['bytes'] = 0
+        stats['location'] = self.path
+        return stats
+
+    def close(self):
+        self._connections.discard()
+
+    def __len__(self) -> int:
+        return self.stats()['entries']
+
+
+class _RESPConnection:
+    """A blocking connection speaking the Redis serialization protocol (RESP2)."""
+    def __init__(self, host: str, port: int, timeout: float):
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile('rb')
+
+    @staticmethod
+    def _encode(arguments: Tuple[Any, ...]) -> bytes:
+        parts = [b'*%d\r\n' % len(arguments)]
+        for argument in arguments:
+            if isinstance(argument, str):
+                argument = argument.encode('utf-8')
+            elif not isinstance(argument, bytes):
+                argument = str(argument).encode('ascii')
+            parts.append(b'$%d\r\n' % len(argument))
+            parts.append(argument)
+            parts.append(b'\r\n')
+        return b''.join(parts)
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b'\r\n'):
+            raise ConnectionError("Cache server closed the connection.")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b'+':
+            return body.decode('utf-8')
+        if prefix == b'-':
+            raise CacheBackendError(body.decode('utf-8', 'replace'))
+        if prefix == b':':
+            return int(body)
+        if prefix == b'$':
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("Cache server closed the connection.")
+            return data[:-2]
+        if prefix == b'*':
+            count = int(body)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        raise CacheBackendError(f"Unexpected reply from cache server: {line!r}")
+
+    def execute(self, *arguments: Any) -> Any:
+        self._socket.sendall(self._encode(arguments))
+        return self._read_reply()
+
+    def close(self):
+        try:
+            self._reader.close()
+        finally:
+            self._socket.close()
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """
+    Cache store on a server speaking the Redis protocol (Redis, Valkey, KeyDB, ...), shared by
+    every process that connects to it. Uses a small built-in RESP client, so no client library
+    is required. Expiry is handled by the server. Values are pickled, so only use a server
+    that untrusted clients cannot write to.
+    """
+    name = 'redis'
+
+    def __init__(self, url: str = 'redis://127.0.0.1:6379/0', key_prefix: str = 'lback:', timeout: float = 5.0):
+        """
+        Configures the backend. Connections are opened on first use, one per thread.
+
+        Args:
+            url: redis://[:password@]host[:port][/db]
+            key_prefix: Prefix added to every key. clear() only removes keys with this prefix.
+            timeout: Socket connect and read timeout in seconds.
+        """
+        parts = urlsplit(url)
+        if parts.scheme != 'redis':
+            raise ConfigurationError(f"Unsupported cache URL scheme '{parts.scheme}'. Use redis://host:port/db.")
+        self.url = url
+        self.host = parts.hostname or '127.0.0.1'
+        self.port = parts.port or 6379
+        self.db = int(parts.path.lstrip('/') or 0)
+        self._password = unquote(parts.password) if parts.password else None
+        self.key_prefix = key_prefix
+        self.timeout = timeout
+        self._counters = _ProcessCounters()
+        self._connections = _PerThreadConnections(self._connect)
+        logger.info(f"RedisCacheBackend using {self.host}:{self.port}/{self.db} with key prefix '{key_prefix}'.")
+
+    def _connect(self) -> _RESPConnection:
+        connection = _RESPConnection(self.host, self.port, self.timeout)
+        if self._password:
+            connection.execute('AUTH', self._password)
+        if self.db:
+            connection.execute('SELECT', self.db)
+        return connection
+
+    def _execute(self, *arguments: Any) -> Any:
+        """Runs a command, reconnecting once if the connection was dropped."""
+        for attempt in (1, 2):
+            try:
+                return self._connections.get().execute(*arguments)
+            except (OSError, ConnectionError) as e:
+                self._connections.discard()
+                if attempt == 2:
+                    raise CacheBackendError(f"Cache server {self.host}:{self.port} unavailable: {e}") from e
+                logger.warning(f"RedisCacheBackend: connection error ({e}); reconnecting.")
+
+    def _key(self, key: Any) -> str:
+        return self.key_prefix + _storage_key(key)
+
+    def _scan(self) -> List[bytes]:
+        keys: List[bytes] = []
+        cursor = b'0'
+        while True:
+            cursor, batch = self._execute('SCAN', cursor, 'MATCH', self.key_prefix + '*', 'COUNT', REDIS_SCAN_COUNT)
+            keys.extend(batch)
+            if cursor in (b'0', 0):
+                return keys
+
+    def get(self, key: Any) -> Tuple[bool, Any, Optional[float]]:
+        value = self._execute('GET', self._key(key))
+        if value is None:
+            self._counters.add('misses')
+            return False, None, None
+        self._counters.add('hits')
+        return True, pickle.loads(value), None
+
+    def set(self, key: Any, value: Any, ttl: Optional[float]) -> Tuple[bool, List[Any]]:
+        storage_key = self._key(key)
+        if ttl is not None and ttl <= 0:
+            self._execute('DEL', storage_key)
+        elif ttl is not None:
+            self._execute('SET', storage_key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), 'PX', max(1, int(ttl * 1000)))
+        else:
+            self._execute('SET', storage_key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        self._counters.add('sets')
+        return True, []
+
+    def delete(self, key: Any) -> bool:
+        deleted = self._execute('DEL', self._key(key)) > 0
+        if deleted:
+            self._counters.add('deletes')
+        return deleted
+
+    def has(self, key: Any) -> bool:
+        return self._execute('EXISTS', self._key(key)) > 0
+
+    def keys(self) -> List[Any]:
+        prefix_length = len(self.key_prefix.encode('utf-8'))
+        return [key[prefix_length:].decode('utf-8') for key in self._scan()]
+
+    def clear(self) -> int:
+        keys = self._scan()
+        removed = 0
+        for start in range(0, len(keys), REDIS_SCAN_COUNT):
+            removed += self._execute('DEL', *keys[start:start + REDIS_SCAN_COUNT])
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the process counters and the number of keys with this backend's prefix.
+        Counting SCANs the whole keyspace, so it is O(N) in the number of keys on the server:
+        do not call it on every request.
+        """
+        stats = self._counters.snapshot()
+        stats['entries'] = len(self._scan())
+        stats['bytes'] = 0
+        stats['location'] = f"{self.host}:{self.port}/{self.db}"
+        return stats
+
+    def close(self):
+        self._connections.discard()
+
+
+CACHE_BACKENDS = ('memory', 'sqlite', 'redis')
+
+
+def backend_from_config(config: Any) -> BaseCacheBackend:
+    """
+    Builds the cache backend selected by CACHE_BACKEND.
+
+    Args:
+        config: The Config instance.
+
+    Returns:
+        A MemoryCacheBackend, SQLiteCacheBackend or RedisCacheBackend.
+
+    Raises:
+        ConfigurationError: If CACHE_BACKEND is unknown or CACHE_LOCATION is missing.
+    """
+    backend_name = str(getattr(config, 'CACHE_BACKEND', 'memory') or 'memory').lower()
+    location = getattr(config, 'CACHE_LOCATION', '') or ''
+    key_prefix = getattr(config, 'CACHE_KEY_PREFIX', 'lback:') or ''
+    max_entries = getattr(config, 'CACHE_MAX_ENTRIES', None)
+
+    if backend_name == 'memory':
+        return MemoryCacheBackend(
+            max_entries=max_entries,
+            max_bytes=getattr(config, 'CACHE_MAX_BYTES', None),
+            eviction_policy=getattr(config, 'CACHE_EVICTION_POLICY', LRU) or LRU,
+            shards=getattr(config, 'CACHE_SHARDS', DEFAULT_SHARDS) or DEFAULT_SHARDS,
+        )
+    if backend_name == 'sqlite':
+        if not location:
+            raise ConfigurationError("CACHE_LOCATION must be set to a file path for the 'sqlite' cache backend.")
+        return SQLiteCacheBackend(location, max_entries=max_entries, key_prefix=key_prefix)
+    if backend_name == 'redis':
+        return RedisCacheBackend(location or 'redis://127.0.0.1:6379/0', key_prefix=key_prefix)
+    raise ConfigurationError(f"Unknown CACHE_BACKEND '{backend_name}'. Use one of {', '.join(CACHE_BACKENDS)}.")
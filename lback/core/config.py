@@ -18,6 +18,36 @@ DEFAULTS = {
     "DB_PASSWORD_ENCRYPTED": "",
     "DB_NAME": "db",
     "DATABASE_ECHO": "False",
+    "DB_POOL_SIZE": "5",
+    "DB_MAX_OVERFLOW": "10",
+    "DB_POOL_TIMEOUT": "30",
+    "DB_POOL_RECYCLE": "1800",
+    "DB_POOL_PRE_PING": "True",
+    "DATABASE_REPLICA_URLS": [],
+    "DB_REPLICA_SELECTION": "round_robin",
+    "DB_REPLICA_STICKY_SECONDS": "5",
+    "CACHE_BACKEND": "memory",
+    "CACHE_LOCATION": "",
+    "CACHE_KEY_PREFIX": "lback:",
+    "CACHE_MAX_ENTRIES": None,
+    "CACHE_MAX_BYTES": None,
+    "CACHE_EVICTION_POLICY": "lru",
+    "CACHE_SHARDS": "16",
+    "JSON_CODEC": "auto",
+    "PROFILE_PIPELINE": "False",
+    "SIGNAL_ASYNC_QUEUE_SIZE": "10000",
+    "SIGNAL_ASYNC_WORKERS": "2",
+    "SIGNAL_ASYNC_BATCH_SIZE": "100",
+    "SIGNAL_ASYNC_BATCH_WAIT_MS": "50",
+    "SIGNAL_ASYNC_BACKPRESSURE": "drop",
+    "SIGNAL_ASYNC_SAMPLE_EVERY": "10",
+    "SIGNAL_ASYNC_BLOCK_TIMEOUT_MS": "1000",
+    "UPLOAD_MAX_MEMORY_SIZE": "2621440",
+    "UPLOAD_MAX_FIELD_SIZE": "1048576",
+    "UPLOAD_MAX_FILE_SIZE": None,
+    "UPLOAD_MAX_REQUEST_SIZE": None,
+    "UPLOAD_TEMP_DIR": None,
+    "UPLOAD_FILE_PERMISSIONS": None,
     "API_KEY_SERVICE_1_ENCRYPTED": "",
     "API_KEY_SERVICE_2_ENCRYPTED": "",
     "JWT_SECRET_KEY": "",
@@ -140,6 +170,15 @@ class Config:
                  logger.warning(f"Could not convert value '{value}' to integer.")
                  return None
 
+        def _to_file_mode(value):
+             if value is None or value == "": return None
+             if isinstance(value, int): return value
+             try:
+                 return int(str(value), 8)
+             except (ValueError, TypeError):
+                 logger.warning(f"Could not convert value '{value}' to an octal file mode.")
+                 return None
+
         def _to_list(value):
             if value is None: return None
             if isinstance(value, list): return value
@@ -208,6 +247,43 @@ class Config:
         self.DATABASE_ECHO = _get_value("DATABASE_ECHO", conversion_func=_str_to_bool, default=DEFAULTS["DATABASE_ECHO"])
         if self.DATABASE_ECHO is None: self.DATABASE_ECHO = _str_to_bool(DEFAULTS["DATABASE_ECHO"]) if "DATABASE_ECHO" in DEFAULTS else False
 
+        self.DB_POOL_SIZE = _get_value("DB_POOL_SIZE", conversion_func=_to_int, default=DEFAULTS["DB_POOL_SIZE"])
+        self.DB_MAX_OVERFLOW = _get_value("DB_MAX_OVERFLOW", conversion_func=_to_int, default=DEFAULTS["DB_MAX_OVERFLOW"])
+        self.DB_POOL_TIMEOUT = _get_value("DB_POOL_TIMEOUT", conversion_func=_to_int, default=DEFAULTS["DB_POOL_TIMEOUT"])
+        self.DB_POOL_RECYCLE = _get_value("DB_POOL_RECYCLE", conversion_func=_to_int, default=DEFAULTS["DB_POOL_RECYCLE"])
+        self.DB_POOL_PRE_PING = _get_value("DB_POOL_PRE_PING", conversion_func=_str_to_bool, default=DEFAULTS["DB_POOL_PRE_PING"])
+
+        self.DATABASE_REPLICA_URLS = _get_value("DATABASE_REPLICA_URLS", conversion_func=_to_list, default=DEFAULTS["DATABASE_REPLICA_URLS"])
+        if not isinstance(self.DATABASE_REPLICA_URLS, list): self.DATABASE_REPLICA_URLS = []
+        self.DB_REPLICA_SELECTION = _get_value("DB_REPLICA_SELECTION", default=DEFAULTS["DB_REPLICA_SELECTION"])
+        self.DB_REPLICA_STICKY_SECONDS = _get_value("DB_REPLICA_STICKY_SECONDS", conversion_func=_to_int, default=DEFAULTS["DB_REPLICA_STICKY_SECONDS"])
+
+        self.CACHE_BACKEND = _get_value("CACHE_BACKEND", default=DEFAULTS["CACHE_BACKEND"])
+        self.CACHE_LOCATION = _get_value("CACHE_LOCATION", default=DEFAULTS["CACHE_LOCATION"])
+        self.CACHE_KEY_PREFIX = _get_value("CACHE_KEY_PREFIX", default=DEFAULTS["CACHE_KEY_PREFIX"])
+        self.CACHE_MAX_ENTRIES = _get_value("CACHE_MAX_ENTRIES", conversion_func=_to_int, default=DEFAULTS["CACHE_MAX_ENTRIES"])
+        self.CACHE_MAX_BYTES = _get_value("CACHE_MAX_BYTES", conversion_func=_to_int, default=DEFAULTS["CACHE_MAX_BYTES"])
+        self.CACHE_EVICTION_POLICY = _get_value("CACHE_EVICTION_POLICY", default=DEFAULTS["CACHE_EVICTION_POLICY"])
+        self.CACHE_SHARDS = _get_value("CACHE_SHARDS", conversion_func=_to_int, default=DEFAULTS["CACHE_SHARDS"])
+
+        self.JSON_CODEC = _get_value("JSON_CODEC", default=DEFAULTS["JSON_CODEC"])
+        self.PROFILE_PIPELINE = _get_value("PROFILE_PIPELINE", conversion_func=_str_to_bool, default=DEFAULTS["PROFILE_PIPELINE"])
+
+        self.SIGNAL_ASYNC_QUEUE_SIZE = _get_value("SIGNAL_ASYNC_QUEUE_SIZE", conversion_func=_to_int, default=DEFAULTS["SIGNAL_ASYNC_QUEUE_SIZE"])
+        self.SIGNAL_ASYNC_WORKERS = _get_value("SIGNAL_ASYNC_WORKERS", conversion_func=_to_int, default=DEFAULTS["SIGNAL_ASYNC_WORKERS"])
+        self.SIGNAL_ASYNC_BATCH_SIZE = _get_value("SIGNAL_ASYNC_BATCH_SIZE", conversion_func=_to_int, default=DEFAULTS["SIGNAL_ASYNC_BATCH_SIZE"])
+        self.SIGNAL_ASYNC_BATCH_WAIT_MS = _get_value("SIGNAL_ASYNC_BATCH_WAIT_MS", conversion_func=_to_int, default=DEFAULTS["SIGNAL_ASYNC_BATCH_WAIT_MS"])
+        self.SIGNAL_ASYNC_BACKPRESSURE = _get_value("SIGNAL_ASYNC_BACKPRESSURE", default=DEFAULTS["SIGNAL_ASYNC_BACKPRESSURE"])
+        self.SIGNAL_ASYNC_SAMPLE_EVERY = _get_value("SIGNAL_ASYNC_SAMPLE_EVERY", conversion_func=_to_int, default=DEFAULTS["SIGNAL_ASYNC_SAMPLE_EVERY"])
+        self.SIGNAL_ASYNC_BLOCK_TIMEOUT_MS = _get_value("SIGNAL_ASYNC_BLOCK_TIMEOUT_MS", conversion_func=_to_int, default=DEFAULTS["SIGNAL_ASYNC_BLOCK_TIMEOUT_MS"])
+
+        self.UPLOAD_MAX_MEMORY_SIZE = _get_value("UPLOAD_MAX_MEMORY_SIZE", conversion_func=_to_int, default=DEFAULTS["UPLOAD_MAX_MEMORY_SIZE"])
+        self.UPLOAD_MAX_FIELD_SIZE = _get_value("UPLOAD_MAX_FIELD_SIZE", conversion_func=_to_int, default=DEFAULTS["UPLOAD_MAX_FIELD_SIZE"])
+        self.UPLOAD_MAX_FILE_SIZE = _get_value("UPLOAD_MAX_FILE_SIZE", conversion_func=_to_int, default=DEFAULTS["UPLOAD_MAX_FILE_SIZE"])
+        self.UPLOAD_MAX_REQUEST_SIZE = _get_value("UPLOAD_MAX_REQUEST_SIZE", conversion_func=_to_int, default=DEFAULTS["UPLOAD_MAX_REQUEST_SIZE"])
+        self.UPLOAD_TEMP_DIR = _get_value("UPLOAD_TEMP_DIR", default=DEFAULTS["UPLOAD_TEMP_DIR"])
+        self.UPLOAD_FILE_PERMISSIONS = _get_value("UPLOAD_FILE_PERMISSIONS", conversion_func=_to_file_mode, default=DEFAULTS["UPLOAD_FILE_PERMISSIONS"])
+
         self.MIDDLEWARES = _get_value("MIDDLEWARES", conversion_func=_to_list, default=DEFAULTS.get("MIDDLEWARES", []))
         if not isinstance(self.MIDDLEWARES, list): self.MIDDLEWARES = []
 
@@ -0,0 +1,65 @@
+import uuid
+from typing import Any, Dict, Type
+
+
+class TypeConverter:
+    """
+    Base class for path variable type converters.
+    A converter declares the regex fragment used by the router to match the variable
+    and converts the matched string to a Python value once, during route resolution.
+    """
+    regex: str = r'[^/]+'
+
+    def to_python(self, value: str) -> Any:
+        """Converts the string value from the URL to a Python type."""
+        raise NotImplementedError
+
+    def to_url(self, value: Any) -> str:
+        """Converts a Python value to its URL representation."""
+        raise NotImplementedError
+
+    @property
+    def openapi_type(self) -> Dict[str, Any]:
+        """Returns the OpenAPI schema type for this converter."""
+        return {"type": "string"}
+
+class StringConverter(TypeConverter):
+    def to_python(self, value: str) -> str:
+        return value
+
+    def to_url(self, value: Any) -> str:
+        return str(value)
+
+class IntegerConverter(TypeConverter):
+    regex = r'\d+'
+
+    def to_python(self, value: str) -> int:
+        return int(value)
+
+    def to_url(self, value: Any) -> str:
+        return str(value)
+
+    @property
+    def openapi_type(self) -> Dict[str, Any]:
+        return {"type": "integer", "format": "int64"}
+
+class UUIDConverter(TypeConverter):
+    regex = r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+
+    def to_python(self, value: str) -> uuid.UUID:
+        return uuid.UUID(value)
+
+    def to_url(self, value: Any) -> str:
+        return str(value)
+
+    @property
+    def openapi_type(self) -> Dict[str, Any]:
+        return {"type": "string", "format": "uuid"}
+
+
+DEFAULT_CONVERTERS: Dict[str, Type[TypeConverter]] = {
+    'str': StringConverter,
+    'string': StringConverter,
+    'int': IntegerConverter,
+    'uuid': UUIDConverter,
+}
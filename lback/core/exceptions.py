@@ -66,6 +66,13 @@ class MethodNotAllowed(HTTPException):
         if message is None:
             self.message = f"Method {method} not allowed for path {path}. Allowed methods: {', '.join(allowed_methods)}"
 
+class PayloadTooLarge(HTTPException):
+    status_code = 413
+    message = "Payload Too Large"
+
+    def __init__(self, message: Optional[str] = None, data: Optional[Any] = None):
+        super().__init__(message=message, status_code=413, data=data)
+
 class ServerError(HTTPException):
     status_code = 500
     message = "Internal Server Error"
@@ -76,6 +83,9 @@ class ServerError(HTTPException):
 class ConfigurationError(FrameworkException):
     pass
 
+class CacheBackendError(FrameworkException):
+    pass
+
 class ValidationError(BadRequest):
     status_code = 400
     message = "Validation Error"
@@ -0,0 +1,198 @@
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import logging
+import uuid
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+from lback.core.exceptions import ConfigurationError
+
+
+logger = logging.getLogger(__name__)
+
+
+_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+    uuid.UUID: str,
+    decimal.Decimal: str,
+}
+
+
+def _default(obj: Any, _encoder_for: Callable[[type], Optional[Callable[[Any], Any]]] = _ENCODERS.get) -> Any:
+    """
+    Converts values the JSON libraries do not encode themselves.
+    orjson encodes datetime, date, time, UUID and dataclasses natively and only calls this for the rest.
+    The common API types are looked up by exact type first, so the stdlib and ujson codecs pay one
+    dict lookup per value instead of a chain of isinstance() checks; subclasses fall through to them.
+    """
+    encoder = _encoder_for(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    mapping = getattr(obj, '_mapping', None)
+    if mapping is not None:
+        return dict(mapping)
+    to_dict = getattr(obj, 'to_dict', None)
+    if callable(to_dict):
+        return to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """
+    Encodes Python values to UTF-8 JSON bytes and decodes JSON bytes or text.
+
+    All codecs handle datetime/date/time (ISO 8601), UUID and Decimal (as strings), enums,
+    sets, SQLAlchemy Row objects (as objects keyed by column) and models with a to_dict() method.
+    """
+    name = 'base'
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    The standard library json module, with a reusable compact encoder.
+    Like orjson, it does not track containers to detect circular references: a circular value
+    raises RecursionError instead of ValueError, and every other value encodes faster.
+    """
+    name = 'json'
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(',', ':'), default=_default)
+        self._decoder = json.JSONDecoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode('utf-8')
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if not isinstance(data, str):
+            data = bytes(data).decode('utf-8')
+        return self._decoder.decode(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson: encodes straight to bytes and handles datetime and UUID in Rust."""
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ConfigurationError("The 'orjson' JSON codec requires the 'orjson' package.")
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=self._options)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """ujson: a C encoder and decoder with a str-based API."""
+    name = 'ujson'
+
+    def __init__(self):
+        if ujson is None:
+            raise ConfigurationError("The 'ujson' JSON codec requires the 'ujson' package.")
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, default=_default).encode('utf-8')
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return ujson.loads(data)
+
+
+JSON_CODECS: Dict[str, Type[JSONCodec]] = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': StdlibJSONCodec,
+}
+
+_codec: Optional[JSONCodec] = None
+
+
+def create_codec(name: str = 'auto') -> JSONCodec:
+    """
+    Creates a codec by name.
+
+    Args:
+        name: 'orjson', 'ujson', 'json', or 'auto' for the fastest installed one.
+
+    Returns:
+        The codec.
+
+    Raises:
+        ConfigurationError: If the name is unknown or its package is not installed.
+    """
+    name = (name or 'auto').lower()
+    if name == 'auto':
+        if orjson is not None:
+            return OrjsonCodec()
+        if ujson is not None:
+            return UjsonCodec()
+        return StdlibJSONCodec()
+    codec_class = JSON_CODECS.get(name)
+    if codec_class is None:
+        raise ConfigurationError(f"Unknown JSON codec '{name}'. Choose one of: auto, {', '.join(JSON_CODECS)}.")
+    return codec_class()
+
+
+def set_codec(codec: Union[str, JSONCodec]) -> JSONCodec:
+    """Sets the process-wide codec used by dumps()/loads(), by name or instance, and returns it."""
+    global _codec
+    _codec = create_codec(codec) if isinstance(codec, str) else codec
+    logger.info(f"JSON codec set to '{_codec.name}'.")
+    return _codec
+
+
+def get_codec() -> JSONCodec:
+    """Returns the process-wide codec, choosing the fastest installed one on first use."""
+    global _codec
+    if _codec is None:
+        _codec = create_codec('auto')
+        logger.debug(f"JSON codec defaulted to '{_codec.name}'.")
+    return _codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Encodes a value to compact UTF-8 JSON bytes with the process-wide codec."""
+    return get_codec().dumps(obj)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Decodes JSON bytes or text with the process-wide codec.
+
+    Raises:
+        ValueError: If the data is not valid JSON (json.JSONDecodeError for the json and orjson codecs).
+    """
+    return get_codec().loads(data)
@@ -3,12 +3,14 @@ import inspect
 import logging
 from typing import Optional, Any, Type, Dict
 
-from .middleware_manager import MiddlewareManager
+from .middleware_manager import MiddlewareManager, MiddlewareScope
 from .config import Config
 
 
 logger = logging.getLogger(__name__)
 
+_SCOPE_RULES = ('include_paths', 'exclude_paths', 'include_routes', 'exclude_routes')
+
 
 def import_class(class_path: str) -> Type[Any]:
     """
@@ -122,6 +124,9 @@ def load_middlewares_from_config(
     Reads the middleware list from a Config object, imports classes, and instantiates them
     using the available dependencies and parameters from the config, adding them to MiddlewareManager in order.
 
+    A dictionary item may scope its middleware with 'include_paths', 'exclude_paths' (path
+    prefixes), 'include_routes' and 'exclude_routes' (route names); see MiddlewareScope.
+
     Args:
         middleware_manager: The MiddlewareManager instance to add middlewares to.
         config: The Config instance containing the middleware list (e.g., config.MIDDLEWARES).
@@ -148,6 +153,7 @@ def load_middlewares_from_config(
     for index, middleware_item in enumerate(middleware_list):
         middleware_class_path = None
         middleware_params = None
+        middleware_scope = None
 
         if isinstance(middleware_item, str):
             middleware_class_path = middleware_item
@@ -160,6 +166,13 @@ def load_middlewares_from_config(
             if middleware_params is not None and not isinstance(middleware_params, dict):
                  logger.warning(f"Middleware item '{middleware_class_path}' at index {index} has a 'params' key, but its value is not a dictionary ({type(middleware_params)}). Parameters will be ignored.")
                  middleware_params = None
+            scope_rules = {rule: middleware_item[rule] for rule in _SCOPE_RULES if middleware_item.get(rule)}
+            if scope_rules:
+                try:
+                    middleware_scope = MiddlewareScope(**scope_rules)
+                except TypeError as scope_error:
+                    logger.error(f"Middleware item '{middleware_class_path}' at index {index} has an invalid scope: {scope_error} Skipping item.")
+                    continue
 
         else:
             logger.error(f"Middleware item at index {index} in config is not a string or dictionary ({type(middleware_item)}). Skipping item.")
@@ -198,7 +211,7 @@ def load_middlewares_from_config(
                     available_dependencies_instances=available_dependencies_instances,
                     params=middleware_params
                 )
-                middleware_manager.add_middleware(instance)
+                middleware_manager.add_middleware(instance, scope=middleware_scope)
                 logger.info(f"Successfully loaded and registered middleware: {middleware_class.__name__} ({middleware_class_path})")
                 loaded_middlewares_count += 1
 
@@ -1,12 +1,26 @@
 import logging
-from typing import Optional, List, Any, Protocol, runtime_checkable, Type
+import time
+from typing import Optional, List, Any, Callable, Dict, Iterable, Protocol, runtime_checkable, Tuple, Type
 from http import HTTPStatus
 
+from .profiling import profiler
 from .signals import dispatcher
 from .response import Response
+from .base_middleware import BaseMiddleware
 
 logger = logging.getLogger(__name__)
 
+
+def _inherits_noop(middleware: Any, hook: str) -> bool:
+    """
+    Checks whether a middleware's process_request/process_response is the no-op implementation
+    inherited from BaseMiddleware or the Middleware Protocol. Such hooks are skipped by the
+    compiled chains; any method the middleware class defines itself is always called.
+    """
+    method = getattr(type(middleware), hook, None)
+    return any(method is getattr(base, hook) for base in (BaseMiddleware, Middleware))
+
+
 @runtime_checkable
 class Middleware(Protocol):
     """
@@ -43,12 +57,93 @@ class Middleware(Protocol):
         pass
 
 
+class MiddlewareScope:
+    """
+    Limits a middleware to part of the application.
+
+    A scoped middleware runs for a request when:
+    - no include rule is given, or the path starts with one of include_paths, or the resolved
+      route's name is in include_routes; and
+    - the path doesn't start with one of exclude_paths and the route name isn't in exclude_routes.
+
+    Exclude rules win over include rules. Requests that match no route (e.g. static files)
+    have no route name, so only path rules apply to them.
+    """
+    __slots__ = ('include_paths', 'exclude_paths', 'include_routes', 'exclude_routes')
+
+    def __init__(self, include_paths: Optional[Iterable[str]] = None, exclude_paths: Optional[Iterable[str]] = None,
+                 include_routes: Optional[Iterable[str]] = None, exclude_routes: Optional[Iterable[str]] = None):
+        """
+        Args:
+            include_paths: Path prefixes the middleware is limited to (e.g. ['/api/']).
+            exclude_paths: Path prefixes the middleware skips (e.g. ['/static/', '/health']).
+            include_routes: Route names the middleware is limited to.
+            exclude_routes: Route names the middleware skips.
+
+        Raises:
+            TypeError: If a rule is not a list of strings.
+        """
+        self.include_paths: Tuple[str, ...] = self._strings("include_paths", include_paths)
+        self.exclude_paths: Tuple[str, ...] = self._strings("exclude_paths", exclude_paths)
+        self.include_routes = frozenset(self._strings("include_routes", include_routes))
+        self.exclude_routes = frozenset(self._strings("exclude_routes", exclude_routes))
+
+    @staticmethod
+    def _strings(rule: str, values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+        if values is None:
+            return ()
+        if isinstance(values, str):
+            values = [values]
+        values = tuple(values)
+        if not all(isinstance(value, str) and value for value in values):
+            raise TypeError(f"Middleware scope rule '{rule}' must be a list of non-empty strings, got {values!r}.")
+        return values
+
+    @property
+    def uses_route_names(self) -> bool:
+        """True if the scope has route name rules, i.e. it needs the route resolved first."""
+        return bool(self.include_routes or self.exclude_routes)
+
+    def applies(self, path: str, route_name: Optional[str] = None) -> bool:
+        """
+        Checks whether the scoped middleware should run for a request.
+
+        Args:
+            path: The request path.
+            route_name: The name of the resolved route, or None if unresolved or unnamed.
+
+        Returns:
+            True if the middleware should run.
+        """
+        if self.include_paths or self.include_routes:
+            if not ((self.include_paths and path.startswith(self.include_paths))
+                    or (route_name is not None and route_name in self.include_routes)):
+                return False
+        if self.exclude_paths and path.startswith(self.exclude_paths):
+            return False
+        if route_name is not None and route_name in self.exclude_routes:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return (f"MiddlewareScope(include_paths={list(self.include_paths)}, exclude_paths={list(self.exclude_paths)}, "
+                f"include_routes={sorted(self.include_routes)}, exclude_routes={sorted(self.exclude_routes)})")
+
+
 class MiddlewareManager:
     """
     Manages a list of middleware instances and applies them to requests and responses.
     Middlewares are processed in the order they are added for process_request
     and in reverse order for process_response.
     Integrates SignalDispatcher to emit events during middleware processing.
+
+    The middleware list is compiled into tuples of bound methods whenever it changes, and
+    per-middleware signals are only sent while a receiver is connected to them, so an idle
+    dispatcher costs nothing per request. When the pipeline profiler is enabled, each
+    middleware's process_request and process_response are timed into its histograms.
+
+    Middlewares can be added with a MiddlewareScope. Each distinct combination of scope
+    decisions gets its own compiled chains, built on first use and reused afterwards.
     """
     def __init__(self):
         """
@@ -56,12 +151,19 @@ class MiddlewareManager:
         Emits 'middleware_manager_initialized' signal.
         """
         self.middlewares: List[Middleware] = []
+        self._request_chain: Tuple[Tuple[Middleware, str, Callable, str], ...] = ()
+        self._response_chain: Tuple[Tuple[Middleware, str, Callable, str], ...] = ()
+        self._scopes: Dict[int, MiddlewareScope] = {}
+        self._scoped: Tuple[Tuple[Middleware, MiddlewareScope], ...] = ()
+        self._scoped_chains: Dict[Tuple[bool, ...], Tuple[tuple, tuple]] = {}
+        self.uses_route_names: bool = False
+        self.uses_route_resolution: bool = False
         logger.info("MiddlewareManager initialized.")
         dispatcher.send("middleware_manager_initialized", sender=self)
         logger.debug("Signal 'middleware_manager_initialized' sent.")
 
 
-    def add_middleware(self, middleware: Middleware):
+    def add_middleware(self, middleware: Middleware, scope: Optional[MiddlewareScope] = None):
         """
         Registers a new middleware component instance.
         Middlewares should be instances of classes implementing the Middleware Protocol.
@@ -70,6 +172,8 @@ class MiddlewareManager:
 
         Args:
             middleware: The middleware instance to add.
+            scope: Optional MiddlewareScope restricting which requests the middleware runs for.
+                   If None, it runs for every request.
 
         Raises:
             TypeError: If the provided object does not implement the Middleware Protocol
@@ -85,7 +189,10 @@ class MiddlewareManager:
              raise TypeError("Middleware object must implement the Middleware Protocol (have callable 'process_request' and 'process_response' methods).")
 
         self.middlewares.append(middleware)
-        logger.info(f"Middleware added successfully: {middleware_name}. Total middlewares: {len(self.middlewares)}")
+        if scope is not None:
+            self._scopes[id(middleware)] = scope
+        self.compile()
+        logger.info(f"Middleware added successfully: {middleware_name}{f' with {scope!r}' if scope is not None else ''}. Total middlewares: {len(self.middlewares)}")
         dispatcher.send("middleware_added", sender=self, middleware_instance=middleware, middleware_name=middleware_name)
         logger.debug(f"Signal 'middleware_added' sent for '{middleware_name}'.")
 
@@ -103,6 +210,7 @@ class MiddlewareManager:
         logger.debug(f"Attempting to remove middleware instance: {middleware_name}")
         try:
             self.middlewares.remove(middleware)
+            self.compile()
             logger.info(f"Middleware instance removed: {middleware_name}. Total middlewares: {len(self.middlewares)}")
             dispatcher.send("middleware_removed", sender=self, middleware_instance=middleware, middleware_name=middleware_name)
             logger.debug(f"Signal 'middleware_removed' sent for '{middleware_name}'.")
@@ -133,6 +241,7 @@ class MiddlewareManager:
         initial_count = len(self.middlewares)
         removed_instances = [m for m in self.middlewares if isinstance(m, middleware_class)]
         self.middlewares = [m for m in self.middlewares if not isinstance(m, middleware_class)]
+        self.compile()
         removed_count = initial_count - len(self.middlewares)
 
         if removed_count > 0:
@@ -143,7 +252,69 @@ class MiddlewareManager:
             logger.warning(f"No instance of middleware class {middleware_class_name} found for removal.")
 
 
-    def process_request(self, request: Any) -> Optional[Response]:
+    def compile(self):
+        """
+        Compiles the middleware list into the request and response chains used per request.
+        Each chain is a tuple of (middleware, name, bound method, profiling stage name) entries, in
+        request order and in reverse order respectively. Hooks a middleware inherits unchanged from the
+        Middleware Protocol or BaseMiddleware do nothing and are left out of their chain.
+        Called automatically by add_middleware() and the remove methods; call it again after
+        mutating self.middlewares directly. Also drops the per-scope chains built by chains_for().
+        Sets uses_route_resolution when a scope has route name rules or a middleware sets
+        'uses_route_resolution = True', so the AppController resolves the route before the
+        request middlewares run.
+        """
+        request_chain = []
+        response_chain = []
+        for middleware in self.middlewares:
+            middleware_name = getattr(middleware, '__class__', type(middleware)).__name__
+            if not _inherits_noop(middleware, 'process_request'):
+                request_chain.append((middleware, middleware_name, middleware.process_request, f"middleware.{middleware_name}.request"))
+            if not _inherits_noop(middleware, 'process_response'):
+                response_chain.append((middleware, middleware_name, middleware.process_response, f"middleware.{middleware_name}.response"))
+        response_chain.reverse()
+        self._request_chain = tuple(request_chain)
+        self._response_chain = tuple(response_chain)
+
+        present = {id(middleware) for middleware in self.middlewares}
+        self._scopes = {key: scope for key, scope in self._scopes.items() if key in present}
+        self._scoped = tuple((middleware, self._scopes[id(middleware)]) for middleware in self.middlewares if id(middleware) in self._scopes)
+        self._scoped_chains = {}
+        self.uses_route_names = any(scope.uses_route_names for _, scope in self._scoped)
+        self.uses_route_resolution = self.uses_route_names or any(
+            getattr(middleware, 'uses_route_resolution', False) is True for middleware in self.middlewares)
+        logger.debug(f"MiddlewareManager: Compiled {len(self._request_chain)} request and {len(self._response_chain)} response middleware(s) from {len(self.middlewares)} middleware(s).")
+
+    def chains_for(self, path: str, route_name: Optional[str] = None) -> Tuple[tuple, tuple]:
+        """
+        Returns the compiled (request chain, response chain) for a request, leaving out scoped
+        middlewares whose MiddlewareScope doesn't apply to it.
+        Chains are cached per combination of scope decisions, so the per-request cost is one
+        applies() check per scoped middleware.
+
+        Args:
+            path: The request path.
+            route_name: The name of the resolved route, if known.
+
+        Returns:
+            A tuple (request_chain, response_chain).
+        """
+        scoped = self._scoped
+        if not scoped:
+            return self._request_chain, self._response_chain
+        key = tuple([scope.applies(path, route_name) for _, scope in scoped])
+        chains = self._scoped_chains.get(key)
+        if chains is None:
+            skipped = {id(middleware) for (middleware, _), applies in zip(scoped, key) if not applies}
+            chains = (
+                tuple(entry for entry in self._request_chain if id(entry[0]) not in skipped),
+                tuple(entry for entry in self._response_chain if id(entry[0]) not in skipped),
+            )
+            self._scoped_chains[key] = chains
+            logger.debug(f"MiddlewareManager: Compiled scoped chains for {path} (route: {route_name}), skipping {len(skipped)} middleware(s).")
+        return chains
+
+    def process_request(self, request: Any, route_name: Optional[str] = None) -> Optional[Response]:
         """
         Applies the process_request method of each middleware in the order they were added.
         Stops the chain and returns a Response object if any middleware returns one.
@@ -155,6 +326,7 @@ class MiddlewareManager:
         Args:
             request: The incoming request object. This object is passed through the chain
                      and can be modified by middlewares (e.g., adding context, user).
+            route_name: The name of the resolved route, used by route-scoped middlewares.
 
         Returns:
             A Response object if a middleware short-circuits the chain or an error occurs,
@@ -162,57 +334,64 @@ class MiddlewareManager:
         """
         request_method = getattr(request, 'method', 'N/A')
         request_path = getattr(request, 'path', 'N/A')
-        logger.debug(f"MiddlewareManager: Starting request middleware chain for {request_method} {request_path}.")
-        dispatcher.send("middleware_request_processing_started", sender=self, request=request, method=request_method, path=request_path)
-        logger.debug(f"Signal 'middleware_request_processing_started' sent for {request_method} {request_path}.")
-
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"MiddlewareManager: Starting request middleware chain for {request_method} {request_path}.")
+        if dispatcher.has_receivers("middleware_request_processing_started"):
+            dispatcher.send("middleware_request_processing_started", sender=self, request=request, method=request_method, path=request_path)
+
+        notify_started = dispatcher.has_receivers("middleware_process_request_started")
+        notify_succeeded = dispatcher.has_receivers("middleware_process_request_succeeded")
+        timed = profiler.enabled
         final_response = None
 
-        for middleware in self.middlewares:
-            middleware_name = getattr(middleware, '__class__', type(middleware)).__name__
-            logger.debug(f"MiddlewareManager: Processing request with {middleware_name}")
-            dispatcher.send("middleware_process_request_started", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request)
-            logger.debug(f"Signal 'middleware_process_request_started' sent for {middleware_name}.")
+        for middleware, middleware_name, process_request, stage in self.chains_for(request_path, route_name)[0]:
+            if notify_started:
+                dispatcher.send("middleware_process_request_started", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request)
 
             try:
-                response = middleware.process_request(request)
-
-                if response is not None:
-                    logger.info(f"Request short-circuited by middleware: {middleware_name} (Status: {getattr(response, 'status_code', 'N/A')})")
-                    if not isinstance(response, Response):
-                         logger.error(f"Middleware {middleware_name} returned unexpected type {type(response)} in process_request for {request_method} {request_path}. Expected Response. Returning 500.")
-                         dispatcher.send("middleware_process_request_failed", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, error_type="invalid_response_type", returned_type=type(response))
-                         logger.debug(f"Signal 'middleware_process_request_failed' (invalid_response_type) sent for {middleware_name}.")
-                         final_response = Response(body=b"Internal Server Error: Invalid middleware response type.", status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value, headers={'Content-Type': 'text/plain'})
-                    else:
-                         final_response = response
-
-                    dispatcher.send("middleware_request_short_circuited", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, response=final_response)
-                    logger.debug(f"Signal 'middleware_request_short_circuited' sent by {middleware_name}.")
-
-                    break
-
+                if timed:
+                    started_ns = time.perf_counter_ns()
+                    try:
+                        response = process_request(request)
+                    finally:
+                        profiler.record(stage, time.perf_counter_ns() - started_ns)
                 else:
-                    logger.debug(f"Middleware {middleware_name} processed request, continuing chain.")
-                    dispatcher.send("middleware_process_request_succeeded", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request)
-                    logger.debug(f"Signal 'middleware_process_request_succeeded' sent for {middleware_name}.")
-
-
+                    response = process_request(request)
             except Exception as e:
                 logger.exception(f"Error in process_request of {middleware_name} for {request_method} {request_path}: {e}")
                 dispatcher.send("middleware_process_request_failed", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, error_type="exception", exception=e)
-                logger.debug(f"Signal 'middleware_process_request_failed' (exception) sent for {middleware_name}.")
                 final_response = Response(body=b"Internal Server Error: Middleware processing failed.", status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value, headers={'Content-Type': 'text/plain'})
                 break
 
+            if response is None:
+                if debug:
+                    logger.debug(f"Middleware {middleware_name} processed request, continuing chain.")
+                if notify_succeeded:
+                    dispatcher.send("middleware_process_request_succeeded", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request)
+                continue
+
+            logger.info(f"Request short-circuited by middleware: {middleware_name} (Status: {getattr(response, 'status_code', 'N/A')})")
+            if not isinstance(response, Response):
+                logger.error(f"Middleware {middleware_name} returned unexpected type {type(response)} in process_request for {request_method} {request_path}. Expected Response. Returning 500.")
+                dispatcher.send("middleware_process_request_failed", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, error_type="invalid_response_type", returned_type=type(response))
+                final_response = Response(body=b"Internal Server Error: Invalid middleware response type.", status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value, headers={'Content-Type': 'text/plain'})
+            else:
+                final_response = response
+
+            if dispatcher.has_receivers("middleware_request_short_circuited"):
+                dispatcher.send("middleware_request_short_circuited", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, response=final_response)
+            break
+
         if final_response is None:
-             logger.debug("MiddlewareManager: Request passed through all request middlewares without short-circuit. Proceeding to view.")
-             dispatcher.send("middleware_request_processing_finished", sender=self, request=request, method=request_method, path=request_path)
-             logger.debug(f"Signal 'middleware_request_processing_finished' sent for {request_method} {request_path}.")
+            if debug:
+                logger.debug("MiddlewareManager: Request passed through all request middlewares without short-circuit. Proceeding to view.")
+            if dispatcher.has_receivers("middleware_request_processing_finished"):
+                dispatcher.send("middleware_request_processing_finished", sender=self, request=request, method=request_method, path=request_path)
 
         return final_response
 
-    def process_response(self, request: Any, response: Response) -> Response:
+    def process_response(self, request: Any, response: Response, route_name: Optional[str] = None) -> Response:
         """
         Applies the process_response method of each middleware in reverse order of addition.
         Starts with the response generated by the view or a short-circuiting middleware.
@@ -225,45 +404,56 @@ class MiddlewareManager:
         Args:
             request: The incoming request object (potentially modified by process_request chain).
             response: The initial Response object generated by the view or a short-circuiting middleware.
+            route_name: The name of the resolved route, used by route-scoped middlewares.
 
         Returns:
             The final Response object after all response middlewares have been applied.
         """
         request_method = getattr(request, 'method', 'N/A')
         request_path = getattr(request, 'path', 'N/A')
-        logger.debug(f"MiddlewareManager: Starting response middleware chain for {request_method} {request_path}.")
-        dispatcher.send("middleware_response_processing_started", sender=self, request=request, method=request_method, path=request_path, initial_response=response)
-        logger.debug(f"Signal 'middleware_response_processing_started' sent for {request_method} {request_path}.")
-
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"MiddlewareManager: Starting response middleware chain for {request_method} {request_path}.")
+        if dispatcher.has_receivers("middleware_response_processing_started"):
+            dispatcher.send("middleware_response_processing_started", sender=self, request=request, method=request_method, path=request_path, initial_response=response)
+
+        notify_started = dispatcher.has_receivers("middleware_process_response_started")
+        notify_succeeded = dispatcher.has_receivers("middleware_process_response_succeeded")
+        timed = profiler.enabled
         processed_response = response
 
-        for middleware in reversed(self.middlewares):
-            middleware_name = getattr(middleware, '__class__', type(middleware)).__name__
-            logger.debug(f"MiddlewareManager: Processing response with {middleware_name}")
-            dispatcher.send("middleware_process_response_started", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, current_response=processed_response)
-            logger.debug(f"Signal 'middleware_process_response_started' sent for {middleware_name}.")
+        for middleware, middleware_name, process_response, stage in self.chains_for(request_path, route_name)[1]:
+            if notify_started:
+                dispatcher.send("middleware_process_response_started", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, current_response=processed_response)
 
             try:
-                middleware_response = middleware.process_response(request, processed_response)
-
-                if not isinstance(middleware_response, Response):
-                    logger.error(f"Response Middleware {middleware_name} returned unexpected type {type(middleware_response)} in process_response for {request_method} {request_path}. Expected Response. Attempting to continue with previous response.")
-                    dispatcher.send("middleware_process_response_failed", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, current_response=processed_response, error_type="invalid_response_type", returned_type=type(middleware_response))
-                    logger.debug(f"Signal 'middleware_process_response_failed' (invalid_response_type) sent for {middleware_name}.")
-
+                if timed:
+                    started_ns = time.perf_counter_ns()
+                    try:
+                        middleware_response = process_response(request, processed_response)
+                    finally:
+                        profiler.record(stage, time.perf_counter_ns() - started_ns)
                 else:
-                    processed_response = middleware_response
-                    logger.debug(f"Response processed by: {middleware_name}")
-                    dispatcher.send("middleware_process_response_succeeded", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, processed_response=processed_response)
-                    logger.debug(f"Signal 'middleware_process_response_succeeded' sent for {middleware_name}.")
-
+                    middleware_response = process_response(request, processed_response)
             except Exception as e:
                 logger.exception(f"Error in process_response of {middleware_name} for {request_method} {request_path}: {e}")
                 dispatcher.send("middleware_process_response_failed", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, current_response=processed_response, error_type="exception", exception=e)
-                logger.debug(f"Signal 'middleware_process_response_failed' (exception) sent for {middleware_name}.")
-
-        logger.debug(f"MiddlewareManager: Response passed through all response middlewares. Finalizing response for {request_method} {request_path}.")
-        dispatcher.send("middleware_response_processing_finished", sender=self, request=request, method=request_method, path=request_path, final_response=processed_response)
-        logger.debug(f"Signal 'middleware_response_processing_finished' sent for {request_method} {request_path}.")
+                continue
+
+            if not isinstance(middleware_response, Response):
+                logger.error(f"Response Middleware {middleware_name} returned unexpected type {type(middleware_response)} in process_response for {request_method} {request_path}. Expected Response. Attempting to continue with previous response.")
+                dispatcher.send("middleware_process_response_failed", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, current_response=processed_response, error_type="invalid_response_type", returned_type=type(middleware_response))
+                continue
+
+            processed_response = middleware_response
+            if debug:
+                logger.debug(f"Response processed by: {middleware_name}")
+            if notify_succeeded:
+                dispatcher.send("middleware_process_response_succeeded", sender=self, middleware_instance=middleware, middleware_name=middleware_name, request=request, processed_response=processed_response)
+
+        if debug:
+            logger.debug(f"MiddlewareManager: Response passed through all response middlewares. Finalizing response for {request_method} {request_path}.")
+        if dispatcher.has_receivers("middleware_response_processing_finished"):
+            dispatcher.send("middleware_response_processing_finished", sender=self, request=request, method=request_method, path=request_path, final_response=processed_response)
 
         return processed_response
@@ -1,12 +1,19 @@
-import json
 import logging
 import http
+import mimetypes
+import os
 import re
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, List, Tuple, Union
+
+from lback.core import json_codec
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
 class Response:
+    streaming = False
+
     def __init__(self, body: Any = None, status_code: int = 200, headers: Optional[Dict[str, str]] = None, content_type: Optional[str] = None):
         self.body = body
         self.status_code = status_code
@@ -17,12 +24,15 @@ class Response:
 
         logger.debug(f"Response initialized with status: {self.status_code}, body type: {type(self.body).__name__}, headers: {self.headers}")
 
-    def get_wsgi_response(self) -> Tuple[str, List[Tuple[str, str]], List[bytes]]:
+    def _status_line(self) -> str:
         try:
             status_text = http.HTTPStatus(self.status_code).phrase
         except ValueError:
             status_text = "Unknown Status"
-        status_line = f"{self.status_code} {status_text}"
+        return f"{self.status_code} {status_text}"
+
+    def get_wsgi_response(self, environ: Optional[Dict[str, Any]] = None) -> Tuple[str, List[Tuple[str, str]], Iterable[bytes]]:
+        status_line = self._status_line()
 
         header_list = [(key, value) for key, value in self.headers.items()]
 
@@ -112,15 +122,15 @@ class JSONResponse(Response):
              body_data["message"] = message
 
         try:
-            json_body_string = json.dumps(body_data, ensure_ascii=False)
+            json_body = json_codec.dumps(body_data)
         except Exception as e:
             logger.error(f"Failed to serialize JSON response body: {e}", exc_info=True)
-            json_body_string = json.dumps({"error": "Internal Server Error", "message": "Failed to serialize response data"}, ensure_ascii=False)
+            json_body = json_codec.dumps({"error": "Internal Server Error", "message": "Failed to serialize response data"})
             status_code = 500
             message = "Internal Server Error"
 
         super().__init__(
-            body=json_body_string,
+            body=json_body,
             status_code=status_code,
             headers=headers,
             content_type="application/json; charset=utf-8"
@@ -152,4 +162,111 @@ class RedirectResponse(Response):
             headers=redirect_headers,
             content_type="text/plain"
         )
-        logger.debug(f"RedirectResponse created to URL: {redirect_url} with status {self.status_code}.")
\ No newline at end of file
+        logger.debug(f"RedirectResponse created to URL: {redirect_url} with status {self.status_code}.")
+
+class StreamingResponse(Response):
+    """
+    A response whose body is an iterable of bytes or str chunks, sent to the client as they are produced.
+
+    The body is never joined in memory, and no Content-Length header is added unless one is given.
+    Middlewares can check 'response.streaming' to leave the body alone.
+    """
+    streaming = True
+
+    def __init__(self, content: Iterable[Union[bytes, str]], status_code: int = 200, headers: Optional[Dict[str, str]] = None, content_type: Optional[str] = "application/octet-stream"):
+        super().__init__(body=content, status_code=status_code, headers=headers, content_type=content_type)
+        logger.debug(f"StreamingResponse created with status {self.status_code}.")
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        encoding = self._get_encoding()
+        iterator = iter(self.body if self.body is not None else ())
+        try:
+            for chunk in iterator:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode(encoding)
+                if chunk:
+                    yield chunk
+        finally:
+            close = getattr(iterator, 'close', None)
+            if callable(close):
+                close()
+
+    def get_wsgi_response(self, environ: Optional[Dict[str, Any]] = None) -> Tuple[str, List[Tuple[str, str]], Iterable[bytes]]:
+        header_list = [(key, value) for key, value in self.headers.items()]
+        logger.debug(f"Prepared streaming WSGI response: Status='{self.status_code}', Headers={header_list}")
+        return self._status_line(), header_list, self._iter_chunks()
+
+
+class FileResponse(StreamingResponse):
+    """
+    Streams a file from disk.
+
+    Uses the server's 'wsgi.file_wrapper' when it provides one (which lets servers use sendfile),
+    otherwise reads the file in fixed-size chunks. Partial responses (a 'length') are always read
+    in chunks, since file wrappers send up to the end of the file. The file is closed when the
+    response is finished.
+    """
+
+    def __init__(self, file: Union[str, os.PathLike, BinaryIO], status_code: int = 200, headers: Optional[Dict[str, str]] = None,
+                 content_type: Optional[str] = None, filename: Optional[str] = None, as_attachment: bool = False,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, offset: int = 0, length: Optional[int] = None):
+        """
+        Initializes the response.
+
+        Args:
+            file: A path, or a file object opened in binary mode.
+            status_code: The HTTP status code.
+            headers: Extra response headers.
+            content_type: The Content-Type. Guessed from the file name if None.
+            filename: The name shown to the client. Defaults to the file's base name.
+            as_attachment: If True, sends 'Content-Disposition: attachment' so browsers download the file.
+            chunk_size: Bytes per read when no file wrapper is available.
+            offset: Byte position to start sending from.
+            length: Number of bytes to send (for range requests). None sends the rest of the file.
+        """
+        self.file = open(file, 'rb') if isinstance(file, (str, os.PathLike)) else file
+        self.chunk_size = chunk_size
+        self.length = length
+        if offset:
+            self.file.seek(offset)
+        if filename is None:
+            name = getattr(self.file, 'name', None)
+            filename = os.path.basename(name) if isinstance(name, str) else None
+        if content_type is None:
+            guessed, encoding = mimetypes.guess_type(filename or '')
+            content_type = guessed if guessed and not encoding else "application/octet-stream"
+        super().__init__(content=self.file, status_code=status_code, headers=headers, content_type=content_type)
+
+        if "Content-Length" not in self.headers and length is not None:
+            self.headers["Content-Length"] = str(length)
+        elif "Content-Length" not in self.headers:
+            try:
+                size = os.fstat(self.file.fileno()).st_size - self.file.tell()
+                self.headers["Content-Length"] = str(size)
+            except (AttributeError, OSError, ValueError):
+                logger.debug("FileResponse: Could not determine the file size. Sending without Content-Length.")
+        if as_attachment and filename:
+            self.headers.setdefault("Content-Disposition", f'attachment; filename="{filename}"')
+        logger.debug(f"FileResponse created for {filename} with status {self.status_code}.")
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        remaining = self.length
+        try:
+            while remaining is None or remaining > 0:
+                chunk = self.file.read(self.chunk_size if remaining is None else min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            self.file.close()
+
+    def get_wsgi_response(self, environ: Optional[Dict[str, Any]] = None) -> Tuple[str, List[Tuple[str, str]], Iterable[bytes]]:
+        header_list = [(key, value) for key, value in self.headers.items()]
+        file_wrapper = (environ or {}).get('wsgi.file_wrapper')
+        if file_wrapper is not None and self.length is None:
+            logger.debug(f"Prepared file WSGI response using wsgi.file_wrapper: Status='{self.status_code}'")
+            return self._status_line(), header_list, file_wrapper(self.file, self.chunk_size)
+        logger.debug(f"Prepared file WSGI response with {self.chunk_size}-byte chunks: Status='{self.status_code}'")
+        return self._status_line(), header_list, self._iter_chunks()
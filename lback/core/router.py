@@ -1,9 +1,12 @@
 import logging
 import re
-from typing import Any, Dict, List, Tuple, Callable, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple, Callable, Optional, Pattern, Type
 
 
 from .exceptions import RouteNotFound, MethodNotAllowed
+from .converters import TypeConverter, StringConverter, DEFAULT_CONVERTERS
 
 
 logger = logging.getLogger(__name__)
@@ -14,7 +17,7 @@ class Route:
     Stores the path pattern, view callable, allowed methods, optional name,
     and whether the route requires authentication.
     """
-    def __init__(self, path: str, view: Callable, methods: Optional[List[str]] = None, name: Optional[str] = None, requires_auth: bool = True):
+    def __init__(self, path: str, view: Callable, methods: Optional[List[str]] = None, name: Optional[str] = None, requires_auth: bool = True, converters: Optional[Dict[str, Type[TypeConverter]]] = None):
         """
         Initializes a Route object.
 
@@ -24,6 +27,8 @@ class Route:
             methods: A list of allowed HTTP methods (e.g., ['GET', 'POST']). If None, all methods are allowed.
             name: An optional name for the route (useful for URL reversal).
             requires_auth: Boolean indicating if this route requires user authentication. Defaults to True.
+            converters: A mapping of type names (e.g., 'int') to TypeConverter classes used for
+                        typed path variables. Defaults to DEFAULT_CONVERTERS.
         """
         if not isinstance(path, str) or not path.startswith('/'):
             logger.error(f"Invalid route path format: {path}. Must be a string starting with '/'.")
@@ -47,21 +52,29 @@ class Route:
         self.methods: Optional[List[str]] = [m.upper() for m in methods] if methods is not None else None
         self.name: Optional[str] = name
         self.requires_auth: bool = requires_auth
+        self._available_converters: Dict[str, Type[TypeConverter]] = converters if converters is not None else DEFAULT_CONVERTERS
         try:
             self._path_regex: str
-            self._variable_names: List[str]
+            self._variable_names: Dict[str, TypeConverter]
             self._path_regex, self._variable_names = self._build_path_regex(path)
+            self._converters: Dict[str, TypeConverter] = {
+                var_name: converter for var_name, converter in self._variable_names.items()
+                if not isinstance(converter, StringConverter)
+            }
+            self._compiled_regex: Pattern[str] = re.compile(self._path_regex)
+            self._segments: List[Tuple[str, Optional[Pattern[str]]]] = self._build_segments(path)
             logger.debug(f"Route created: path='{self.path}', methods={self.methods}, regex='{self._path_regex}', variables={self._variable_names}, requires_auth={self.requires_auth}")
         except ValueError as e:
              logger.error(f"Error building regex for path '{path}': {e}")
              raise 
 
 
-    def _build_path_regex(self, path: str) -> Tuple[str, List[str]]:
+    def _build_path_regex(self, path: str) -> Tuple[str, Dict[str, TypeConverter]]:
         """
         Builds the regex pattern for a path with dynamic variables.
         Handles variable definitions like '{variable_name}' or '{variable_name:type}'.
-        Type hints are currently ignored in regex building but can be used later for type conversion.
+        The type selects a TypeConverter whose regex is emitted for the variable
+        (e.g., '\\d+' for 'int'). Untyped variables and unknown types match '[^/]+'.
 
         Args:
             path: The URL path pattern string.
@@ -69,12 +82,12 @@ class Route:
         Returns:
             A tuple containing:
             - The regex pattern string for matching the path.
-            - A list of variable names found in the path pattern.
+            - A dictionary mapping variable names found in the path pattern to their converter instances.
 
         Raises:
             ValueError: If the path pattern contains malformed variable definitions.
         """
-        variable_names: List[str] = []
+        variable_names: Dict[str, TypeConverter] = {}
         regex_parts: List[str] = []
         parts = re.split(r'(\{.*?\})', path)
         for part in parts:
@@ -90,14 +103,73 @@ class Route:
                     logger.error(f"Empty variable name found in path: {path}")
                     raise ValueError(f"Empty variable name found in path: {path}")
 
-                variable_names.append(var_name)
-                regex_parts.append(rf'(?P<{var_name}>[^/]+)')
+                converter_class = self._available_converters.get(var_type_str, StringConverter) if var_type_str else StringConverter
+                if var_type_str and var_type_str not in self._available_converters:
+                    logger.warning(f"Unknown path variable type '{var_type_str}' for '{var_name}' in path: {path}. Treating it as a string.")
+                converter = converter_class()
+                variable_names[var_name] = converter
+                regex_parts.append(rf'(?P<{var_name}>{converter.regex})')
             else:
                 regex_parts.append(re.escape(part))
 
         regex_pattern = '^' + ''.join(regex_parts) + '$'
         return regex_pattern, variable_names
 
+    def _build_segments(self, path: str) -> List[Tuple[str, Optional[Pattern[str]]]]:
+        """
+        Splits the path pattern on '/' into the segments used by the router's route tree.
+        Path variables never match '/', so every variable lives inside exactly one segment.
+
+        Args:
+            path: The URL path pattern string.
+
+        Returns:
+            A list of (key, pattern) tuples, one per segment. Literal segments have
+            pattern None and use the segment text as key. Segments containing variables
+            use their regex source as key and carry the compiled regex.
+        """
+        segments: List[Tuple[str, Optional[Pattern[str]]]] = []
+        for segment in path.split('/'):
+            if re.search(r'\{.*?\}', segment):
+                segment_regex, _ = self._build_path_regex(segment)
+                segments.append((segment_regex, re.compile(segment_regex)))
+            else:
+                segments.append((segment, None))
+        return segments
+
+    def convert_variables(self, path_variables: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Converts matched path variables to Python values using the route's converters.
+
+        Args:
+            path_variables: The raw string values captured from the path.
+
+        Returns:
+            A new dictionary with converted values, or None if a converter rejected a value.
+        """
+        if not self._converters:
+            return path_variables
+        converted = dict(path_variables)
+        try:
+            for var_name, converter in self._converters.items():
+                converted[var_name] = converter.to_python(converted[var_name])
+        except (ValueError, TypeError) as e:
+            logger.debug(f"Path variable conversion failed for route '{self.path}': {e}")
+            return None
+        return converted
+
+    def allows_method(self, method: Any) -> bool:
+        """
+        Checks whether the given HTTP method is allowed for this route.
+
+        Args:
+            method: The request method as a string or HTTPMethod enum.
+
+        Returns:
+            True if the route accepts all methods or the method is listed, False otherwise.
+        """
+        return self.methods is None or str(method) in self.methods
+
     def match(self, path: str, method: str) -> Optional[Dict[str, Any]]:
         """
         Checks if the route's path pattern matches the given path and if the method is allowed.
@@ -113,13 +185,15 @@ class Route:
             Returns None if the path does not match the route's pattern.
         """
 
-        match = re.match(self._path_regex, path)
+        match = self._compiled_regex.match(path)
         if not match:
             logger.debug(f"Path '{path}' did not match regex pattern for route '{self.path}'.")
             return None
-        path_variables: Dict[str, str] = match.groupdict()
+        path_variables: Optional[Dict[str, Any]] = self.convert_variables(match.groupdict())
+        if path_variables is None:
+            return None
 
-        if self.methods is not None and str(method) not in self.methods:
+        if not self.allows_method(method):
             logger.debug(f"Method '{method}' is not allowed for route '{self.path}'. Allowed methods: {self.methods}")
             return {'_method_mismatch': True, '_allowed_methods': self.methods}
 
@@ -127,15 +201,132 @@ class Route:
         return path_variables
 
 
+class _RouteNode:
+    """
+    A single node of the router's segment tree.
+    Literal segments are looked up in a dict; segments containing path variables
+    are tried with their precompiled regex. Routes ending at this node are stored
+    with their registration order so resolution keeps first-registered-wins semantics.
+    """
+    __slots__ = ('static_children', 'dynamic_children', 'routes')
+
+    def __init__(self):
+        self.static_children: Dict[str, '_RouteNode'] = {}
+        self.dynamic_children: Dict[str, Tuple[Pattern[str], '_RouteNode']] = {}
+        self.routes: List[Tuple[int, Route]] = []
+
+    def insert(self, route: Route, order: int):
+        """Adds a route under this node, creating child nodes for its segments as needed."""
+        node = self
+        for key, pattern in route._segments:
+            if pattern is None:
+                child = node.static_children.get(key)
+                if child is None:
+                    child = node.static_children[key] = _RouteNode()
+            else:
+                entry = node.dynamic_children.get(key)
+                if entry is None:
+                    entry = node.dynamic_children[key] = (pattern, _RouteNode())
+                child = entry[1]
+            node = child
+        node.routes.append((order, route))
+
+    def collect(self, segments: List[str], index: int, variables: Dict[str, Any], matches: List[Tuple[int, Route, Dict[str, Any]]]):
+        """
+        Collects every route whose pattern matches the remaining path segments.
+
+        Args:
+            segments: The request path split on '/'.
+            index: The index of the segment to match at this node.
+            variables: Path variables extracted by the parent nodes.
+            matches: Output list receiving (order, route, path_variables) tuples.
+        """
+        if index == len(segments):
+            for order, route in self.routes:
+                matches.append((order, route, variables))
+            return
+
+        segment = segments[index]
+        child = self.static_children.get(segment)
+        if child is not None:
+            child.collect(segments, index + 1, variables, matches)
+
+        for pattern, child in self.dynamic_children.values():
+            match = pattern.match(segment)
+            if match is not None:
+                child.collect(segments, index + 1, {**variables, **match.groupdict()}, matches)
+
+
 class Router:
     """
     Manages a collection of Route objects and provides methods for matching
     incoming requests to registered routes and generating URLs.
     """
-    def __init__(self):
-        """Initializes the Router with an empty list of routes."""
+    def __init__(self, resolve_cache_size: int = 0):
+        """
+        Initializes the Router with an empty list of routes.
+
+        Args:
+            resolve_cache_size: Maximum number of (path, method) resolutions kept in an LRU cache
+                                in front of resolve(). Both successful matches and RouteNotFound /
+                                MethodNotAllowed outcomes are cached. 0 disables the cache.
+        """
+        if not isinstance(resolve_cache_size, int) or resolve_cache_size < 0:
+            logger.error(f"Invalid resolve_cache_size: {resolve_cache_size}. Must be a non-negative integer.")
+            raise ValueError(f"Invalid resolve_cache_size: {resolve_cache_size}. Must be a non-negative integer.")
         self.routes: List[Route] = []
-        logger.info("Router initialized.")
+        self._route_tree: _RouteNode = _RouteNode()
+        self._compiled_route_count: int = 0
+        self.converters: Dict[str, Type[TypeConverter]] = dict(DEFAULT_CONVERTERS)
+        self.resolve_cache_size: int = resolve_cache_size
+        self._resolve_cache: "OrderedDict[Tuple[str, str], Tuple[Any, ...]]" = OrderedDict()
+        self._resolve_cache_lock = threading.Lock()
+        self._resolve_cache_generation: int = 0
+        self.resolve_cache_hits: int = 0
+        self.resolve_cache_misses: int = 0
+        logger.info(f"Router initialized (resolve_cache_size={resolve_cache_size}).")
+
+    def clear_resolve_cache(self):
+        """
+        Drops all cached resolutions. Hit/miss counters are kept.
+        Lookups already in progress do not store their result, since it may predate the change.
+        """
+        with self._resolve_cache_lock:
+            self._resolve_cache.clear()
+            self._resolve_cache_generation += 1
+        logger.debug("Router resolve cache cleared.")
+
+    def resolve_cache_info(self) -> Dict[str, int]:
+        """
+        Returns statistics for the resolve cache.
+
+        Returns:
+            A dictionary with 'hits', 'misses', 'size' and 'maxsize'.
+        """
+        with self._resolve_cache_lock:
+            return {
+                'hits': self.resolve_cache_hits,
+                'misses': self.resolve_cache_misses,
+                'size': len(self._resolve_cache),
+                'maxsize': self.resolve_cache_size,
+            }
+
+    def register_converter(self, name: str, converter_class: Type[TypeConverter]):
+        """
+        Registers a custom path converter usable as '{variable:name}' in routes added afterwards.
+
+        Args:
+            name: The type name used in route patterns (e.g., 'slug').
+            converter_class: A TypeConverter subclass providing regex, to_python and to_url.
+
+        Raises:
+            TypeError: If converter_class is not a TypeConverter subclass.
+        """
+        if not isinstance(converter_class, type) or not issubclass(converter_class, TypeConverter):
+            logger.error(f"Invalid converter registered for '{name}'. Must be a TypeConverter subclass.")
+            raise TypeError(f"Invalid converter registered for '{name}'. Must be a TypeConverter subclass.")
+        self.converters[name] = converter_class
+        logger.info(f"Path converter registered: '{name}' -> {converter_class.__name__}")
 
     def add_route(self, path: str, view: Callable, methods: Optional[List[str]] = None, name: Optional[str] = None, requires_auth: bool = True):
         """
@@ -149,26 +340,53 @@ class Router:
                      If still None, all methods are allowed.
             name: An optional name for the route (useful for URL reversal).
             requires_auth: Boolean indicating if this route requires user authentication. Defaults to True.
+
+        Returns:
+            The created Route object.
         """
         if methods is None and hasattr(view, 'methods') and isinstance(getattr(view, 'methods'), list):
              methods = getattr(view, 'methods')
              logger.debug(f"Using methods from view callable '{getattr(view, '__name__', str(view))}': {methods}")
 
         try:
-            route = Route(path, view, methods, name, requires_auth=requires_auth)
-            self.routes.append(route) 
+            route = Route(path, view, methods, name, requires_auth=requires_auth, converters=self.converters)
+            if self._compiled_route_count != len(self.routes):
+                self._rebuild_route_tree()
+            self._route_tree.insert(route, len(self.routes))
+            self.routes.append(route)
+            self._compiled_route_count = len(self.routes)
+            if self.resolve_cache_size:
+                self.clear_resolve_cache()
             logger.info(f"Route added: path='{path}', methods={methods}, view='{getattr(view, '__name__', str(view))}', requires_auth={requires_auth}")
+            return route
         except (ValueError, TypeError) as e:
              logger.error(f"Failed to add route for path '{path}': {e}")
              raise
 
 
+    def _rebuild_route_tree(self):
+        """
+        Rebuilds the segment tree from self.routes.
+        Called after routes are removed, or if self.routes was modified directly.
+        """
+        self._route_tree = _RouteNode()
+        for order, route in enumerate(self.routes):
+            self._route_tree.insert(route, order)
+        self._compiled_route_count = len(self.routes)
+        if self.resolve_cache_size:
+            self.clear_resolve_cache()
+        logger.debug(f"Route tree rebuilt with {self._compiled_route_count} routes.")
+
     def resolve(self, path: str, method: str) -> Tuple[Callable, Dict[str, Any], bool]:
         """
         Finds a matching route for the given path and method.
 
-        Iterates through registered routes and uses the Route.match method.
-        If a path matches but the method is not allowed, it collects allowed methods.
+        Walks the precompiled segment tree, so the cost depends on the number of path
+        segments rather than the number of registered routes. When several routes match
+        the path, the first registered one that allows the method wins. Typed path
+        variables are converted with the route's converters; a value the converter
+        rejects means the route does not match. If a path matches but the method is
+        not allowed, it collects allowed methods.
 
         Args:
             path: The incoming request path string.
@@ -184,38 +402,95 @@ class Router:
             RouteNotFound: If no route matches the path.
             MethodNotAllowed: If a route matches the path but not the method.
         """
-        logger.debug(f"Attempting to resolve route: path='{path}' with method: '{method}'")
-        matched_route: Optional[Route] = None
-        path_variables: Dict[str, Any] = {}
-        allowed_methods_for_path: List[str] = []
+        route, path_variables = self.resolve_route(path, method)
+        return route.view, path_variables, route.requires_auth
 
-        for route in self.routes:
-            match_result = route.match(path, method)
-
-            if match_result is not None:
-                if '_method_mismatch' in match_result:
-                    if '_allowed_methods' in match_result and isinstance(match_result['_allowed_methods'], list):
-                         for m in match_result['_allowed_methods']:
-                             if m not in allowed_methods_for_path:
-                                 allowed_methods_for_path.append(m)
-                    logger.debug(f"Path matched for route '{route.path}', but method '{method}' is not allowed. Allowed: {route.methods}")
-                else:
-                    matched_route = route
-                    path_variables = match_result
-                    logger.debug(f"Full match found: route='{route.path}' for method {method} and path '{path}'. Extracted variables: {path_variables}")
-                    break
-
-        if matched_route is None:
-            if allowed_methods_for_path:
-                unique_allowed_methods = sorted(list(set(allowed_methods_for_path)))
-                logger.warning(f"MethodNotAllowed: Method {method} not allowed for path {path}. Allowed: {', '.join(unique_allowed_methods)}")
-                raise MethodNotAllowed(path=path, method=method, allowed_methods=unique_allowed_methods)
+    def resolve_route(self, path: str, method: str) -> Tuple[Route, Dict[str, Any]]:
+        """
+        Like resolve(), but returns the matched Route object itself (with its name, pattern
+        and methods) and the converted path variables. Shares resolve()'s cache.
+
+        Args:
+            path: The incoming request path string.
+            method: The incoming request HTTP method string.
+
+        Returns:
+            A tuple (route, path_variables).
+
+        Raises:
+            RouteNotFound: If no route matches the path.
+            MethodNotAllowed: If a route matches the path but not the method.
+        """
+        if self._compiled_route_count != len(self.routes):
+            self._rebuild_route_tree()
+
+        if not self.resolve_cache_size:
+            return self._resolve_uncached(path, method)
+
+        cache_key = (path, str(method))
+        with self._resolve_cache_lock:
+            cached = self._resolve_cache.get(cache_key)
+            if cached is not None:
+                self._resolve_cache.move_to_end(cache_key)
+                self.resolve_cache_hits += 1
             else:
-                logger.warning(f"RouteNotFound: No route found for method {method} and path {path}")
-                raise RouteNotFound(path=path, method=method)
+                self.resolve_cache_misses += 1
+                generation = self._resolve_cache_generation
+
+        if cached is None:
+            try:
+                route, path_variables = self._resolve_uncached(path, method)
+                cached = ('match', route, path_variables)
+            except MethodNotAllowed as e:
+                cached = ('method_not_allowed', e.allowed_methods)
+            except RouteNotFound:
+                cached = ('not_found',)
+            with self._resolve_cache_lock:
+                if generation == self._resolve_cache_generation:
+                    self._resolve_cache[cache_key] = cached
+                    self._resolve_cache.move_to_end(cache_key)
+                    while len(self._resolve_cache) > self.resolve_cache_size:
+                        self._resolve_cache.popitem(last=False)
+        else:
+            logger.debug(f"Resolve cache hit for {method} {path}.")
+
+        if cached[0] == 'match':
+            return cached[1], dict(cached[2])
+        if cached[0] == 'method_not_allowed':
+            raise MethodNotAllowed(path=path, method=method, allowed_methods=list(cached[1]))
+        raise RouteNotFound(path=path, method=method)
 
-        logger.debug(f"Route resolved: '{matched_route.path}'. View: {getattr(matched_route.view, '__name__', str(matched_route.view))}, Requires Auth: {matched_route.requires_auth}")
-        return matched_route.view, path_variables, matched_route.requires_auth
+    def _resolve_uncached(self, path: str, method: str) -> Tuple[Route, Dict[str, Any]]:
+        """
+        Resolves a path and method against the route tree, bypassing the resolve cache.
+        See resolve_route() for arguments, return value and raised exceptions.
+        """
+
+        matches: List[Tuple[int, Route, Dict[str, Any]]] = []
+        self._route_tree.collect(path.split('/'), 0, {}, matches)
+        if len(matches) > 1:
+            matches.sort(key=lambda item: item[0])
+
+        allowed_methods_for_path: List[str] = []
+        for _, route, path_variables in matches:
+            if route.allows_method(method):
+                converted_variables = route.convert_variables(path_variables)
+                if converted_variables is None:
+                    continue
+                return route, converted_variables
+            if route.convert_variables(path_variables) is None:
+                continue
+            for m in route.methods:
+                if m not in allowed_methods_for_path:
+                    allowed_methods_for_path.append(m)
+
+        if allowed_methods_for_path:
+            unique_allowed_methods = sorted(allowed_methods_for_path)
+            logger.warning(f"MethodNotAllowed: Method {method} not allowed for path {path}. Allowed: {', '.join(unique_allowed_methods)}")
+            raise MethodNotAllowed(path=path, method=method, allowed_methods=unique_allowed_methods)
+
+        logger.warning(f"RouteNotFound: No route found for method {method} and path {path}")
+        raise RouteNotFound(path=path, method=method)
 
 
     def url_for(self, name: str, **params: Any) -> str:
@@ -239,7 +514,9 @@ class Router:
                 try:
                     formatted_path = route.path
                     for param, value in params.items():
-                        formatted_path = formatted_path.replace(f"{{{param}}}", str(value))
+                        converter = route._variable_names.get(param)
+                        url_value = converter.to_url(value) if converter is not None else str(value)
+                        formatted_path = re.sub(rf"\{{{re.escape(param)}(?::[^}}]*)?\}}", lambda _: url_value, formatted_path)
 
                     if '{' in formatted_path or '}' in formatted_path:
                         expected_params_missing = [
@@ -303,6 +580,7 @@ class Router:
             )
         ]
         removed_count = initial_route_count - len(self.routes) 
+        self._rebuild_route_tree()
 
         if removed_count > 0:
             logger.info(f"Removed {removed_count} route(s) for path: '{path}' and methods: {methods}")
@@ -17,7 +17,10 @@ from .app_controller import AppController
 from .templates import TemplateRenderer
 from .config import Config, CONFIG_FILE
 
-from .types import Request
+from .types import Request, AppContext
+from .cache import Cache
+from . import json_codec
+from .profiling import profiler, STAGE_WSGI_RESPONSE
 from .logging_setup import setup_logging
 from .error_handler import ErrorHandler
 from .signals import SignalDispatcher
@@ -52,6 +55,8 @@ app_controller: Optional[AppController] = None
 db_manager: Optional[DatabaseManager] = None
 project_root: Optional[str] = None
 error_handler_instance: Optional[ErrorHandler] = None
+app_context: Optional[AppContext] = None
+cache: Optional[Cache] = None
 _core_components_initialized = False
 
 
@@ -67,7 +72,7 @@ def initialize_core_components() -> None:
     global config, template_renderer, router, middleware_manager, \
            session_manager, admin_user_manager, user_manager, jwt_auth_utility, \
            app_controller, db_manager, project_root, _core_components_initialized, \
-           logger, dispatcher, error_handler_instance, admin
+           logger, dispatcher, error_handler_instance, admin, app_context, cache
 
     if _core_components_initialized:
         logger.info("Core components already initialized. Skipping.")
@@ -210,7 +215,7 @@ def initialize_core_components() -> None:
 
 
     try:
-        router = Router()
+        router = Router(resolve_cache_size=int(getattr(config, 'ROUTER_RESOLVE_CACHE_SIZE', 0) or 0))
         middleware_manager = MiddlewareManager() 
         session_timeout = getattr(config, 'SESSION_TIMEOUT_MINUTES', 30)
         session_manager = SessionManager(timeout_minutes=session_timeout)
@@ -267,6 +272,24 @@ def initialize_core_components() -> None:
         )
         logger.info("AdvancedFirewall initialized.")
 
+        cache = Cache.from_config(config)
+        json_codec.set_codec(getattr(config, 'JSON_CODEC', 'auto'))
+        profiler.enabled = bool(getattr(config, 'PROFILE_PIPELINE', False))
+        if profiler.enabled:
+            logger.info("Pipeline profiling enabled. Per-stage latencies are available at /admin/pipeline-profile/.")
+        try:
+            dispatcher.configure_async(
+                maxsize=getattr(config, 'SIGNAL_ASYNC_QUEUE_SIZE', None) or 10000,
+                workers=getattr(config, 'SIGNAL_ASYNC_WORKERS', None) or 2,
+                batch_size=getattr(config, 'SIGNAL_ASYNC_BATCH_SIZE', None) or 100,
+                batch_wait=(getattr(config, 'SIGNAL_ASYNC_BATCH_WAIT_MS', None) or 0) / 1000,
+                backpressure=getattr(config, 'SIGNAL_ASYNC_BACKPRESSURE', None) or 'drop',
+                sample_every=getattr(config, 'SIGNAL_ASYNC_SAMPLE_EVERY', None) or 10,
+                block_timeout=(getattr(config, 'SIGNAL_ASYNC_BLOCK_TIMEOUT_MS', None) or 0) / 1000,
+            )
+        except ValueError as e:
+            logger.error(f"Invalid SIGNAL_ASYNC_* setting, keeping the default async signal queue: {e}")
+
         available_dependencies_instances = {
             'session_manager': session_manager,
             'admin_user_manager': admin_user_manager,
@@ -282,8 +305,10 @@ def initialize_core_components() -> None:
             'firewall': firewall_instance,
             'headers_configurator': headers_configurator,
             'rate_limiter': rate_limiter_instance,
-            'admin_registry': admin
+            'admin_registry': admin,
+            'cache': cache,
         }
+        app_context = AppContext({**available_dependencies_instances, 'jwt_auth_utility': jwt_auth_utility})
         logger.info("Core framework components initialized and dependencies dictionary created.")
 
     except Exception as e:
@@ -309,6 +334,7 @@ def initialize_core_components() -> None:
             user_manager=user_manager,
             available_dependencies_instances=available_dependencies_instances,
             dispatcher=dispatcher,
+            app_context=app_context,
         )
         logger.info("AppController initialized successfully.")
         logger.info("--- Core Components Initialization Complete ---")
@@ -361,8 +387,9 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
              headers['CONTENT-LENGTH'] = environ['CONTENT_LENGTH']
 
         if dispatcher:
-             dispatcher.send("server_request_received", sender="wsgi_application", method=method, path=path, full_path=raw_path_with_query, headers=headers, environ=environ)
-             logging.debug(f"Signal 'server_request_received' sent for {method} {raw_path_with_query}.")
+             if dispatcher.has_receivers("server_request_received"):
+                 dispatcher.send("server_request_received", sender="wsgi_application", method=method, path=path, full_path=raw_path_with_query, headers=headers, environ=environ)
+                 logging.debug(f"Signal 'server_request_received' sent for {method} {raw_path_with_query}.")
         else:
              logging.warning("Dispatcher is None. Cannot send 'server_request_received' signal.")
     except Exception as e:
@@ -396,7 +423,7 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
                 start_response(status, headers_list)
                 return [b"Payload Too Large: Error handler not initialized."]
          try:
-             dummy_request = Request(raw_path_with_query, method, b'', headers, environ=environ)
+             dummy_request = Request(raw_path_with_query, method, b'', headers, environ=environ, app_context=app_context)
          except Exception as req_e:
               logger.critical(f"[{method}] Failed to create dummy Request object for 413 error handling: {req_e}", exc_info=True)
               status = f"{HTTPStatus.INTERNAL_SERVER_ERROR.value} {HTTPStatus.INTERNAL_SERVER_ERROR.phrase}"
@@ -409,7 +436,7 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
 
     if response is None:
          try:
-             request = Request(raw_path_with_query, method, body, headers, environ=environ)
+             request = Request(raw_path_with_query, method, body, headers, environ=environ, app_context=app_context)
              logger.debug("WSGI Application: Main Request object created.")
          except Exception as req_e:
              logger.critical(f"[{method}] Failed to create main Request object for path: {raw_path_with_query}: {req_e}", exc_info=True)
@@ -421,7 +448,7 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
                 return [b"Internal Server Error: Failed to create request object."]
 
              try:
-                 dummy_request_for_error = Request(raw_path_with_query, method, b'', headers, environ=environ)
+                 dummy_request_for_error = Request(raw_path_with_query, method, b'', headers, environ=environ, app_context=app_context)
              except Exception as final_req_e:
                   logger.critical(f"WSGI Application: Failed to create final error request object: {final_req_e}", exc_info=True)
                   status = f"{HTTPStatus.INTERNAL_SERVER_ERROR.value} {HTTPStatus.INTERNAL_SERVER_ERROR.phrase}"
@@ -446,24 +473,9 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
                   logger.critical("WSGI Application: db_manager does not have a get_instance method.")
                   raise RuntimeError("Database Manager get_instance method is missing.")
 
-             db_session = db_manager.get_instance()
+             db_session = db_manager.get_instance().lazy_session()
              request.add_context('db_session', db_session)
-             logger.debug("WSGI Application: Added DB session to request context.")
-
-             if config: request.add_context('config', config)
-             if template_renderer: request.add_context('template_renderer', template_renderer)
-             if router: request.add_context('router', router)
-             if admin_user_manager: request.add_context('admin_user_manager', admin_user_manager)
-             if session_manager: request.add_context('session_manager', session_manager)
-             if user_manager: request.add_context('user_manager', user_manager)
-             if jwt_auth_utility: request.add_context('jwt_auth_utility', jwt_auth_utility)
-             if error_handler_instance: request.add_context('error_handler', error_handler_instance)
-             if dispatcher: request.add_context('dispatcher', dispatcher)
-             if 'admin' in globals() and admin:
-                  request.add_context('admin_registry', admin)
-             if environ: request.add_context('environ', environ)
-
-             logger.debug("WSGI Application: Added dependencies to request context.")
+             logger.debug("WSGI Application: Added lazy DB session to request context. Shared dependencies are served from the app context.")
 
          except Exception as e:
              logger.critical(f"WSGI Application: Error adding dependencies to request context: {e}", exc_info=True)
@@ -485,7 +497,7 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
                  return [b"Internal Server Error: Could not prepare request context."]
 
              try:
-                 dummy_request_for_error = Request(raw_path_with_query, method, b'', headers, environ=environ)
+                 dummy_request_for_error = Request(raw_path_with_query, method, b'', headers, environ=environ, app_context=app_context)
              except Exception as final_req_e:
                   logger.critical(f"WSGI Application: Failed to create error request object after DI error: {final_req_e}", exc_info=True)
                   status = f"{HTTPStatus.INTERNAL_SERVER_ERROR.value} {HTTPStatus.INTERNAL_SERVER_ERROR.phrase}"
@@ -551,7 +563,9 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
         duration = end_time - start_time 
         if request:
             db_session_from_context = request.get_context('db_session')
-            if db_session_from_context and hasattr(db_session_from_context, 'close') and callable(db_session_from_context.close):
+            if db_session_from_context is not None and not getattr(db_session_from_context, 'opened', True):
+                 logger.debug("WSGI Application: Lazy database session was never opened. Nothing to close.")
+            elif db_session_from_context and hasattr(db_session_from_context, 'close') and callable(db_session_from_context.close):
                  try:
                       db_session_from_context.close()
                       logger.debug("WSGI Application: Database session closed in finally block.")
@@ -562,11 +576,11 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
         else:
             logger.warning("WSGI Application: Request object was not created. Cannot close DB session in finally block.")
 
-        if dispatcher:
+        if dispatcher and dispatcher.has_receivers("server_request_finished"):
             final_status = getattr(final_response, 'status_code', 'N/A') if final_response else 'N/A'
             dispatcher.send("server_request_finished", sender="wsgi_application", method=method, path=path, full_path=raw_path_with_query, duration=duration, status_code=final_status, response=final_response, request=request)
             logging.debug(f"Signal 'server_request_finished' sent for {method} {raw_path_with_query}. Duration: {duration:.4f}s, Status: {final_status}.")
-        else:
+        elif not dispatcher:
             logging.warning("Dispatcher is None. Cannot send 'server_request_finished' signal.")
 
     except Exception as e:
@@ -581,7 +595,7 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
          logger.critical("WSGI Application: final_response is None after all processing. Returning a default 500 error.")
          if request is None:
               try:
-                  request = Request(raw_path_with_query, method, b'', headers, environ=environ) 
+                  request = Request(raw_path_with_query, method, b'', headers, environ=environ, app_context=app_context) 
               except Exception as req_e:
                    logger.critical(f"[{method}] Failed to create Request object for final 500 handling: {req_e}", exc_info=True)
                    if error_handler_instance is None:
@@ -617,7 +631,12 @@ def wsgi_application(environ: Dict[str, Any], start_response: Callable) -> Any:
          start_response(status, headers_list)
          return [b"Internal Server Error: Invalid response object generated."]
 
-    status_line, header_list_tuples, body_iterable = final_response.get_wsgi_response()
+    if profiler.enabled:
+        wsgi_response_started_ns = time.perf_counter_ns()
+        status_line, header_list_tuples, body_iterable = final_response.get_wsgi_response(environ)
+        profiler.record(STAGE_WSGI_RESPONSE, time.perf_counter_ns() - wsgi_response_started_ns)
+    else:
+        status_line, header_list_tuples, body_iterable = final_response.get_wsgi_response(environ)
     start_response(status_line, header_list_tuples)
 
     logger.debug(f"--- END WSGI APPLICATION REQUEST PROCESSING --- Method: {method}, Path: {path}, Status: {status_line}")
@@ -667,4 +686,5 @@ class Server:
             logger.info("Server stopped by user (KeyboardInterrupt caught).")
         finally:
             logger.info("Server shutting down.")
+            dispatcher.shutdown()
 
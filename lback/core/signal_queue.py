@@ -0,0 +1,243 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_DROP = "drop"
+BACKPRESSURE_BLOCK = "block"
+BACKPRESSURE_SAMPLE = "sample"
+BACKPRESSURE_POLICIES = (BACKPRESSURE_DROP, BACKPRESSURE_BLOCK, BACKPRESSURE_SAMPLE)
+
+_STOP = object()
+
+
+class SignalEvent(NamedTuple):
+    """One dispatched signal, as delivered to async receivers."""
+    signal_name: str
+    sender: Any
+    kwargs: Dict[str, Any]
+    timestamp: float
+
+
+class AsyncSignalQueue:
+    """
+    Bounded queue of signal events drained by a pool of worker threads.
+
+    Each worker takes up to batch_size events, waiting at most batch_wait seconds for the
+    batch to fill, and calls every async receiver once with the list of its events, in the
+    order they were sent. With more than one worker, batches for the same receiver may be
+    delivered concurrently and out of order.
+
+    When the queue is full, the backpressure policy decides what send() does:
+    - 'drop': the event is discarded.
+    - 'block': send() waits up to block_timeout seconds for space, then discards the event.
+    - 'sample': once the queue is half full, only one event in every sample_every is
+      enqueued; when the queue is full the event is discarded.
+
+    Workers start on the first put() and are stopped by shutdown() or at interpreter exit.
+    """
+
+    def __init__(self, maxsize: int = 10000, workers: int = 2, batch_size: int = 100, batch_wait: float = 0.05,
+                 backpressure: str = BACKPRESSURE_DROP, sample_every: int = 10, block_timeout: float = 1.0):
+        """
+        Args:
+            maxsize: Maximum number of queued events.
+            workers: Number of worker threads.
+            batch_size: Maximum number of events handed to one worker at a time.
+            batch_wait: Seconds a worker waits for a batch to fill before delivering it.
+            backpressure: 'drop', 'block' or 'sample'.
+            sample_every: Under the 'sample' policy, keep one event in this many.
+            block_timeout: Under the 'block' policy, seconds send() waits for space.
+
+        Raises:
+            ValueError: If backpressure is unknown or a size/count is not positive.
+        """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown signal backpressure policy '{backpressure}'. Expected one of {BACKPRESSURE_POLICIES}.")
+        for option, value in (("maxsize", maxsize), ("workers", workers), ("batch_size", batch_size), ("sample_every", sample_every)):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"Async signal option '{option}' must be a positive integer, got {value!r}.")
+
+        self.maxsize = maxsize
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.backpressure = backpressure
+        self.sample_every = sample_every
+        self.block_timeout = block_timeout
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._sample_threshold = max(1, maxsize // 2)
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._sample_counter = 0
+        self._stats = {"enqueued": 0, "delivered": 0, "dropped": 0, "sampled_out": 0,
+                       "batches": 0, "receiver_errors": 0, "max_depth": 0}
+
+    def put(self, receivers: Tuple[Callable[..., Any], ...], event: SignalEvent) -> bool:
+        """
+        Enqueues an event for the given async receivers, applying the backpressure policy.
+
+        Returns:
+            True if the event was enqueued, False if it was dropped or sampled out.
+        """
+        if not self._threads:
+            self._start_workers()
+
+        depth = self._queue.qsize()
+        if self.backpressure == BACKPRESSURE_SAMPLE and depth >= self._sample_threshold:
+            with self._stats_lock:
+                self._sample_counter += 1
+                keep = self._sample_counter % self.sample_every == 0
+                if not keep:
+                    self._stats["sampled_out"] += 1
+            if not keep:
+                return False
+
+        try:
+            if self.backpressure == BACKPRESSURE_BLOCK:
+                self._queue.put((receivers, event), timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait((receivers, event))
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["dropped"] += 1
+            logger.debug(f"AsyncSignalQueue: Queue full ({self.maxsize}); dropped '{event.signal_name}' event.")
+            return False
+
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+            if depth + 1 > self._stats["max_depth"]:
+                self._stats["max_depth"] = depth + 1
+        return True
+
+    def _start_workers(self):
+        with self._start_lock:
+            if self._threads:
+                return
+            self._threads = [
+                threading.Thread(target=self._work, name=f"lback-signal-worker-{index}", daemon=True)
+                for index in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+            atexit.register(self.shutdown)
+            logger.info(f"AsyncSignalQueue: Started {self.workers} worker(s) (maxsize={self.maxsize}, batch_size={self.batch_size}, backpressure='{self.backpressure}').")
+
+    def _work(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            items = [item]
+            deadline = time.monotonic() + self.batch_wait
+            while len(items) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    next_item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_item is _STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                items.append(next_item)
+            try:
+                self._deliver(items)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+    def _deliver(self, items: List[Tuple[Tuple[Callable[..., Any], ...], SignalEvent]]):
+        batches: Dict[Callable[..., Any], List[SignalEvent]] = {}
+        for receivers, event in items:
+            for receiver in receivers:
+                batches.setdefault(receiver, []).append(event)
+
+        errors = 0
+        for receiver, events in batches.items():
+            try:
+                receiver(events)
+            except Exception as e:
+                errors += 1
+                logger.error(f"Error calling async receiver {getattr(receiver, '__name__', receiver)} with {len(events)} event(s): {e}", exc_info=True)
+
+        with self._stats_lock:
+            self._stats["delivered"] += len(items)
+            self._stats["batches"] += 1
+            self._stats["receiver_errors"] += errors
+
+    @property
+    def depth(self) -> int:
+        """The number of events currently waiting in the queue."""
+        return self._queue.qsize()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns the queue metrics: current depth, capacity, the highest depth seen, and the
+        enqueued, delivered, dropped and sampled-out event counts, batch count and receiver errors.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats.update({
+            "depth": self.depth,
+            "capacity": self.maxsize,
+            "workers": sum(1 for thread in self._threads if thread.is_alive()),
+            "backpressure": self.backpressure,
+        })
+        return stats
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every queued event has been delivered.
+
+        Args:
+            timeout: Maximum seconds to wait; None waits indefinitely.
+
+        Returns:
+            True if the queue drained, False on timeout.
+        """
+        if not self._threads:
+            return self._queue.unfinished_tasks == 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: Optional[float] = 5.0):
+        """
+        Delivers the queued events and stops the workers.
+
+        Args:
+            timeout: Maximum seconds to wait for the workers to finish.
+        """
+        with self._start_lock:
+            threads, self._threads = self._threads, []
+        if not threads:
+            return
+        atexit.unregister(self.shutdown)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for _ in threads:
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning("AsyncSignalQueue: Queue still full at shutdown; workers may not stop in time.")
+                break
+        for thread in threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        pending = self._queue.qsize()
+        if pending:
+            logger.warning(f"AsyncSignalQueue: Shut down with {pending} undelivered event(s).")
+        else:
+            logger.info("AsyncSignalQueue: Workers stopped.")
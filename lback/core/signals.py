@@ -1,28 +1,64 @@
 import logging
-from typing import Callable, Dict, List, Any, Optional
+import threading
+import time
+from typing import Callable, Dict, Tuple, Any, Optional
+
+from .signal_queue import AsyncSignalQueue, SignalEvent
 
 
 logger = logging.getLogger(__name__)
 
 Receiver = Callable[..., Any]
-ReceiverList = List[Receiver]
+ReceiverList = Tuple[Receiver, ...]
 
 SignalRegistry = Dict[str, ReceiverList]
 
+SYNC = "sync"
+ASYNC = "async"
+
 class SignalDispatcher:
     """
     Signal Dispatcher for the Lback framework.
 
     This class allows registering receivers (callable functions or methods) for specific signals,
     and dispatching signals to invoke all registered receivers.
+
+    Receivers connected with mode="async" are not called by send(). Their events go to a bounded
+    AsyncSignalQueue, and worker threads call each receiver with a list of SignalEvent objects.
+    The queue is created on the first async connect, using the options from configure_async().
+
+    Each signal's receivers are stored as immutable tuples that connect() and disconnect()
+    replace rather than mutate, so send() can iterate them without copying or locking, and a
+    signal with no receivers costs send() one dict lookup.
     """
 
     def __init__(self):
         """Initializes the SignalDispatcher with an empty signal registry."""
         self._registry: SignalRegistry = {}
+        self._async_registry: SignalRegistry = {}
+        self._async_options: Dict[str, Any] = {}
+        self._async_queue: Optional[AsyncSignalQueue] = None
+        self._connected: Dict[str, Tuple[ReceiverList, ReceiverList]] = {}
+        self._registry_lock = threading.Lock()
         logger.info("SignalDispatcher initialized.")
 
-    def connect(self, signal_name: str, receiver: Receiver):
+    def configure_async(self, **options: Any):
+        """
+        Sets the options of the async delivery queue (see AsyncSignalQueue): maxsize, workers,
+        batch_size, batch_wait, backpressure, sample_every and block_timeout.
+        A running queue is drained and replaced.
+
+        Raises:
+            ValueError: If an option is invalid.
+        """
+        new_queue = AsyncSignalQueue(**options)
+        old_queue, self._async_queue = self._async_queue, new_queue
+        self._async_options = options
+        if old_queue is not None:
+            old_queue.shutdown()
+        logger.info(f"SignalDispatcher: Async signal delivery configured with {options}.")
+
+    def connect(self, signal_name: str, receiver: Receiver, mode: str = SYNC):
         """
         Registers a receiver function or method to a specific signal.
 
@@ -30,6 +66,9 @@ class SignalDispatcher:
             signal_name (str): The name of the signal to connect the receiver to.
             receiver (Callable): The function or method to be called when the signal is dispatched.
                                  Must be callable.
+            mode (str): "sync" (default) calls receiver(sender=..., **kwargs) inside send().
+                        "async" queues the event; a worker thread later calls receiver(events)
+                        with a list of SignalEvent objects.
         """
         if not isinstance(signal_name, str) or not signal_name:
             logger.error(f"Invalid signal_name provided: '{signal_name}'. Must be a non-empty string.")
@@ -39,15 +78,22 @@ class SignalDispatcher:
             logger.error(f"Invalid receiver provided for signal '{signal_name}': {receiver}. Must be callable.")
             return
 
-        if signal_name not in self._registry:
-            self._registry[signal_name] = []
-            logger.debug(f"Created new entry for signal: '{signal_name}' in registry.")
+        if mode not in (SYNC, ASYNC):
+            logger.error(f"Invalid mode '{mode}' for receiver {receiver.__name__} on signal '{signal_name}'. Must be '{SYNC}' or '{ASYNC}'.")
+            return
 
-        if receiver not in self._registry[signal_name]:
-            self._registry[signal_name].append(receiver)
-            logger.info(f"Connected receiver {receiver.__name__} to signal '{signal_name}'.")
-        else:
-            logger.warning(f"Receiver {receiver.__name__} is already connected to signal '{signal_name}'. Skipping.")
+        registry = self._async_registry if mode == ASYNC else self._registry
+        with self._registry_lock:
+            if mode == ASYNC and self._async_queue is None:
+                self._async_queue = AsyncSignalQueue(**self._async_options)
+
+            receivers = registry.get(signal_name, ())
+            if receiver in receivers:
+                logger.warning(f"Receiver {receiver.__name__} is already connected to signal '{signal_name}'. Skipping.")
+                return
+            registry[signal_name] = receivers + (receiver,)
+            self._rebuild_connected(signal_name)
+        logger.info(f"Connected {mode} receiver {receiver.__name__} to signal '{signal_name}'.")
 
 
     def disconnect(self, signal_name: str, receiver: Receiver):
@@ -66,18 +112,49 @@ class SignalDispatcher:
             logger.error(f"Invalid receiver provided for signal '{signal_name}' disconnect: {receiver}. Must be callable.")
             return
         
-        if signal_name in self._registry:
-            try:
-                self._registry[signal_name].remove(receiver)
-                logger.info(f"Disconnected receiver {receiver.__name__} from signal '{signal_name}'.")
-                if not self._registry[signal_name]:
-                    del self._registry[signal_name]
-                    logger.debug(f"Removed signal '{signal_name}' from registry as it has no more receivers.")
-            except ValueError:
-                logger.warning(f"Receiver {receiver.__name__} was not found connected to signal '{signal_name}'.")
-        else:
+        if signal_name not in self._registry and signal_name not in self._async_registry:
             logger.warning(f"Signal '{signal_name}' not found in registry. Cannot disconnect receiver {receiver.__name__}.")
+            return
+
+        disconnected = False
+        with self._registry_lock:
+            for registry in (self._registry, self._async_registry):
+                receivers = registry.get(signal_name, ())
+                if receiver in receivers:
+                    remaining = tuple(connected for connected in receivers if connected != receiver)
+                    disconnected = True
+                    if remaining:
+                        registry[signal_name] = remaining
+                    else:
+                        del registry[signal_name]
+                        logger.debug(f"Removed signal '{signal_name}' from registry as it has no more receivers.")
+            self._rebuild_connected(signal_name)
+        if disconnected:
+            logger.info(f"Disconnected receiver {receiver.__name__} from signal '{signal_name}'.")
+        else:
+            logger.warning(f"Receiver {receiver.__name__} was not found connected to signal '{signal_name}'.")
+
+
+    def _rebuild_connected(self, signal_name: str):
+        """Recomputes the (sync, async) receiver tuples send() reads for a signal. Called with the registry lock held."""
+        receivers = (self._registry.get(signal_name, ()), self._async_registry.get(signal_name, ()))
+        if receivers[0] or receivers[1]:
+            self._connected[signal_name] = receivers
+        else:
+            self._connected.pop(signal_name, None)
 
+    def has_receivers(self, signal_name: str) -> bool:
+        """
+        Checks whether any receiver is connected to a signal.
+        Lets hot code paths skip building signal arguments nobody will receive.
+
+        Args:
+            signal_name (str): The name of the signal.
+
+        Returns:
+            True if at least one receiver is connected, False otherwise.
+        """
+        return signal_name in self._connected
 
     def send(self, signal_name: str, sender: Optional[Any] = None, **kwargs: Any):
         """
@@ -89,30 +166,62 @@ class SignalDispatcher:
             **kwargs: Additional keyword arguments to pass to the receivers.
 
         Returns:
-            list: A list of tuples containing each receiver and its return value or exception.
+            list: A list of tuples containing each sync receiver and its return value or exception.
+                  Async receivers are not included; their events are queued.
         """
-        if not isinstance(signal_name, str) or not signal_name:
-            logger.error(f"Invalid signal_name provided for send: '{signal_name}'. Must be a non-empty string.")
+        try:
+            connected = self._connected.get(signal_name)
+        except TypeError:
+            connected = None
+
+        if connected is None:
+            if not isinstance(signal_name, str) or not signal_name:
+                logger.error(f"Invalid signal_name provided for send: '{signal_name}'. Must be a non-empty string.")
             return []
+        receivers, async_receivers = connected
 
-        logger.debug(f"Sending signal: '{signal_name}' from sender: {sender} with data: {kwargs}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Sending signal: '{signal_name}' from sender: {sender!r} with data keys: {sorted(kwargs)}")
 
         results = []
 
-        if signal_name in self._registry:
-            for receiver in list(self._registry[signal_name]):
+        if receivers:
+            for receiver in receivers:
                 try:
-                    result = receiver(sender=sender, **kwargs)
-                    results.append((receiver, result))
-                    logger.debug(f"Successfully called receiver {receiver.__name__} for signal '{signal_name}'.")
+                    results.append((receiver, receiver(sender=sender, **kwargs)))
+                    if debug:
+                        logger.debug(f"Successfully called receiver {receiver.__name__} for signal '{signal_name}'.")
                 except Exception as e:
                     logger.error(f"Error calling receiver {receiver.__name__} for signal '{signal_name}': {e}", exc_info=True)
                     results.append((receiver, e))
 
-        else:
-            logger.debug(f"No receivers connected for signal: '{signal_name}'.")
+        if async_receivers:
+            self._async_queue.put(async_receivers, SignalEvent(signal_name, sender, kwargs, time.time()))
 
         return results
 
+    def async_metrics(self) -> Dict[str, Any]:
+        """
+        Returns the async queue metrics (depth, capacity, max_depth, enqueued, delivered,
+        dropped, sampled_out, batches, receiver_errors, workers, backpressure),
+        or an empty dict if no async receiver was ever connected.
+        """
+        return self._async_queue.metrics() if self._async_queue is not None else {}
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every queued async event has been delivered.
+
+        Returns:
+            True if the queue drained (or there is none), False on timeout.
+        """
+        return self._async_queue.flush(timeout) if self._async_queue is not None else True
+
+    def shutdown(self, timeout: Optional[float] = 5.0):
+        """Delivers the queued async events and stops the worker threads."""
+        if self._async_queue is not None:
+            self._async_queue.shutdown(timeout)
+
 dispatcher = SignalDispatcher()
 
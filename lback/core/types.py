@@ -1,15 +1,18 @@
-from typing import Dict, Any, Optional, Union, List, BinaryIO
+from typing import Dict, Any, Optional, Union, List, BinaryIO, Iterator, Mapping
+from types import MappingProxyType
 from urllib.parse import parse_qs, urlparse
 import logging
 import enum
 from http.cookies import SimpleCookie 
 import os
+import shutil
 from sqlalchemy.orm import Session as SQLASession
 
 from lback.core.config import Config
 from lback.core.templates import TemplateRenderer
 from lback.core.error_handler import ErrorHandler
 from lback.core.signals import SignalDispatcher
+from lback.core.converters import TypeConverter, StringConverter, IntegerConverter, UUIDConverter
 try:
     from lback.utils.app_session import AppSession
 except ImportError:
@@ -19,7 +22,8 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 class UploadedFile:
-    def __init__(self, filename: str, content_type: str, file: BinaryIO, field_name: str, size: int, headers: Dict[str, str] = None):
+    def __init__(self, filename: str, content_type: str, file: BinaryIO, field_name: str, size: int, headers: Dict[str, str] = None,
+                 digest: Optional[str] = None, detected_content_type: Optional[str] = None):
         """
         Represents a single uploaded file from a multipart/form-data request.
 
@@ -30,6 +34,8 @@ class UploadedFile:
             field_name: The name of the form field that contained this file.
             size: The size of the file in bytes.
             headers: Optional dictionary of headers specific to the file part (e.g., Content-Disposition).
+            digest: Hex digest of the content, computed while the upload was received.
+            detected_content_type: MIME type sniffed from the first bytes of the content, if known.
         """
         self.filename = filename
         self.content_type = content_type
@@ -37,6 +43,8 @@ class UploadedFile:
         self.field_name = field_name
         self.size = size
         self.headers = headers if headers is not None else {}
+        self.digest = digest
+        self.detected_content_type = detected_content_type
 
     def read(self, size=-1):
         """Reads bytes from the file-like object."""
@@ -54,6 +62,26 @@ class UploadedFile:
         if self.file and hasattr(self.file, 'close') and callable(self.file.close):
             self.file.close()
 
+    def move_to(self, destination: str) -> str:
+        """
+        Stores the content at 'destination'.
+        A file spooled to disk by the multipart parser is renamed into place (no copy when both
+        paths are on the same filesystem); other streams are copied in chunks.
+
+        Args:
+            destination: The target file path. Its directory must exist.
+
+        Returns:
+            The destination path.
+        """
+        move_to = getattr(self.file, 'move_to', None)
+        if callable(move_to):
+            return move_to(destination)
+        self.file.seek(0)
+        with open(destination, 'wb') as target:
+            shutil.copyfileobj(self.file, target)
+        return destination
+
     def __repr__(self):
         return (f"<UploadedFile: filename='{self.filename}', field_name='{self.field_name}', "
                 f"size={self.size}, content_type='{self.content_type}'>")
@@ -87,6 +115,48 @@ class HTTPMethod(enum.Enum):
         return hash(self.value)
 
 
+class AppContext(Mapping):
+    """
+    Immutable, application-wide context shared by all requests.
+    Holds long-lived dependencies (config, router, managers, error handler, ...) that were
+    previously copied into every request's context. Request.get_context() falls back to it
+    for keys that were not set on the request itself, so only request-specific values
+    (db_session, user, session, ...) are stored per request.
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None):
+        """
+        Initializes the AppContext.
+
+        Args:
+            data: A mapping of dependency names to instances. Entries whose value is None are dropped.
+        """
+        self._data = MappingProxyType({key: value for key, value in (data or {}).items() if value is not None})
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
+        return self._data.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<AppContext keys={list(self._data.keys())}>"
+
+
+EMPTY_APP_CONTEXT = AppContext()
+_HTTP_METHODS: Dict[str, HTTPMethod] = {m.value: m for m in HTTPMethod}
+
+
 class Request:
     """
     Represents an incoming HTTP request.
@@ -94,10 +164,28 @@ class Request:
     and serves as a context object to pass data (user, session, db_session, path_params, dependencies)
     through the middleware chain and to the view.
     Includes enhancements for file uploads, cookies, META, etc., populated by middlewares.
+
+    Headers, the URL, query params, cookies and META are parsed on first access, so requests
+    that never look at them (static files, health checks, cached pages) don't pay for it.
+    Fields are declared in __slots__; arbitrary attributes cannot be set on a Request, use
+    set_context() for request-scoped data instead.
     """
-    def __init__(self, path: str, method: Union[str, HTTPMethod], body: Union[str, bytes, None], headers: Dict[str, str], environ: Dict[str, Any]):
+    __slots__ = (
+        'raw_path', 'method', 'route_requires_auth',
+        '_initial_body', '_cached_body_text', '_raw_headers', '_headers', '_environ',
+        '_context', '_app_context',
+        '_path', '_query_string', '_query_params', '_cookies', '_meta',
+        '_parsed_body', '_files', '_user', '_session', '_db_session',
+        '_error_handler', '_config', '_template_renderer', '_router', '_dispatcher',
+        '_admin_registry', '_admin_user_manager', '_session_manager', '_user_manager',
+        '_start_time',
+    )
+
+    def __init__(self, path: str, method: Union[str, HTTPMethod], body: Union[str, bytes, None], headers: Dict[str, str], environ: Dict[str, Any], app_context: Optional[AppContext] = None):
         """
         Initializes a Request object with raw request data and WSGI environment.
+        app_context is the shared application context that get_context() falls back to.
+        Only the method is normalised here; everything else is parsed lazily.
         """
         if not isinstance(path, str):
              logger.error(f"Invalid path type during Request initialization: {type(path)}")
@@ -117,26 +205,32 @@ class Request:
 
         self.raw_path: str = path
         if isinstance(method, str):
-            try:
-                self.method: HTTPMethod = HTTPMethod(method.upper())
-            except ValueError:
-                self.method: Union[str, HTTPMethod] = method.upper()
+            known_method = _HTTP_METHODS.get(method)
+            if known_method is None:
+                known_method = _HTTP_METHODS.get(method.upper())
+            if known_method is not None:
+                self.method: Union[str, HTTPMethod] = known_method
+            else:
+                self.method = method.upper()
                 logger.warning(f"Received unknown HTTP method: {method}")
         else:
-            self.method: HTTPMethod = method
+            self.method = method
 
         self._initial_body: Union[str, bytes, None] = body
-        self.headers: Dict[str, str] = {k.replace('_', '-').upper(): v for k, v in headers.items()}
+        self._raw_headers: Dict[str, str] = headers
+        self._headers: Optional[Dict[str, str]] = None
         self._environ: Dict[str, Any] = environ
 
         self._context: Dict[str, Any] = {}
-        self.path: str = ""
-        self.query_params: Dict[str, Any] = {}
-        self.cookies: Dict[str, str] = {}
-        self.meta: Dict[str, Any] = {}
+        self._app_context: AppContext = app_context if app_context is not None else EMPTY_APP_CONTEXT
+        self._path: Optional[str] = None
+        self._query_string: str = ""
+        self._query_params: Optional[Dict[str, Any]] = None
+        self._cookies: Optional[Dict[str, str]] = None
+        self._meta: Optional[Dict[str, Any]] = None
 
         self._parsed_body: Optional[Dict[str, Any]] = None
-        self._files: Dict[str, Union[UploadedFile, List[UploadedFile]]] = {}
+        self._files: Optional[Dict[str, Union[UploadedFile, List[UploadedFile]]]] = None
         self._user: Optional[Any] = None
         self._session: Optional[AppSession] = None
         self._db_session: Optional[Any] = None
@@ -150,92 +244,167 @@ class Request:
         self._admin_user_manager: Optional[Any] = None
         self._session_manager: Optional[Any] = None
         self._user_manager: Optional[Any] = None
-        self._path_params: Dict[str, Any] = {}
         self.route_requires_auth: bool = False
 
-        self._parse_url()
-        self._parse_cookies()
-        self._populate_meta()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Request object initialized for {self.method} {self.raw_path}")
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """
+        The request headers, keyed by upper-case names with dashes (e.g. 'CONTENT-TYPE').
+        Normalised from the raw headers on first access.
+        """
+        if self._headers is None:
+            self._headers = {k.replace('_', '-').upper(): v for k, v in self._raw_headers.items()}
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: Dict[str, str]):
+        """Replaces the request headers. Keys are normalised on next access."""
+        self._raw_headers = headers
+        self._headers = None
 
-        logger.debug(f"Request object initialized for {self.method} {self.path}")
-        logger.debug(f"Headers: {self.headers}")
-        logger.debug(f"Query Params: {self.query_params}")
-        logger.debug(f"Cookies: {self.cookies}")
+    @property
+    def path(self) -> str:
+        """The request path without the query string, parsed from raw_path on first access."""
+        if self._path is None:
+            self._parse_url()
+        return self._path
+
+    @path.setter
+    def path(self, path: str):
+        if self._path is None:
+            self._parse_url()
+        self._path = path
+
+    @property
+    def query_params(self) -> Dict[str, Any]:
+        """
+        Query string parameters, parsed on first access. Single values are unwrapped,
+        repeated keys map to a list.
+        """
+        if self._query_params is None:
+            if self._path is None:
+                self._parse_url()
+            self._query_params = self._parse_query_string(self._query_string)
+        return self._query_params
 
+    @query_params.setter
+    def query_params(self, params: Dict[str, Any]):
+        self._query_params = params
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        """Cookies from the 'Cookie' header, parsed on first access."""
+        if self._cookies is None:
+            self._parse_cookies()
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, cookies: Dict[str, str]):
+        self._cookies = cookies
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        """Django-style META built from the WSGI environment on first access."""
+        if self._meta is None:
+            self._populate_meta()
+        return self._meta
+
+    @meta.setter
+    def meta(self, meta: Dict[str, Any]):
+        self._meta = meta
 
     def _parse_url(self):
         """
-        Parses the raw request path to extract the clean path and query parameters.
-        Updates self.path and self.query_params.
-        Called during __init__.
+        Splits the raw request path into the clean path and the query string.
+        Updates self._path and self._query_string. Query params are parsed separately,
+        on first access to self.query_params. Plain paths are split directly; paths with
+        ';params', a fragment or a leading '//' (which urlparse reads as a netloc) go through urlparse.
         """
-        logger.debug(f"Parsing URL: {self.raw_path}")
+        raw_path = self.raw_path
+        if (raw_path.startswith('/') and not raw_path.startswith('//')
+                and ';' not in raw_path and '#' not in raw_path):
+            self._path, _, self._query_string = raw_path.partition('?')
+            return
+        try:
+            parsed_url = urlparse(raw_path)
+            self._path = parsed_url.path
+            self._query_string = parsed_url.query
+        except Exception as e:
+            logger.error(f"Error parsing URL '{raw_path}': {e}")
+            self._path = raw_path
+            self._query_string = ""
+
+    def _parse_query_string(self, query_string: str) -> Dict[str, Any]:
+        """Parses a query string into a dict, unwrapping single values."""
+        if not query_string:
+            return {}
         try:
-            parsed_url = urlparse(self.raw_path)
-            self.path: str = parsed_url.path 
-            self.query_params = {k: v[0] if len(v) == 1 else v for k, v in parse_qs(parsed_url.query).items()}
-            logger.debug(f"URL parsed. Clean path: {self.path}, Query params: {self.query_params}")
+            query_params = {k: v[0] if len(v) == 1 else v for k, v in parse_qs(query_string).items()}
+            logger.debug(f"Query string parsed: {query_params}")
+            return query_params
         except Exception as e:
-            logger.error(f"Error parsing URL '{self.raw_path}': {e}")
-            self.path = self.raw_path
-            self.query_params = {}
+            logger.error(f"Error parsing query string '{query_string}': {e}")
+            return {}
 
     def _parse_cookies(self):
         """
         Parses the 'Cookie' header to extract cookie key-value pairs.
-        Updates self.cookies.
-        Called during __init__.
+        Updates self._cookies.
+        Called on first access to self.cookies.
         """
-        logger.debug("Parsing cookies from headers.")
         cookie_header = self.headers.get('COOKIE')
-        self.cookies = {}
+        self._cookies = {}
         if cookie_header:
             try:
                 cookie_object = SimpleCookie()
                 cookie_object.load(cookie_header)
-                self.cookies = {key: morsel.value for key, morsel in cookie_object.items()}
-                logger.debug(f"Parsed {len(self.cookies)} cookies.")
+                self._cookies = {key: morsel.value for key, morsel in cookie_object.items()}
+                logger.debug(f"Parsed {len(self._cookies)} cookies.")
             except Exception as e:
                 logger.error(f"Error parsing Cookie header '{cookie_header}': {e}", exc_info=True)
-        else:
-             logger.debug("No 'Cookie' header found.")
 
     def _populate_meta(self):
         """
-        Populates the self.meta dictionary with relevant information from the WSGI environment.
+        Populates the self._meta dictionary with relevant information from the WSGI environment.
         Mimics Django's request.META.
-        Called during __init__.
+        Called on first access to self.meta.
         """
         logger.debug("Populating META data from environ.")
-        self.meta = {}
+        meta = {}
         for key, value in self._environ.items():
             if isinstance(key, str) and key.isupper():
                  if not key.startswith('WSGI.') and key not in ['SERVER_SOFTWARE', 'GATEWAY_INTERFACE']:
-                     self.meta[key] = value
+                     meta[key] = value
 
         for key, value in self._environ.items():
             if key.startswith('HTTP_'):
                  header_name = key[len('HTTP_'):].replace('_', '-')
-                 if header_name not in self.meta: 
-                     self.meta[header_name] = value
+                 if header_name not in meta:
+                     meta[header_name] = value
 
         if 'CONTENT_TYPE' in self._environ:
-             self.meta['CONTENT-TYPE'] = self._environ['CONTENT_TYPE']
+             meta['CONTENT-TYPE'] = self._environ['CONTENT_TYPE']
         if 'CONTENT_LENGTH' in self._environ:
-             self.meta['CONTENT-LENGTH'] = self._environ['CONTENT_LENGTH']
-
-        self.meta['REQUEST_METHOD'] = self.method.value if isinstance(self.method, HTTPMethod) else self.method
-        self.meta['PATH_INFO'] = self.path
-        self.meta['SCRIPT_NAME'] = self._environ.get('SCRIPT_NAME', '')
-        self.meta['QUERY_STRING'] = urlparse(self.raw_path).query
-        self.meta['SERVER_NAME'] = self._environ.get('SERVER_NAME', '')
-        self.meta['SERVER_PORT'] = self._environ.get('SERVER_PORT', '')
-        self.meta['REMOTE_ADDR'] = self._environ.get('REMOTE_ADDR', '')
-        self.meta['REMOTE_HOST'] = self._environ.get('REMOTE_HOST', '')
-        self.meta['SERVER_PROTOCOL'] = self._environ.get('SERVER_PROTOCOL', '')
-        self.meta['wsgi.url_scheme'] = self._environ.get('wsgi.url_scheme', '')
-
-        logger.debug(f"Populated META with {len(self.meta)} keys.")
+             meta['CONTENT-LENGTH'] = self._environ['CONTENT_LENGTH']
+
+        if self._path is None:
+            self._parse_url()
+        meta['REQUEST_METHOD'] = self.method.value if isinstance(self.method, HTTPMethod) else self.method
+        meta['PATH_INFO'] = self._path
+        meta['SCRIPT_NAME'] = self._environ.get('SCRIPT_NAME', '')
+        meta['QUERY_STRING'] = self._query_string
+        meta['SERVER_NAME'] = self._environ.get('SERVER_NAME', '')
+        meta['SERVER_PORT'] = self._environ.get('SERVER_PORT', '')
+        meta['REMOTE_ADDR'] = self._environ.get('REMOTE_ADDR', '')
+        meta['REMOTE_HOST'] = self._environ.get('REMOTE_HOST', '')
+        meta['SERVER_PROTOCOL'] = self._environ.get('SERVER_PROTOCOL', '')
+        meta['wsgi.url_scheme'] = self._environ.get('wsgi.url_scheme', '')
+        self._meta = meta
+
+        logger.debug(f"Populated META with {len(meta)} keys.")
 
     @property
     def body_bytes(self) -> bytes:
@@ -355,6 +524,8 @@ class Request:
          objects or lists of UploadedFile objects for multiple files with the same name.
          Returns an empty dictionary if no files were uploaded or parsing failed.
          """
+         if self._files is None:
+             self._files = {}
          return self._files
 
     @files.setter
@@ -508,13 +679,27 @@ class Request:
 
     def get_context(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
         """
-        Retrieves a value from the internal context dictionary (_context).
+        Retrieves a value from the internal context dictionary (_context), falling back
+        to the shared application context for keys not set on this request.
         Known context items with dedicated properties should be accessed via those properties
         (e.g., request.db_session, request.user) for type safety and clarity.
         This method is for accessing other arbitrary data stored in the context dictionary
         via set_context().
         """
-        return self._context.get(key, default)
+        try:
+            return self._context[key]
+        except KeyError:
+            return self._app_context.get(key, default)
+
+    @property
+    def app_context(self) -> AppContext:
+        """The shared application context used as fallback by get_context()."""
+        return self._app_context
+
+    @app_context.setter
+    def app_context(self, app_context: Optional[AppContext]):
+        """Setter for the shared application context. Used by AppController."""
+        self._app_context = app_context if app_context is not None else EMPTY_APP_CONTEXT
 
 
     @property
@@ -705,42 +890,3 @@ class Request:
                 f"session={'<set>' if self._session is not None else '<not set>'}, "
                 f"db_session={'<set>' if self._db_session is not None else '<not set>'} "
                 f")>")
-    
-
-class TypeConverter:
-    """Base class for path variable type converters."""
-    def to_python(self, value: str) -> Any:
-        """Converts the string value from the URL to a Python type."""
-        raise NotImplementedError
-
-    def to_url(self, value: Any) -> str:
-        """Converts a Python value to its URL representation."""
-        raise NotImplementedError
-
-    @property
-    def openapi_type(self) -> Dict[str, Any]:
-        """Returns the OpenAPI schema type for this converter."""
-        return {"type": "string"}
-
-class IntegerConverter(TypeConverter):
-    def to_python(self, value: str) -> int:
-        return int(value)
-
-    def to_url(self, value: Any) -> str:
-        return str(value)
-
-    @property
-    def openapi_type(self) -> Dict[str, Any]:
-        return {"type": "integer", "format": "int64"}
-
-class UUIDConverter(TypeConverter):
-    def to_python(self, value: str) -> 'uuid.UUID':
-        import uuid
-        return uuid.UUID(value)
-
-    def to_url(self, value: Any) -> str:
-        return str(value)
-
-    @property
-    def openapi_type(self) -> Dict[str, Any]:
-        return {"type": "string", "format": "uuid"}
\ No newline at end of file
@@ -81,4 +81,12 @@ and session management.
     A middleware component designed to measure and log the time taken to process each request.
     This middleware can be useful for performance monitoring and identifying bottlenecks
     in the application's request-response cycle.
+
+13. **ResponseCacheMiddleware (from .response_cache_middleware):**
+    A middleware component that caches whole responses of opted-in views and serves repeated
+    anonymous GET requests from the cache, with ETag/Last-Modified validation and 304 responses.
+
+14. **CompressionMiddleware (from .compression_middleware):**
+    A middleware component that compresses response bodies (brotli, gzip or deflate) according
+    to the client's Accept-Encoding header, including streaming responses.
 """
\ No newline at end of file
@@ -1,29 +1,47 @@
 import logging
-import json
 import urllib.parse
 from typing import Optional,Any
 from http import HTTPStatus
 import enum
-from werkzeug.datastructures import FileStorage, MultiDict 
-from werkzeug.formparser import parse_form_data
+from werkzeug.datastructures import MultiDict 
 
+from lback.core import json_codec
 from lback.core.base_middleware import BaseMiddleware
+from lback.core.exceptions import BadRequest, PayloadTooLarge
 from lback.core.response import Response
 from lback.core.types import Request, UploadedFile 
+from lback.utils.multipart import MultipartParser, boundary_from_content_type
 
 logger = logging.getLogger(__name__)
 
 class BodyParsingMiddleware(BaseMiddleware):
     """
     Middleware for parsing the request body based on Content-Type.
-    Handles application/json, application/x-www-form-urlencoded, and multipart/form-data (using Werkzeug).
+    Handles application/json, application/x-www-form-urlencoded, and multipart/form-data.
     Attaches parsed data to request.parsed_body (MultiDict) and uploaded files to request.files (dict of UploadedFile or list of UploadedFile).
+
+    Multipart bodies are parsed incrementally from wsgi.input by MultipartParser. Upload limits come
+    from the UPLOAD_MAX_MEMORY_SIZE, UPLOAD_MAX_FIELD_SIZE, UPLOAD_MAX_FILE_SIZE,
+    UPLOAD_MAX_REQUEST_SIZE and UPLOAD_TEMP_DIR settings; exceeding one returns 413. Saved files get
+    the UPLOAD_FILE_PERMISSIONS mode. A body without Content-Length is only read when the server
+    sets wsgi.input_terminated.
     """
 
     def __init__(self, config: Optional[Any] = None):
         """Initialize BodyParsingMiddleware."""
         self.config = config
-        logger.info("BodyParsingMiddleware initialized (using Werkzeug).")
+        logger.info("BodyParsingMiddleware initialized.")
+
+    def _multipart_parser(self, request: Request) -> MultipartParser:
+        config = self.config if self.config is not None else request.config
+        return MultipartParser(
+            memory_threshold=getattr(config, 'UPLOAD_MAX_MEMORY_SIZE', None) or 2560 * 1024,
+            max_field_size=getattr(config, 'UPLOAD_MAX_FIELD_SIZE', None) or 1024 * 1024,
+            max_file_size=getattr(config, 'UPLOAD_MAX_FILE_SIZE', None),
+            max_total_size=getattr(config, 'UPLOAD_MAX_REQUEST_SIZE', None),
+            temp_dir=getattr(config, 'UPLOAD_TEMP_DIR', None) or None,
+            file_mode=getattr(config, 'UPLOAD_FILE_PERMISSIONS', None),
+        )
 
     def process_request(self, request: Request) -> Optional[Response]:
         """
@@ -45,9 +63,8 @@ class BodyParsingMiddleware(BaseMiddleware):
                 body_bytes = request.body_bytes
                 if body_bytes:
                     try:
-                        body_text = body_bytes.decode('utf-8')
-                        request.parsed_body = json.loads(body_text)
-                    except json.JSONDecodeError:
+                        request.parsed_body = json_codec.loads(body_bytes)
+                    except ValueError:
                         logger.warning(f"Invalid JSON body received for {request_method_str} {request.path}.")
                         return Response(HTTPStatus.BAD_REQUEST.value, "Invalid JSON body")
                     except Exception as e:
@@ -66,37 +83,34 @@ class BodyParsingMiddleware(BaseMiddleware):
 
             elif 'multipart/form-data' in content_type:
                 content_length_str = request.headers.get('CONTENT-LENGTH')
-                content_length = 0
+                content_length = None
                 if content_length_str and content_length_str.isdigit():
-                    try:
-                        content_length = int(content_length_str)
-                    except ValueError:
-                        logger.warning(f"Invalid Content-Length '{content_length_str}' for {request_method_str} {request.path}. Treating as 0.")
-                        content_length = 0
+                    content_length = int(content_length_str)
 
-                if content_length != 0:
+                input_terminated = bool(request.environ.get('wsgi.input_terminated'))
+                if content_length is None and not input_terminated:
+                    logger.debug(f"No Content-Length for multipart {request_method_str} {request.path}; treating the body as empty.")
+                elif content_length != 0:
+                    stream = request.get_body_stream()
+                    if stream is None:
+                        logger.warning(f"No wsgi.input stream for multipart {request_method_str} {request.path}.")
+                        return None
                     try:
-                        _, form_data_werkzeug, files_data_werkzeug = parse_form_data(request.environ)
-                        request.parsed_body = form_data_werkzeug
-                        uploaded_files_processed: MultiDict = MultiDict()
-                        if files_data_werkzeug:
-                            for field_name, file_storage_list_or_single in files_data_werkzeug.items(multi=True):
-                                if isinstance(file_storage_list_or_single, FileStorage):
-                                    uploaded_file = UploadedFile(
-                                        filename=file_storage_list_or_single.filename,
-                                        content_type=file_storage_list_or_single.mimetype,
-                                        file=file_storage_list_or_single.stream,
-                                        field_name=field_name,
-                                        size=file_storage_list_or_single.content_length or 0,
-                                        headers=dict(file_storage_list_or_single.headers)
-                                    )
-                                    uploaded_files_processed.add(field_name, uploaded_file)
-                        request.files = uploaded_files_processed
+                        form_data, files_data = self._multipart_parser(request).parse(
+                            stream, boundary_from_content_type(request.headers.get('CONTENT-TYPE', '')), content_length,
+                            input_terminated=input_terminated)
+                        request.parsed_body = form_data
+                        request.files = files_data
+                    except (BadRequest, PayloadTooLarge) as e:
+                        logger.warning(f"Rejected multipart body for {request_method_str} {request.path}: {e.message}")
+                        request.parsed_body = MultiDict()
+                        request.files = MultiDict()
+                        return Response(body=e.message.encode('utf-8'), status_code=e.status_code, content_type="text/plain")
                     except Exception as e:
                         logger.error(f"Exception during multipart parsing: {e}", exc_info=True)
                         request.parsed_body = MultiDict()
                         request.files = MultiDict()
-                        error_message = f"Error parsing multipart body with Werkzeug: {e}"
+                        error_message = f"Error parsing multipart body: {e}"
                         return Response(body=error_message.encode('utf-8'), status_code=HTTPStatus.BAD_REQUEST.value, content_type="text/plain")
         except Exception as e:
             logger.error(f"Unhandled exception during body parsing for {request_method_str} {request.path}: {e}", exc_info=True)
@@ -110,10 +124,12 @@ class BodyParsingMiddleware(BaseMiddleware):
     def process_response(self, request: Request, response: Response) -> Response:
         """
         Processes the outgoing response.
-        Cleans up any temporary files created during multipart body parsing (Werkzeug).
+        Cleans up any temporary files created during multipart body parsing.
+        Files already moved into place with UploadedFile.move_to() are kept.
         """
         if request.files:
-            for field_name, file_info in request.files.items():
+            file_items = request.files.items(multi=True) if isinstance(request.files, MultiDict) else request.files.items()
+            for field_name, file_info in file_items:
                 if isinstance(file_info, list):
                     for uploaded_file in file_info:
                         if isinstance(uploaded_file, UploadedFile) and hasattr(uploaded_file, 'close') and callable(uploaded_file.close):
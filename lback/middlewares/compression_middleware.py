@@ -0,0 +1,176 @@
+import logging
+import zlib
+from typing import Any, Iterable, Iterator, List, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from lback.core.base_middleware import BaseMiddleware
+from lback.core.response import Response, StreamingResponse
+from lback.core.types import Request
+from lback.utils.response_helpers import patch_vary_headers
+from lback.utils.static_files import accepted_encodings
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPRESSIBLE_TYPES = (
+    'text/html', 'text/css', 'text/plain', 'text/csv', 'text/xml', 'text/javascript',
+    'application/json', 'application/javascript', 'application/xml', 'application/xhtml+xml',
+    'application/ld+json', 'application/problem+json', 'application/manifest+json',
+    'image/svg+xml',
+)
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+DEFLATE_WBITS = zlib.MAX_WBITS
+SKIPPED_STATUS_CODES = frozenset({204, 206, 304})
+
+
+class _Compressor:
+    """Incremental compressor with the same interface for gzip, deflate and brotli."""
+
+    def __init__(self, encoding: str, level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == 'br':
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+            self._zlib = None
+        else:
+            self._brotli = None
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS if encoding == 'gzip' else DEFLATE_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data)
+        return self._zlib.compress(data)
+
+    def flush(self) -> bytes:
+        """Emits everything compressed so far, so the client can decode it without waiting for more."""
+        if self._brotli is not None:
+            return self._brotli.flush()
+        return self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class CompressionMiddleware(BaseMiddleware):
+    """
+    Compresses response bodies with brotli, gzip or deflate, as negotiated with the client's
+    Accept-Encoding header.
+
+    Only bodies of compressible content types (JSON, HTML, CSS, ...) at least 'min_size' bytes
+    long are compressed. Responses that already have a Content-Encoding (such as precompressed
+    static files), partial responses and responses marked 'Cache-Control: no-transform' are left
+    alone. Streaming responses are compressed chunk by chunk as they are sent, never buffered:
+    each chunk is flushed, so the client can decode it as soon as it arrives.
+
+    List it first in MIDDLEWARES: process_response runs in reverse order, so it then compresses
+    the final body after every other middleware has run.
+    """
+
+    def __init__(self, min_size: int = 500, level: int = 6, brotli_quality: int = 4,
+                 compressible_types: Optional[List[str]] = None, encodings: Optional[List[str]] = None):
+        """
+        Initializes the middleware.
+
+        Args:
+            min_size: Smallest body, in bytes, worth compressing. Streaming bodies have no known size
+                      and are always compressed.
+            level: zlib compression level for gzip and deflate (1-9).
+            brotli_quality: Brotli quality (0-11). Brotli is used only if the 'brotli' package is installed.
+            compressible_types: Content types (without parameters) to compress.
+            encodings: Supported encodings in order of preference. Defaults to ['br', 'gzip', 'deflate'].
+        """
+        self.min_size = min_size
+        self.level = level
+        self.brotli_quality = brotli_quality
+        self.compressible_types = frozenset(compressible_types or DEFAULT_COMPRESSIBLE_TYPES)
+        self.encodings = [
+            encoding for encoding in (encodings or ['br', 'gzip', 'deflate'])
+            if encoding in ('gzip', 'deflate') or (encoding == 'br' and brotli is not None)
+        ]
+        logger.info(f"CompressionMiddleware initialized (encodings={self.encodings}, min_size={min_size}, level={level}).")
+
+    def process_request(self, request: Request) -> Optional[Response]:
+        return None
+
+    def _is_compressible(self, response: Response) -> bool:
+        if response.status_code < 200 or response.status_code in SKIPPED_STATUS_CODES:
+            return False
+        headers = response.headers
+        if 'Content-Encoding' in headers or 'Content-Range' in headers:
+            return False
+        if 'no-transform' in headers.get('Cache-Control', '').lower():
+            return False
+        content_type = headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        return content_type in self.compressible_types
+
+    def _negotiate(self, request: Request) -> Optional[str]:
+        accepted = accepted_encodings(request.headers.get('ACCEPT-ENCODING', ''))
+        for encoding in self.encodings:
+            if encoding in accepted:
+                return encoding
+        return None
+
+    def _compress_stream(self, chunks: Iterable[bytes], compressor: _Compressor) -> Iterator[bytes]:
+        iterator = iter(chunks)
+        try:
+            for chunk in iterator:
+                if not chunk:
+                    continue
+                # Flush after every chunk: a streamed response (server-sent events, progress
+                # output) must reach the client as it is produced, not when the compressor's
+                # window fills up.
+                yield compressor.compress(chunk) + compressor.flush()
+            yield compressor.finish()
+        finally:
+            close = getattr(iterator, 'close', None)
+            if callable(close):
+                close()
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        """Compresses the response body if the client accepts a supported encoding."""
+        if str(request.method) == 'HEAD' or not self._is_compressible(response):
+            return response
+        patch_vary_headers(response.headers, ['Accept-Encoding'])
+        encoding = self._negotiate(request)
+        if encoding is None:
+            return response
+
+        if getattr(response, 'streaming', False):
+            headers = {name: value for name, value in response.headers.items() if name != 'Content-Length'}
+            headers['Content-Encoding'] = encoding
+            _weaken_etag(headers)
+            chunks = response.get_wsgi_response()[2]
+            compressed = StreamingResponse(self._compress_stream(chunks, _Compressor(encoding, self.level, self.brotli_quality)),
+                                           status_code=response.status_code, headers=headers, content_type=None)
+            logger.debug(f"CompressionMiddleware: Streaming {encoding} for {request.method} {request.path}.")
+            return compressed
+
+        body = response.body
+        if isinstance(body, str):
+            body = body.encode(response._get_encoding())
+        if not isinstance(body, bytes) or len(body) < self.min_size:
+            return response
+        compressor = _Compressor(encoding, self.level, self.brotli_quality)
+        compressed_body = compressor.compress(body) + compressor.finish()
+        if len(compressed_body) >= len(body):
+            logger.debug(f"CompressionMiddleware: {encoding} did not shrink {request.path}. Sending uncompressed.")
+            return response
+
+        response.body = compressed_body
+        response.headers['Content-Encoding'] = encoding
+        response.headers['Content-Length'] = str(len(compressed_body))
+        _weaken_etag(response.headers)
+        logger.debug(f"CompressionMiddleware: Compressed {request.path} with {encoding}: {len(body)} -> {len(compressed_body)} bytes.")
+        return response
+
+
+def _weaken_etag(headers: Any):
+    """A compressed body is a different byte sequence, so a strong ETag of the original must become weak."""
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        headers['ETag'] = 'W/' + etag
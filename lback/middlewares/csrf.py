@@ -25,6 +25,8 @@ class CSRFMiddleware(BaseMiddleware):
     Generates a CSRF token and adds it to the session and request context for GET requests.
     Checks the CSRF token for POST requests (or other methods that change state).
     Returns a Forbidden response if validation fails.
+    Safe requests that get a token are marked with the 'csrf_token_exposed' context item, which
+    ResponseCacheMiddleware uses to keep their responses out of the cache.
     """
     def __init__(self, session_manager: SessionManager):
         """
@@ -94,6 +96,10 @@ class CSRFMiddleware(BaseMiddleware):
                     logger.error(f"CSRFMiddleware: Failed to generate token string for session {getattr(session, 'session_id', 'N/A')} (secrets.token_hex returned None).")
             except Exception as e:
                 logger.exception(f"CSRFMiddleware: Exception while generating/storing CSRF token for session {getattr(session, 'session_id', 'N/A')}: {e}")
+        if request.method.value in safe_methods and request.get_context('csrf_token'):
+            # The token reaches the response (X-CSRF-Token header, csrf_token in render()), so
+            # the response belongs to this session and must not be stored in a shared cache.
+            request.add_context('csrf_token_exposed', True)
         return None
     def process_response(self, request: Request, response: Response) -> Response:
         """
@@ -81,7 +81,9 @@ class DebugMiddleware(BaseMiddleware):
                  logger.debug(f"Response Status Code: {response.status_code}")
             else:
                  logger.warning("Response object has no 'status_code' attribute in DebugMiddleware.")
-            if hasattr(response, 'body') and response.body:
+            if getattr(response, 'streaming', False):
+                logger.debug("Response Body: <streaming>")
+            elif hasattr(response, 'body') and response.body:
                 body = self._truncate_body(response.body) 
                 logger.debug(f"Response Body: {body}")
             else:
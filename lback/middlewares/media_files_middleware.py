@@ -1,9 +1,9 @@
 import os
-import mimetypes
 import logging
+from typing import Dict, Optional
 
-from lback.core.response import Response
 from lback.core.base_middleware import BaseMiddleware
+from lback.utils.static_files import StaticFileServer
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +12,32 @@ class MediaFilesMiddleware(BaseMiddleware):
     Middleware to serve user-uploaded media files during development.
     Only active when config.DEBUG is True.
     It uses UPLOAD_URL and UPLOAD_FOLDER from the application's configuration.
+
+    Files are served by a StaticFileServer, so large uploads such as video are streamed
+    and support Range requests (206) and conditional requests (304).
     """
 
+    def __init__(self, stat_cache_ttl: Optional[float] = 2.0, cache_control: Optional[str] = None):
+        """
+        Initializes the middleware.
+
+        Args:
+            stat_cache_ttl: Seconds a file lookup is reused before the file is checked again.
+                            Keep it short, since uploads can be replaced at any time.
+            cache_control: Value of the Cache-Control header of served files, if any.
+        """
+        self.stat_cache_ttl = stat_cache_ttl
+        self.cache_control = cache_control
+        self._servers: Dict[str, StaticFileServer] = {}
+
+    def _server_for(self, root: str) -> StaticFileServer:
+        server = self._servers.get(root)
+        if server is None:
+            server = StaticFileServer(root, stat_cache_ttl=self.stat_cache_ttl, cache_control=self.cache_control)
+            self._servers[root] = server
+            logger.debug(f"MediaFilesMiddleware: Created file server for {server.root}")
+        return server
+
     def process_request(self, request):
         """
         Processes the incoming request to check if it's for a media file.
@@ -44,36 +68,12 @@ class MediaFilesMiddleware(BaseMiddleware):
         if request.path.startswith(upload_url):
             relative_media_path = request.path[len(upload_url):]
             logger.debug(f"Attempting to serve media file: {relative_media_path}")
-            media_file_path = os.path.join(upload_root, relative_media_path)
-
-            abs_upload_root = os.path.abspath(upload_root)
-            abs_media_file_path = os.path.abspath(media_file_path)
-
-            if not abs_media_file_path.startswith(abs_upload_root):
-                logger.warning(f"Attempted directory traversal detected for media file: {request.path}")
-                return None 
-
-            if os.path.exists(abs_media_file_path) and os.path.isfile(abs_media_file_path):
-                try:
-
-                    mime_type, _ = mimetypes.guess_type(abs_media_file_path)
-                    if mime_type is None:
-                        mime_type = 'application/octet-stream'
-
-                    with open(abs_media_file_path, 'rb') as f:
-                        file_content = f.read()
-
-                    logger.info(f"Served media file: {abs_media_file_path}")
-
-                    return Response(file_content, status_code=200, headers={'Content-Type': mime_type})
-
-                except IOError as e:
-                    logger.error(f"Error reading media file {abs_media_file_path}: {e}", exc_info=True)
-                    return None
-
+            response = self._server_for(upload_root).serve(request, relative_media_path)
+            if response is None:
+                logger.debug(f"Media file not found or is not a file: {relative_media_path}")
             else:
-                logger.debug(f"Media file not found or is not a file: {abs_media_file_path}")
-                return None 
+                logger.info(f"Served media file: {relative_media_path} ({response.status_code})")
+            return response
 
         logger.debug(f"Request path '{request.path}' does not match UPLOAD_URL '{upload_url}'.")
         return None
@@ -93,4 +93,3 @@ class MediaFilesMiddleware(BaseMiddleware):
         """
         logger.debug("MediaFilesMiddleware process_response called.")
         return response
-
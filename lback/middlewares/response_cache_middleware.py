@@ -0,0 +1,217 @@
+import hashlib
+import logging
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from lback.core.base_middleware import BaseMiddleware
+from lback.core.cache import Cache
+from lback.core.response import Response
+from lback.core.router import Router, RouteNotFound, MethodNotAllowed
+from lback.core.signals import dispatcher
+from lback.core.types import Request
+from lback.utils.response_helpers import etag_matches, not_modified_since, patch_vary_headers
+
+
+logger = logging.getLogger(__name__)
+
+CACHEABLE_METHODS = frozenset({'GET', 'HEAD'})
+UNCACHEABLE_DIRECTIVES = ('no-store', 'private', 'no-cache')
+NOT_MODIFIED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control', 'Vary', 'Expires')
+
+
+def cache_response(ttl: int, vary: Iterable[str] = ()) -> Callable[[Any], Any]:
+    """
+    Opts a view (function or class) in to ResponseCacheMiddleware.
+
+    Args:
+        ttl: Seconds to serve the cached response.
+        vary: Extra request header names whose values are part of the cache key
+              (e.g., 'Accept-Language').
+
+    Returns:
+        A decorator that sets 'cache_ttl' and 'cache_vary' on the view.
+    """
+    def decorator(view: Any) -> Any:
+        view.cache_ttl = ttl
+        view.cache_vary = tuple(vary)
+        return view
+    return decorator
+
+
+def compute_etag(body: bytes) -> str:
+    """Returns a strong ETag for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class ResponseCacheMiddleware(BaseMiddleware):
+    """
+    Caches full responses of safe requests (GET/HEAD) in lback.core.cache.Cache and serves
+    repeats without running the view, its template or its database session.
+
+    Only views opted in with @cache_response(ttl) or a 'cache_ttl' attribute are cached,
+    unless default_ttl is set. Responses are keyed on path, query string and the configured
+    Vary headers, not on the method: only GET responses are stored, and HEAD requests are
+    answered from the GET entry without a body. Each cached response gets a strong ETag and a
+    Last-Modified header, and conditional requests (If-None-Match / If-Modified-Since) are
+    answered with 304 Not Modified and no body.
+
+    Place it after the session and authentication middlewares in MIDDLEWARES: middlewares
+    listed after it are skipped on a cache hit, and their response headers are part of the
+    cached response. Responses to requests that CSRFMiddleware gave a token are not stored,
+    because the token is specific to the session; leave cached views out of CSRFMiddleware's
+    scope.
+
+    The view is found from the route the AppController resolves before the request middlewares
+    run ('uses_route_resolution'), so the router is not consulted a second time.
+    """
+
+    uses_route_resolution = True
+
+    def __init__(self, cache: Cache, router: Router, default_ttl: Optional[int] = None,
+                 vary_headers: Optional[List[str]] = None, cache_authenticated: bool = False,
+                 key_prefix: str = 'response:'):
+        """
+        Initializes the middleware.
+
+        Args:
+            cache: The Cache used as storage (the 'cache' dependency).
+            router: The Router, used to find the view and its cache settings when the request
+                    was not resolved by the AppController.
+            default_ttl: TTL for views without their own setting. None caches opted-in views only.
+            vary_headers: Request headers whose values are part of every cache key.
+            cache_authenticated: If False, requests with an Authorization header or an
+                                 authenticated request.user are neither served from nor stored in the cache.
+            key_prefix: Prefix of the cache keys.
+        """
+        self.cache = cache
+        self.router = router
+        self.default_ttl = default_ttl
+        self.vary_headers = tuple(vary_headers) if vary_headers else ('Accept-Encoding',)
+        self.cache_authenticated = cache_authenticated
+        self.key_prefix = key_prefix
+        logger.info(f"ResponseCacheMiddleware initialized (default_ttl={default_ttl}, vary={self.vary_headers}).")
+
+    def _cache_settings(self, request: Request) -> Optional[Tuple[int, Tuple[str, ...]]]:
+        resolution = request.get_context('route_resolution')
+        if resolution is not None and resolution[0] == request.path:
+            outcome = resolution[1]
+        else:
+            try:
+                outcome = self.router.resolve(request.path, request.method)
+            except (RouteNotFound, MethodNotAllowed) as e:
+                outcome = e
+        if isinstance(outcome, Exception):
+            return None
+        view = outcome[0]
+        ttl = getattr(view, 'cache_ttl', None)
+        if ttl is None:
+            ttl = self.default_ttl
+        if not ttl or ttl <= 0:
+            return None
+        return ttl, self.vary_headers + tuple(getattr(view, 'cache_vary', ()))
+
+    def _cache_key(self, request: Request, vary: Tuple[str, ...]) -> str:
+        query = request.raw_path.partition('?')[2]
+        vary_values = '|'.join(f"{name.lower()}={request.headers.get(name.upper(), '')}" for name in vary)
+        return f"{self.key_prefix}{request.path}?{query}#{vary_values}"
+
+    def _is_anonymous(self, request: Request) -> bool:
+        return 'AUTHORIZATION' not in request.headers and not request.user
+
+    def process_request(self, request: Request) -> Optional[Response]:
+        """Serves a cached response (or 304) for eligible requests, or marks the request for storing."""
+        if str(request.method) not in CACHEABLE_METHODS:
+            return None
+        if not self.cache_authenticated and not self._is_anonymous(request):
+            return None
+        settings = self._cache_settings(request)
+        if settings is None:
+            return None
+        ttl, vary = settings
+        key = self._cache_key(request, vary)
+
+        entry = self.cache.get(key)
+        if entry is None:
+            request.add_context('response_cache_key', key)
+            request.add_context('response_cache_ttl', ttl)
+            request.add_context('response_cache_vary', vary)
+            logger.debug(f"ResponseCacheMiddleware: MISS for {request.method} {request.path}.")
+            return None
+
+        request.add_context('response_cache_hit', True)
+        logger.debug(f"ResponseCacheMiddleware: HIT for {request.method} {request.path}.")
+        if dispatcher.has_receivers("response_cache_hit"):
+            dispatcher.send("response_cache_hit", sender=self, request=request, key=key)
+        headers = dict(entry['headers'])
+        headers['Age'] = str(max(0, int(time.time() - entry['stored_at'])))
+        headers['X-Cache'] = 'HIT'
+        conditional = self._not_modified(request, headers, entry['last_modified'])
+        if conditional is not None:
+            return conditional
+        body = b'' if str(request.method) == 'HEAD' else entry['body']
+        return Response(body=body, status_code=entry['status_code'], headers=headers)
+
+    def _not_modified(self, request: Request, headers: Dict[str, str], last_modified: float) -> Optional[Response]:
+        """Returns a 304 response if the request's validators match, otherwise None."""
+        if_none_match = request.headers.get('IF-NONE-MATCH')
+        if if_none_match is not None:
+            matched = etag_matches(if_none_match, headers.get('ETag', ''))
+        else:
+            if_modified_since = request.headers.get('IF-MODIFIED-SINCE')
+            matched = if_modified_since is not None and not_modified_since(if_modified_since, last_modified)
+        if not matched:
+            return None
+        not_modified_headers = {name: headers[name] for name in NOT_MODIFIED_HEADERS if name in headers}
+        if 'X-Cache' in headers:
+            not_modified_headers['X-Cache'] = headers['X-Cache']
+        return Response(body=b'', status_code=HTTPStatus.NOT_MODIFIED.value, headers=not_modified_headers)
+
+    def _is_storable(self, request: Request, response: Response) -> bool:
+        if response.status_code != HTTPStatus.OK.value or request.get_context('exception'):
+            return False
+        if request.get_context('csrf_token_exposed'):
+            return False
+        if not isinstance(response.body, (bytes, str)):
+            return False
+        if any(name.lower() == 'set-cookie' for name in response.headers):
+            return False
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        return not any(directive in cache_control for directive in UNCACHEABLE_DIRECTIVES)
+
+    def process_response(self, request: Request, response: Response) -> Response:
+        """Stores eligible responses with validators, and answers conditional requests with 304."""
+        key = request.get_context('response_cache_key')
+        if key is None or request.get_context('response_cache_hit') or str(request.method) != 'GET':
+            return response
+        if not self._is_storable(request, response):
+            logger.debug(f"ResponseCacheMiddleware: Response for {request.method} {request.path} is not cacheable.")
+            return response
+
+        ttl = request.get_context('response_cache_ttl')
+        vary = request.get_context('response_cache_vary') or ()
+        body = response.body if isinstance(response.body, bytes) else response.body.encode(response._get_encoding())
+        now = time.time()
+        response.headers.setdefault('ETag', compute_etag(body))
+        response.headers.setdefault('Last-Modified', formatdate(now, usegmt=True))
+        response.headers.setdefault('Cache-Control', f"public, max-age={ttl}")
+        patch_vary_headers(response.headers, vary)
+
+        headers = {name: value for name, value in response.headers.items() if name != 'Content-Length'}
+        try:
+            last_modified = parsedate_to_datetime(response.headers['Last-Modified']).timestamp()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            last_modified = now
+        self.cache.set(key, {
+            'status_code': response.status_code,
+            'headers': headers,
+            'body': body,
+            'last_modified': last_modified,
+            'stored_at': now,
+        }, ttl=ttl)
+        logger.debug(f"ResponseCacheMiddleware: Stored {request.method} {request.path} for {ttl}s.")
+
+        response.headers['X-Cache'] = 'MISS'
+        conditional = self._not_modified(request, response.headers, last_modified)
+        return conditional if conditional is not None else response
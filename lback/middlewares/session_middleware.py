@@ -9,6 +9,7 @@ from lback.core.response import Response
 from lback.core.base_middleware import BaseMiddleware
 from lback.utils.session_manager import SessionManager
 from lback.utils.app_session import AppSession
+from lback.models.routing import untracked_writes
 from sqlalchemy.orm import Session as DBSession
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,8 @@ class SessionMiddleware(BaseMiddleware):
     Attaches a Session object (AppSession wrapper) to the request context using 'session'.
     Handles session cookie reading and writing.
     Requires SQLAlchemyMiddleware to run before it to provide the DB session.
+    Session renewal and saving are untracked writes, so with read replicas they don't
+    move the request's reads to the primary or start the client's sticky window.
     """
     def __init__(self, session_manager: SessionManager):
         """
@@ -71,7 +74,8 @@ class SessionMiddleware(BaseMiddleware):
                     logger.error(f"SessionMiddleware: Unexpected error processing session data for ID {session_id}: {e}", exc_info=True)
                     session_data_payload = {}
 
-                self.session_manager.renew_session(db_session, session_id)
+                with untracked_writes(db_session):
+                    self.session_manager.renew_session(db_session, session_id)
                 logger.debug(f"SessionMiddleware: Renewed session ID {session_id}.")
             else:
                 logger.debug(f"SessionMiddleware: Session ID {session_id} from cookie not found or expired in manager. Treating as no valid session.")
@@ -124,7 +128,8 @@ class SessionMiddleware(BaseMiddleware):
             logger.debug("SessionMiddleware: Added Set-Cookie header to delete session cookie.")
         elif request_session_wrapper.modified or request_session_wrapper.is_new:
             logger.debug("SessionMiddleware: Session was modified or is new. Attempting to save.")
-            saved_session_id = request_session_wrapper.save()
+            with untracked_writes(db_session):
+                saved_session_id = request_session_wrapper.save()
 
             if saved_session_id:
                 session_manager_from_wrapper = request_session_wrapper._session_manager
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session as DBSession
 from lback.core.base_middleware import BaseMiddleware
 from lback.core.response import Response
 from lback.core.types import Request
-from lback.models.database import DatabaseManager
+from lback.models.database import DatabaseManager, LazyDBSession
 
 
 
@@ -15,9 +15,10 @@ logger = logging.getLogger(__name__)
 class SQLAlchemySessionMiddleware(BaseMiddleware):
     """
     Middleware to manage a SQLAlchemy database session for each request.
-    Creates a new session at the start of the request and closes it at the end.
-    Attaches the session to the request context using the key 'db_session'.
-    Handles transaction management (commit or rollback) based on request outcome.
+    Attaches a LazyDBSession to the request context using the key 'db_session'; the
+    real session is only opened if a middleware or view uses it.
+    Handles transaction management (commit or rollback) and closing based on request
+    outcome, for sessions that were actually opened.
     """
 
     def __init__(self, db_manager: DatabaseManager):
@@ -36,28 +37,25 @@ class SQLAlchemySessionMiddleware(BaseMiddleware):
 
     def process_request(self, request: Request) -> Optional[Response]:
         """
-        Creates a new database session and attaches it to the request context.
+        Attaches a lazy database session to the request context.
+        Reuses a LazyDBSession already attached by the WSGI application, if any.
         """
-        logger.debug(f"SQLAlchemySessionMiddleware: Creating DB session for {request.method} {request.path}")
-        db_session = None
+        logger.debug(f"SQLAlchemySessionMiddleware: Attaching lazy DB session for {request.method} {request.path}")
 
         try:
-            session_object_from_manager = self.db_manager.create_session()
+            existing_session = request.get_context('db_session')
+            if isinstance(existing_session, LazyDBSession):
+                logger.debug("SQLAlchemySessionMiddleware: Reusing lazy DB session already on the request context.")
+                return None
 
-            logger.debug(f"SQLAlchemySessionMiddleware: Object returned by create_session. Type: {type(session_object_from_manager)}, Repr: {repr(session_object_from_manager)}")
-
-            if isinstance(session_object_from_manager, DBSession):
-                 db_session = session_object_from_manager
-                 logger.debug("SQLAlchemySessionMiddleware: create_session returned a valid SQLAlchemy Session.")
-            else:
-                 logger.error(f"SQLAlchemySessionMiddleware: create_session did NOT return a SQLAlchemy Session. Returned type: {type(session_object_from_manager)}")
+            db_session = self.db_manager.lazy_session()
 
             if hasattr(request, 'add_context') and callable(request.add_context):
                  request.add_context('db_session', db_session)
-                 logger.debug(f"SQLAlchemySessionMiddleware: Attached DB session ({type(db_session)}) to request context using add_context.")
+                 logger.debug("SQLAlchemySessionMiddleware: Attached lazy DB session to request context using add_context.")
             elif hasattr(request, '_context') and isinstance(request._context, dict):
                  request._context['db_session'] = db_session
-                 logger.debug(f"SQLAlchemySessionMiddleware: Attached DB session ({type(db_session)}) to request context using _context dictionary.")
+                 logger.debug("SQLAlchemySessionMiddleware: Attached lazy DB session to request context using _context dictionary.")
             else:
                  logger.error("SQLAlchemySessionMiddleware: Request object does not support adding context data. Cannot attach DB session.")
 
@@ -78,10 +76,13 @@ class SQLAlchemySessionMiddleware(BaseMiddleware):
 
         db_session_from_context: Optional[Any] = request.get_context('db_session')
 
-        logger.debug(f"SQLAlchemySessionMiddleware: Retrieved object from context['db_session']. Value: {db_session_from_context}, Type: {type(db_session_from_context)}, Repr: {repr(db_session_from_context)}")
+        logger.debug(f"SQLAlchemySessionMiddleware: Retrieved object from context['db_session']. Type: {type(db_session_from_context)}, Repr: {repr(db_session_from_context)}")
+
+        if isinstance(db_session_from_context, LazyDBSession) and not db_session_from_context.opened:
+            logger.debug("SQLAlchemySessionMiddleware: Lazy DB session was never opened. Skipping commit/rollback/close.")
 
-        if isinstance(db_session_from_context, DBSession):
-            db_session: DBSession = db_session_from_context
+        elif isinstance(db_session_from_context, (DBSession, LazyDBSession)):
+            db_session = db_session_from_context
             logger.debug("SQLAlchemySessionMiddleware: Retrieved object from context is a valid SQLAlchemy Session.")
 
             try:
@@ -1,9 +1,8 @@
-import os
-import mimetypes
 import logging
+from typing import Dict, Optional
 
-from lback.core.response import Response
 from lback.core.base_middleware import BaseMiddleware
+from lback.utils.static_files import StaticFileServer
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +10,33 @@ class StaticFilesMiddleware(BaseMiddleware):
     """
     Middleware to serve static files during development.
     Only active when config.DEBUG is True.
+
+    Files are served by a StaticFileServer: streamed instead of read into memory, with
+    ETag/Last-Modified validators, 304 for conditional requests and 206 for Range requests.
+    Files are looked up in STATIC_ROOT (where collectstatic writes hashed and precompressed
+    copies) first, then in STATIC_DIRS, so assets work before collectstatic has run.
     """
 
+    def __init__(self, stat_cache_ttl: Optional[float] = 2.0, cache_control: Optional[str] = None):
+        """
+        Initializes the middleware.
+
+        Args:
+            stat_cache_ttl: Seconds a file lookup is reused before the file is checked again.
+            cache_control: Value of the Cache-Control header of served files, if any.
+        """
+        self.stat_cache_ttl = stat_cache_ttl
+        self.cache_control = cache_control
+        self._servers: Dict[str, StaticFileServer] = {}
+
+    def _server_for(self, root: str) -> StaticFileServer:
+        server = self._servers.get(root)
+        if server is None:
+            server = StaticFileServer(root, stat_cache_ttl=self.stat_cache_ttl, cache_control=self.cache_control)
+            self._servers[root] = server
+            logger.debug(f"StaticFilesMiddleware: Created file server for {server.root}")
+        return server
+
     def process_request(self, request):
         """
         Processes the incoming request to check if it's for a static file.
@@ -40,35 +64,16 @@ class StaticFilesMiddleware(BaseMiddleware):
         if request.path.startswith(static_url):
             relative_static_path = request.path[len(static_url):]
             logger.debug(f"Attempting to serve static file: {relative_static_path}")
-            static_file_path = os.path.join(static_root, relative_static_path)
-
-            abs_static_root = os.path.abspath(static_root)
-            abs_static_file_path = os.path.abspath(static_file_path)
-
-            if not abs_static_file_path.startswith(abs_static_root):
-                 logger.warning(f"Attempted directory traversal detected: {request.path}")
-                 return None
-
-            if os.path.exists(abs_static_file_path) and os.path.isfile(abs_static_file_path):
-                try:
-                    mime_type, _ = mimetypes.guess_type(abs_static_file_path)
-                    if mime_type is None:
-                        mime_type = 'application/octet-stream'
-
-                    with open(abs_static_file_path, 'rb') as f:
-                        file_content = f.read()
-
-                    logger.info(f"Served static file: {abs_static_file_path}")
-
-                    return Response(file_content, status_code=200, headers={'Content-Type': mime_type})
-
-                except IOError as e:
-                    logger.error(f"Error reading static file {abs_static_file_path}: {e}", exc_info=True)
-                    return None 
-
+            response = None
+            for root in dict.fromkeys([static_root, *(getattr(config, 'STATIC_DIRS', None) or [])]):
+                response = self._server_for(root).serve(request, relative_static_path)
+                if response is not None:
+                    break
+            if response is None:
+                logger.debug(f"Static file not found or is not a file: {relative_static_path}")
             else:
-                logger.debug(f"Static file not found or is not a file: {abs_static_file_path}")
-                return None
+                logger.info(f"Served static file: {relative_static_path} ({response.status_code})")
+            return response
 
         logger.debug(f"Request path '{request.path}' does not match STATIC_URL '{static_url}'.")
         return None
@@ -1,11 +1,15 @@
 from sqlalchemy import create_engine, exc
 from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session
 import logging
-from typing import Optional, Any
+import threading
+from contextlib import contextmanager
+from typing import Optional, Any, Dict, Iterator, List
 from sqlalchemy.orm import Session as DBSession
 
 from lback.core.config import Config
 from lback.core.signals import dispatcher
+from lback.models.pool import PoolStats, build_engine_options
+from lback.models.routing import RoutingSession, ReplicaSelector, StickyWrites
 
 
 try:
@@ -49,15 +53,40 @@ class DatabaseManager:
             self._engine = create_engine(
                 database_url,
                 echo=echo_queries,
+                **build_engine_options(database_url, config),
             )
-            logger.info("SQLAlchemy engine created.")
-
-            self._session_factory = sessionmaker(bind=self._engine)
+            self._pool_stats = PoolStats()
+            self._pool_stats.attach(self._engine.pool)
+            logger.info(f"SQLAlchemy engine created with {type(self._engine.pool).__name__}.")
+
+            replica_urls: List[str] = getattr(config, 'DATABASE_REPLICA_URLS', None) or []
+            self.replica_engines: List[Any] = []
+            self._replica_pool_stats: List[PoolStats] = []
+            for replica_url in replica_urls:
+                replica_engine = create_engine(replica_url, echo=echo_queries, **build_engine_options(replica_url, config))
+                replica_stats = PoolStats()
+                replica_stats.attach(replica_engine.pool)
+                self.replica_engines.append(replica_engine)
+                self._replica_pool_stats.append(replica_stats)
+            sticky_seconds = getattr(config, 'DB_REPLICA_STICKY_SECONDS', 5)
+            self.sticky_writes = StickyWrites(window_seconds=sticky_seconds if sticky_seconds is not None else 5)
+
+            if self.replica_engines:
+                self.replica_selector = ReplicaSelector(self._replica_pool_stats, strategy=getattr(config, 'DB_REPLICA_SELECTION', 'round_robin'))
+                self._session_factory = sessionmaker(class_=RoutingSession, db_manager=self)
+                logger.info(f"Read replica routing enabled with {len(self.replica_engines)} replica(s) ({self.replica_selector.strategy}).")
+            else:
+                self.replica_selector = None
+                self._session_factory = sessionmaker(bind=self._engine)
             logger.debug("Session factory created.")
 
             self._scoped_session = scoped_session(self._session_factory)
             logger.debug("Scoped session factory created.")
 
+            self._usage_lock = threading.Lock()
+            self._lazy_sessions_created = 0
+            self._lazy_sessions_opened = 0
+
             self._initialized = True
             logger.info("DatabaseManager initialized successfully.")
 
@@ -86,6 +115,67 @@ class DatabaseManager:
         logger.debug("DatabaseManager: Creating new database session from scoped factory.")
 
         return self._scoped_session()
+
+    @property
+    def has_replicas(self) -> bool:
+        """True if read replicas are configured (DATABASE_REPLICA_URLS)."""
+        return bool(getattr(self, 'replica_engines', None))
+
+    def lazy_session(self) -> 'LazyDBSession':
+        """
+        Returns a LazyDBSession bound to this manager.
+        The underlying session is only created from the scoped session factory when the
+        proxy is first used, so requests that never query the database never touch the pool.
+        Each call is counted as one request for session_usage_stats().
+        """
+        with self._usage_lock:
+            self._lazy_sessions_created += 1
+        return LazyDBSession(self)
+
+    def _record_lazy_session_opened(self):
+        """Counts a LazyDBSession that actually opened a database session."""
+        with self._usage_lock:
+            self._lazy_sessions_opened += 1
+
+    def session_usage_stats(self) -> Dict[str, int]:
+        """
+        Returns counters for lazy per-request sessions.
+
+        Returns:
+            A dictionary with 'requests' (lazy sessions handed out), 'requests_touching_db'
+            (lazy sessions that opened a real session) and 'requests_skipping_db'.
+        """
+        with self._usage_lock:
+            created = self._lazy_sessions_created
+            opened = self._lazy_sessions_opened
+        return {
+            'requests': created,
+            'requests_touching_db': opened,
+            'requests_skipping_db': created - opened,
+        }
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Returns live connection pool statistics and emits the 'db_pool_stats' signal with them.
+
+        Returns:
+            A dictionary with checked out connections, totals, wait time histogram and,
+            for queue pools, size, idle and overflow connections. Empty if the engine
+            is not initialized.
+        """
+        if not self._initialized or self._engine is None:
+            logger.warning("Attempted to read pool stats before DatabaseManager was successfully initialized.")
+            return {}
+        stats = self._pool_stats.snapshot(self._engine.pool)
+        if self.replica_engines:
+            stats['replicas'] = [
+                replica_stats.snapshot(replica_engine.pool)
+                for replica_engine, replica_stats in zip(self.replica_engines, self._replica_pool_stats)
+            ]
+        dispatcher.send("db_pool_stats", sender=self, manager=self, stats=stats)
+        logger.debug("Signal 'db_pool_stats' sent.")
+        return stats
+
     @classmethod
     def get_instance(cls) -> 'DatabaseManager':
         """
@@ -202,6 +292,8 @@ class DatabaseManager:
         if self._engine:
             try:
                 self._engine.dispose()
+                for replica_engine in getattr(self, 'replica_engines', []):
+                    replica_engine.dispose()
                 logger.info("Engine disposed successfully.")
                 dispatcher.send("db_engine_disposed", sender=self, manager=self)
                 logger.debug("Signal 'db_engine_disposed' sent.")
@@ -218,3 +310,109 @@ class DatabaseManager:
         engine_status = "Available" if self._engine else "None"
         return f"<DatabaseManager(status='{status}', engine='{engine_status}')>"
 
+
+
+class LazyDBSession:
+    """
+    Per-request proxy for a SQLAlchemy session that is opened on first real use.
+    Attribute access (query, add, execute, ...) opens the session through
+    DatabaseManager.create_session() and forwards to it. commit(), rollback() and
+    close() are no-ops while the session has not been opened, and is_active is False,
+    so end-of-request cleanup never checks out a connection for requests that did not
+    use the database.
+    """
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initializes the proxy without opening a session.
+
+        Args:
+            db_manager: The DatabaseManager used to create the session on first use.
+        """
+        self._db_manager = db_manager
+        self._session: Optional[DBSession] = None
+        self._read_only = False
+        self._sticky_key: Optional[str] = None
+        self._untracked_writes = False
+
+    def set_routing(self, read_only: bool, sticky_key: Optional[str] = None):
+        """
+        Sets the read/write intent used by RoutingSession when replicas are configured.
+        Applies immediately if the session is already open. Writes made before routing is
+        set (middleware housekeeping such as session renewal) stop counting, so they don't
+        keep the view's reads on the primary.
+
+        Args:
+            read_only: True to send reads to a replica (writes still go to the primary).
+            sticky_key: A key identifying the client (see routing.client_sticky_key) for the
+                        sticky-after-write window.
+        """
+        self._read_only = read_only
+        self._sticky_key = sticky_key
+        if self._session is not None and self._db_manager.has_replicas:
+            self._session.info.update(read_only=read_only, sticky_key=sticky_key, wrote=False)
+
+    @contextmanager
+    def untracked_writes(self) -> Iterator["LazyDBSession"]:
+        """
+        Within the block, flushes still go to the primary but don't count as writes of the
+        request (see RoutingSession). Does not open the session by itself.
+        """
+        previous = self._untracked_writes
+        self._set_untracked_writes(True)
+        try:
+            yield self
+        finally:
+            self._set_untracked_writes(previous)
+
+    def _set_untracked_writes(self, value: bool):
+        self._untracked_writes = value
+        if self._session is not None and self._db_manager.has_replicas:
+            self._session.info['untracked_writes'] = value
+
+    @property
+    def opened(self) -> bool:
+        """True if the underlying session has been created."""
+        return self._session is not None
+
+    @property
+    def session(self) -> DBSession:
+        """The underlying SQLAlchemy session, opened on first access."""
+        if self._session is None:
+            self._session = self._db_manager.create_session()
+            if self._db_manager.has_replicas:
+                self._session.info.update(read_only=self._read_only, sticky_key=self._sticky_key, wrote=False, replica_index=None, untracked_writes=self._untracked_writes)
+            self._db_manager._record_lazy_session_opened()
+            logger.debug("LazyDBSession: Opened database session on first use.")
+        return self._session
+
+    @property
+    def is_active(self) -> bool:
+        """False until the session is opened, then the session's own is_active."""
+        return self._session is not None and self._session.is_active
+
+    def commit(self):
+        """Commits the session if it was opened."""
+        if self._session is not None:
+            self._session.commit()
+
+    def rollback(self):
+        """Rolls back the session if it was opened."""
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self):
+        """Closes the session if it was opened."""
+        if self._session is not None:
+            self._session.close()
+            if self._db_manager.has_replicas:
+                self._session.info.update(read_only=False, sticky_key=None, wrote=False, replica_index=None, untracked_writes=False)
+            logger.debug("LazyDBSession: Closed database session.")
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.session, name)
+
+    def __repr__(self) -> str:
+        state = "opened" if self._session is not None else "not opened"
+        return f"<LazyDBSession({state})>"
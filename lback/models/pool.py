@@ -0,0 +1,197 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool, Pool, QueuePool, StaticPool
+
+from lback.core.signals import dispatcher
+
+
+logger = logging.getLogger(__name__)
+
+WAIT_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 50, 100, 500, 1000, 5000)
+SLOW_CHECKOUT_THRESHOLD_SECONDS = 0.1
+
+
+class PoolStats:
+    """
+    Thread-safe counters for a SQLAlchemy connection pool.
+    Tracks connections checked out, total checkouts, new connections, invalidations
+    and a histogram of the time spent waiting for a connection.
+    """
+    def __init__(self):
+        """Initializes all counters to zero."""
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_histogram: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.wait_total_seconds = 0.0
+        self.wait_max_seconds = 0.0
+
+    def record_wait(self, seconds: float):
+        """
+        Records the time spent acquiring a connection from the pool.
+        Emits 'db_pool_checkout_slow' if the wait exceeded SLOW_CHECKOUT_THRESHOLD_SECONDS.
+
+        Args:
+            seconds: The wait time in seconds.
+        """
+        milliseconds = seconds * 1000
+        bucket = len(WAIT_BUCKETS_MS)
+        for index, upper_bound in enumerate(WAIT_BUCKETS_MS):
+            if milliseconds <= upper_bound:
+                bucket = index
+                break
+        with self._lock:
+            self.wait_histogram[bucket] += 1
+            self.wait_total_seconds += seconds
+            if seconds > self.wait_max_seconds:
+                self.wait_max_seconds = seconds
+        if seconds > SLOW_CHECKOUT_THRESHOLD_SECONDS:
+            logger.warning(f"PoolStats: Waited {milliseconds:.1f} ms for a database connection.")
+            dispatcher.send("db_pool_checkout_slow", sender=self, wait_seconds=seconds)
+
+    def on_checkout(self, *args: Any):
+        with self._lock:
+            self.checked_out += 1
+            self.checkouts += 1
+
+    def on_checkin(self, *args: Any):
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def on_connect(self, *args: Any):
+        with self._lock:
+            self.connects += 1
+
+    def on_invalidate(self, *args: Any):
+        with self._lock:
+            self.invalidations += 1
+
+    def attach(self, pool: Pool):
+        """
+        Registers the pool event listeners that keep the counters up to date.
+
+        Args:
+            pool: The SQLAlchemy pool to observe.
+        """
+        event.listen(pool, 'checkout', self.on_checkout)
+        event.listen(pool, 'checkin', self.on_checkin)
+        event.listen(pool, 'connect', self.on_connect)
+        event.listen(pool, 'invalidate', self.on_invalidate)
+        if isinstance(pool, _TimedPoolMixin):
+            pool.pool_stats = self
+
+    def snapshot(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        """
+        Returns a point-in-time copy of the counters.
+        If a QueuePool is given, its size, idle and overflow figures are included.
+
+        Args:
+            pool: The pool the counters belong to, used for live size figures.
+
+        Returns:
+            A dictionary of pool statistics. 'wait_histogram_ms' maps each bucket's upper
+            bound in milliseconds (or '+Inf') to the number of checkouts in that bucket.
+        """
+        with self._lock:
+            histogram = list(self.wait_histogram)
+            waits = sum(histogram)
+            stats: Dict[str, Any] = {
+                'pool_class': type(pool).__name__ if pool is not None else None,
+                'checked_out': self.checked_out,
+                'checkouts': self.checkouts,
+                'connects': self.connects,
+                'invalidations': self.invalidations,
+                'wait_avg_ms': (self.wait_total_seconds / waits * 1000) if waits else 0.0,
+                'wait_max_ms': self.wait_max_seconds * 1000,
+            }
+        labels = [str(upper_bound) for upper_bound in WAIT_BUCKETS_MS] + ['+Inf']
+        stats['wait_histogram_ms'] = dict(zip(labels, histogram))
+        if isinstance(pool, QueuePool):
+            stats['size'] = pool.size()
+            stats['idle'] = pool.checkedin()
+            stats['overflow'] = max(0, pool.overflow())
+        return stats
+
+
+class _TimedPoolMixin:
+    """Measures how long each connection checkout waits and reports it to pool_stats."""
+    pool_stats: Optional[PoolStats] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.pool_stats is not None:
+                self.pool_stats.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        new_pool = super().recreate()
+        new_pool.pool_stats = self.pool_stats
+        return new_pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedNullPool(_TimedPoolMixin, NullPool):
+    pass
+
+
+class TimedStaticPool(_TimedPoolMixin, StaticPool):
+    pass
+
+
+def _is_sqlite_memory(database_url: str) -> bool:
+    url = make_url(database_url)
+    database = url.database or ''
+    return database in ('', ':memory:') or 'mode=memory' in database or url.query.get('mode') == 'memory'
+
+
+def build_engine_options(database_url: str, config: Any) -> Dict[str, Any]:
+    """
+    Builds the create_engine keyword arguments for pooling from configuration.
+
+    SQLite gets a pool class suited to it instead of the pool settings: in-memory
+    databases use a StaticPool (one shared connection, so every session sees the same
+    database) and file databases use a NullPool (a fresh connection per checkout, so
+    threads do not serialise on a single pooled connection). Other engines use a
+    QueuePool configured from DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE and DB_POOL_PRE_PING.
+
+    Args:
+        database_url: The SQLAlchemy database URL.
+        config: The Config instance to read pool settings from.
+
+    Returns:
+        A dictionary of keyword arguments for sqlalchemy.create_engine().
+    """
+    if database_url.startswith('sqlite'):
+        if _is_sqlite_memory(database_url):
+            logger.info("SQLite in-memory database detected. Using StaticPool.")
+            return {
+                'poolclass': TimedStaticPool,
+                'connect_args': {'check_same_thread': False},
+            }
+        logger.info("SQLite file database detected. Using NullPool.")
+        return {'poolclass': TimedNullPool}
+
+    options: Dict[str, Any] = {
+        'poolclass': TimedQueuePool,
+        'pool_size': getattr(config, 'DB_POOL_SIZE', 5),
+        'max_overflow': getattr(config, 'DB_MAX_OVERFLOW', 10),
+        'pool_timeout': getattr(config, 'DB_POOL_TIMEOUT', 30),
+        'pool_recycle': getattr(config, 'DB_POOL_RECYCLE', 1800),
+        'pool_pre_ping': getattr(config, 'DB_POOL_PRE_PING', True),
+    }
+    logger.info(f"Using QueuePool with pool_size={options['pool_size']}, max_overflow={options['max_overflow']}, "
+                f"pool_timeout={options['pool_timeout']}, pool_recycle={options['pool_recycle']}, pool_pre_ping={options['pool_pre_ping']}.")
+    return options
@@ -0,0 +1,195 @@
+import itertools
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, List, Optional, TYPE_CHECKING
+
+from sqlalchemy.orm import Session as DBSession
+from sqlalchemy.sql.elements import TextClause
+
+if TYPE_CHECKING:
+    from lback.models.database import DatabaseManager
+
+
+logger = logging.getLogger(__name__)
+
+READ_ONLY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+ROUND_ROBIN = 'round_robin'
+LEAST_CONNECTIONS = 'least_connections'
+MAX_STICKY_KEYS = 10000
+_TEXT_SELECT_RE = re.compile(r'[\s(]*select\b', re.IGNORECASE)
+
+
+def read_only(view: Callable) -> Callable:
+    """
+    Marks a view as read-only so that its GET/HEAD/OPTIONS requests read from a replica.
+    Writes made by the view still go to the primary.
+
+    Args:
+        view: The view function or class.
+
+    Returns:
+        The same view, with 'db_read_only' set to True.
+    """
+    view.db_read_only = True
+    return view
+
+
+def is_read_only_request(view: Any, method: Any) -> bool:
+    """
+    Checks whether a request may read from a replica.
+
+    Args:
+        view: The resolved view function or class.
+        method: The request method as a string or HTTPMethod enum.
+
+    Returns:
+        True if the method is GET, HEAD or OPTIONS and the view is marked read-only.
+    """
+    return str(method) in READ_ONLY_METHODS and getattr(view, 'db_read_only', False) is True
+
+
+def client_sticky_key(request: Any) -> Optional[str]:
+    """
+    Returns the key used for the sticky-after-write window: the first X-Forwarded-For
+    address if present, otherwise REMOTE_ADDR. Every client has one, including anonymous
+    clients without a session cookie. Clients sharing an address share the window, which
+    only sends more of their reads to the primary.
+
+    Args:
+        request: The current Request.
+
+    Returns:
+        The client address, or None if it is unknown.
+    """
+    forwarded_for = request.headers.get('X-FORWARDED-FOR')
+    if forwarded_for:
+        return forwarded_for.split(',', 1)[0].strip() or None
+    return (request.environ or {}).get('REMOTE_ADDR') or None
+
+
+def untracked_writes(db_session: Any) -> ContextManager[Any]:
+    """
+    Returns a context manager under which flushes of db_session go to the primary without
+    counting as writes of the request: they neither stop replica reads nor start the sticky
+    window. Meant for bookkeeping writes whose rows are always read from the primary, such
+    as session renewal. A no-op for sessions other than LazyDBSession.
+
+    Args:
+        db_session: The request's database session.
+    """
+    if hasattr(type(db_session), 'untracked_writes'):
+        return db_session.untracked_writes()
+    return nullcontext()
+
+
+class ReplicaSelector:
+    """
+    Chooses a replica index using round-robin or least-connections selection.
+    Least-connections uses the checked-out count of each replica's PoolStats.
+    """
+    def __init__(self, pool_stats: List[Any], strategy: str = ROUND_ROBIN):
+        """
+        Initializes the selector.
+
+        Args:
+            pool_stats: One PoolStats per replica, in replica order.
+            strategy: 'round_robin' or 'least_connections'.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        if strategy not in (ROUND_ROBIN, LEAST_CONNECTIONS):
+            logger.error(f"Unknown replica selection strategy: '{strategy}'.")
+            raise ValueError(f"Unknown replica selection strategy: '{strategy}'. Use '{ROUND_ROBIN}' or '{LEAST_CONNECTIONS}'.")
+        self.pool_stats = pool_stats
+        self.strategy = strategy
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def select(self) -> int:
+        """Returns the index of the replica to use for the next read."""
+        if self.strategy == LEAST_CONNECTIONS:
+            return min(range(len(self.pool_stats)), key=lambda index: self.pool_stats[index].checked_out)
+        with self._lock:
+            return next(self._counter) % len(self.pool_stats)
+
+
+class StickyWrites:
+    """
+    Remembers recent writes per sticky key (e.g., the web session ID), so that reads
+    for that key go to the primary until replicas have had time to catch up.
+    """
+    def __init__(self, window_seconds: float):
+        """
+        Initializes the tracker.
+
+        Args:
+            window_seconds: How long after a write reads stay on the primary.
+        """
+        self.window_seconds = window_seconds
+        self._last_writes: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record_write(self, key: Optional[str]):
+        if not key or self.window_seconds <= 0:
+            return
+        with self._lock:
+            self._last_writes[key] = time.monotonic()
+            self._last_writes.move_to_end(key)
+            while len(self._last_writes) > MAX_STICKY_KEYS:
+                self._last_writes.popitem(last=False)
+
+    def is_sticky(self, key: Optional[str]) -> bool:
+        if not key or self.window_seconds <= 0:
+            return False
+        with self._lock:
+            last_write = self._last_writes.get(key)
+        return last_write is not None and time.monotonic() - last_write < self.window_seconds
+
+
+def _is_read_statement(clause: Any) -> bool:
+    """
+    Checks whether a statement only reads. Raw text() statements count as reads when they start
+    with SELECT in any case, optionally inside parentheses. WITH statements go to the primary:
+    a CTE may contain INSERT/UPDATE/DELETE ... RETURNING.
+    """
+    if getattr(clause, 'is_select', False):
+        return True
+    if isinstance(clause, TextClause):
+        return _TEXT_SELECT_RE.match(clause.text) is not None
+    return False
+
+
+class RoutingSession(DBSession):
+    """
+    SQLAlchemy session that picks the primary or a replica engine per statement.
+
+    Flushes and any statement that is not a SELECT (including raw text() statements
+    other than SELECT, and WITH statements) use the primary and count as a write, unless info['untracked_writes']
+    is set (see untracked_writes()). SELECTs use a replica only
+    when the session's info['read_only'] is True, the session has not written yet, and
+    its info['sticky_key'] has not written within the sticky window.
+    The replica chosen for a session is kept for the rest of that session.
+    """
+    def __init__(self, *args: Any, db_manager: 'DatabaseManager', **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._db_manager = db_manager
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Any:
+        manager = self._db_manager
+        if self._flushing or (clause is not None and not _is_read_statement(clause)):
+            if not self.info.get('untracked_writes'):
+                self.info['wrote'] = True
+                manager.sticky_writes.record_write(self.info.get('sticky_key'))
+            return manager.engine
+        if clause is not None and self.info.get('read_only') and not self.info.get('wrote') and not manager.sticky_writes.is_sticky(self.info.get('sticky_key')):
+            replica_index = self.info.get('replica_index')
+            if replica_index is None:
+                replica_index = manager.replica_selector.select()
+                self.info['replica_index'] = replica_index
+            return manager.replica_engines[replica_index]
+        return manager.engine
@@ -4,6 +4,7 @@ import logging
 
 
 from lback.core.signals import dispatcher
+from lback.models.database import LazyDBSession
 from lback.models.adminuser import AdminUser
 
 logger = logging.getLogger(__name__)
@@ -21,10 +22,10 @@ class AdminUserRepository:
         Initializes the AdminUserRepository with a SQLAlchemy session.
 
         Args:
-            session: The SQLAlchemy Session object to use for database operations.
+            session: The SQLAlchemy Session (or the request's LazyDBSession) to use for database operations.
                      This session should be managed externally (e.g., by a middleware).
         """
-        if not isinstance(session, Session):
+        if not isinstance(session, (Session, LazyDBSession)):
              logger.error("AdminUserRepository initialized without a valid SQLAlchemy Session instance.")
 
         self.session = session
@@ -3,6 +3,7 @@ from typing import List, Optional, Any
 import logging
 
 from lback.core.signals import dispatcher
+from lback.models.database import LazyDBSession
 from lback.models.adminuser import Permission
 
 logger = logging.getLogger(__name__)
@@ -20,10 +21,10 @@ class PermissionRepository:
         Initializes the PermissionRepository with a SQLAlchemy session.
 
         Args:
-            session: The SQLAlchemy Session object to use for database operations.
+            session: The SQLAlchemy Session (or the request's LazyDBSession) to use for database operations.
                      This session should be managed externally (e.g., by a middleware).
         """
-        if not isinstance(session, Session):
+        if not isinstance(session, (Session, LazyDBSession)):
              logger.error("PermissionRepository initialized without a valid SQLAlchemy Session instance.")
 
         self.session = session
@@ -35,6 +35,10 @@ framework components, enhancing code reusability and simplifying common developm
         location on the server's file system.
     * **delete_saved_file:** A function to remove a previously saved file from the server.
 
+    * **MultipartParser (from .multipart):** An incremental multipart/form-data parser that
+        spools large file parts to disk, hashes and sniffs them while streaming, and enforces
+        upload size limits.
+
 5.  **Filters (from .filters):**
     A collection of utility functions that can be used for filtering or transforming data.
 
@@ -71,6 +75,8 @@ framework components, enhancing code reusability and simplifying common developm
 
     * **static:** A function to generate URLs for static files.
     * **find_static_file:** A function to locate a static file within the project's static directories.
+    * **StaticFileServer:** Serves files below a directory with streaming, ETag/Last-Modified,
+      304 and Range (206) support, and caches file lookups.
 
 10. **URL Utilities (from .urls):**
     Utilities related to URL pattern definition.
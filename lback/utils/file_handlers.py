@@ -33,9 +33,11 @@ def validate_uploaded_file(uploaded_file: UploadedFile, allowed_types: Optional[
 
     if allowed_types:
         try:
-            uploaded_file.file.seek(0)
-            mime_type = magic.from_buffer(uploaded_file.file.read(1024), mime=True)
-            uploaded_file.file.seek(0)
+            mime_type = getattr(uploaded_file, 'detected_content_type', None)
+            if mime_type is None:
+                uploaded_file.file.seek(0)
+                mime_type = magic.from_buffer(uploaded_file.file.read(1024), mime=True)
+                uploaded_file.file.seek(0)
 
             logger.debug(f"validate_uploaded_file: Detected MIME type for '{uploaded_file.filename}': {mime_type}")
 
@@ -51,6 +53,7 @@ def save_uploaded_file(uploaded_file: UploadedFile, config: Config, model_name:
     """
     Saves an uploaded file to the server's file system.
     Determines save path based on config and model name.
+    Files spooled to disk by the multipart parser are renamed into place rather than copied.
     Returns the relative path to the saved file, or None on failure.
     """
     if not uploaded_file or not uploaded_file.file:
@@ -95,9 +98,7 @@ def save_uploaded_file(uploaded_file: UploadedFile, config: Config, model_name:
     logger.debug(f"save_uploaded_file: Full save path will be {full_save_path}")
 
     try:
-        uploaded_file.file.seek(0)
-        with open(full_save_path, 'wb') as f:
-            f.write(uploaded_file.file.read())
+        uploaded_file.move_to(full_save_path)
         
         logger.info(f"save_uploaded_file: Successfully saved file to {full_save_path}")
 
@@ -0,0 +1,416 @@
+import hashlib
+import io
+import logging
+import os
+import re
+import shutil
+import tempfile
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+from werkzeug.datastructures import MultiDict
+
+try:
+    import magic
+except ImportError:
+    magic = None
+
+from lback.core.exceptions import BadRequest, PayloadTooLarge
+from lback.core.types import UploadedFile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MEMORY_THRESHOLD = 2560 * 1024
+DEFAULT_MAX_FIELD_SIZE = 1024 * 1024
+DEFAULT_MAX_PARTS = 1000
+MAX_HEADER_SIZE = 16 * 1024
+SNIFF_SIZE = 2048
+
+
+
+def _default_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Read once at import: os.umask() can only be queried by setting it, which is not thread-safe.
+DEFAULT_FILE_MODE = _default_file_mode()
+
+_OPTION_RE = re.compile(r';\s*([^\s=;]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+
+
+def parse_options_header(value: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Splits a header such as 'form-data; name="file"; filename="a.png"' into its value and parameters.
+    RFC 5987 'filename*' parameters are decoded and take precedence over 'filename'.
+    """
+    main, _, rest = value.partition(';')
+    params: Dict[str, str] = {}
+    for key, raw in _OPTION_RE.findall(';' + rest):
+        key = key.lower()
+        raw = raw.strip()
+        if raw.startswith('"') and raw.endswith('"') and len(raw) >= 2:
+            raw = re.sub(r'\\(.)', r'\1', raw[1:-1])
+        if key.endswith('*'):
+            charset, _, encoded = raw.partition("''")
+            raw = unquote(encoded or raw, encoding=charset or 'utf-8', errors='replace')
+            key = key[:-1]
+        elif key in params:
+            continue
+        params[key] = raw
+    return main.strip().lower(), params
+
+
+def boundary_from_content_type(content_type: str) -> bytes:
+    """
+    Returns the multipart boundary of a Content-Type header.
+
+    Raises:
+        BadRequest: If the header has no valid boundary.
+    """
+    _, params = parse_options_header(content_type)
+    boundary = params.get('boundary', '')
+    if not boundary or len(boundary) > 200:
+        raise BadRequest("Missing or invalid multipart boundary.")
+    return boundary.encode('latin-1')
+
+
+class SpooledUpload:
+    """
+    A write-then-read file for one uploaded file. Content stays in memory up to 'max_size' bytes,
+    then moves to a named temporary file, which move_to() can rename into its final place.
+
+    Temporary files are created with mode 0600, so move_to() sets 'file_mode' on the stored file,
+    by default 0666 minus the process umask, as a file written with open() would get.
+    """
+
+    def __init__(self, max_size: int, temp_dir: Optional[str] = None, file_mode: Optional[int] = None):
+        self.max_size = max_size
+        self.temp_dir = temp_dir
+        self.file_mode = DEFAULT_FILE_MODE if file_mode is None else file_mode
+        self._file: BinaryIO = io.BytesIO()
+        self.path: Optional[str] = None
+
+    @property
+    def rolled(self) -> bool:
+        """True once the content has been moved to a temporary file on disk."""
+        return self.path is not None
+
+    def write(self, data: bytes) -> int:
+        if self.path is None and self._file.tell() + len(data) > self.max_size:
+            self._rollover()
+        return self._file.write(data)
+
+    def _rollover(self):
+        disk_file = tempfile.NamedTemporaryFile(prefix='lback-upload-', dir=self.temp_dir, delete=False)
+        disk_file.write(self._file.getvalue())
+        self._file = disk_file
+        self.path = disk_file.name
+        logger.debug(f"SpooledUpload: Spooled upload to {self.path}")
+
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def flush(self):
+        self._file.flush()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def move_to(self, destination: str) -> str:
+        """
+        Stores the content at 'destination', renaming the temporary file when possible, and
+        sets its permissions to 'file_mode'.
+
+        The stored file is then reopened for reading at position 0, so the upload can still be
+        read, or moved again, which copies the stored file to the new destination.
+
+        Returns:
+            The destination path.
+        """
+        if self.path is not None:
+            self._file.close()
+            try:
+                os.replace(self.path, destination)
+            except OSError:
+                shutil.move(self.path, destination)
+            logger.debug(f"SpooledUpload: Moved {self.path} to {destination}")
+            self.path = None
+        elif isinstance(self._file, io.BytesIO):
+            with open(destination, 'wb') as target:
+                target.write(self._file.getbuffer())
+            self._file.close()
+        else:
+            if not (os.path.exists(destination) and os.path.samefile(self._file.name, destination)):
+                self._file.seek(0)
+                with open(destination, 'wb') as target:
+                    shutil.copyfileobj(self._file, target)
+                logger.debug(f"SpooledUpload: Copied {self._file.name} to {destination}")
+            self._file.close()
+        os.chmod(destination, self.file_mode)
+        self._file = open(destination, 'rb')
+        return destination
+
+    def close(self):
+        """Closes the file and deletes its temporary file, unless it was moved."""
+        self._file.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+            self.path = None
+
+
+class _FilePart:
+    """Receives the content of one file part: spools it, hashes it and sniffs its MIME type as it arrives."""
+
+    def __init__(self, parser: 'MultipartParser', field_name: str, filename: str, content_type: str, headers: Dict[str, str]):
+        self.parser = parser
+        self.field_name = field_name
+        self.filename = filename
+        self.content_type = content_type
+        self.headers = headers
+        self.file = SpooledUpload(parser.memory_threshold, parser.temp_dir, parser.file_mode)
+        self.hasher = hashlib.new(parser.hash_algorithm)
+        self.size = 0
+        self.head = b''
+        self.detected_content_type: Optional[str] = None
+
+    def write(self, data: bytes):
+        self.size += len(data)
+        if self.parser.max_file_size is not None and self.size > self.parser.max_file_size:
+            raise PayloadTooLarge(f"File '{self.filename}' exceeds the maximum size of {self.parser.max_file_size} bytes.")
+        if len(self.head) < SNIFF_SIZE:
+            self.head += data[:SNIFF_SIZE - len(self.head)]
+            if len(self.head) >= SNIFF_SIZE:
+                self._sniff()
+        self.hasher.update(data)
+        self.file.write(data)
+
+    def _sniff(self):
+        if magic is None or self.detected_content_type is not None:
+            return
+        try:
+            self.detected_content_type = magic.from_buffer(self.head, mime=True)
+        except Exception as e:
+            logger.debug(f"MultipartParser: Could not sniff MIME type of '{self.filename}': {e}")
+
+    def finish(self) -> UploadedFile:
+        if self.head:
+            self._sniff()
+        self.file.seek(0)
+        return UploadedFile(
+            filename=self.filename,
+            content_type=self.content_type,
+            file=self.file,
+            field_name=self.field_name,
+            size=self.size,
+            headers=self.headers,
+            digest=self.hasher.hexdigest(),
+            detected_content_type=self.detected_content_type,
+        )
+
+    def discard(self):
+        self.file.close()
+
+
+class _FieldPart:
+    """Receives the value of one non-file form field."""
+
+    def __init__(self, parser: 'MultipartParser', field_name: str, charset: str):
+        self.parser = parser
+        self.field_name = field_name
+        self.charset = charset
+        self.buffer = bytearray()
+
+    def write(self, data: bytes):
+        if len(self.buffer) + len(data) > self.parser.max_field_size:
+            raise PayloadTooLarge(f"Form field '{self.field_name}' exceeds the maximum size of {self.parser.max_field_size} bytes.")
+        self.buffer += data
+
+    def finish(self) -> str:
+        return self.buffer.decode(self.charset, errors='replace')
+
+    def discard(self):
+        self.buffer = bytearray()
+
+
+class MultipartParser:
+    """
+    Incremental multipart/form-data parser.
+
+    Reads the body from a stream in fixed-size chunks and never holds more than one chunk plus
+    the current non-file field in memory. File parts are written to SpooledUpload files (memory
+    up to 'memory_threshold', then a temporary file) and are hashed and MIME-sniffed while they
+    arrive. Size limits are enforced as bytes come in, so an oversized upload is rejected
+    without reading the rest of it.
+    """
+
+    def __init__(self, memory_threshold: int = DEFAULT_MEMORY_THRESHOLD, max_field_size: int = DEFAULT_MAX_FIELD_SIZE,
+                 max_file_size: Optional[int] = None, max_total_size: Optional[int] = None,
+                 max_parts: int = DEFAULT_MAX_PARTS, temp_dir: Optional[str] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, hash_algorithm: str = 'sha256',
+                 file_mode: Optional[int] = None):
+        """
+        Initializes the parser.
+
+        Args:
+            memory_threshold: Bytes of a file kept in memory before it is spooled to disk.
+            max_field_size: Maximum size of a non-file field, in bytes.
+            max_file_size: Maximum size of one file, in bytes. None for no limit.
+            max_total_size: Maximum size of the whole body, in bytes. None for no limit.
+            max_parts: Maximum number of parts.
+            temp_dir: Directory for spooled files. Put it on the same filesystem as the upload
+                      folder so that saving an upload is a rename.
+            chunk_size: Bytes read from the stream at a time.
+            hash_algorithm: hashlib algorithm for UploadedFile.digest.
+            file_mode: Permissions of saved uploads. None for 0666 minus the process umask.
+        """
+        self.memory_threshold = memory_threshold
+        self.max_field_size = max_field_size
+        self.max_file_size = max_file_size
+        self.max_total_size = max_total_size
+        self.max_parts = max_parts
+        self.temp_dir = temp_dir
+        self.chunk_size = chunk_size
+        self.hash_algorithm = hash_algorithm
+        self.file_mode = file_mode
+
+    def _chunks(self, stream: BinaryIO, content_length: Optional[int], input_terminated: bool = False):
+        if content_length is None and not input_terminated:
+            # PEP 3333: without a Content-Length the application must not read past it, and
+            # reading to EOF can block on a keep-alive connection.
+            content_length = 0
+        if content_length is not None and self.max_total_size is not None and content_length > self.max_total_size:
+            raise PayloadTooLarge(f"Request body of {content_length} bytes exceeds the maximum of {self.max_total_size} bytes.")
+        remaining = content_length
+        total = 0
+        while remaining is None or remaining > 0:
+            chunk = stream.read(self.chunk_size if remaining is None else min(self.chunk_size, remaining))
+            if not chunk:
+                break
+            total += len(chunk)
+            if self.max_total_size is not None and total > self.max_total_size:
+                raise PayloadTooLarge(f"Request body exceeds the maximum of {self.max_total_size} bytes.")
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+    def _start_part(self, raw_headers: bytes, default_charset: str):
+        headers: Dict[str, str] = {}
+        for line in raw_headers.split(b'\r\n'):
+            name, sep, value = line.decode('utf-8', errors='replace').partition(':')
+            if sep:
+                headers[name.strip().title()] = value.strip()
+        disposition, params = parse_options_header(headers.get('Content-Disposition', ''))
+        if disposition != 'form-data' or 'name' not in params:
+            raise BadRequest("Multipart part without a form-data Content-Disposition name.")
+        if 'filename' in params:
+            filename = os.path.basename(params['filename'].replace('\\', '/'))
+            content_type = headers.get('Content-Type', 'application/octet-stream')
+            return _FilePart(self, params['name'], filename, content_type, headers)
+        _, type_params = parse_options_header(headers.get('Content-Type', 'text/plain'))
+        return _FieldPart(self, params['name'], type_params.get('charset', default_charset))
+
+    def parse(self, stream: BinaryIO, boundary: bytes, content_length: Optional[int] = None,
+              charset: str = 'utf-8', input_terminated: bool = False) -> Tuple[MultiDict, MultiDict]:
+        """
+        Parses a multipart body.
+
+        Args:
+            stream: The body stream, e.g. environ['wsgi.input'].
+            boundary: The boundary from the Content-Type header.
+            content_length: The body size from Content-Length. Reading stops there. If it is None,
+                            the body is read to EOF only when 'input_terminated' is set, and is
+                            otherwise treated as empty.
+            charset: Charset of field values without their own.
+            input_terminated: True if the server terminates the stream at the end of the body
+                              (environ['wsgi.input_terminated']), e.g. for chunked requests.
+
+        Returns:
+            (form, files): MultiDicts of field values (str) and UploadedFile objects. Files with an
+            empty filename (a file input left empty) are skipped.
+
+        Raises:
+            BadRequest: If the body is malformed or truncated.
+            PayloadTooLarge: If a size or part limit is exceeded. Files received so far are deleted.
+        """
+        delimiter = b'\r\n--' + boundary
+        keep = len(delimiter) + 4
+        form = MultiDict()
+        files = MultiDict()
+        received: List[UploadedFile] = []
+        buffer = b'\r\n'
+        state = 'preamble'
+        part = None
+        parts = 0
+        try:
+            for chunk in self._chunks(stream, content_length, input_terminated):
+                buffer += chunk
+                while True:
+                    if state in ('preamble', 'body'):
+                        index = buffer.find(delimiter)
+                        if index < 0:
+                            if len(buffer) > keep:
+                                if part is not None:
+                                    part.write(buffer[:-keep])
+                                buffer = buffer[-keep:]
+                            break
+                        if len(buffer) < index + len(delimiter) + 2:
+                            break
+                        if part is not None:
+                            part.write(buffer[:index])
+                            if isinstance(part, _FilePart):
+                                uploaded = part.finish()
+                                if uploaded.filename:
+                                    files.add(part.field_name, uploaded)
+                                    received.append(uploaded)
+                                else:
+                                    uploaded.close()
+                            else:
+                                form.add(part.field_name, part.finish())
+                            part = None
+                        after = buffer[index + len(delimiter):index + len(delimiter) + 2]
+                        buffer = buffer[index + len(delimiter) + 2:]
+                        if after == b'--':
+                            state = 'done'
+                            break
+                        if after != b'\r\n':
+                            raise BadRequest("Malformed multipart boundary line.")
+                        state = 'headers'
+                    elif state == 'headers':
+                        index = buffer.find(b'\r\n\r\n')
+                        if index < 0:
+                            if len(buffer) > MAX_HEADER_SIZE:
+                                raise BadRequest("Multipart part headers are too large.")
+                            break
+                        parts += 1
+                        if parts > self.max_parts:
+                            raise PayloadTooLarge(f"Multipart body has more than {self.max_parts} parts.")
+                        part = self._start_part(buffer[:index], charset)
+                        buffer = buffer[index + 4:]
+                        state = 'body'
+                    else:
+                        break
+                if state == 'done':
+                    break
+            if state != 'done':
+                raise BadRequest("Multipart body ended before the closing boundary.")
+        except Exception:
+            if part is not None:
+                part.discard()
+            for uploaded in received:
+                uploaded.close()
+            raise
+        logger.debug(f"MultipartParser: Parsed {len(form)} fields and {len(received)} files.")
+        return form, files
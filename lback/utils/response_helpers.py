@@ -1,6 +1,7 @@
-import json
-from typing import Any, Dict, Optional
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
 
+from lback.core import json_codec
 from lback.core.response import Response
 
 
@@ -13,6 +14,46 @@ def json_response(data: Any, status: int = 200, headers: Optional[Dict[str, str]
     
     headers['Content-Type'] = 'application/json'
     
-    response = Response(body=json.dumps(data).encode('utf-8'), headers=headers)
+    response = Response(body=json_codec.dumps(data), headers=headers)
     response.status_code = status 
     return response
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag, as RFC 9110 requires for GET/HEAD.
+    """
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified_since(if_modified_since: str, last_modified: float) -> bool:
+    """
+    Checks an If-Modified-Since header against a modification timestamp (whole seconds, as HTTP dates have).
+    """
+    try:
+        return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return False
+
+
+def patch_vary_headers(headers: Dict[str, str], names: Iterable[str]):
+    """
+    Adds header names to a response's Vary header, keeping existing entries and their order.
+    """
+    existing = [name.strip() for name in headers.get('Vary', '').split(',') if name.strip()]
+    known = {name.lower() for name in existing}
+    for name in names:
+        if name.lower() not in known:
+            existing.append(name)
+            known.add(name.lower())
+    if existing:
+        headers['Vary'] = ', '.join(existing)
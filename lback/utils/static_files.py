@@ -1,9 +1,62 @@
 import os
+import json
 import logging
-from typing import List, Optional, Any 
+import mimetypes
+import stat
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from typing import List, Optional, Any, Dict, FrozenSet, Tuple
+
+from lback.core.response import DEFAULT_CHUNK_SIZE, FileResponse, Response
+from lback.utils.response_helpers import etag_matches, not_modified_since
+from lback.utils.static_pipeline import COMPRESSIBLE_EXTENSIONS, MANIFEST_NAME
 
 logger = logging.getLogger(__name__)
 
+SAFE_METHODS = frozenset({'GET', 'HEAD'})
+PRECOMPRESSED_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+MANIFEST_RECHECK_SECONDS = 2.0
+
+_manifests: Dict[str, Tuple[float, Optional[float], Dict[str, str]]] = {}
+_manifests_lock = threading.Lock()
+
+
+def load_manifest(static_root: str) -> Dict[str, str]:
+    """
+    Returns the original-to-hashed path mapping written by collectstatic into static_root,
+    or an empty mapping if there is no manifest. The file is re-checked at most every
+    MANIFEST_RECHECK_SECONDS, so a new collectstatic run is picked up without a restart.
+    """
+    path = os.path.join(static_root, MANIFEST_NAME)
+    now = time.monotonic()
+    with _manifests_lock:
+        cached = _manifests.get(path)
+    if cached is not None and now - cached[0] < MANIFEST_RECHECK_SECONDS:
+        return cached[2]
+
+    try:
+        mtime: Optional[float] = os.stat(path).st_mtime
+    except OSError:
+        mtime = None
+    if cached is not None and cached[1] == mtime:
+        paths = cached[2]
+    elif mtime is None:
+        paths = {}
+    else:
+        try:
+            with open(path, 'r', encoding='utf-8') as manifest_file:
+                paths = json.load(manifest_file).get('paths', {})
+            logger.debug(f"Loaded static manifest {path} with {len(paths)} entries.")
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not read static manifest {path}: {e}. Using unhashed static URLs.")
+            paths = {}
+    with _manifests_lock:
+        _manifests[path] = (now, mtime, paths)
+    return paths
+
 def static(config: Any, relative_path: str) -> str:
     """
     Generates the full URL for a static file.
@@ -14,12 +67,17 @@ def static(config: Any, relative_path: str) -> str:
 
     Returns:
         The full URL to the static file (e.g., '/static/css/style.css').
+        If collectstatic wrote a manifest into STATIC_ROOT, the content-hashed name is used
+        (e.g., '/static/css/style.3f2a1b9c0d1e.css').
         Returns the relative_path itself if STATIC_URL is not configured.
     """
     static_url = getattr(config, 'STATIC_URL', None)
     if static_url:
         static_url = static_url.rstrip('/') + '/'
         relative_path = relative_path.lstrip('/')
+        static_root = getattr(config, 'STATIC_ROOT', None)
+        if static_root:
+            relative_path = load_manifest(static_root).get(relative_path, relative_path)
         full_url_path = os.path.join(static_url, relative_path).replace(os.sep, '/')
         logger.debug(f"Generated static URL for '{relative_path}': {full_url_path}")
         return full_url_path
@@ -74,3 +132,263 @@ def find_static_file(config: Any, relative_path: str) -> Optional[str]:
     logger.warning(f"find_static_file: Static file '{relative_path}' not found in any configured STATIC_DIRS.")
     return None
 
+
+
+class StaticFile:
+    """The cached result of a stat() call for a servable file."""
+    __slots__ = ('path', 'size', 'mtime', 'etag', 'last_modified', 'content_type')
+
+    def __init__(self, path: str, size: int, mtime: float, etag: str, last_modified: str, content_type: str):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+
+
+def parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parses a single-range 'Range: bytes=...' header.
+
+    Args:
+        range_header: The Range header value.
+        size: The size of the file in bytes.
+
+    Returns:
+        The inclusive (start, end) byte positions, or None if the header is malformed or asks
+        for several ranges (the full file is then sent, as RFC 9110 allows).
+
+    Raises:
+        ValueError: If the range cannot be satisfied for a file of this size.
+    """
+    unit, _, spec = range_header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, dash, last = spec.strip().partition('-')
+    if not dash:
+        return None
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+    if start is None:
+        if end is None:
+            return None
+        if end <= 0 or size == 0:
+            raise ValueError(f"Unsatisfiable suffix range '{range_header}'.")
+        return max(0, size - end), size - 1
+    if end is not None and end < start:
+        return None
+    if start >= size:
+        raise ValueError(f"Range start {start} is beyond the file size {size}.")
+    return start, size - 1 if end is None else min(end, size - 1)
+
+
+def accepted_encodings(accept_encoding: str) -> FrozenSet[str]:
+    """
+    Returns the content codings an Accept-Encoding header allows (q > 0).
+    A '*' entry allows the precompressed codings that are not listed explicitly.
+    """
+    accepted = set()
+    refused = set()
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        (accepted if quality > 0 else refused).add(coding)
+    if '*' in accepted:
+        accepted.update(encoding for encoding, _ in PRECOMPRESSED_ENCODINGS if encoding not in refused)
+    return frozenset(accepted)
+
+
+class StaticFileServer:
+    """
+    Serves files below a root directory.
+
+    Files are streamed through FileResponse (wsgi.file_wrapper/sendfile when the server offers it).
+    Responses carry ETag, Last-Modified and Accept-Ranges headers; conditional requests get 304
+    and single byte ranges get 206. Path resolution and stat() results, including misses, are kept
+    in a bounded cache for 'stat_cache_ttl' seconds, so repeat hits cost no filesystem calls
+    besides open(). Precompressed '.br'/'.gz' siblings are served to clients that accept them.
+    """
+
+    def __init__(self, root: str, stat_cache_ttl: Optional[float] = 2.0, max_cache_entries: int = 4096,
+                 cache_control: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, precompressed: bool = True):
+        """
+        Initializes the server.
+
+        Args:
+            root: The directory files are served from.
+            stat_cache_ttl: Seconds a stat() result is reused. None keeps results until clear() is called,
+                            which suits collected static files that do not change while the process runs.
+            max_cache_entries: Maximum number of paths in the stat cache.
+            cache_control: Value of the Cache-Control header of served files, if any.
+            chunk_size: Bytes per read when no file wrapper is available.
+            precompressed: Serve '.br'/'.gz' siblings written by collectstatic to clients that accept them.
+        """
+        self.root = os.path.abspath(root)
+        self._root_prefix = self.root.rstrip(os.sep) + os.sep
+        self.stat_cache_ttl = stat_cache_ttl
+        self.max_cache_entries = max_cache_entries
+        self.cache_control = cache_control
+        self.chunk_size = chunk_size
+        self.precompressed = precompressed
+        self._entries: "OrderedDict[str, Tuple[Optional[StaticFile], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Empties the stat cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def find(self, relative_path: str) -> Optional[StaticFile]:
+        """
+        Returns the StaticFile for a path relative to the root, or None if it is missing,
+        not a regular file or outside the root.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(relative_path)
+            if entry is not None and (self.stat_cache_ttl is None or now - entry[1] < self.stat_cache_ttl):
+                self._entries.move_to_end(relative_path)
+                return entry[0]
+
+        static_file = self._stat(relative_path)
+        with self._lock:
+            self._entries[relative_path] = (static_file, now)
+            self._entries.move_to_end(relative_path)
+            while len(self._entries) > self.max_cache_entries:
+                self._entries.popitem(last=False)
+        return static_file
+
+    def _stat(self, relative_path: str) -> Optional[StaticFile]:
+        path = os.path.normpath(os.path.join(self.root, relative_path.lstrip('/')))
+        if not path.startswith(self._root_prefix):
+            logger.warning(f"StaticFileServer: Attempted directory traversal detected: {relative_path}")
+            return None
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            logger.debug(f"StaticFileServer: File not found: {path}")
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            logger.debug(f"StaticFileServer: Not a regular file: {path}")
+            return None
+        content_type, encoding = mimetypes.guess_type(path)
+        if content_type is None or encoding is not None:
+            content_type = 'application/octet-stream'
+        return StaticFile(
+            path=path,
+            size=file_stat.st_size,
+            mtime=file_stat.st_mtime,
+            etag=f'"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"',
+            last_modified=formatdate(file_stat.st_mtime, usegmt=True),
+            content_type=content_type,
+        )
+
+    def _precompressed_variants(self, relative_path: str) -> List[Tuple[str, StaticFile]]:
+        if not self.precompressed or os.path.splitext(relative_path)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+            return []
+        variants = []
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            variant = self.find(relative_path + suffix)
+            if variant is not None:
+                variants.append((encoding, variant))
+        return variants
+
+    def _if_range_matches(self, if_range: str, static_file: StaticFile) -> bool:
+        if_range = if_range.strip()
+        if if_range.startswith('"') or if_range.startswith('W/'):
+            return if_range == static_file.etag
+        try:
+            return int(parsedate_to_datetime(if_range).timestamp()) == int(static_file.mtime)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+
+    def serve(self, request: Any, relative_path: str) -> Optional[Response]:
+        """
+        Builds the response for a GET or HEAD request of a file.
+
+        Args:
+            request: The incoming request.
+            relative_path: The file path relative to the root.
+
+        Returns:
+            A 200, 206, 304 or 416 response, or None if the method is not GET/HEAD or the file does not exist.
+        """
+        method = str(request.method)
+        if method not in SAFE_METHODS:
+            return None
+        static_file = self.find(relative_path)
+        if static_file is None:
+            return None
+        content_type = static_file.content_type
+        range_header = request.headers.get('RANGE')
+
+        headers: Dict[str, str] = {'Accept-Ranges': 'bytes'}
+        if self.cache_control:
+            headers['Cache-Control'] = self.cache_control
+        variants = self._precompressed_variants(relative_path)
+        if variants:
+            headers['Vary'] = 'Accept-Encoding'
+            if not range_header:
+                accepted = accepted_encodings(request.headers.get('ACCEPT-ENCODING', ''))
+                for encoding, variant in variants:
+                    if encoding in accepted:
+                        static_file = variant
+                        headers['Content-Encoding'] = encoding
+                        break
+        headers['ETag'] = static_file.etag
+        headers['Last-Modified'] = static_file.last_modified
+
+        if_none_match = request.headers.get('IF-NONE-MATCH')
+        if if_none_match is not None:
+            not_modified = etag_matches(if_none_match, static_file.etag)
+        else:
+            if_modified_since = request.headers.get('IF-MODIFIED-SINCE')
+            not_modified = if_modified_since is not None and not_modified_since(if_modified_since, static_file.mtime)
+        if not_modified:
+            logger.debug(f"StaticFileServer: 304 for {static_file.path}")
+            return Response(body=b'', status_code=HTTPStatus.NOT_MODIFIED.value, headers=headers)
+
+        headers['Content-Type'] = content_type
+        byte_range = None
+        if range_header and self._if_range_matches(request.headers.get('IF-RANGE', static_file.etag), static_file):
+            try:
+                byte_range = parse_range(range_header, static_file.size)
+            except ValueError:
+                headers['Content-Range'] = f"bytes */{static_file.size}"
+                return Response(body=b'', status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE.value, headers=headers)
+
+        status_code = HTTPStatus.OK.value
+        offset, length = 0, static_file.size
+        if byte_range is not None:
+            status_code = HTTPStatus.PARTIAL_CONTENT.value
+            offset, length = byte_range[0], byte_range[1] - byte_range[0] + 1
+            headers['Content-Range'] = f"bytes {byte_range[0]}-{byte_range[1]}/{static_file.size}"
+        headers['Content-Length'] = str(length)
+
+        if method == 'HEAD':
+            return Response(body=b'', status_code=status_code, headers=headers)
+        try:
+            file = open(static_file.path, 'rb')
+        except OSError as e:
+            logger.warning(f"StaticFileServer: Could not open {static_file.path}: {e}")
+            with self._lock:
+                for key in [relative_path] + [relative_path + suffix for _, suffix in PRECOMPRESSED_ENCODINGS]:
+                    self._entries.pop(key, None)
+            return None
+        logger.debug(f"StaticFileServer: Serving {static_file.path} ({status_code}, {length} bytes).")
+        return FileResponse(file, status_code=status_code, headers=headers, content_type=content_type,
+                            chunk_size=self.chunk_size, offset=offset,
+                            length=length if byte_range is not None else None)
@@ -0,0 +1,195 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+HASH_LENGTH = 12
+COMPRESSIBLE_EXTENSIONS = frozenset({
+    '.css', '.js', '.mjs', '.map', '.json', '.html', '.htm', '.txt', '.xml', '.svg', '.ico', '.wasm',
+    '.ttf', '.otf', '.eot',
+})
+MIN_COMPRESS_SIZE = 256
+MIN_COMPRESSION_GAIN = 0.95
+
+
+def hashed_name(relative_path: str, digest: str) -> str:
+    """
+    Returns the content-hashed name of a file, e.g. 'css/site.css' -> 'css/site.3f2a1b9c0d1e.css'.
+    """
+    directory, filename = os.path.split(relative_path)
+    stem, extension = os.path.splitext(filename)
+    return os.path.join(directory, f"{stem}.{digest[:HASH_LENGTH]}{extension}").replace(os.sep, '/')
+
+
+def read_manifest(output_dir: str) -> Dict[str, Any]:
+    """Reads the manifest of a collected static directory. Returns an empty manifest if there is none."""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+    except FileNotFoundError:
+        return {'version': MANIFEST_VERSION, 'paths': {}, 'files': {}}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read static manifest {path}: {e}. Collecting all files again.")
+        return {'version': MANIFEST_VERSION, 'paths': {}, 'files': {}}
+    if manifest.get('version') != MANIFEST_VERSION:
+        logger.info(f"Static manifest {path} has version {manifest.get('version')}. Collecting all files again.")
+        return {'version': MANIFEST_VERSION, 'paths': {}, 'files': {}}
+    return manifest
+
+
+class StaticCollector:
+    """
+    Collects static files into one directory for deployment.
+
+    For every source file the collector writes:
+
+    * a copy under its original name,
+    * a copy under a content-hashed name (safe to serve with far-future caching),
+    * '.gz' and, if the 'brotli' package is installed, '.br' siblings of both names for
+      compressible types, when compression saves at least 5%.
+
+    A 'manifest.json' maps original names to hashed names (read by lback.utils.static_files.static)
+    and stores each file's digest, so unchanged files are skipped on the next run.
+    Files are processed in parallel by a thread pool; hashing, compression and file I/O
+    release the GIL.
+    """
+
+    def __init__(self, static_dirs: List[str], output_dir: str, max_workers: Optional[int] = None,
+                 gzip_enabled: bool = True, brotli_enabled: bool = True, compression_level: int = 9):
+        """
+        Initializes the collector.
+
+        Args:
+            static_dirs: Source directories. When several contain the same relative path, the last one wins.
+            output_dir: The directory to collect into.
+            max_workers: Threads used to process files. None uses ThreadPoolExecutor's default.
+            gzip_enabled: Whether to write '.gz' files.
+            brotli_enabled: Whether to write '.br' files. Ignored if the 'brotli' package is not installed.
+            compression_level: gzip level (1-9). Brotli always uses quality 11.
+
+        Raises:
+            ValueError: If output_dir is inside a source directory or contains one. Collecting
+                        there would pick up the hashed copies as sources on the next run.
+        """
+        output_path = os.path.realpath(output_dir)
+        for static_dir in static_dirs:
+            source_path = os.path.realpath(static_dir)
+            if os.path.commonpath([output_path, source_path]) in (output_path, source_path):
+                raise ValueError(f"collectstatic output directory '{output_dir}' overlaps the static source directory '{static_dir}'. "
+                                 f"Set STATIC_ROOT to a directory outside STATIC_DIRS (e.g. 'staticfiles').")
+        self.static_dirs = static_dirs
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.gzip_enabled = gzip_enabled
+        self.brotli_enabled = brotli_enabled and brotli is not None
+        self.compression_level = compression_level
+        if brotli_enabled and brotli is None:
+            logger.info("StaticCollector: The 'brotli' package is not installed. Skipping .br files.")
+        self._dirs_lock = threading.Lock()
+
+    def _sources(self) -> Dict[str, str]:
+        sources: Dict[str, str] = {}
+        for static_dir in self.static_dirs:
+            if not os.path.isdir(static_dir):
+                logger.warning(f"Static directory not found: {static_dir}")
+                continue
+            for root, _, files in os.walk(static_dir):
+                for file in files:
+                    src_file = os.path.join(root, file)
+                    rel_path = os.path.relpath(src_file, static_dir).replace(os.sep, '/')
+                    sources[rel_path] = src_file
+        return sources
+
+    def _write(self, relative_path: str, data: bytes):
+        dest_file = os.path.join(self.output_dir, relative_path)
+        directory = os.path.dirname(dest_file)
+        with self._dirs_lock:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = f"{dest_file}.tmp{threading.get_ident()}"
+        with open(tmp_file, 'wb') as dest:
+            dest.write(data)
+        os.replace(tmp_file, dest_file)
+
+    def _compressed_variants(self, relative_path: str, data: bytes) -> List[Tuple[str, bytes]]:
+        if os.path.splitext(relative_path)[1].lower() not in COMPRESSIBLE_EXTENSIONS or len(data) < MIN_COMPRESS_SIZE:
+            return []
+        variants = []
+        if self.gzip_enabled:
+            variants.append(('.gz', gzip.compress(data, compresslevel=self.compression_level, mtime=0)))
+        if self.brotli_enabled:
+            variants.append(('.br', brotli.compress(data, quality=11)))
+        return [(suffix, compressed) for suffix, compressed in variants if len(compressed) < len(data) * MIN_COMPRESSION_GAIN]
+
+    def _outputs_exist(self, relative_path: str, entry: Dict[str, Any]) -> bool:
+        names = [relative_path, entry['hashed']]
+        names += [name + suffix for name in (relative_path, entry['hashed']) for suffix in entry.get('encodings', [])]
+        return all(os.path.isfile(os.path.join(self.output_dir, name)) for name in names)
+
+    def _process(self, relative_path: str, src_file: str, previous: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        with open(src_file, 'rb') as src:
+            data = src.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if previous and previous.get('digest') == digest and self._outputs_exist(relative_path, previous):
+            logger.debug(f"Unchanged: {src_file}")
+            return previous, False
+
+        hashed = hashed_name(relative_path, digest)
+        variants = self._compressed_variants(relative_path, data)
+        for name in (relative_path, hashed):
+            self._write(name, data)
+            for suffix, compressed in variants:
+                self._write(name + suffix, compressed)
+        logger.info(f"Collected: {src_file} -> {hashed}" + (f" (+{', '.join(s for s, _ in variants)})" if variants else ""))
+        return {'digest': digest, 'hashed': hashed, 'size': len(data), 'encodings': [suffix for suffix, _ in variants]}, True
+
+    def collect(self) -> Dict[str, int]:
+        """
+        Collects all files and writes the manifest.
+
+        Returns:
+            Counts of 'collected' (written), 'unchanged' (skipped) and 'failed' files.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        previous_files = read_manifest(self.output_dir).get('files', {})
+        sources = self._sources()
+
+        files: Dict[str, Dict[str, Any]] = {}
+        counts = {'collected': 0, 'unchanged': 0, 'failed': 0}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='collectstatic') as executor:
+            futures = {
+                relative_path: executor.submit(self._process, relative_path, src_file, previous_files.get(relative_path))
+                for relative_path, src_file in sources.items()
+            }
+            for relative_path, future in futures.items():
+                try:
+                    entry, written = future.result()
+                except OSError as e:
+                    logger.error(f"Error collecting static file {sources[relative_path]}: {e}", exc_info=True)
+                    counts['failed'] += 1
+                    continue
+                files[relative_path] = entry
+                counts['collected' if written else 'unchanged'] += 1
+
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'paths': {relative_path: files[relative_path]['hashed'] for relative_path in sorted(files)},
+            'files': {relative_path: files[relative_path] for relative_path in sorted(files)},
+        }
+        self._write(MANIFEST_NAME, json.dumps(manifest, indent=2).encode('utf-8'))
+        logger.info(f"Static files collected into {self.output_dir}: {counts['collected']} written, "
+                    f"{counts['unchanged']} unchanged, {counts['failed']} failed.")
+        return counts
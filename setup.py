@@ -113,6 +113,12 @@ INSTALL_REQUIRES = [
 ]
 
 EXTRAS_REQUIRE = {
+    'brotli': [
+        'brotli~=1.1.0',
+    ],
+    'orjson': [
+        'orjson~=3.8',
+    ],
     'testing': [
         'bandit~=1.8.3',
         'coverage~=7.8.0',
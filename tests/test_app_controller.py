@@ -0,0 +1,159 @@
+from lback.core.app_controller import AppController
+from lback.core.middleware_manager import MiddlewareManager
+from lback.core.response import Response
+from lback.core.router import Router
+from lback.core.signals import SignalDispatcher
+from lback.core.types import Request
+
+
+class DummyConfig:
+    ROOT_URLCONF = None
+
+
+class DummyRegistry:
+    def __init__(self, models):
+        self.models = models
+        self.lookups = 0
+
+    def get_model(self, model_name):
+        self.lookups += 1
+        return self.models.get(model_name.lower())
+
+
+def make_controller(**dependencies):
+    return AppController(
+        middleware_manager=MiddlewareManager(),
+        router=Router(),
+        template_renderer=None,
+        config=DummyConfig(),
+        admin_user_manager=None,
+        session_manager=None,
+        user_manager=None,
+        available_dependencies_instances=dependencies,
+        dispatcher=SignalDispatcher(),
+    )
+
+
+def make_request(path, method="GET"):
+    return Request(path=path, method=method, body=None, headers={}, environ={})
+
+
+def test_injection_plan_is_compiled_once_at_registration(monkeypatch):
+    controller = make_controller(mailer="mailer-instance")
+    received = {}
+
+    def item_view(request, item_id, mailer, current_user=None, page=1):
+        received.update(item_id=item_id, mailer=mailer, current_user=current_user, page=page)
+        return Response(body=b"ok")
+
+    controller.add_route("/items/{item_id:int}/", item_view, methods=["GET"])
+
+    def fail_signature(*args, **kwargs):
+        raise AssertionError("inspect.signature must not run per request")
+    monkeypatch.setattr("lback.core.app_controller.inspect.signature", fail_signature)
+
+    for _ in range(2):
+        request = make_request("/items/5/")
+        request.user = "alice"
+        response = controller.handle_request(request)
+        assert response.status_code == 200
+    assert received == {'item_id': 5, 'mailer': "mailer-instance", 'current_user': "alice", 'page': 1}
+
+
+def test_missing_required_parameter_returns_server_error():
+    controller = make_controller()
+    calls = []
+
+    def broken_view(request, unknown):
+        calls.append(unknown)
+        return Response(body=b"never")
+
+    controller.add_route("/broken/", broken_view, methods=["GET"])
+    response = controller.handle_request(make_request("/broken/"))
+
+    assert response.status_code == 500
+    assert b"never" not in response.body
+    assert calls == []
+
+
+def test_model_parameter_uses_cached_registry_lookup():
+    controller = make_controller()
+    registry = DummyRegistry({'article': object})
+    seen = []
+
+    def model_view(request, model_name, model):
+        seen.append(model)
+        return Response(body=b"ok")
+
+    controller.add_route("/admin/{model_name}/", model_view, methods=["GET"])
+    for _ in range(3):
+        request = make_request("/admin/Article/")
+        request.admin_registry = registry
+        controller.handle_request(request)
+
+    assert seen == [object, object, object]
+    assert registry.lookups == 1
+
+
+def test_request_falls_back_to_shared_app_context():
+    from lback.core.types import AppContext
+    shared = AppContext({'config': "shared-config", 'router': None})
+    request = Request(path="/", method="GET", body=None, headers={}, environ={}, app_context=shared)
+
+    assert request.get_context('config') == "shared-config"
+    assert request.config == "shared-config"
+    assert 'router' not in shared
+    assert request.get_context('router', "fallback") == "fallback"
+
+    request.add_context('config', "request-config")
+    assert request.config == "request-config"
+    assert shared['config'] == "shared-config"
+    assert list(request._context) == ['config']
+
+
+def test_handle_request_attaches_controller_app_context():
+    controller = make_controller(mailer="mailer-instance")
+    seen = {}
+
+    def view(request):
+        seen['mailer'] = request.get_context('mailer')
+        return Response(body=b"ok")
+
+    controller.add_route("/", view, methods=["GET"])
+    request = make_request("/")
+    controller.handle_request(request)
+
+    assert seen == {'mailer': "mailer-instance"}
+    assert 'mailer' not in request._context
+
+
+def test_route_scoped_middleware_uses_pre_resolved_route_name():
+    from lback.core.base_middleware import BaseMiddleware
+    from lback.core.middleware_manager import MiddlewareScope
+
+    seen = []
+
+    class SessionLike(BaseMiddleware):
+        def process_request(self, request):
+            seen.append(request.path)
+
+        def process_response(self, request, response):
+            return response
+
+    controller = make_controller()
+    controller.middleware_manager.add_middleware(SessionLike(), scope=MiddlewareScope(exclude_routes=["health"]))
+    controller.add_route("/health", lambda request: Response(body=b"ok"), methods=["GET"], name="health", requires_auth=False)
+    controller.add_route("/home", lambda request: Response(body=b"home"), methods=["GET"], name="home", requires_auth=False)
+
+    resolutions = []
+    original_resolve_route = controller.router.resolve_route
+
+    def counting_resolve_route(path, method):
+        resolutions.append(path)
+        return original_resolve_route(path, method)
+    controller.router.resolve_route = counting_resolve_route
+
+    assert controller.handle_request(make_request("/health")).body == b"ok"
+    assert controller.handle_request(make_request("/home")).body == b"home"
+    assert seen == ["/home"]
+    assert resolutions == ["/health", "/home"]
@@ -31,4 +31,247 @@ def test_has():
     cache.set("x", 123)
     assert cache.has("x")
     cache.delete("x")
-    assert not cache.has("x")
\ No newline at end of file
+    assert not cache.has("x")
+
+
+def test_lru_evicts_least_recently_used():
+    cache = Cache(max_entries=2, shards=1)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert sorted(cache.keys()) == ["a", "c"]
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = Cache(max_entries=2, eviction_policy="lfu", shards=1)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    for _ in range(3):
+        cache.get("b")
+    cache.get("a")
+    cache.set("c", 3)
+    assert sorted(cache.keys()) == ["b", "c"]
+
+
+def test_tinylfu_rejects_rarely_seen_keys():
+    cache = Cache(max_entries=2, eviction_policy="tinylfu", shards=1)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    for _ in range(5):
+        cache.get("a")
+        cache.get("b")
+    cache.set("once", 3)
+    assert not cache.has("once")
+    for _ in range(10):
+        cache.get("popular")
+    cache.set("popular", 4)
+    assert cache.get("popular") == 4
+    assert len(cache) == 2
+
+
+def test_max_bytes_bounds_memory():
+    cache = Cache(max_bytes=2000, shards=1)
+    for index in range(20):
+        cache.set(index, b"x" * 300)
+    assert 0 < cache.total_bytes <= 2000
+    assert len(cache) < 20
+    cache.set("huge", b"x" * 5000)
+    assert not cache.has("huge")
+
+
+def test_sweep_removes_expired_items_without_get(monkeypatch):
+    import lback.core.cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = Cache(shards=4)
+    for index in range(10):
+        cache.set(index, index, ttl=5)
+    cache.set("live", 1)
+    now[0] += 10
+    assert len(cache) == 11
+    assert cache.sweep() == 10
+    assert cache.keys() == ["live"]
+
+
+def test_writes_sweep_expired_items(monkeypatch):
+    import lback.core.cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = Cache(shards=1)
+    for index in range(10):
+        cache.set(index, index, ttl=5)
+    now[0] += 10
+    cache.set("live", 1)
+    assert len(cache) == 1
+
+
+def test_concurrent_access_keeps_bounds():
+    import threading
+
+    cache = Cache(max_entries=64, shards=8)
+    def worker(offset):
+        for index in range(500):
+            cache.set((offset, index % 100), index)
+            cache.get((offset, (index * 7) % 100))
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) <= 64
+
+
+def test_invalid_configuration_is_rejected():
+    import pytest
+    from lback.core.cache import CacheItem
+
+    with pytest.raises(ValueError):
+        Cache(eviction_policy="fifo")
+    with pytest.raises(ValueError):
+        Cache(shards=0)
+    assert not hasattr(CacheItem(1), "__dict__")
+
+
+def test_stats_aggregate_counters():
+    cache = Cache(max_entries=2, shards=1)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=-1)
+    cache.get("a")
+    cache.get("b")
+    cache.get("missing")
+    cache.set("c", 3)
+    cache.set("d", 4)
+    cache.delete("d")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+    assert stats["evictions"] == 1
+    assert stats["sets"] == 4
+    assert stats["deletes"] == 1
+    assert stats["entries"] == 1
+    assert stats["hit_rate"] == 1 / 3
+
+
+def test_signals_only_sent_to_connected_receivers(monkeypatch):
+    from lback.core.signals import dispatcher
+
+    sent = []
+    monkeypatch.setattr(dispatcher, "send", lambda name, **kwargs: sent.append(name))
+    cache = Cache()
+    cache.set("a", 1)
+    cache.get("a")
+    assert sent == []
+
+    received = []
+    def on_hit(sender, **kwargs):
+        received.append(kwargs["key"])
+    monkeypatch.undo()
+    dispatcher.connect("cache_hit", on_hit)
+    try:
+        cache.get("a")
+        Cache(signal_sample_rate=0.0).get("a")
+        muted = Cache(signal_sample_rate=0.0)
+        muted.set("a", 1)
+        muted.get("a")
+    finally:
+        dispatcher.disconnect("cache_hit", on_hit)
+    assert received == ["a"]
+
+
+def test_get_or_set_computes_once_for_concurrent_callers():
+    import threading
+
+    cache = Cache()
+    calls = []
+    started = threading.Event()
+    def factory():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_set("k", factory, ttl=60))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == ["value"] * 8
+    assert cache.get("k") == "value"
+
+
+def test_get_or_set_serves_stale_value_while_refreshing(monkeypatch):
+    import threading
+    import lback.core.cache as cache_module
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = Cache()
+    refreshed = threading.Event()
+    values = iter(["old", "new"])
+    def factory():
+        value = next(values)
+        if value == "new":
+            refreshed.set()
+        return value
+
+    assert cache.get_or_set("k", factory, ttl=10, stale_ttl=30, beta=0) == "old"
+    now[0] += 15
+    assert cache.get_or_set("k", factory, ttl=10, stale_ttl=30, beta=0) == "old"
+    assert refreshed.wait(2)
+    for _ in range(100):
+        if cache.get("k") == "new":
+            break
+        time.sleep(0.01)
+    assert cache.get_or_set("k", factory, ttl=10, stale_ttl=30, beta=0) == "new"
+
+
+def test_get_or_set_refreshes_early_with_xfetch(monkeypatch):
+    import lback.core.cache as cache_module
+
+    cache = Cache()
+    counter = iter(range(100))
+    def slow_first():
+        time.sleep(0.01)
+        return next(counter)
+    cache.get_or_set("k", slow_first, ttl=10)
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.999999)
+    assert cache.get_or_set("k", lambda: next(counter), ttl=10, beta=1e9) == 1
+    assert cache.get_or_set("k", lambda: next(counter), ttl=10, beta=0) == 1
+
+
+def test_get_or_set_propagates_factory_errors():
+    import pytest
+
+    cache = Cache()
+    def failing():
+        raise RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        cache.get_or_set("k", failing, ttl=5)
+    assert cache.get_or_set("k", lambda: 1, ttl=5) == 1
+
+
+def test_cached_decorator_uses_key_template_and_invalidates():
+    from lback.core.cache import cached
+
+    cache = Cache()
+    calls = []
+
+    @cached(ttl=60, key="product:{0}", cache=cache)
+    def load_product(product_id):
+        calls.append(product_id)
+        return {"id": product_id}
+
+    assert load_product(1) == {"id": 1}
+    assert load_product(1) == {"id": 1}
+    assert calls == [1]
+    assert cache.get("product:1") == {"id": 1}
+    load_product.invalidate(1)
+    load_product(1)
+    assert calls == [1, 1]
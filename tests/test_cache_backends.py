@@ -0,0 +1,177 @@
+import socketserver
+import threading
+import time
+
+import pytest
+
+from lback.core.cache import Cache, MemoryCacheBackend
+from lback.core.cache_backends import RedisCacheBackend, SQLiteCacheBackend, backend_from_config
+from lback.core.exceptions import ConfigurationError
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Answers the subset of the Redis protocol used by RedisCacheBackend."""
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        arguments = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            arguments.append(self.rfile.read(length + 2)[:-2])
+        return arguments
+
+    def reply(self, value):
+        if value is None:
+            self.wfile.write(b"$-1\r\n")
+        elif isinstance(value, int):
+            self.wfile.write(b":%d\r\n" % value)
+        elif isinstance(value, list):
+            self.wfile.write(b"*%d\r\n" % len(value))
+            for item in value:
+                self.reply(item)
+        else:
+            self.wfile.write(b"$%d\r\n%s\r\n" % (len(value), value))
+
+    def handle(self):
+        store = self.server.store
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+            name, arguments = command[0].upper(), command[1:]
+            now = time.time()
+            for key, (_, expires_at) in list(store.items()):
+                if expires_at is not None and expires_at <= now:
+                    del store[key]
+            if name == b"GET":
+                self.reply(store.get(arguments[0], (None, None))[0])
+            elif name == b"SET":
+                expires_at = now + int(arguments[3]) / 1000 if len(arguments) > 2 else None
+                store[arguments[0]] = (arguments[1], expires_at)
+                self.wfile.write(b"+OK\r\n")
+            elif name == b"DEL":
+                self.reply(sum(1 for key in arguments if store.pop(key, None) is not None))
+            elif name == b"EXISTS":
+                self.reply(int(arguments[0] in store))
+            elif name == b"SCAN":
+                prefix = arguments[2][:-1]
+                self.reply([b"0", [key for key in store if key.startswith(prefix)]])
+            else:
+                self.wfile.write(b"-ERR unknown command\r\n")
+
+
+@pytest.fixture
+def redis_url():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeRedisHandler)
+    server.daemon_threads = True
+    server.store = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+
+def exercise(cache):
+    cache.set("a", {"value": 1})
+    cache.set(("tuple", 2), [1, 2])
+    assert cache.get("a") == {"value": 1}
+    assert cache.get(("tuple", 2)) == [1, 2]
+    assert cache.has("a")
+    assert sorted(cache.keys()) == ["('tuple', 2)", "a"]
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.set("short", 1, ttl=0.05)
+    time.sleep(0.1)
+    assert cache.get("short") is None
+    cache.clear()
+    assert cache.keys() == []
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+
+
+def test_sqlite_backend(tmp_path):
+    cache = Cache(backend=SQLiteCacheBackend(str(tmp_path / "cache.db")))
+    exercise(cache)
+    assert cache.stats()["backend"] == "sqlite"
+    cache.close()
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    writer = Cache(backend=SQLiteCacheBackend(path))
+    reader = Cache(backend=SQLiteCacheBackend(path))
+    writer.set("shared", b"payload")
+    assert reader.get("shared") == b"payload"
+
+
+def test_sqlite_backend_trims_to_max_entries(tmp_path):
+    cache = Cache(backend=SQLiteCacheBackend(str(tmp_path / "cache.db"), max_entries=5))
+    for index in range(20):
+        cache.set(f"key-{index}", index)
+    assert len(cache) == 5
+    assert cache.get("key-19") == 19
+    assert cache.stats()["evictions"] == 15
+
+
+def test_sqlite_trim_and_sweep_only_touch_their_own_prefix(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.db")
+    other = SQLiteCacheBackend(path, key_prefix="other:")
+    for index in range(10):
+        other.set(f"key-{index}", index, None)
+    other.set("expiring", 1, 0.01)
+
+    bounded = SQLiteCacheBackend(path, max_entries=5, key_prefix="bounded:")
+    for index in range(20):
+        bounded.set(f"key-{index}", index, None)
+    assert len(bounded) == 5
+    assert bounded.stats()["evictions"] == 15
+
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + 60)
+    assert bounded.sweep() == 0
+    assert len(other) == 11
+    assert other.sweep() == 1
+    assert sorted(other.keys()) == sorted(f"key-{index}" for index in range(10))
+
+
+def test_redis_backend(redis_url):
+    cache = Cache(backend=RedisCacheBackend(redis_url, key_prefix="test:"))
+    exercise(cache)
+    assert cache.stats()["backend"] == "redis"
+    cache.close()
+
+
+def test_redis_backend_reconnects(redis_url):
+    backend = RedisCacheBackend(redis_url)
+    backend.set("a", 1, None)
+    backend._connections.get()._socket.close()
+    assert backend.get("a") == (True, 1, None)
+
+
+class DummyConfig:
+    CACHE_BACKEND = "memory"
+    CACHE_LOCATION = ""
+    CACHE_KEY_PREFIX = "lback:"
+    CACHE_MAX_ENTRIES = 100
+    CACHE_MAX_BYTES = None
+    CACHE_EVICTION_POLICY = "lfu"
+    CACHE_SHARDS = 4
+
+
+def test_backend_selected_from_config(tmp_path):
+    config = DummyConfig()
+    backend = backend_from_config(config)
+    assert isinstance(backend, MemoryCacheBackend)
+    assert backend.eviction_policy == "lfu"
+
+    config.CACHE_BACKEND = "sqlite"
+    config.CACHE_LOCATION = str(tmp_path / "cache.db")
+    assert isinstance(Cache.from_config(config).backend, SQLiteCacheBackend)
+
+    config.CACHE_BACKEND = "memcached"
+    with pytest.raises(ConfigurationError):
+        backend_from_config(config)
@@ -0,0 +1,85 @@
+import gzip
+import json
+import zlib
+
+from lback.core.response import HTMLResponse, JSONResponse, Response, StreamingResponse
+from lback.core.types import Request
+from lback.middlewares import compression_middleware
+from lback.middlewares.compression_middleware import CompressionMiddleware
+
+
+def make_request(accept_encoding="gzip, deflate", method="GET"):
+    return Request(path="/api/items/", method=method, body=None, headers={"ACCEPT-ENCODING": accept_encoding}, environ={})
+
+
+def test_compresses_large_json_with_gzip():
+    middleware = CompressionMiddleware()
+    data = [{"id": index, "name": f"item {index}"} for index in range(200)]
+    response = middleware.process_response(make_request(), JSONResponse(data=data, headers={"ETag": '"abc"'}))
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert int(response.headers["Content-Length"]) == len(response.body)
+    assert json.loads(gzip.decompress(response.body))["data"] == data
+
+
+def test_negotiation_and_skips():
+    middleware = CompressionMiddleware(encodings=["gzip", "deflate"])
+    page = "<p>hello</p>" * 100
+
+    deflated = middleware.process_response(make_request("deflate"), HTMLResponse(page))
+    assert deflated.headers["Content-Encoding"] == "deflate"
+    assert zlib.decompress(deflated.body).decode() == page
+
+    identity = middleware.process_response(make_request("identity"), HTMLResponse(page))
+    assert "Content-Encoding" not in identity.headers
+    assert identity.headers["Vary"] == "Accept-Encoding"
+
+    small = middleware.process_response(make_request(), HTMLResponse("<p>hi</p>"))
+    assert "Content-Encoding" not in small.headers
+
+    image = middleware.process_response(make_request(), Response(b"\x89PNG" * 500, content_type="image/png"))
+    assert "Content-Encoding" not in image.headers
+
+    precompressed = Response(gzip.compress(page.encode()), headers={"Content-Encoding": "gzip", "Content-Type": "text/html"})
+    assert middleware.process_response(make_request(), precompressed).body == precompressed.body
+
+    head = middleware.process_response(make_request(method="HEAD"), HTMLResponse(page))
+    assert "Content-Encoding" not in head.headers
+
+
+def test_streaming_response_is_compressed_incrementally():
+    middleware = CompressionMiddleware(level=1)
+    produced = []
+
+    def rows():
+        for index in range(1000):
+            produced.append(index)
+            yield f"{index},row {index}\n"
+
+    response = middleware.process_response(make_request(), StreamingResponse(rows(), content_type="text/csv"))
+
+    assert response.streaming
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert produced == []
+    body = b"".join(response.get_wsgi_response()[2])
+    assert gzip.decompress(body).decode() == "".join(f"{index},row {index}\n" for index in range(1000))
+
+
+def test_each_streamed_chunk_is_flushed_to_the_client():
+    encodings = {"gzip": zlib.decompressobj(16 + zlib.MAX_WBITS).decompress,
+                 "deflate": zlib.decompressobj(zlib.MAX_WBITS).decompress}
+    if compression_middleware.brotli is not None:
+        encodings["br"] = compression_middleware.brotli.Decompressor().process
+
+    for encoding, decompress in encodings.items():
+        events = [f"data: tick {index}\n\n" for index in range(5)]
+        response = CompressionMiddleware().process_response(
+            make_request(accept_encoding=encoding), StreamingResponse(iter(events), content_type="text/plain"))
+        assert response.headers["Content-Encoding"] == encoding
+
+        chunks = iter(response.get_wsgi_response()[2])
+        for event in events:
+            assert decompress(next(chunks)).decode() == event
@@ -0,0 +1,270 @@
+from sqlalchemy import text
+
+from lback.models.database import DatabaseManager, LazyDBSession
+
+
+def make_manager(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    return DatabaseManager()
+
+
+def test_lazy_session_is_not_opened_until_used(monkeypatch):
+    manager = make_manager(monkeypatch)
+    lazy = manager.lazy_session()
+
+    assert isinstance(lazy, LazyDBSession)
+    assert lazy
+    assert not lazy.opened
+    assert not lazy.is_active
+    lazy.commit()
+    lazy.rollback()
+    lazy.close()
+    assert not lazy.opened
+
+    assert lazy.execute(text("SELECT 1")).scalar() == 1
+    assert lazy.opened
+    assert lazy.is_active
+    lazy.close()
+
+
+def test_session_usage_stats_count_requests_touching_db(monkeypatch):
+    manager = make_manager(monkeypatch)
+    for _ in range(3):
+        manager.lazy_session().close()
+    used = manager.lazy_session()
+    used.execute(text("SELECT 1"))
+    used.close()
+
+    assert manager.session_usage_stats() == {
+        'requests': 4,
+        'requests_touching_db': 1,
+        'requests_skipping_db': 3,
+    }
+
+
+def test_sqlite_memory_uses_static_pool_and_reports_stats(monkeypatch):
+    from lback.core.signals import dispatcher
+    from lback.models.pool import TimedStaticPool
+
+    manager = make_manager(monkeypatch)
+    assert isinstance(manager.engine.pool, TimedStaticPool)
+
+    received = []
+    def on_stats(sender, **kwargs):
+        received.append(kwargs['stats'])
+    dispatcher.connect("db_pool_stats", on_stats)
+    try:
+        session = manager.lazy_session()
+        session.execute(text("SELECT 1"))
+        session.close()
+        stats = manager.pool_stats()
+    finally:
+        dispatcher.disconnect("db_pool_stats", on_stats)
+
+    assert received == [stats]
+    assert stats['pool_class'] == 'TimedStaticPool'
+    assert stats['checkouts'] >= 1
+    assert stats['checked_out'] == 0
+    assert sum(stats['wait_histogram_ms'].values()) >= 1
+
+
+def test_admin_db_pool_endpoint_reports_the_server_pool(monkeypatch):
+    from types import SimpleNamespace
+    from lback.admin.views import admin_db_pool
+    from lback.core import json_codec
+
+    manager = make_manager(monkeypatch)
+    monkeypatch.setattr(DatabaseManager, "_instance", manager)
+    session = manager.lazy_session()
+    session.execute(text("SELECT 1"))
+    session.close()
+
+    request = SimpleNamespace(user=SimpleNamespace(is_superuser=True, username="root"), path="/admin/db-pool/",
+                              method="GET", session=None)
+    response = admin_db_pool(request)
+
+    assert response.status_code == 200
+    payload = json_codec.loads(response.body)["data"]
+    assert payload["pool_class"] == "TimedStaticPool"
+    assert payload["checkouts"] == manager.pool_stats()["checkouts"] >= 1
+
+
+def test_build_engine_options_from_config():
+    from lback.models.pool import build_engine_options, TimedNullPool, TimedQueuePool
+
+    class PoolConfig:
+        DB_POOL_SIZE = 20
+        DB_MAX_OVERFLOW = 5
+        DB_POOL_TIMEOUT = 3
+        DB_POOL_RECYCLE = 600
+        DB_POOL_PRE_PING = False
+
+    assert build_engine_options("sqlite:///app.db", PoolConfig()) == {'poolclass': TimedNullPool}
+    assert build_engine_options("postgresql://u:p@localhost/db", PoolConfig()) == {
+        'poolclass': TimedQueuePool,
+        'pool_size': 20,
+        'max_overflow': 5,
+        'pool_timeout': 3,
+        'pool_recycle': 600,
+        'pool_pre_ping': False,
+    }
+
+
+def make_replicated_manager(monkeypatch, tmp_path, selection="round_robin", sticky_seconds="5"):
+    from sqlalchemy import create_engine
+
+    urls = [f"sqlite:///{tmp_path / name}.db" for name in ("primary", "replica1", "replica2")]
+    for url in urls:
+        engine = create_engine(url)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE node (name TEXT)"))
+            connection.execute(text("INSERT INTO node VALUES (:name)"), {"name": url.rsplit('/', 1)[-1][:-3]})
+        engine.dispose()
+    monkeypatch.setenv("DATABASE_URL", urls[0])
+    monkeypatch.setenv("DATABASE_REPLICA_URLS", ",".join(urls[1:]))
+    monkeypatch.setenv("DB_REPLICA_SELECTION", selection)
+    monkeypatch.setenv("DB_REPLICA_STICKY_SECONDS", sticky_seconds)
+    return DatabaseManager()
+
+
+def read_node(manager, read_only, sticky_key=None, sql="SELECT name FROM node"):
+    session = manager.lazy_session()
+    session.set_routing(read_only, sticky_key)
+    try:
+        return session.execute(text(sql)).scalar()
+    finally:
+        session.close()
+
+
+def test_read_only_sessions_round_robin_over_replicas(monkeypatch, tmp_path):
+    manager = make_replicated_manager(monkeypatch, tmp_path)
+
+    assert manager.has_replicas
+    assert [read_node(manager, True) for _ in range(4)] == ["replica1", "replica2", "replica1", "replica2"]
+    assert read_node(manager, False) == "primary"
+    assert len(manager.pool_stats()['replicas']) == 2
+
+
+def test_writes_go_to_primary_and_stick_for_the_client(monkeypatch, tmp_path):
+    manager = make_replicated_manager(monkeypatch, tmp_path)
+
+    session = manager.lazy_session()
+    session.set_routing(True, "client-a")
+    session.execute(text("INSERT INTO node VALUES ('written')"))
+    assert session.execute(text("SELECT count(*) FROM node")).scalar() == 2
+    session.commit()
+    session.close()
+
+    assert read_node(manager, True, "client-a") == "primary"
+    assert read_node(manager, True, "client-b").startswith("replica")
+
+
+def test_text_selects_are_recognised_in_any_case_and_with_goes_to_primary(monkeypatch, tmp_path):
+    manager = make_replicated_manager(monkeypatch, tmp_path, sticky_seconds="0")
+
+    for sql in ("Select name FROM node", "\n  select name FROM node"):
+        assert read_node(manager, True, sql=sql).startswith("replica"), sql
+    assert read_node(manager, True, sql="WITH n AS (SELECT name FROM node) SELECT name FROM n") == "primary"
+
+
+def test_least_connections_prefers_idle_replica(monkeypatch, tmp_path):
+    manager = make_replicated_manager(monkeypatch, tmp_path, selection="least_connections", sticky_seconds="0")
+
+    busy = manager.replica_engines[0].connect()
+    try:
+        assert read_node(manager, True) == "replica2"
+        assert read_node(manager, True) == "replica2"
+    finally:
+        busy.close()
+    assert read_node(manager, True) == "replica1"
+
+
+def test_is_read_only_request_requires_marked_view_and_safe_method():
+    from lback.api.generics import CreateAPIView, ListAPIView
+    from lback.models.routing import is_read_only_request, read_only
+
+    @read_only
+    def view(request):
+        return None
+
+    assert is_read_only_request(view, "GET")
+    assert not is_read_only_request(view, "POST")
+    assert is_read_only_request(ListAPIView, "GET")
+    assert not is_read_only_request(CreateAPIView, "GET")
+
+
+def test_session_housekeeping_does_not_defeat_replica_reads(monkeypatch, tmp_path):
+    from lback.core.app_controller import AppController
+    from lback.core.middleware_manager import MiddlewareManager
+    from lback.core.response import Response
+    from lback.core.router import Router
+    from lback.core.signals import SignalDispatcher
+    from lback.core.types import Request
+    from lback.middlewares.session_middleware import SessionMiddleware
+    from lback.models.routing import read_only
+    from lback.models.session import Session as SessionModel
+    from lback.utils.session_manager import SessionManager
+
+    manager = make_replicated_manager(monkeypatch, tmp_path)
+    SessionModel.__table__.create(manager.engine)
+    session_manager = SessionManager()
+    setup = manager.lazy_session()
+    session_id = session_manager.create_session(setup)
+    setup.commit()
+    setup.close()
+
+    middleware_manager = MiddlewareManager()
+    middleware_manager.add_middleware(SessionMiddleware(session_manager))
+    controller = AppController(
+        middleware_manager=middleware_manager, router=Router(), template_renderer=None,
+        config=type("DummyConfig", (), {"ROOT_URLCONF": None})(), admin_user_manager=None,
+        session_manager=session_manager, user_manager=None, available_dependencies_instances={},
+        dispatcher=SignalDispatcher(),
+    )
+
+    @read_only
+    def node_view(request):
+        return Response(body=request.get_context('db_session').execute(text("SELECT name FROM node")).scalar().encode())
+
+    def write_view(request):
+        request.get_context('db_session').execute(text("INSERT INTO node VALUES ('written')"))
+        return Response(body=b"ok")
+
+    controller.add_route("/node/", node_view, methods=["GET"])
+    controller.add_route("/write/", write_view, methods=["POST"])
+
+    def call(path, address, method="GET", cookie=None):
+        headers = {'COOKIE': f"session_id={cookie}"} if cookie else {}
+        request = Request(path=path, method=method, body=None, headers=headers, environ={'REMOTE_ADDR': address})
+        db_session = manager.lazy_session()
+        request.add_context('db_session', db_session)
+        try:
+            return controller.handle_request(request).body
+        finally:
+            db_session.commit()
+            db_session.close()
+
+    assert call("/node/", "10.0.0.1", cookie=session_id).startswith(b"replica")
+    assert call("/node/", "10.0.0.1", cookie=session_id).startswith(b"replica")
+    assert call("/node/", "10.0.0.2").startswith(b"replica")
+    assert call("/node/", "10.0.0.2").startswith(b"replica")
+
+    assert call("/write/", "10.0.0.3", method="POST") == b"ok"
+    assert call("/node/", "10.0.0.3") == b"primary"
+    assert call("/node/", "10.0.0.4").startswith(b"replica")
+
+
+def test_repositories_accept_lazy_session_without_opening_it(monkeypatch, caplog):
+    import logging
+    from lback.repositories.admin_user_repository import AdminUserRepository
+    from lback.repositories.permission_repository import PermissionRepository
+    from lback.repositories.role_repository import RoleRepository
+    from lback.repositories.user_repository import UserRepository
+
+    lazy = make_manager(monkeypatch).lazy_session()
+    with caplog.at_level(logging.ERROR, logger="lback.repositories"):
+        repositories = [repository(lazy) for repository in (UserRepository, AdminUserRepository, RoleRepository, PermissionRepository)]
+
+    assert [record.getMessage() for record in caplog.records] == []
+    assert all(repository.session is lazy for repository in repositories)
+    assert not lazy.opened
@@ -0,0 +1,80 @@
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from lback.core import json_codec
+from lback.core.exceptions import ConfigurationError
+from lback.core.response import JSONResponse
+from lback.core.types import Request
+from lback.middlewares.body_parsing_middleware import BodyParsingMiddleware
+
+
+def available_codecs():
+    names = ["json"]
+    if json_codec.orjson is not None:
+        names.append("orjson")
+    if json_codec.ujson is not None:
+        names.append("ujson")
+    return names
+
+
+@pytest.fixture
+def row():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT 1 AS id, 'widget' AS name")).first()
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codecs_encode_rich_types_to_bytes(name, row):
+    codec = json_codec.create_codec(name)
+    value = {
+        "when": datetime.datetime(2026, 1, 2, 3, 4, 5),
+        "day": datetime.date(2026, 1, 2),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "price": decimal.Decimal("19.99"),
+        "row": row,
+        "name": "café",
+        1: "non-string key",
+    }
+    encoded = codec.dumps(value)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == {
+        "when": "2026-01-02T03:04:05",
+        "day": "2026-01-02",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "price": "19.99",
+        "row": {"id": 1, "name": "widget"},
+        "name": "café",
+        "1": "non-string key",
+    }
+    assert codec.loads(encoded)["price"] == "19.99"
+    assert codec.loads(encoded.decode("utf-8"))["name"] == "café"
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+
+
+def test_codec_selection():
+    assert json_codec.create_codec("json").name == "json"
+    assert json_codec.create_codec("auto").name in available_codecs()
+    with pytest.raises(ConfigurationError):
+        json_codec.create_codec("yaml")
+
+
+def test_json_response_and_body_parsing_use_codec(monkeypatch):
+    monkeypatch.setattr(json_codec, "_codec", json_codec.StdlibJSONCodec())
+    response = JSONResponse(data={"at": datetime.date(2026, 5, 1)})
+    assert response.body == b'{"data":{"at":"2026-05-01"}}'
+
+    body = b'{"name": "widget", "tags": ["a", "b"]}'
+    request = Request(path="/api/items/", method="POST", body=body,
+                      headers={"CONTENT-TYPE": "application/json", "CONTENT-LENGTH": str(len(body))}, environ={})
+    assert BodyParsingMiddleware().process_request(request) is None
+    assert request.parsed_body == {"name": "widget", "tags": ["a", "b"]}
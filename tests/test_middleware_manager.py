@@ -0,0 +1,168 @@
+from lback.core.base_middleware import BaseMiddleware
+from lback.core.middleware_manager import Middleware, MiddlewareManager
+from lback.core.profiling import profiler
+from lback.core.response import Response
+from lback.core.signals import dispatcher
+
+
+class Recorder(BaseMiddleware):
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def process_request(self, request):
+        self.calls.append(("request", self.name))
+        return None
+
+    def process_response(self, request, response):
+        self.calls.append(("response", self.name))
+        return response
+
+
+class RequestOnly(Middleware):
+    def process_request(self, request):
+        request.append("seen")
+
+
+class ReturnsNone(BaseMiddleware):
+    def process_request(self, request):
+        pass
+
+    def process_response(self, request, response):
+        pass
+
+
+class ShortCircuit(BaseMiddleware):
+    def process_request(self, request):
+        return Response(body=b"blocked", status_code=403)
+
+    def process_response(self, request, response):
+        return response
+
+
+def test_compiled_chains_skip_noop_methods_and_follow_changes():
+    calls = []
+    manager = MiddlewareManager()
+    first, second, request_only = Recorder("first", calls), Recorder("second", calls), RequestOnly()
+    for middleware in (first, request_only, second):
+        manager.add_middleware(middleware)
+
+    def run():
+        calls.clear()
+        request = []
+        response = Response(body=b"ok")
+        profiler.reset()
+        profiler.enabled = True
+        try:
+            assert manager.process_request(request) is None
+            assert manager.process_response(request, response) is response
+        finally:
+            profiler.enabled = False
+        stages = {stage: summary["count"] for stage, summary in profiler.snapshot().items()}
+        profiler.reset()
+        return request, stages
+
+    request, stages = run()
+    assert request == ["seen"]
+    assert calls == [("request", "first"), ("request", "second"), ("response", "second"), ("response", "first")]
+    assert stages == {"middleware.Recorder.request": 2, "middleware.RequestOnly.request": 1, "middleware.Recorder.response": 2}
+
+    manager.remove_middleware(first)
+    request, stages = run()
+    assert request == ["seen"]
+    assert calls == [("request", "second"), ("response", "second")]
+
+    manager.remove_middleware_by_class(Recorder)
+    request, stages = run()
+    assert request == ["seen"]
+    assert calls == []
+    assert stages == {"middleware.RequestOnly.request": 1}
+
+
+def test_response_hooks_returning_none_are_still_reported():
+    manager = MiddlewareManager()
+    manager.add_middleware(ReturnsNone())
+    failures = []
+
+    def on_failed(sender, middleware_name, error_type, **kwargs):
+        failures.append((middleware_name, error_type))
+
+    response = Response(body=b"ok")
+    dispatcher.connect("middleware_process_response_failed", on_failed)
+    try:
+        assert manager.process_response([], response) is response
+    finally:
+        dispatcher.disconnect("middleware_process_response_failed", on_failed)
+    assert failures == [("ReturnsNone", "invalid_response_type")]
+
+
+def test_short_circuit_and_signals_only_when_connected():
+    calls = []
+    manager = MiddlewareManager()
+    manager.add_middleware(ShortCircuit())
+    manager.add_middleware(Recorder("after", calls))
+
+    received = []
+
+    def on_started(sender, middleware_name, **kwargs):
+        received.append(middleware_name)
+
+    assert manager.process_request([]).status_code == 403
+    assert calls == [] and received == []
+
+    dispatcher.connect("middleware_process_request_started", on_started)
+    try:
+        manager.process_request([])
+    finally:
+        dispatcher.disconnect("middleware_process_request_started", on_started)
+    assert received == ["ShortCircuit"]
+
+
+def test_scoped_middlewares_get_per_scope_chains():
+    from lback.core.middleware_manager import MiddlewareScope
+
+    calls = []
+    manager = MiddlewareManager()
+    everywhere = Recorder("everywhere", calls)
+    not_static = Recorder("not_static", calls)
+    api_only = Recorder("api_only", calls)
+    manager.add_middleware(everywhere)
+    manager.add_middleware(not_static, scope=MiddlewareScope(exclude_paths=["/static/", "/health"]))
+    manager.add_middleware(api_only, scope=MiddlewareScope(include_paths=["/api/"], exclude_routes=["api_login"]))
+    assert manager.uses_route_names is True
+
+    def names(path, route_name=None):
+        return [m.name for m, _, _, _ in manager.chains_for(path, route_name)[0]]
+
+    assert names("/static/site.css") == ["everywhere"]
+    assert names("/health") == ["everywhere"]
+    assert names("/api/items/") == ["everywhere", "not_static", "api_only"]
+    assert names("/api/login/", "api_login") == ["everywhere", "not_static"]
+    assert names("/pages/") == ["everywhere", "not_static"]
+    assert manager.chains_for("/pages/") is manager.chains_for("/about/")
+
+    class Req:
+        path = "/static/app.js"
+    manager.process_response(Req(), manager.process_request(Req()) or Response(body=b""))
+    assert calls == [("request", "everywhere"), ("response", "everywhere")]
+
+    manager.remove_middleware(api_only)
+    assert manager.uses_route_names is False
+    assert names("/api/items/") == ["everywhere", "not_static"]
+
+
+def test_loader_reads_scope_rules_from_config():
+    from lback.core.middleware_loader import load_middlewares_from_config
+
+    class Config:
+        MIDDLEWARES = [
+            {"class": "lback.middlewares.timer.TimerMiddleware", "exclude_paths": ["/static/"], "include_routes": ["home"]},
+            {"class": "lback.middlewares.timer.TimerMiddleware", "exclude_paths": "/static/", "include_routes": [""]},
+        ]
+
+    manager = MiddlewareManager()
+    load_middlewares_from_config(manager, Config(), {})
+    assert len(manager.middlewares) == 1
+    scope = manager._scopes[id(manager.middlewares[0])]
+    assert scope.exclude_paths == ("/static/",) and scope.include_routes == frozenset({"home"})
+    assert manager.chains_for("/", "home")[0] and not manager.chains_for("/", "about")[0]
@@ -0,0 +1,175 @@
+import hashlib
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from lback.core.exceptions import BadRequest, PayloadTooLarge
+from lback.core.types import Request
+from lback.middlewares.body_parsing_middleware import BodyParsingMiddleware
+from lback.utils import multipart
+from lback.utils.multipart import MultipartParser, parse_options_header
+
+BOUNDARY = b"----lbackBoundary7MA4YWxk"
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\rIHDR" + bytes(range(256)) * 20
+
+
+def encode(fields, files):
+    body = io.BytesIO()
+    for name, value in fields:
+        body.write(b"--" + BOUNDARY + b"\r\n")
+        body.write(f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode())
+        body.write(value.encode() + b"\r\n")
+    for name, filename, content_type, data in files:
+        body.write(b"--" + BOUNDARY + b"\r\n")
+        body.write(f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'.encode())
+        body.write(f"Content-Type: {content_type}\r\n\r\n".encode() + data + b"\r\n")
+    body.write(b"--" + BOUNDARY + b"--\r\n")
+    return body.getvalue()
+
+
+def test_parses_fields_and_files_across_chunk_boundaries():
+    body = encode([("title", "Report"), ("tags", "a"), ("tags", "b")],
+                  [("document", "report.png", "image/png", PNG), ("empty", "", "application/octet-stream", b"")])
+    parser = MultipartParser(chunk_size=7)
+    form, files = parser.parse(io.BytesIO(body), BOUNDARY, len(body))
+
+    assert form["title"] == "Report"
+    assert form.getlist("tags") == ["a", "b"]
+    assert "empty" not in files
+    uploaded = files["document"]
+    assert uploaded.filename == "report.png"
+    assert uploaded.content_type == "image/png"
+    assert uploaded.size == len(PNG)
+    assert uploaded.read() == PNG
+    assert uploaded.digest == hashlib.sha256(PNG).hexdigest()
+    if multipart.magic is not None:
+        assert uploaded.detected_content_type == "image/png"
+
+
+def test_large_files_spool_to_disk_and_move_by_rename(tmp_path):
+    body = encode([], [("document", "report.png", "image/png", PNG)])
+    parser = MultipartParser(memory_threshold=1024, temp_dir=str(tmp_path))
+    _, files = parser.parse(io.BytesIO(body), BOUNDARY, len(body))
+    uploaded = files["document"]
+
+    spooled_path = uploaded.file.path
+    assert spooled_path is not None and os.path.dirname(spooled_path) == str(tmp_path)
+    inode = os.stat(spooled_path).st_ino
+
+    destination = tmp_path / "saved.png"
+    uploaded.move_to(str(destination))
+    uploaded.close()
+    assert not os.path.exists(spooled_path)
+    assert os.stat(destination).st_ino == inode
+    assert destination.read_bytes() == PNG
+
+
+def test_saved_uploads_get_the_file_mode_instead_of_the_temp_file_mode(tmp_path):
+    body = encode([], [("large", "large.png", "image/png", PNG), ("small", "small.txt", "text/plain", b"hi")])
+
+    _, files = MultipartParser(memory_threshold=1024, temp_dir=str(tmp_path)).parse(io.BytesIO(body), BOUNDARY, len(body))
+    assert os.stat(files["large"].file.path).st_mode & 0o777 == 0o600
+    for name in ("large", "small"):
+        destination = tmp_path / f"default-{name}"
+        files[name].move_to(str(destination))
+        assert os.stat(destination).st_mode & 0o777 == multipart.DEFAULT_FILE_MODE
+
+    _, files = MultipartParser(memory_threshold=1024, temp_dir=str(tmp_path), file_mode=0o640).parse(
+        io.BytesIO(body), BOUNDARY, len(body))
+    for name in ("large", "small"):
+        destination = tmp_path / f"configured-{name}"
+        files[name].move_to(str(destination))
+        assert os.stat(destination).st_mode & 0o777 == 0o640
+
+
+def test_moved_uploads_can_be_read_and_moved_again(tmp_path):
+    body = encode([], [("large", "large.png", "image/png", PNG), ("small", "small.txt", "text/plain", b"hi")])
+    _, files = MultipartParser(memory_threshold=1024, temp_dir=str(tmp_path)).parse(io.BytesIO(body), BOUNDARY, len(body))
+
+    for name, content in (("large", PNG), ("small", b"hi")):
+        uploaded = files[name]
+        first = tmp_path / f"first-{name}"
+        second = tmp_path / f"second-{name}"
+        uploaded.move_to(str(first))
+        assert uploaded.read() == content
+        uploaded.move_to(str(second))
+        uploaded.move_to(str(second))
+        uploaded.seek(0)
+        assert uploaded.read() == content
+        uploaded.close()
+        assert first.read_bytes() == content
+        assert second.read_bytes() == content
+        assert os.stat(second).st_mode & 0o777 == multipart.DEFAULT_FILE_MODE
+
+
+def test_limits_are_enforced_mid_stream(tmp_path):
+    body = encode([("note", "x" * 100)], [("document", "report.png", "image/png", PNG)])
+
+    with pytest.raises(PayloadTooLarge):
+        MultipartParser(max_field_size=10).parse(io.BytesIO(body), BOUNDARY, len(body))
+
+    stream = io.BytesIO(body)
+    with pytest.raises(PayloadTooLarge):
+        MultipartParser(max_file_size=1000, memory_threshold=100, temp_dir=str(tmp_path), chunk_size=256).parse(
+            stream, BOUNDARY, input_terminated=True)
+    assert stream.tell() < len(body)
+    assert os.listdir(tmp_path) == []
+
+    with pytest.raises(PayloadTooLarge):
+        MultipartParser(max_total_size=100).parse(io.BytesIO(body), BOUNDARY, len(body))
+
+    with pytest.raises(BadRequest):
+        MultipartParser().parse(io.BytesIO(body[:-30]), BOUNDARY, len(body) - 30)
+
+
+def test_parse_options_header():
+    assert parse_options_header('form-data; name="file"; filename="a \\"b\\".txt"') == (
+        "form-data", {"name": "file", "filename": 'a "b".txt'})
+    assert parse_options_header("form-data; name=f; filename*=UTF-8''caf%C3%A9.txt; filename=\"cafe.txt\"")[1]["filename"] == "café.txt"
+
+
+def test_body_parsing_middleware_streams_multipart():
+    body = encode([("title", "Report")], [("document", "report.png", "image/png", PNG)])
+    headers = {"CONTENT-TYPE": "multipart/form-data; boundary=" + BOUNDARY.decode(), "CONTENT-LENGTH": str(len(body))}
+
+    def make_request():
+        return Request(path="/upload/", method="POST", body=None, headers=dict(headers),
+                       environ={"wsgi.input": io.BytesIO(body), "CONTENT_LENGTH": str(len(body))})
+
+    middleware = BodyParsingMiddleware(config=SimpleNamespace(UPLOAD_MAX_FILE_SIZE=None))
+    request = make_request()
+    assert middleware.process_request(request) is None
+    assert request.parsed_body["title"] == "Report"
+    assert request.files["document"].read() == PNG
+
+    limited = BodyParsingMiddleware(config=SimpleNamespace(UPLOAD_MAX_FILE_SIZE=100))
+    response = limited.process_request(make_request())
+    assert response.status_code == 413
+
+
+def test_body_without_content_length_is_read_only_when_input_is_terminated():
+    body = encode([("title", "Report")], [])
+
+    class UnterminatedInput(io.BytesIO):
+        def read(self, size=-1):
+            raise AssertionError("wsgi.input read without Content-Length")
+
+    with pytest.raises(BadRequest):
+        MultipartParser().parse(UnterminatedInput(body), BOUNDARY)
+    form, _ = MultipartParser().parse(io.BytesIO(body), BOUNDARY, input_terminated=True)
+    assert form["title"] == "Report"
+
+    def make_request(environ):
+        headers = {"CONTENT-TYPE": "multipart/form-data; boundary=" + BOUNDARY.decode()}
+        return Request(path="/upload/", method="POST", body=None, headers=headers, environ=environ)
+
+    middleware = BodyParsingMiddleware(config=SimpleNamespace())
+    request = make_request({"wsgi.input": UnterminatedInput(body)})
+    assert middleware.process_request(request) is None
+    assert not request.parsed_body
+
+    request = make_request({"wsgi.input": io.BytesIO(body), "wsgi.input_terminated": True})
+    assert middleware.process_request(request) is None
+    assert request.parsed_body["title"] == "Report"
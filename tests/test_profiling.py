@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+from lback.core.base_middleware import BaseMiddleware
+from lback.core.middleware_manager import MiddlewareManager
+from lback.core.profiling import LatencyHistogram, PipelineProfiler, profiler
+from lback.core.response import Response
+
+
+class Passthrough(BaseMiddleware):
+    def process_request(self, request):
+        request.append("seen")
+
+    def process_response(self, request, response):
+        response.headers["X-Seen"] = "1"
+        return response
+
+
+def test_histogram_percentiles_are_bucket_bounded():
+    histogram = LatencyHistogram()
+    for _ in range(98):
+        histogram.record(100_000)
+    histogram.record(5_000_000)
+    histogram.record(50_000_000)
+
+    assert histogram.count == 100
+    assert 100_000 <= histogram.percentile(0.50) <= 120_000
+    assert 100_000 <= histogram.percentile(0.95) <= 120_000
+    assert 5_000_000 <= histogram.percentile(0.99) <= 6_000_000
+    assert histogram.percentile(1.0) == 50_000_000
+    summary = histogram.summary()
+    assert summary["max_ms"] == 50.0 and summary["count"] == 100
+    assert LatencyHistogram().summary()["p99_ms"] == 0.0
+
+
+def test_snapshot_orders_stages_by_p99_and_reset_clears():
+    local = PipelineProfiler(enabled=True)
+    local.record("view", 2_000_000)
+    local.record("router.resolve", 3_000)
+    assert list(local.snapshot()) == ["view", "router.resolve"]
+    local.reset()
+    assert local.snapshot() == {}
+
+
+def test_manager_records_middleware_phases_only_when_enabled():
+    manager = MiddlewareManager()
+    manager.add_middleware(Passthrough())
+    profiler.reset()
+
+    manager.process_response([], manager.process_request([]) or Response(body=b"ok"))
+    assert profiler.snapshot() == {}
+
+    profiler.enabled = True
+    try:
+        manager.process_request([])
+        manager.process_response([], Response(body=b"ok"))
+    finally:
+        profiler.enabled = False
+    stages = profiler.snapshot()
+    assert set(stages) == {"middleware.Passthrough.request", "middleware.Passthrough.response"}
+    assert all(summary["count"] == 1 for summary in stages.values())
+    profiler.reset()
+
+
+def test_admin_pipeline_profile_endpoint():
+    from lback.admin.views import admin_pipeline_profile
+    from lback.core import json_codec
+
+    profiler.reset()
+    profiler.record("view", 1_000_000)
+    request = SimpleNamespace(user=SimpleNamespace(is_superuser=True, username="root"), path="/admin/pipeline-profile/",
+                              method="GET", session=None)
+    response = admin_pipeline_profile(request)
+    profiler.reset()
+
+    assert response.status_code == 200
+    payload = json_codec.loads(response.body)["data"]
+    assert payload["enabled"] is False
+    assert payload["stages"]["view"]["count"] == 1
@@ -0,0 +1,64 @@
+import pytest
+
+from lback.core.types import HTTPMethod, Request
+
+ENVIRON = {
+    'REQUEST_METHOD': 'GET', 'PATH_INFO': '/items/', 'QUERY_STRING': 'page=2&tag=a&tag=b',
+    'HTTP_COOKIE': 'session_id=abc; theme=dark', 'SERVER_NAME': 'localhost', 'SERVER_PORT': '8000',
+    'wsgi.url_scheme': 'http',
+}
+
+
+def make_request(**overrides):
+    kwargs = dict(path='/items/?page=2&tag=a&tag=b', method='get', body=None,
+                  headers={'COOKIE': 'session_id=abc; theme=dark', 'x_requested_with': 'fetch'}, environ=ENVIRON)
+    kwargs.update(overrides)
+    return Request(**kwargs)
+
+
+def test_request_parses_lazily_on_first_access():
+    request = make_request()
+    assert request.method == HTTPMethod.GET
+    assert request._headers is None and request._cookies is None
+    assert request._query_params is None and request._meta is None
+
+    assert request.path == '/items/'
+    assert request._query_params is None
+    assert request.query_params == {'page': '2', 'tag': ['a', 'b']}
+    assert request.headers['X-REQUESTED-WITH'] == 'fetch'
+    assert request.cookies == {'session_id': 'abc', 'theme': 'dark'}
+    assert request.meta['QUERY_STRING'] == 'page=2&tag=a&tag=b'
+    assert request.meta['PATH_INFO'] == '/items/'
+    assert request.meta['COOKIE'] == 'session_id=abc; theme=dark'
+
+
+def test_request_url_edge_cases_and_setters():
+    absolute = make_request(path='http://example.com/a/b?x=1#frag')
+    assert absolute.path == '/a/b'
+    assert absolute.query_params == {'x': '1'}
+    assert make_request(path='/plain').query_params == {}
+
+    request = make_request()
+    request.headers = {'cookie': 'a=1'}
+    assert request.headers == {'COOKIE': 'a=1'}
+    request.query_params = {'q': 'x'}
+    assert request.query_params == {'q': 'x'}
+    assert request.files == {}
+
+
+def test_request_paths_match_urlparse():
+    from urllib.parse import urlparse
+    for path in ('/items/?page=2', '/a;b=1/c?x=1', '/a/b;v=2', '//evil.example/a?x=1', '/a?x=1;y=2', '/a?x=1#frag'):
+        request = make_request(path=path)
+        parsed = urlparse(path)
+        assert (request.path, request._query_string) == (parsed.path, parsed.query)
+
+
+def test_request_uses_slots():
+    request = make_request()
+    assert not hasattr(request, '__dict__')
+    request._start_time = 1.0
+    with pytest.raises(AttributeError):
+        request.arbitrary_attribute = True
+    request.set_context(arbitrary_attribute=True)
+    assert request.get_context('arbitrary_attribute') is True
@@ -0,0 +1,67 @@
+import io
+
+from lback.core.middleware_manager import MiddlewareManager
+from lback.core.response import FileResponse, StreamingResponse
+from lback.core.types import Request
+from lback.middlewares.debug import DebugMiddleware
+
+
+def test_streaming_response_yields_chunks_lazily():
+    produced = []
+
+    def rows():
+        for index in range(3):
+            produced.append(index)
+            yield f"row {index}\n"
+        yield b"end"
+
+    response = StreamingResponse(rows(), content_type="text/csv; charset=utf-8")
+    status, headers, body = response.get_wsgi_response()
+
+    assert status == "200 OK"
+    assert "Content-Length" not in dict(headers)
+    assert produced == []
+    assert next(body) == b"row 0\n"
+    assert produced == [0]
+    assert b"".join(body) == b"row 1\nrow 2\nend"
+
+
+def test_streaming_response_passes_through_middlewares():
+    manager = MiddlewareManager()
+    manager.add_middleware(DebugMiddleware(enabled=True, log_response=True))
+    request = Request(path="/export/", method="GET", body=None, headers={}, environ={})
+    response = StreamingResponse(iter([b"a", b"b"]))
+
+    processed = manager.process_response(request, response)
+
+    assert processed is response
+    assert b"".join(processed.get_wsgi_response()[2]) == b"ab"
+
+
+def test_file_response_reads_in_chunks(tmp_path):
+    path = tmp_path / "report.csv"
+    path.write_bytes(b"x" * 10)
+    response = FileResponse(str(path), as_attachment=True, chunk_size=4)
+    status, headers, body = response.get_wsgi_response({})
+    headers = dict(headers)
+
+    assert headers["Content-Type"] == "text/csv"
+    assert headers["Content-Length"] == "10"
+    assert headers["Content-Disposition"] == 'attachment; filename="report.csv"'
+    assert list(body) == [b"xxxx", b"xxxx", b"xx"]
+    assert response.file.closed
+
+
+def test_file_response_uses_wsgi_file_wrapper():
+    wrapped = []
+
+    def file_wrapper(file, block_size):
+        wrapped.append((file, block_size))
+        return iter([file.read()])
+
+    file = io.BytesIO(b"payload")
+    response = FileResponse(file, content_type="application/octet-stream", chunk_size=1024)
+    _, headers, body = response.get_wsgi_response({"wsgi.file_wrapper": file_wrapper})
+
+    assert wrapped == [(file, 1024)]
+    assert list(body) == [b"payload"]
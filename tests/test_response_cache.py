@@ -0,0 +1,142 @@
+from lback.core.app_controller import AppController
+from lback.core.cache import Cache
+from lback.core.middleware_manager import MiddlewareManager
+from lback.core.response import HTMLResponse
+from lback.core.router import Router
+from lback.core.signals import SignalDispatcher
+from lback.core.types import Request
+from lback.middlewares.csrf import CSRFMiddleware
+from lback.middlewares.response_cache_middleware import ResponseCacheMiddleware, cache_response
+
+
+def make_middleware(**kwargs):
+    calls = []
+
+    @cache_response(ttl=60)
+    def cached_view(request):
+        calls.append(request.path)
+        return HTMLResponse("<h1>products</h1>")
+
+    def plain_view(request):
+        calls.append(request.path)
+        return HTMLResponse("<h1>cart</h1>")
+
+    router = Router()
+    router.add_route("/products/", cached_view, methods=["GET", "HEAD"], requires_auth=False)
+    router.add_route("/cart/", plain_view, methods=["GET"], requires_auth=False)
+    return ResponseCacheMiddleware(cache=Cache(), router=router, **kwargs), router, calls
+
+
+def run(middleware, router, path, headers=None, method="GET"):
+    request = Request(path=path, method=method, body=None, headers=headers or {}, environ={})
+    response = middleware.process_request(request)
+    if response is None:
+        view, path_variables, _ = router.resolve(request.path, request.method)
+        response = view(request, **path_variables)
+    return middleware.process_response(request, response)
+
+
+def test_repeat_get_is_served_without_running_view():
+    middleware, router, calls = make_middleware()
+    first = run(middleware, router, "/products/?page=1")
+    second = run(middleware, router, "/products/?page=1")
+
+    assert calls == ["/products/"]
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.body == "<h1>products</h1>".encode()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert "Last-Modified" in second.headers
+
+    run(middleware, router, "/products/?page=2")
+    assert calls == ["/products/", "/products/"]
+
+
+def test_conditional_requests_get_304():
+    middleware, router, calls = make_middleware()
+    first = run(middleware, router, "/products/")
+
+    by_etag = run(middleware, router, "/products/", {"If-None-Match": first.headers["ETag"]})
+    assert by_etag.status_code == 304
+    assert by_etag.body == b""
+
+    by_date = run(middleware, router, "/products/", {"If-Modified-Since": first.headers["Last-Modified"]})
+    assert by_date.status_code == 304
+
+    changed = run(middleware, router, "/products/", {"If-None-Match": '"other"'})
+    assert changed.status_code == 200
+    assert len(calls) == 1
+
+
+def test_opt_in_authentication_and_vary():
+    middleware, router, calls = make_middleware()
+    run(middleware, router, "/cart/")
+    run(middleware, router, "/cart/")
+    assert calls == ["/cart/", "/cart/"]
+
+    run(middleware, router, "/products/", {"Authorization": "Bearer token"})
+    run(middleware, router, "/products/", {"Authorization": "Bearer token"})
+    assert calls.count("/products/") == 2
+
+    run(middleware, router, "/products/", {"Accept-Encoding": "gzip"})
+    run(middleware, router, "/products/", {"Accept-Encoding": "br"})
+    assert calls.count("/products/") == 4
+
+
+def test_responses_with_cookies_are_not_stored():
+    middleware, router, calls = make_middleware(default_ttl=30)
+    request = Request(path="/cart/", method="GET", body=None, headers={}, environ={})
+    assert middleware.process_request(request) is None
+    response = HTMLResponse("<h1>cart</h1>", headers={"Set-Cookie": "session_id=abc"})
+    middleware.process_response(request, response)
+    assert middleware.cache.keys() == []
+
+    run(middleware, router, "/cart/")
+    run(middleware, router, "/cart/")
+    assert calls == ["/cart/"]
+
+
+def test_pages_carrying_a_csrf_token_are_not_stored():
+    middleware, router, calls = make_middleware()
+    csrf = CSRFMiddleware(session_manager=None)
+
+    for token in ("alice-token", "bob-token"):
+        request = Request(path="/products/", method="GET", body=None, headers={}, environ={})
+        request.add_context("session", {"_csrf_token": token})
+        assert csrf.process_request(request) is None
+        assert middleware.process_request(request) is None
+        response = HTMLResponse(f"<input name='csrfmiddlewaretoken' value='{request.get_context('csrf_token')}'>")
+        middleware.process_response(request, csrf.process_response(request, response))
+
+    assert middleware.cache.keys() == []
+    run(middleware, router, "/products/")
+    run(middleware, router, "/products/")
+    assert calls == ["/products/"]
+
+
+def test_controller_resolves_the_route_once_for_the_cache():
+    middleware, router, calls = make_middleware()
+    resolutions = []
+    resolve_route = router.resolve_route
+
+    def counting_resolve_route(path, method):
+        resolutions.append(path)
+        return resolve_route(path, method)
+
+    def fail_resolve(*args, **kwargs):
+        raise AssertionError("the route must not be resolved a second time")
+
+    router.resolve_route = counting_resolve_route
+    router.resolve = fail_resolve
+    manager = MiddlewareManager()
+    manager.add_middleware(middleware)
+    assert manager.uses_route_resolution is True
+    controller = AppController(middleware_manager=manager, router=router, template_renderer=None, config=None,
+                               admin_user_manager=None, session_manager=None, user_manager=None,
+                               available_dependencies_instances={}, dispatcher=SignalDispatcher())
+
+    first = controller.handle_request(Request(path="/products/", method="GET", body=None, headers={}, environ={}))
+    second = controller.handle_request(Request(path="/products/", method="GET", body=None, headers={}, environ={}))
+    assert (first.headers["X-Cache"], second.headers["X-Cache"]) == ("MISS", "HIT")
+    assert calls == ["/products/"]
+    assert resolutions == ["/products/", "/products/"]
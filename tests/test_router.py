@@ -1,33 +1,206 @@
-from lback.core.router import Route
-
-def setup_function():
-    global test_view, route
-    test_view = lambda request: {"status_code": 200, "body": "Test passed"}
-    route = Route(path="/test", view=test_view, methods=['GET'])
-
-def test_handle_request():
-    request = type('Request', (), {"path": "/test", "method": "GET"})
-    response = route.handle_request(request)
-    assert response['status_code'] == 200
-    assert response['body'] == "Test passed"
-
-def test_method_not_allowed():
-    request = type('Request', (), {"path": "/test", "method": "POST"})
-    response = route.handle_request(request)
-    assert response['status_code'] == 405
-    assert response['body'] == "Method Not Allowed"
-
-def test_route_not_found():
-    request = type('Request', (), {"path": "/nonexistent", "method": "GET"})
-    response = route.handle_request(request)
-    assert response['status_code'] == 404
-    assert response['body'] == "Not Found"
-
-def test_route_with_variable():
-    route_with_var = Route(path="/test/<id>", view=test_view, methods=['GET'])
-    request = type('Request', (), {"path": "/test/123", "method": "GET"})
-    response = route_with_var.handle_request(request)
-    assert response['status_code'] == 200
-    assert response['body'] == "Test passed"
-    assert hasattr(request, "params")
-    assert request.params == {'id': '123'}
\ No newline at end of file
+from lback.core.router import Route
+
+def setup_function():
+    global test_view, route
+    test_view = lambda request: {"status_code": 200, "body": "Test passed"}
+    route = Route(path="/test", view=test_view, methods=['GET'])
+
+def test_handle_request():
+    request = type('Request', (), {"path": "/test", "method": "GET"})
+    response = route.handle_request(request)
+    assert response['status_code'] == 200
+    assert response['body'] == "Test passed"
+
+def test_method_not_allowed():
+    request = type('Request', (), {"path": "/test", "method": "POST"})
+    response = route.handle_request(request)
+    assert response['status_code'] == 405
+    assert response['body'] == "Method Not Allowed"
+
+def test_route_not_found():
+    request = type('Request', (), {"path": "/nonexistent", "method": "GET"})
+    response = route.handle_request(request)
+    assert response['status_code'] == 404
+    assert response['body'] == "Not Found"
+
+def test_route_with_variable():
+    route_with_var = Route(path="/test/<id>", view=test_view, methods=['GET'])
+    request = type('Request', (), {"path": "/test/123", "method": "GET"})
+    response = route_with_var.handle_request(request)
+    assert response['status_code'] == 200
+    assert response['body'] == "Test passed"
+    assert hasattr(request, "params")
+    assert request.params == {'id': '123'}
+
+
+def test_router_resolve_static_and_dynamic():
+    from lback.core.router import Router
+    router = Router()
+    list_view = lambda request: "list"
+    detail_view = lambda request, item_id: "detail"
+    router.add_route("/items/", list_view, methods=["GET"])
+    router.add_route("/items/{item_id}/", detail_view, methods=["GET"])
+
+    assert router.resolve("/items/", "GET") == (list_view, {}, True)
+    assert router.resolve("/items/7/", "GET") == (detail_view, {'item_id': '7'}, True)
+
+
+def test_router_resolve_first_registered_wins():
+    from lback.core.router import Router
+    router = Router()
+    dynamic_view = lambda request, model_name: "dynamic"
+    static_view = lambda request: "static"
+    router.add_route("/admin/{model_name}/", dynamic_view, methods=["GET"])
+    router.add_route("/admin/dashboard/", static_view, methods=["GET"])
+
+    view, path_variables, _ = router.resolve("/admin/dashboard/", "GET")
+    assert view is dynamic_view
+    assert path_variables == {'model_name': 'dashboard'}
+
+
+def test_router_resolve_method_not_allowed_and_not_found():
+    import pytest
+    from lback.core.router import Router
+    from lback.core.exceptions import RouteNotFound, MethodNotAllowed
+    router = Router()
+    router.add_route("/login/", lambda request: None, methods=["GET"])
+    router.add_route("/login/", lambda request: None, methods=["POST"])
+    router.add_route("/files/{name}.txt", lambda request, name: None, methods=["PUT"])
+
+    with pytest.raises(MethodNotAllowed) as exc_info:
+        router.resolve("/files/report.txt", "GET")
+    assert exc_info.value.allowed_methods == ["PUT"]
+
+    with pytest.raises(RouteNotFound):
+        router.resolve("/files/report.csv", "PUT")
+
+    router.remove_route("/login/", methods=["POST"])
+    with pytest.raises(MethodNotAllowed) as exc_info:
+        router.resolve("/login/", "POST")
+    assert exc_info.value.allowed_methods == ["GET"]
+
+
+def test_router_resolve_typed_converters():
+    import uuid
+    import pytest
+    from lback.core.router import Router
+    from lback.core.exceptions import RouteNotFound
+    router = Router()
+    int_view = lambda request, object_id: "int"
+    uuid_view = lambda request, token: "uuid"
+    router.add_route("/objects/{object_id:int}/", int_view, methods=["GET"])
+    router.add_route("/tokens/{token:uuid}/", uuid_view, methods=["GET"])
+
+    assert router.resolve("/objects/42/", "GET") == (int_view, {'object_id': 42}, True)
+    with pytest.raises(RouteNotFound):
+        router.resolve("/objects/abc/", "GET")
+
+    token = uuid.uuid4()
+    assert router.resolve(f"/tokens/{token}/", "GET") == (uuid_view, {'token': token}, True)
+    with pytest.raises(RouteNotFound):
+        router.resolve("/tokens/not-a-uuid/", "GET")
+
+
+def test_router_register_converter_and_url_for():
+    from lback.core.router import Router
+    from lback.core.converters import TypeConverter
+
+    class YearConverter(TypeConverter):
+        regex = r'\d{4}'
+
+        def to_python(self, value):
+            return int(value)
+
+        def to_url(self, value):
+            return f"{value:04d}"
+
+    router = Router()
+    router.register_converter('year', YearConverter)
+    archive_view = lambda request, year: "archive"
+    router.add_route("/archive/{year:year}/", archive_view, methods=["GET"], name="archive")
+    router.add_route("/objects/{object_id:int}/", lambda request, object_id: None, methods=["GET"], name="object_detail")
+
+    assert router.resolve("/archive/2024/", "GET") == (archive_view, {'year': 2024}, True)
+    assert router.url_for("archive", year=999) == "/archive/0999/"
+    assert router.url_for("object_detail", object_id=5) == "/objects/5/"
+
+
+def test_router_resolve_cache_hits_misses_and_invalidation():
+    import pytest
+    from lback.core.router import Router
+    from lback.core.exceptions import RouteNotFound, MethodNotAllowed
+    router = Router(resolve_cache_size=2)
+    detail_view = lambda request, item_id: "detail"
+    router.add_route("/items/{item_id:int}/", detail_view, methods=["GET"])
+
+    assert router.resolve("/items/1/", "GET") == (detail_view, {'item_id': 1}, True)
+    view, path_variables, _ = router.resolve("/items/1/", "GET")
+    path_variables['item_id'] = 99
+    assert router.resolve("/items/1/", "GET")[1] == {'item_id': 1}
+
+    with pytest.raises(MethodNotAllowed) as exc_info:
+        router.resolve("/items/1/", "POST")
+    with pytest.raises(MethodNotAllowed) as exc_info:
+        router.resolve("/items/1/", "POST")
+    assert exc_info.value.allowed_methods == ["GET"]
+    assert router.resolve_cache_info() == {'hits': 3, 'misses': 2, 'size': 2, 'maxsize': 2}
+
+    with pytest.raises(RouteNotFound):
+        router.resolve("/new/", "GET")
+    assert router.resolve_cache_info()['size'] == 2
+
+    new_view = lambda request: "new"
+    router.add_route("/new/", new_view, methods=["GET"])
+    assert router.resolve_cache_info()['size'] == 0
+    assert router.resolve("/new/", "GET") == (new_view, {}, True)
+
+
+def test_router_resolve_cache_is_thread_safe():
+    import threading
+    from lback.core.router import Router
+    router = Router(resolve_cache_size=8)
+    detail_view = lambda request, item_id: "detail"
+    router.add_route("/items/{item_id:int}/", detail_view, methods=["GET"])
+    errors = []
+
+    def worker():
+        try:
+            for i in range(500):
+                item_id = i % 16
+                assert router.resolve(f"/items/{item_id}/", "GET") == (detail_view, {'item_id': item_id}, True)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = router.resolve_cache_info()
+    assert not errors
+    assert info['hits'] + info['misses'] == 8 * 500
+    assert info['size'] <= 8
+
+
+def test_router_resolve_cache_drops_results_of_lookups_overtaken_by_add_route():
+    from lback.core.router import Router
+    from lback.core.exceptions import RouteNotFound
+    router = Router(resolve_cache_size=8)
+    new_view = lambda request: "new"
+    resolve_uncached = router._resolve_uncached
+
+    def resolve_then_add_route(path, method):
+        try:
+            return resolve_uncached(path, method)
+        finally:
+            router._resolve_uncached = resolve_uncached
+            router.add_route("/new/", new_view, methods=["GET"])
+
+    router._resolve_uncached = resolve_then_add_route
+    try:
+        router.resolve("/new/", "GET")
+    except RouteNotFound:
+        pass
+    assert router.resolve_cache_info()['size'] == 0
+    assert router.resolve("/new/", "GET") == (new_view, {}, True)
@@ -0,0 +1,131 @@
+import threading
+import time
+
+from lback.core.signal_queue import AsyncSignalQueue, SignalEvent
+from lback.core.signals import SignalDispatcher
+
+
+def test_async_receivers_get_batches_off_the_request_thread():
+    dispatcher = SignalDispatcher()
+    dispatcher.configure_async(workers=1, batch_size=50, batch_wait=0.05)
+    batches, threads = [], []
+
+    def audit(events):
+        threads.append(threading.current_thread())
+        batches.append(events)
+
+    def inline(sender, **kwargs):
+        return kwargs["n"]
+
+    dispatcher.connect("server_request_finished", audit, mode="async")
+    dispatcher.connect("server_request_finished", inline)
+    assert dispatcher.has_receivers("server_request_finished")
+
+    for n in range(10):
+        results = dispatcher.send("server_request_finished", sender="server", n=n)
+        assert results == [(inline, n)]
+
+    assert dispatcher.flush(timeout=5)
+    events = [event for batch in batches for event in batch]
+    assert [event.kwargs["n"] for event in events] == list(range(10))
+    assert all(isinstance(event, SignalEvent) and event.sender == "server" for event in events)
+    assert len(batches) < 10
+    assert threading.current_thread() not in threads
+
+    metrics = dispatcher.async_metrics()
+    assert metrics["enqueued"] == metrics["delivered"] == 10
+    assert metrics["depth"] == 0 and metrics["dropped"] == 0
+
+    dispatcher.disconnect("server_request_finished", audit)
+    dispatcher.disconnect("server_request_finished", inline)
+    assert not dispatcher.has_receivers("server_request_finished")
+    dispatcher.shutdown()
+
+
+def test_backpressure_policies_when_queue_is_full():
+    release = threading.Event()
+    received = []
+
+    def slow(events):
+        release.wait(5)
+        received.extend(event.kwargs["n"] for event in events)
+
+    def event(n):
+        return SignalEvent("audit", None, {"n": n}, 0.0)
+
+    def stalled(signal_queue):
+        assert signal_queue.put((slow,), event(-1))
+        while signal_queue.depth:
+            time.sleep(0.001)
+        return signal_queue
+
+    dropping = stalled(AsyncSignalQueue(maxsize=2, workers=1, batch_size=1, batch_wait=0))
+    assert [dropping.put((slow,), event(n)) for n in range(3)] == [True, True, False]
+
+    blocking = stalled(AsyncSignalQueue(maxsize=1, workers=1, batch_size=1, backpressure="block", block_timeout=0.01))
+    assert [blocking.put((slow,), event(n)) for n in range(2)] == [True, False]
+
+    sampling = stalled(AsyncSignalQueue(maxsize=8, workers=1, batch_size=1, backpressure="sample", sample_every=2))
+    assert [sampling.put((slow,), event(n)) for n in range(8)] == [True] * 4 + [False, True, False, True]
+
+    release.set()
+    for signal_queue in (dropping, blocking, sampling):
+        signal_queue.shutdown()
+    assert dropping.metrics()["dropped"] == 1
+    assert blocking.metrics()["dropped"] == 1
+    assert sampling.metrics()["sampled_out"] == 2
+    assert sampling.metrics()["max_depth"] == 6
+    assert sampling.metrics()["delivered"] == 7
+    assert sorted(received) == sorted([-1, 0, 1] + [-1, 0] + [-1, 0, 1, 2, 3, 5, 7])
+
+
+def test_failing_async_receiver_is_counted_and_others_still_run():
+    dispatcher = SignalDispatcher()
+    dispatcher.configure_async(workers=1, batch_wait=0)
+    good = []
+
+    def broken(events):
+        raise RuntimeError("boom")
+
+    dispatcher.connect("user_login_failed", broken, mode="async")
+    dispatcher.connect("user_login_failed", good.extend, mode="async")
+    dispatcher.connect("user_login_failed", good.append, mode="bogus")
+    dispatcher.send("user_login_failed", sender=None, username="x")
+
+    assert dispatcher.flush(timeout=5)
+    assert [event.kwargs for event in good] == [{"username": "x"}]
+    assert dispatcher.async_metrics()["receiver_errors"] == 1
+    dispatcher.shutdown()
+
+
+def test_send_uses_receiver_snapshot_and_skips_unconnected_signals():
+    dispatcher = SignalDispatcher()
+    calls = []
+
+    def late(sender, **kwargs):
+        calls.append("late")
+
+    def once(sender, **kwargs):
+        calls.append("once")
+        dispatcher.disconnect("cache_hit", once)
+        dispatcher.connect("cache_hit", late)
+
+    def after(sender, **kwargs):
+        calls.append("after")
+
+    assert dispatcher.send("cache_hit", key="k") == []
+    assert dispatcher.send("", key="k") == []
+    assert not dispatcher.has_receivers("cache_hit")
+
+    dispatcher.connect("cache_hit", once)
+    dispatcher.connect("cache_hit", after)
+    dispatcher.connect("cache_hit", after)
+    assert [receiver for receiver, _ in dispatcher.send("cache_hit", key="k")] == [once, after]
+    assert calls == ["once", "after"]
+
+    dispatcher.send("cache_hit", key="k")
+    assert calls == ["once", "after", "after", "late"]
+
+    dispatcher.disconnect("cache_hit", after)
+    dispatcher.disconnect("cache_hit", late)
+    assert not dispatcher.has_receivers("cache_hit")
@@ -0,0 +1,108 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from lback.core.types import Request
+from lback.middlewares.static_files_middleware import StaticFilesMiddleware
+from lback.utils.static_files import StaticFileServer, parse_range
+
+
+def make_request(path, headers=None, method="GET"):
+    return Request(path=path, method=method, body=None, headers=headers or {}, environ={})
+
+
+def body_of(response):
+    return b"".join(response.get_wsgi_response({})[2])
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_bytes(b"body { color: red; }")
+    (tmp_path / "video.mp4").write_bytes(bytes(range(100)))
+    return tmp_path
+
+
+def test_serves_file_with_validators(root):
+    server = StaticFileServer(str(root))
+    response = server.serve(make_request("/static/css/site.css"), "css/site.css")
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response.headers["Content-Type"] == "text/css"
+    assert response.headers["Content-Length"] == "20"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert body_of(response) == b"body { color: red; }"
+
+    etag = response.headers["ETag"]
+    by_etag = server.serve(make_request("/", {"IF-NONE-MATCH": etag}), "css/site.css")
+    assert by_etag.status_code == 304
+    by_date = server.serve(make_request("/", {"IF-MODIFIED-SINCE": response.headers["Last-Modified"]}), "css/site.css")
+    assert by_date.status_code == 304
+
+
+def test_range_requests(root):
+    server = StaticFileServer(str(root))
+
+    partial = server.serve(make_request("/", {"RANGE": "bytes=10-19"}), "video.mp4")
+    assert partial.status_code == 206
+    assert partial.headers["Content-Range"] == "bytes 10-19/100"
+    assert partial.headers["Content-Length"] == "10"
+    assert body_of(partial) == bytes(range(10, 20))
+
+    suffix = server.serve(make_request("/", {"RANGE": "bytes=-5"}), "video.mp4")
+    assert body_of(suffix) == bytes(range(95, 100))
+
+    unsatisfiable = server.serve(make_request("/", {"RANGE": "bytes=200-"}), "video.mp4")
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["Content-Range"] == "bytes */100"
+
+    stale = server.serve(make_request("/", {"RANGE": "bytes=0-9", "IF-RANGE": '"old"'}), "video.mp4")
+    assert stale.status_code == 200
+
+    head = server.serve(make_request("/", {"RANGE": "bytes=0-9"}, method="HEAD"), "video.mp4")
+    assert head.status_code == 206
+    assert head.body == b""
+
+
+def test_parse_range():
+    assert parse_range("bytes=0-", 10) == (0, 9)
+    assert parse_range("bytes=5-100", 10) == (5, 9)
+    assert parse_range("bytes=0-1,4-5", 10) is None
+    assert parse_range("items=0-1", 10) is None
+    assert parse_range("bytes=a-b", 10) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=10-", 10)
+
+
+def test_stat_cache_and_traversal(root, monkeypatch):
+    server = StaticFileServer(str(root), stat_cache_ttl=None)
+    assert server.find("css/site.css") is not None
+    assert server.find("missing.css") is None
+
+    calls = []
+    real_stat = os.stat
+    monkeypatch.setattr(os, "stat", lambda path, *args, **kwargs: calls.append(path) or real_stat(path, *args, **kwargs))
+    assert server.find("css/site.css") is not None
+    assert server.find("missing.css") is None
+    assert calls == []
+
+    sibling = root.parent / (root.name + "_private")
+    sibling.mkdir()
+    (sibling / "secret.txt").write_bytes(b"secret")
+    assert server.find("../" + sibling.name + "/secret.txt") is None
+    assert server.find("../../etc/passwd") is None
+
+
+def test_middleware_serves_only_in_debug(root):
+    middleware = StaticFilesMiddleware()
+    request = make_request("/static/video.mp4", {"RANGE": "bytes=0-3"})
+    request.add_context("config", SimpleNamespace(DEBUG=True, STATIC_URL="/static/", STATIC_ROOT=str(root)))
+    response = middleware.process_request(request)
+    assert response.status_code == 206
+    assert body_of(response) == bytes(range(4))
+
+    request = make_request("/static/video.mp4")
+    request.add_context("config", SimpleNamespace(DEBUG=False, STATIC_URL="/static/", STATIC_ROOT=str(root)))
+    assert middleware.process_request(request) is None
@@ -0,0 +1,118 @@
+import gzip
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from lback.core.types import Request
+from lback.utils.static_files import StaticFileServer, accepted_encodings, static
+from lback.utils.static_pipeline import StaticCollector
+
+
+CSS = b"body { color: red; }\n" * 50
+
+
+def make_source(tmp_path):
+    source = tmp_path / "static"
+    (source / "css").mkdir(parents=True)
+    (source / "css" / "site.css").write_bytes(CSS)
+    (source / "logo.png").write_bytes(b"\x89PNG" + bytes(1000))
+    return source
+
+
+def test_collect_writes_hashed_compressed_files_and_manifest(tmp_path):
+    source = make_source(tmp_path)
+    output = tmp_path / "staticfiles"
+
+    counts = StaticCollector([str(source)], str(output), max_workers=4).collect()
+    assert counts == {"collected": 2, "unchanged": 0, "failed": 0}
+
+    manifest = json.loads((output / "manifest.json").read_text())
+    hashed = manifest["paths"]["css/site.css"]
+    assert hashed.startswith("css/site.") and hashed.endswith(".css") and hashed != "css/site.css"
+    assert (output / hashed).read_bytes() == CSS
+    assert (output / "css" / "site.css").read_bytes() == CSS
+    assert gzip.decompress((output / (hashed + ".gz")).read_bytes()) == CSS
+    assert not (output / "logo.png.gz").exists()
+
+    assert StaticCollector([str(source)], str(output)).collect() == {"collected": 0, "unchanged": 2, "failed": 0}
+
+    (source / "css" / "site.css").write_bytes(CSS + b"a { color: blue; }\n")
+    assert StaticCollector([str(source)], str(output)).collect()["collected"] == 1
+    assert json.loads((output / "manifest.json").read_text())["paths"]["css/site.css"] != hashed
+
+
+def test_static_helper_uses_manifest(tmp_path):
+    source = make_source(tmp_path)
+    output = tmp_path / "staticfiles"
+    StaticCollector([str(source)], str(output)).collect()
+    hashed = json.loads((output / "manifest.json").read_text())["paths"]["css/site.css"]
+
+    config = SimpleNamespace(STATIC_URL="/static/", STATIC_ROOT=str(output))
+    assert static(config, "css/site.css") == "/static/" + hashed
+    assert static(config, "js/missing.js") == "/static/js/missing.js"
+    assert static(SimpleNamespace(STATIC_URL="/static/", STATIC_ROOT=str(source)), "css/site.css") == "/static/css/site.css"
+
+
+def test_server_prefers_precompressed_variant(tmp_path):
+    source = make_source(tmp_path)
+    output = tmp_path / "staticfiles"
+    StaticCollector([str(source)], str(output)).collect()
+    server = StaticFileServer(str(output))
+
+    def get(headers):
+        return server.serve(Request(path="/", method="GET", body=None, headers=headers, environ={}), "css/site.css")
+
+    compressed = get({"ACCEPT-ENCODING": "gzip, deflate"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Content-Type"] == "text/css"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(b"".join(compressed.get_wsgi_response({})[2])) == CSS
+
+    identity = get({"ACCEPT-ENCODING": "gzip;q=0"})
+    assert "Content-Encoding" not in identity.headers
+    assert identity.headers["ETag"] != compressed.headers["ETag"]
+    assert identity.headers["Vary"] == "Accept-Encoding"
+
+    ranged = get({"ACCEPT-ENCODING": "gzip", "RANGE": "bytes=0-3"})
+    assert ranged.status_code == 206
+    assert "Content-Encoding" not in ranged.headers
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, br;q=0.5") == {"gzip", "br"}
+    assert accepted_encodings("br;q=0, *") == {"*", "gzip"}
+    assert accepted_encodings("") == set()
+
+
+def test_collectstatic_uses_configured_dirs_and_refuses_overlap(tmp_path):
+    from lback.commands.runner import RunnerCommands
+
+    source = make_source(tmp_path)
+    root = tmp_path / "staticfiles"
+    counts = RunnerCommands().collectstatic(static_dirs=[str(source)], output_dir=str(root))
+    assert counts == {"collected": 2, "unchanged": 0, "failed": 0}
+    assert (root / "manifest.json").exists()
+
+    with pytest.raises(ValueError):
+        StaticCollector([str(source)], str(source / "collected"))
+    with pytest.raises(ValueError):
+        StaticCollector([str(source)], str(tmp_path))
+    assert RunnerCommands().collectstatic(static_dirs=[str(source)], output_dir=str(source)) is None
+    assert not (source / "manifest.json").exists()
+
+
+def test_middleware_serves_from_static_dirs_until_collected(tmp_path):
+    from lback.middlewares.static_files_middleware import StaticFilesMiddleware
+
+    source = make_source(tmp_path)
+    config = SimpleNamespace(DEBUG=True, STATIC_URL="/static/", STATIC_ROOT=str(tmp_path / "staticfiles"), STATIC_DIRS=[str(source)])
+
+    def get():
+        request = Request(path="/static/css/site.css", method="GET", body=None, headers={"ACCEPT-ENCODING": "gzip"}, environ={})
+        request.config = config
+        return StaticFilesMiddleware(stat_cache_ttl=None).process_request(request)
+
+    assert get().status_code == 200 and "Content-Encoding" not in get().headers
+    StaticCollector([str(source)], config.STATIC_ROOT).collect()
+    assert get().headers["Content-Encoding"] == "gzip"